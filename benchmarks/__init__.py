@@ -0,0 +1,5 @@
+"""
+Performance benchmark suite for the cofounder_agent backend.
+
+See benchmarks/README.md and `python -m benchmarks.run --help`.
+"""
@@ -0,0 +1,211 @@
+"""
+Deterministic stand-ins for Ollama and Pexels.
+
+Both fakes are small FastAPI apps served by uvicorn on an ephemeral port. Their
+latency and token rates are configurable so the benchmark measures our code
+rather than a real model or a remote API. Output is seeded from the request,
+so identical requests always produce identical responses.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+_WORDS = (
+    "agent pipeline latency model content quality research draft review publish "
+    "throughput system data cache query index token budget image search metric "
+    "workflow service provider fallback cost scale process result context signal"
+).split()
+
+
+@dataclass
+class FakeOllamaConfig:
+    """Latency model for the fake Ollama server"""
+
+    first_token_ms: float = 50.0  # Time to first token
+    tokens_per_second: float = 2000.0  # Generation rate once streaming
+    max_tokens: int = 600  # Cap on num_predict so runs stay short
+    models: List[str] = field(
+        default_factory=lambda: ["neural-chat:latest", "llama2:latest", "qwen2:7b"]
+    )
+
+
+@dataclass
+class FakePexelsConfig:
+    """Latency model for the fake Pexels API"""
+
+    latency_ms: float = 80.0
+    photos_per_page: int = 5
+
+
+def _seeded(*parts: str) -> random.Random:
+    digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _fake_article(rng: random.Random, tokens: int) -> List[str]:
+    """Markdown article split into roughly one-word tokens"""
+    out: List[str] = []
+    section = 0
+    while len(out) < tokens:
+        if len(out) % 120 == 0:
+            section += 1
+            out.append(f"\n\n## Section {section}\n\n")
+        sentence = [rng.choice(_WORDS) for _ in range(rng.randint(8, 16))]
+        sentence[0] = sentence[0].capitalize()
+        out.extend(word + " " for word in sentence[:-1])
+        out.append(sentence[-1] + ". ")
+    return out[:tokens]
+
+
+def create_fake_ollama_app(config: FakeOllamaConfig) -> FastAPI:
+    """Fake Ollama exposing /api/tags, /api/generate and /api/chat"""
+    app = FastAPI()
+
+    @app.get("/api/tags")
+    async def tags():
+        return {"models": [{"name": name, "size": 0} for name in config.models]}
+
+    async def _respond(model: str, prompt: str, options: dict, stream: bool, chat: bool):
+        requested = int(options.get("num_predict") or config.max_tokens)
+        tokens = _fake_article(_seeded(model, prompt), min(requested, config.max_tokens))
+        per_token = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+        total_ns = int((config.first_token_ms / 1000 + per_token * len(tokens)) * 1e9)
+
+        def chunk(text: str, done: bool) -> dict:
+            body = {"model": model, "done": done}
+            if chat:
+                body["message"] = {"role": "assistant", "content": text}
+            else:
+                body["response"] = text
+            if done:
+                body.update(
+                    eval_count=len(tokens),
+                    prompt_eval_count=len(prompt.split()),
+                    total_duration=total_ns,
+                )
+            return body
+
+        if not stream:
+            await asyncio.sleep(total_ns / 1e9)
+            return JSONResponse(chunk("".join(tokens), True))
+
+        async def lines():
+            await asyncio.sleep(config.first_token_ms / 1000)
+            # Emit in small bursts so the event loop isn't woken once per token
+            burst = 8
+            for i in range(0, len(tokens), burst):
+                yield json.dumps(chunk("".join(tokens[i : i + burst]), False)) + "\n"
+                await asyncio.sleep(per_token * burst)
+            yield json.dumps(chunk("", True)) + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.post("/api/generate")
+    async def generate(request: Request):
+        body = await request.json()
+        return await _respond(
+            body.get("model", ""),
+            (body.get("system") or "") + body.get("prompt", ""),
+            body.get("options") or {},
+            bool(body.get("stream", True)),
+            chat=False,
+        )
+
+    @app.post("/api/chat")
+    async def chat(request: Request):
+        body = await request.json()
+        prompt = " ".join(m.get("content", "") for m in body.get("messages", []))
+        return await _respond(
+            body.get("model", ""),
+            prompt,
+            body.get("options") or {},
+            bool(body.get("stream", True)),
+            chat=True,
+        )
+
+    return app
+
+
+def create_fake_pexels_app(config: FakePexelsConfig) -> FastAPI:
+    """Fake Pexels exposing /v1/search and /v1/curated"""
+    app = FastAPI()
+
+    def _photos(query: str, page: int, per_page: int) -> dict:
+        rng = _seeded(query, str(page))
+        count = min(per_page, config.photos_per_page)
+        photos = []
+        for i in range(count):
+            photo_id = rng.randint(10_000, 9_999_999)
+            src = f"https://images.pexels.test/photos/{photo_id}/photo.jpeg"
+            photos.append(
+                {
+                    "id": photo_id,
+                    "width": 1920,
+                    "height": 1080,
+                    "url": f"https://www.pexels.test/photo/{photo_id}/",
+                    "photographer": f"Photographer {i}",
+                    "photographer_url": f"https://www.pexels.test/@p{i}",
+                    "alt": f"{query} illustration {i}",
+                    "src": {
+                        "original": src,
+                        "large2x": src + "?w=1880",
+                        "large": src + "?h=650",
+                        "medium": src + "?h=350",
+                        "small": src + "?h=130",
+                        "landscape": src + "?h=627&w=1200",
+                        "portrait": src + "?h=1200&w=800",
+                        "tiny": src + "?h=200&w=280",
+                    },
+                }
+            )
+        return {"page": page, "per_page": per_page, "total_results": 1000, "photos": photos}
+
+    @app.get("/v1/search")
+    async def search(query: str = "", page: int = 1, per_page: int = 15):
+        await asyncio.sleep(config.latency_ms / 1000)
+        return _photos(query, page, per_page)
+
+    @app.get("/v1/curated")
+    async def curated(page: int = 1, per_page: int = 15):
+        await asyncio.sleep(config.latency_ms / 1000)
+        return _photos("curated", page, per_page)
+
+    return app
+
+
+class BackgroundServer:
+    """Runs an ASGI app with uvicorn on 127.0.0.1 in the current event loop"""
+
+    def __init__(self, app, port: int = 0, lifespan: str = "off"):
+        self.config = uvicorn.Config(
+            app, host="127.0.0.1", port=port, log_level="warning", lifespan=lifespan
+        )
+        self.server = uvicorn.Server(self.config)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def url(self) -> str:
+        sock = self.server.servers[0].sockets[0]
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+    async def __aenter__(self) -> "BackgroundServer":
+        self._task = asyncio.create_task(self.server.serve())
+        while not self.server.started:
+            if self._task.done():
+                self._task.result()  # Surface startup errors
+                raise RuntimeError("server exited during startup")
+            await asyncio.sleep(0.05)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.server.should_exit = True
+        if self._task:
+            await self._task
@@ -0,0 +1,217 @@
+"""
+Load generation, latency statistics, RSS sampling and baseline comparison.
+
+Kept free of application imports so it can be unit tested on its own.
+"""
+
+import asyncio
+import math
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentile with linear interpolation (pct in 0-100)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return ordered[low]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB"""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    # ru_maxrss is a high-water mark: KB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class RssSampler:
+    """Samples RSS in the background and keeps the peak"""
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.start_mb = 0.0
+        self.peak_mb = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+            await asyncio.sleep(self.interval)
+
+    async def __aenter__(self) -> "RssSampler":
+        self.start_mb = self.peak_mb = current_rss_mb()
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements for one scenario at one concurrency level"""
+
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    rss_start_mb: float
+    rss_peak_mb: float
+    error_samples: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}@{self.concurrency}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+async def run_load(
+    name: str,
+    operation: Callable[[int], Awaitable[Any]],
+    concurrency: int,
+    requests: int,
+    warmup: int = 0,
+) -> ScenarioResult:
+    """
+    Run `requests` calls of operation(i) with at most `concurrency` in flight.
+
+    Latency is measured per call; failed calls are counted as errors and
+    excluded from the latency distribution.
+    """
+    for i in range(warmup):
+        try:
+            await operation(-(i + 1))
+        except Exception:
+            pass
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                await operation(i)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    async with RssSampler() as rss:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+
+    return ScenarioResult(
+        scenario=name,
+        concurrency=concurrency,
+        requests=requests,
+        errors=len(errors),
+        duration_s=round(duration, 3),
+        throughput_rps=round(len(latencies) / duration, 2) if duration > 0 else 0.0,
+        p50_ms=round(percentile(latencies, 50), 2),
+        p95_ms=round(percentile(latencies, 95), 2),
+        p99_ms=round(percentile(latencies, 99), 2),
+        max_ms=round(max(latencies, default=0.0), 2),
+        rss_start_mb=round(rss.start_mb, 1),
+        rss_peak_mb=round(rss.peak_mb, 1),
+        error_samples=errors[:5],
+    )
+
+
+@dataclass
+class Thresholds:
+    """Relative change that counts as a regression (0.15 = 15%)"""
+
+    latency: float = 0.15
+    throughput: float = 0.15
+    rss: float = 0.20
+    # Latency differences below this many ms are noise, whatever the ratio
+    min_latency_delta_ms: float = 2.0
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], thresholds: Thresholds
+) -> List[Dict[str, Any]]:
+    """
+    Compare two result documents (as written by benchmarks.run).
+
+    Returns:
+        One entry per regressed metric: {key, metric, baseline, current, change}
+    """
+    base_by_key = {f"{r['scenario']}@{r['concurrency']}": r for r in baseline.get("results", [])}
+    regressions: List[Dict[str, Any]] = []
+
+    def flag(key: str, metric: str, old: float, new: float) -> None:
+        change = (new - old) / old if old else 0.0
+        regressions.append(
+            {
+                "key": key,
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": round(change, 4),
+            }
+        )
+
+    for result in current.get("results", []):
+        key = f"{result['scenario']}@{result['concurrency']}"
+        base = base_by_key.get(key)
+        if not base:
+            continue
+
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            old, new = base[metric], result[metric]
+            if (
+                old > 0
+                and new - old > thresholds.min_latency_delta_ms
+                and (new - old) / old > thresholds.latency
+            ):
+                flag(key, metric, old, new)
+
+        old, new = base["throughput_rps"], result["throughput_rps"]
+        if old > 0 and (old - new) / old > thresholds.throughput:
+            flag(key, "throughput_rps", old, new)
+
+        old, new = base["rss_peak_mb"], result["rss_peak_mb"]
+        if old > 0 and (new - old) / old > thresholds.rss:
+            flag(key, "rss_peak_mb", old, new)
+
+        if result["errors"] > base["errors"]:
+            flag(key, "errors", base["errors"], result["errors"])
+
+    return regressions
@@ -0,0 +1,75 @@
+"""
+Micro-benchmark for the in-process metrics registry (services/metrics_service.py).
+
+Measures the per-call cost of the hot-path operations: counter increments,
+histogram observations on a cached label child, label lookups, and the full
+record_db_query / record_llm_call helpers. No database or app needed.
+
+Usage (from the repository root):
+
+    python -m benchmarks.micro_metrics
+    python -m benchmarks.micro_metrics --iterations 2000000 --json
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+BACKEND = ROOT / "src" / "cofounder_agent"
+
+LoggedQuery = namedtuple("LoggedQuery", "query args timeout elapsed exception conn_addr conn_params")
+
+
+def measure(iterations: int = 1_000_000, repeat: int = 5) -> Dict[str, float]:
+    """Best-of-repeat nanoseconds per call for each operation"""
+    if str(BACKEND) not in sys.path:
+        sys.path.insert(0, str(BACKEND))
+    from services.metrics_service import MetricsRegistry, record_db_query, record_llm_call
+
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "bench")
+    histogram = registry.histogram("bench_seconds", "bench", ("method", "route", "status"))
+    child = histogram.labels("GET", "/api/tasks/{task_id}", 200)
+    values = [random.uniform(0, 2) for _ in range(1024)]
+    query = LoggedQuery("SELECT * FROM content_tasks WHERE task_id = $1", (), None, 0.002, None, None, None)
+
+    operations = {
+        "counter.inc": lambda: counter.inc(),
+        "histogram_child.observe": lambda: child.observe(values[7]),
+        "histogram.labels().observe": lambda: histogram.labels("GET", "/api/tasks/{task_id}", 200).observe(
+            values[7]
+        ),
+        "record_db_query": lambda: record_db_query(query),
+        "record_llm_call": lambda: record_llm_call("ollama", "generate", 1.25, tokens=300),
+    }
+    results = {}
+    for name, operation in operations.items():
+        best = min(timeit.repeat(operation, number=iterations, repeat=repeat))
+        results[name] = round(best / iterations * 1e9, 1)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Metrics registry overhead micro-benchmark")
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = measure(args.iterations, args.repeat)
+    if args.json:
+        print(json.dumps({"ns_per_call": results}, indent=2))
+    else:
+        for name, ns in results.items():
+            print(f"{name:<32} {ns:>8.1f} ns/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
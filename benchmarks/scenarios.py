@@ -0,0 +1,179 @@
+"""
+Benchmark scenarios.
+
+Each scenario runs against the real FastAPI app (served by uvicorn in this
+process), a local PostgreSQL database and the fake Ollama/Pexels servers.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import httpx
+
+# Terminal states written by TaskExecutor._process_single_task
+_EXECUTOR_DONE = {"awaiting_approval", "completed", "failed", "rejected", "published", "approved"}
+
+
+@dataclass
+class BenchContext:
+    """Shared handles for scenarios"""
+
+    app: Any  # FastAPI app (services on app.state)
+    client: httpx.AsyncClient  # Bound to the app's base URL
+    data: Dict[str, Any]
+
+    @property
+    def database(self):
+        return self.app.state.database
+
+
+@dataclass
+class Scenario:
+    """A named operation run at several concurrency levels"""
+
+    name: str
+    description: str
+    operation: Callable[[BenchContext, int], Awaitable[Any]]
+    requests: int
+    concurrency: List[int]
+    setup: Optional[Callable[[BenchContext], Awaitable[None]]] = None
+    warmup: int = 2
+
+
+async def _get_ok(ctx: BenchContext, path: str, **params) -> Any:
+    response = await ctx.client.get(path, params=params or None)
+    response.raise_for_status()
+    return response.json()
+
+
+# ---------------------------------------------------------------------------
+# CMS read endpoints
+# ---------------------------------------------------------------------------
+
+
+async def _cms_list_posts(ctx: BenchContext, i: int) -> Any:
+    return await _get_ok(ctx, "/api/posts", skip=(max(i, 0) % 5) * 20, limit=20)
+
+
+async def _setup_post_slugs(ctx: BenchContext) -> None:
+    body = await _get_ok(ctx, "/api/posts", limit=100)
+    ctx.data["slugs"] = [p["slug"] for p in body.get("data", []) if p.get("slug")]
+
+
+async def _cms_get_post(ctx: BenchContext, i: int) -> Any:
+    slugs = ctx.data.get("slugs")
+    if not slugs:
+        raise RuntimeError("no published posts to read (run content_pipeline first)")
+    return await _get_ok(ctx, f"/api/posts/{slugs[max(i, 0) % len(slugs)]}")
+
+
+async def _cms_categories(ctx: BenchContext, i: int) -> Any:
+    return await _get_ok(ctx, "/api/categories")
+
+
+async def _analytics_kpis(ctx: BenchContext, i: int) -> Any:
+    return await _get_ok(ctx, "/api/analytics/kpis", range=("7d", "30d", "all")[max(i, 0) % 3])
+
+
+# ---------------------------------------------------------------------------
+# Content generation
+# ---------------------------------------------------------------------------
+
+
+async def _content_pipeline(ctx: BenchContext, i: int) -> Any:
+    from services.content_router_service import process_content_generation_task
+
+    result = await process_content_generation_task(
+        topic=f"Benchmark topic {i}: scaling agent pipelines",
+        style="technical",
+        tone="professional",
+        target_length=400,
+        tags=["benchmark"],
+        generate_featured_image=True,
+        database_service=ctx.database,
+        task_id=f"bench-{uuid4()}",
+    )
+    if result.get("status") == "failed":
+        raise RuntimeError(result.get("error") or "pipeline failed")
+    return result
+
+
+async def _task_executor(ctx: BenchContext, i: int) -> Any:
+    """Submit a pending task and wait for the running TaskExecutor to finish it"""
+    task_id = await ctx.database.add_task(
+        {
+            "task_name": f"Benchmark task {i}",
+            "topic": f"Benchmark topic {i}: background execution",
+            "task_type": "blog_post",
+            "status": "pending",
+            "target_length": 400,
+            "metadata": {"benchmark": True},
+        }
+    )
+    task_id = task_id.get("id", task_id) if isinstance(task_id, dict) else task_id
+
+    deadline = time.monotonic() + ctx.data.get("task_timeout", 300)
+    while time.monotonic() < deadline:
+        task = await ctx.database.get_task(task_id)
+        status = (task or {}).get("status")
+        if status in _EXECUTOR_DONE:
+            if status in ("failed", "rejected"):
+                raise RuntimeError(f"task {task_id} ended as {status}")
+            return task
+        await asyncio.sleep(0.1)
+    raise TimeoutError(f"task {task_id} not finished")
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s
+    for s in [
+        Scenario(
+            name="content_pipeline",
+            description="process_content_generation_task end to end (fake Ollama + Pexels)",
+            operation=_content_pipeline,
+            requests=20,
+            concurrency=[1, 4],
+            warmup=1,
+        ),
+        Scenario(
+            name="task_executor",
+            description="Pending task picked up and finished by the background TaskExecutor",
+            operation=_task_executor,
+            requests=12,
+            concurrency=[1, 4],
+            warmup=0,
+        ),
+        Scenario(
+            name="cms_list_posts",
+            description="GET /api/posts",
+            operation=_cms_list_posts,
+            requests=300,
+            concurrency=[1, 16, 64],
+        ),
+        Scenario(
+            name="cms_get_post",
+            description="GET /api/posts/{slug}",
+            operation=_cms_get_post,
+            requests=300,
+            concurrency=[1, 16, 64],
+            setup=_setup_post_slugs,
+        ),
+        Scenario(
+            name="cms_categories",
+            description="GET /api/categories",
+            operation=_cms_categories,
+            requests=300,
+            concurrency=[1, 16, 64],
+        ),
+        Scenario(
+            name="analytics_kpis",
+            description="GET /api/analytics/kpis",
+            operation=_analytics_kpis,
+            requests=100,
+            concurrency=[1, 8, 32],
+        ),
+    ]
+}
@@ -63,6 +63,9 @@ class CreativeAgent:
                 critique=post.qa_feedback[-1],
                 target_audience=post.target_audience or "General",
                 primary_keyword=post.primary_keyword or "topic",
+                word_count_constraint=(
+                    f"Target: {word_count_target} words" if word_count_target else "Keep the current length"
+                ),
             )
 
             # Include writing sample guidance in refinement too
@@ -133,6 +136,45 @@ class CreativeAgent:
         logger.info(f"CreativeAgent: Finished processing for '{post.topic}'.")
         return post
 
+    async def refine_section(
+        self,
+        post: BlogPost,
+        heading: str,
+        section: str,
+        critique: str,
+        word_count_target: int = None,
+    ) -> str:
+        """
+        Rewrites a single section of the post (used by SectionRefiner).
+
+        Args:
+            post (BlogPost): The post the section belongs to (topic, audience, style).
+            heading (str): The section heading, kept verbatim by the caller.
+            section (str): The current section body.
+            critique (str): QA feedback and section-specific suggestions.
+            word_count_target (int): Target word count for this section.
+
+        Returns:
+            str: The rewritten section body.
+        """
+        prompt = self.pm.get_prompt(
+            "blog_generation.section_refinement",
+            topic=post.topic,
+            target_audience=post.target_audience or "General",
+            primary_keyword=post.primary_keyword or "topic",
+            heading=heading or "(introduction)",
+            word_count_constraint=(
+                f"About {word_count_target} words" if word_count_target else "Keep the current length"
+            ),
+            section=section,
+            critique=critique or "Improve clarity and readability",
+        )
+        if post.metadata and post.metadata.get("writing_sample_guidance"):
+            prompt += f"\n\n{post.metadata['writing_sample_guidance']}"
+
+        logger.info(f"CreativeAgent: Refining section '{heading or 'intro'}' of '{post.topic}'.")
+        return await self.llm_client.generate_text(prompt)
+
     def _clean_llm_output(self, text: str) -> str:
         """
         Removes conversational preamble from the LLM's output by finding the
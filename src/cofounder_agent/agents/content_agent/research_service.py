@@ -3,6 +3,8 @@ Research Service using SearXNG for content agent pipeline.
 
 SearXNG provides privacy-respecting, aggregated search results from 247+ engines.
 This service integrates SearXNG for the research stage of content generation.
+Searches go through the shared external API cache and SearXNG rate limit
+(services/external_api_cache.py), since public instances throttle hard.
 """
 
 import asyncio
@@ -74,6 +76,10 @@ class SearXNGResearchService:
         Returns:
             Dictionary with search results and metadata
         """
+        from services.external_api_cache import (  # pylint: disable=import-outside-toplevel
+            get_external_api_cache,
+        )
+
         if not self.client:
             self.client = httpx.AsyncClient(timeout=self.timeout)
 
@@ -86,17 +92,24 @@ class SearXNGResearchService:
                 "results": self.max_results,
             }
 
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
+            async def fetch() -> list:
+                response = await self.client.get(url, params=params)
+                response.raise_for_status()
+                return response.json().get("results", [])
 
-            data = response.json()
+            raw_results = await get_external_api_cache().get_or_fetch(
+                f"searxng.{category}",
+                query,
+                fetch,
+                params={"instance": self.searxng_instance, "results": self.max_results},
+            )
 
             return {
                 "query": query,
                 "category": category,
                 "timestamp": datetime.now().isoformat(),
-                "results": self._parse_results(data.get("results", [])),
-                "count": len(data.get("results", [])),
+                "results": self._parse_results(raw_results),
+                "count": len(raw_results),
                 "source": "SearXNG",
             }
 
@@ -28,6 +28,8 @@ CREATE TABLE IF NOT EXISTS knowledge_clusters (
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     importance_score REAL NOT NULL,
     topics TEXT[],
+    centroid BYTEA,
+    member_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -5,18 +5,38 @@ capabilities for the AI co-founder system. It enables the AI to remember convers
 learn from interactions, build domain expertise, and maintain context across sessions.
 
 Uses PostgreSQL for persistent storage (no SQLite).
+
+Memory use of long-running workers is bounded:
+- Memories are slotted records with float32 embeddings (4 bytes per dimension)
+- Only a size-, byte- and idle-bounded hot set stays in process; eviction is
+  LRU weighted by importance, and evicted memories stay in PostgreSQL where
+  recall_memories() / get_memory() page them back in on demand
+- Conversation context and knowledge clusters are capped the same way
+- A background task prunes idle entries on a schedule; get_memory_stats() and
+  the memory_* metrics expose the current footprint
+
+Knowledge is organized incrementally: memories with embeddings join the
+nearest cluster of an online k-means index (O(k) per memory), and learning
+patterns come from word counters maintained as conversation turns arrive,
+refreshed and persisted by the same background task.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
-from services.logger_config import get_logger
+import os
 import pickle
-from dataclasses import asdict, dataclass
+import re
+import sys
+import time
+from array import array
+from collections import Counter, OrderedDict, deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from uuid import NAMESPACE_OID, UUID, uuid4, uuid5
 
 import asyncpg
 import numpy as np
@@ -29,6 +49,49 @@ except ImportError:
     SentenceTransformer = None
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+from services.logger_config import get_logger
+from services.metrics_service import get_metrics_registry
+
+# Hot-set bounds; everything evicted remains in the memories table
+MEMORY_HOT_SET_SIZE = int(os.getenv("MEMORY_HOT_SET_SIZE", "600"))
+MEMORY_HOT_SET_MAX_BYTES = int(os.getenv("MEMORY_HOT_SET_MAX_BYTES", str(32 * 1024 * 1024)))
+MEMORY_MAX_IDLE_SECONDS = float(os.getenv("MEMORY_MAX_IDLE_SECONDS", str(6 * 3600)))
+MEMORY_MAX_KNOWLEDGE_CLUSTERS = int(os.getenv("MEMORY_MAX_KNOWLEDGE_CLUSTERS", "200"))
+MAX_CONVERSATION_TURNS = 50
+
+# Background pruning (0 disables); forgetting deletes old low-importance rows
+MEMORY_PRUNE_INTERVAL_SECONDS = float(os.getenv("MEMORY_PRUNE_INTERVAL_SECONDS", "300"))
+MEMORY_FORGET_INTERVAL_SECONDS = float(os.getenv("MEMORY_FORGET_INTERVAL_SECONDS", "86400"))
+MEMORY_PATTERN_INTERVAL_SECONDS = float(os.getenv("MEMORY_PATTERN_INTERVAL_SECONDS", "600"))
+
+# Online clustering: at most this many centroids (k); member ids kept per cluster
+MEMORY_MAX_CENTROIDS = int(os.getenv("MEMORY_MAX_CENTROIDS", "256"))
+CLUSTER_MEMBER_SAMPLE = 50
+CLUSTER_MAX_TOPICS = 10
+
+# Least-recently-used entries considered per eviction; the least important goes
+EVICTION_SAMPLE_SIZE = 8
+
+_CLUSTER_DESCRIPTION = "Knowledge cluster for "
+_MEMORY_COLUMNS = """id, content, memory_type, importance, confidence,
+                           created_at, last_accessed, access_count, tags,
+                           related_memories, metadata, embedding"""
+_CLUSTER_COLUMNS = """id, name, description, memories, confidence, last_updated,
+                           importance_score, topics, centroid, member_count"""
+
+MEMORY_HOT_SET_ENTRIES = get_metrics_registry().gauge(
+    "memory_hot_set_entries", "Memories currently held in process"
+)
+MEMORY_HOT_SET_BYTES = get_metrics_registry().gauge(
+    "memory_hot_set_bytes", "Approximate bytes held by in-process memories"
+)
+MEMORY_EVICTIONS = get_metrics_registry().counter(
+    "memory_evictions_total", "Memories dropped from the hot set by reason", ("reason",)
+)
+MEMORY_PAGE_INS = get_metrics_registry().counter(
+    "memory_page_ins_total", "Evicted memories paged back in from PostgreSQL"
+)
+
 
 class MemoryType(str, Enum):
     """Types of memories the AI can store"""
@@ -53,7 +116,20 @@ class ImportanceLevel(int, Enum):
     CRITICAL = 5
 
 
-@dataclass
+def memory_key(memory_id: Any) -> str:
+    """Canonical id for a memory (asyncpg returns UUIDs, new memories use md5 hex)"""
+    try:
+        return UUID(str(memory_id)).hex
+    except ValueError:
+        return str(memory_id)
+
+
+def _float32(values: Any) -> array:
+    """Pack an embedding (list, ndarray or array) as compact float32"""
+    return array("f", np.asarray(values, dtype=np.float32).tobytes())
+
+
+@dataclass(slots=True)
 class Memory:  # pylint: disable=too-many-instance-attributes
     """A single memory or piece of knowledge"""
 
@@ -68,21 +144,57 @@ class Memory:  # pylint: disable=too-many-instance-attributes
     tags: Optional[List[str]] = None
     related_memories: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
-    embedding: Optional[List[float]] = None
-
-
-@dataclass
+    embedding: Optional[array] = None  # float32
+
+    def __post_init__(self):
+        if self.embedding is not None and not isinstance(self.embedding, array):
+            self.embedding = _float32(self.embedding)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with the embedding as a list of floats"""
+        data = asdict(self)
+        if self.embedding is not None:
+            data["embedding"] = self.embedding.tolist()
+        return data
+
+    def footprint(self) -> int:
+        """Approximate bytes held by this memory"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.content)
+        if self.embedding is not None:
+            size += sys.getsizeof(self.embedding)
+        for items in (self.tags, self.related_memories):
+            if items:
+                size += sys.getsizeof(items) + sum(sys.getsizeof(item) for item in items)
+        if self.metadata:
+            size += sys.getsizeof(self.metadata) + len(json.dumps(self.metadata, default=str))
+        return size
+
+
+@dataclass(slots=True)
 class KnowledgeCluster:  # pylint: disable=too-many-instance-attributes
     """A cluster of related knowledge/memories"""
 
     id: str
     name: str
     description: str
-    memories: List[str]
+    memories: List[str]  # Most recent CLUSTER_MEMBER_SAMPLE member ids
     confidence: float
     last_updated: datetime
     importance_score: float
     topics: Optional[List[str]] = None
+    member_count: int = 0
+    centroid: Optional[array] = field(default=None, repr=False)  # float32
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict without the centroid"""
+        data = asdict(self)
+        data.pop("centroid")
+        return data
+
+
+def learning_pattern_id(name: str) -> str:
+    """Stable UUID for a named pattern, so rediscovery updates the stored row"""
+    return str(uuid5(NAMESPACE_OID, f"ai_memory_system.learning_pattern.{name}"))
 
 
 @dataclass
@@ -98,6 +210,206 @@ class LearningPattern:
     discovered_at: datetime
 
 
+class HotMemorySet:
+    """
+    Bounded in-process working set of memories.
+
+    Entries are kept in least-recently-used order. When the entry or byte cap
+    is exceeded, the least important of the EVICTION_SAMPLE_SIZE oldest entries
+    is dropped; expire() drops entries idle longer than max_idle_seconds
+    (important memories get twice as long). Dropped memories are only removed
+    from process memory - they remain in PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MEMORY_HOT_SET_SIZE,
+        max_bytes: int = MEMORY_HOT_SET_MAX_BYTES,
+        max_idle_seconds: float = MEMORY_MAX_IDLE_SECONDS,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.max_idle_seconds = max_idle_seconds
+        self.bytes = 0
+        # key -> (memory, approximate size, monotonic time of last use)
+        self._entries: "OrderedDict[str, Tuple[Memory, int, float]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "page_ins": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, memory_id: Any) -> bool:
+        return memory_key(memory_id) in self._entries
+
+    def keys(self) -> List[str]:
+        return list(self._entries)
+
+    def values(self) -> List[Memory]:
+        """Memories, most recently used first"""
+        return [entry[0] for entry in reversed(self._entries.values())]
+
+    def get(self, memory_id: Any) -> Optional[Memory]:
+        """Look up a memory and mark it as recently used"""
+        key = memory_key(memory_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        self.touch(entry[0])
+        return entry[0]
+
+    def touch(self, memory: Memory) -> None:
+        """Mark a held memory as recently used"""
+        key = memory_key(memory.id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (entry[0], entry[1], time.monotonic())
+            self._entries.move_to_end(key)
+
+    def put(self, memory: Memory) -> List[str]:
+        """Add or replace a memory; returns the keys evicted to make room"""
+        key = memory_key(memory.id)
+        self.discard([key])
+        size = memory.footprint()
+        self._entries[key] = (memory, size, time.monotonic())
+        self.bytes += size
+
+        evicted = []
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self.bytes > self.max_bytes
+        ):
+            evicted.append(self._evict_one())
+        if evicted:
+            self.stats["evictions"] += len(evicted)
+            MEMORY_EVICTIONS.labels("capacity").inc(len(evicted))
+        self._publish()
+        return evicted
+
+    def discard(self, memory_ids: Iterable[Any]) -> None:
+        """Drop memories (e.g. deleted from the database) without counting evictions"""
+        for memory_id in memory_ids:
+            entry = self._entries.pop(memory_key(memory_id), None)
+            if entry is not None:
+                self.bytes -= entry[1]
+        self._publish()
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop entries idle past their allowance; returns how many were dropped"""
+        if self.max_idle_seconds <= 0:
+            return 0
+        now = time.monotonic() if now is None else now
+        expired = []
+        for key, (memory, _, used_at) in self._entries.items():
+            allowance = self.max_idle_seconds
+            if memory.importance.value >= ImportanceLevel.HIGH.value:
+                allowance *= 2
+            if now - used_at > allowance:
+                expired.append(key)
+        self.discard(expired)
+        if expired:
+            self.stats["expired"] += len(expired)
+            MEMORY_EVICTIONS.labels("idle").inc(len(expired))
+        return len(expired)
+
+    def _evict_one(self) -> str:
+        """Drop the least important of the oldest few entries (ties go to the oldest)"""
+        candidates = []
+        for key, (memory, _, _) in self._entries.items():
+            if len(candidates) >= EVICTION_SAMPLE_SIZE:
+                break
+            candidates.append((memory.importance.value, memory.access_count, key))
+        victim = min(candidates, key=lambda item: (item[0], item[1]))[2]
+        self.bytes -= self._entries.pop(victim)[1]
+        return victim
+
+    def _publish(self) -> None:
+        MEMORY_HOT_SET_ENTRIES.set(len(self._entries))
+        MEMORY_HOT_SET_BYTES.set(self.bytes)
+
+
+class CentroidIndex:
+    """
+    Online k-means over memory embeddings.
+
+    Centroids live in one preallocated float32 matrix, so the nearest cluster
+    for a memory or query is a single O(k*d) matrix-vector product and adding
+    a member is an O(d) running-mean update. At most max_clusters centroids
+    exist; once full, every memory joins its nearest cluster.
+    """
+
+    def __init__(self, max_clusters: int = MEMORY_MAX_CENTROIDS):
+        self.max_clusters = max(1, max_clusters)
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._counts: List[int] = []
+        self._centroids: Optional[np.ndarray] = None  # (max_clusters, dimension)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, cluster_id: str) -> bool:
+        return cluster_id in self._positions
+
+    @property
+    def full(self) -> bool:
+        return len(self._ids) >= self.max_clusters
+
+    def nearest(self, vector: Any, n: int = 1) -> List[Tuple[str, float]]:
+        """Up to n (cluster id, cosine similarity) pairs, most similar first"""
+        if not self._ids:
+            return []
+        vector = np.asarray(vector, dtype=np.float32)
+        centroids = self._centroids[: len(self._ids)]
+        if vector.shape != centroids.shape[1:]:
+            return []
+        norms = np.linalg.norm(centroids, axis=1) * np.linalg.norm(vector)
+        similarities = centroids @ vector / np.maximum(norms, 1e-12)
+        order = np.argsort(-similarities)[:n]
+        return [(self._ids[i], float(similarities[i])) for i in order]
+
+    def add(self, cluster_id: str, centroid: Any, count: int = 1) -> None:
+        """Add (or replace) a cluster's centroid"""
+        vector = np.asarray(centroid, dtype=np.float32)
+        if self._centroids is None:
+            self._centroids = np.zeros((self.max_clusters, vector.shape[0]), dtype=np.float32)
+        if vector.shape != self._centroids.shape[1:]:
+            return
+        position = self._positions.get(cluster_id)
+        if position is None:
+            if self.full:
+                return
+            position = len(self._ids)
+            self._positions[cluster_id] = position
+            self._ids.append(cluster_id)
+            self._counts.append(0)
+        self._centroids[position] = vector
+        self._counts[position] = max(1, count)
+
+    def update(self, cluster_id: str, vector: Any) -> array:
+        """Move a centroid toward a new member; returns the new centroid"""
+        position = self._positions[cluster_id]
+        self._counts[position] += 1
+        row = self._centroids[position]
+        row += (np.asarray(vector, dtype=np.float32) - row) / self._counts[position]
+        return _float32(row)
+
+    def remove(self, cluster_id: str) -> None:
+        """Drop a cluster, moving the last row into its slot"""
+        position = self._positions.pop(cluster_id, None)
+        if position is None:
+            return
+        last = len(self._ids) - 1
+        if position != last:
+            moved = self._ids[last]
+            self._ids[position] = moved
+            self._counts[position] = self._counts[last]
+            self._centroids[position] = self._centroids[last]
+            self._positions[moved] = position
+        self._ids.pop()
+        self._counts.pop()
+
+
 class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
     """
     Comprehensive memory and knowledge management system for AI co-founder.
@@ -114,12 +426,23 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
     Uses PostgreSQL via asyncpg for all persistence operations.
     """
 
-    def __init__(self, db_pool: asyncpg.Pool):
+    def __init__(
+        self,
+        db_pool: asyncpg.Pool,
+        hot_set_size: int = MEMORY_HOT_SET_SIZE,
+        hot_set_max_bytes: int = MEMORY_HOT_SET_MAX_BYTES,
+        max_idle_seconds: float = MEMORY_MAX_IDLE_SECONDS,
+        max_knowledge_clusters: int = MEMORY_MAX_KNOWLEDGE_CLUSTERS,
+    ):
         """
         Initialize AI Memory System.
 
         Args:
             db_pool: asyncpg connection pool for PostgreSQL database
+            hot_set_size: Most memories held in process
+            hot_set_max_bytes: Approximate byte cap for memories held in process
+            max_idle_seconds: Unused memories are dropped from process after this long
+            max_knowledge_clusters: Most knowledge clusters held in process
         """
         self.db_pool = db_pool
         self.logger = logging.getLogger("ai_memory_system")
@@ -128,22 +451,44 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         self.embedding_model = None
         self._init_embedding_model()
 
-        # Memory caches
-        self.recent_memories: List[Memory] = []
-        self.important_memories: List[Memory] = []
+        # Memory caches (bounded; PostgreSQL is the source of truth)
+        self.hot_memories = HotMemorySet(hot_set_size, hot_set_max_bytes, max_idle_seconds)
         self.user_preferences: Dict[str, Any] = {}
-        self.knowledge_clusters: Dict[str, KnowledgeCluster] = {}
+        self.knowledge_clusters: "OrderedDict[str, KnowledgeCluster]" = OrderedDict()
 
         # Learning systems
         self.learning_patterns: Dict[str, LearningPattern] = {}
-        self.conversation_context: List[Dict[str, Any]] = []
+        self.conversation_context: Deque[Dict[str, Any]] = deque(maxlen=MAX_CONVERSATION_TURNS)
+        self.centroid_index = CentroidIndex()
+
+        # Running counts over user turns in conversation_context
+        self._word_counts: Counter = Counter()
+        self._user_turns = 0
+        self._user_questions = 0
+        self._patterns_stale = False
 
         # Configuration
-        self.max_recent_memories = 100
-        self.max_important_memories = 500
+        self.max_knowledge_clusters = max_knowledge_clusters
         self.embedding_dimension = 384
         self.similarity_threshold = 0.7
 
+        # Background pruning and pattern discovery
+        self._prune_task: Optional[asyncio.Task] = None
+        self._last_forget = time.monotonic()
+        self._last_pattern_refresh = time.monotonic()
+        self._last_query: Optional[Tuple[str, np.ndarray]] = None
+
+    @property
+    def recent_memories(self) -> List[Memory]:
+        """Memories held in process, most recently used first"""
+        return self.hot_memories.values()
+
+    @property
+    def important_memories(self) -> List[Memory]:
+        """High-importance memories held in process"""
+        high = ImportanceLevel.HIGH.value
+        return [m for m in self.hot_memories.values() if m.importance.value >= high]
+
     async def initialize(self) -> None:
         """
         Async initialization - loads memories from PostgreSQL.
@@ -151,6 +496,9 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         """
         await self._verify_tables_exist()
         await self._load_persistent_memory()
+        await self._load_learning_patterns()
+        if MEMORY_PRUNE_INTERVAL_SECONDS > 0:
+            await self.start_background_pruning()
 
     async def _verify_tables_exist(self) -> None:
         """
@@ -200,20 +548,20 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         """Load persistent memory from PostgreSQL"""
         try:
             async with self.db_pool.acquire() as conn:
-                # Load recent and important memories
+                # Warm the hot set with the most recently used memories
                 rows = await conn.fetch(
-                    """
-                    SELECT id, content, memory_type, importance, confidence, 
-                           created_at, last_accessed, access_count, tags, 
-                           related_memories, metadata, embedding
+                    f"""
+                    SELECT {_MEMORY_COLUMNS}
                     FROM memories 
                     ORDER BY last_accessed DESC 
                     LIMIT $1
                 """,
-                    self.max_recent_memories,
+                    self.hot_memories.max_entries,
                 )
 
-                self.recent_memories = [self._row_to_memory(row) for row in rows]
+                # Oldest first so the LRU order matches last_accessed
+                for row in reversed(rows):
+                    self.hot_memories.put(self._row_to_memory(row))
 
                 # Load user preferences
                 pref_rows = await conn.fetch(
@@ -223,19 +571,39 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
                 )
                 self.user_preferences = {row["key"]: json.loads(row["value"]) for row in pref_rows}
 
-                # Load knowledge clusters
+                # Load the most recently updated knowledge clusters
                 cluster_rows = await conn.fetch(
-                    """
-                    SELECT id, name, description, memories, confidence, 
-                           last_updated, importance_score, topics
+                    f"""
+                    SELECT {_CLUSTER_COLUMNS}
                     FROM knowledge_clusters
-                """
+                    ORDER BY last_updated DESC
+                    LIMIT $1
+                """,
+                    self.max_knowledge_clusters,
+                )
+                self.knowledge_clusters.clear()
+                for row in reversed(cluster_rows):
+                    cluster = self._row_to_cluster(row)
+                    self._cache_cluster(self._cluster_key_for(cluster), cluster)
+
+                # Every centroid, including clusters not held in process
+                centroid_rows = await conn.fetch(
+                    """
+                    SELECT id, centroid, member_count FROM knowledge_clusters
+                    WHERE centroid IS NOT NULL
+                    ORDER BY member_count DESC
+                    LIMIT $1
+                """,
+                    self.centroid_index.max_clusters,
                 )
-                self.knowledge_clusters = {
-                    row["id"]: self._row_to_cluster(row) for row in cluster_rows
-                }
+                for row in centroid_rows:
+                    self.centroid_index.add(
+                        str(row["id"]),
+                        np.frombuffer(row["centroid"], dtype=np.float32),
+                        row["member_count"],
+                    )
 
-                count_memories = len(self.recent_memories)
+                count_memories = len(self.hot_memories)
                 count_prefs = len(self.user_preferences)
                 self.logger.info(
                     "Loaded %d memories, %d preferences",
@@ -278,7 +646,7 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             metadata = {}
 
         return Memory(
-            id=row["id"],
+            id=memory_key(row["id"]),
             content=row["content"],
             memory_type=MemoryType(row["memory_type"]),
             importance=ImportanceLevel(row["importance"]),
@@ -300,6 +668,8 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             memories = json.loads(memories) if memories else []
         elif memories is None:
             memories = []
+        member_count = row["member_count"] or len(memories)
+        memories = [memory_key(memory_id) for memory_id in memories[-CLUSTER_MEMBER_SAMPLE:]]
 
         # Handle topics: PostgreSQL text[] returns as list
         topics = row["topics"]
@@ -309,7 +679,7 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             topics = []
 
         return KnowledgeCluster(
-            id=row["id"],
+            id=str(row["id"]),
             name=row["name"],
             description=row["description"],
             memories=memories,
@@ -317,6 +687,10 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             last_updated=row["last_updated"],
             importance_score=row["importance_score"],
             topics=topics,
+            member_count=member_count,
+            centroid=_float32(np.frombuffer(row["centroid"], dtype=np.float32))
+            if row["centroid"]
+            else None,
         )
 
     async def store_memory(  # pylint: disable=too-many-positional-arguments
@@ -337,7 +711,7 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         embedding = None
         if self.embedding_model:
             try:
-                embedding = self.embedding_model.encode([content])[0].tolist()
+                embedding = _float32(self.embedding_model.encode([content])[0])
             except Exception as e:  # pylint: disable=broad-except
                 self.logger.error("Error generating embedding: %s", e)
 
@@ -358,17 +732,8 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         # Store in database
         await self._persist_memory(memory)
 
-        # Add to caches
-        self.recent_memories.insert(0, memory)
-        if len(self.recent_memories) > self.max_recent_memories:
-            self.recent_memories.pop()
-
-        if importance.value >= ImportanceLevel.HIGH.value:
-            self.important_memories.append(memory)
-            if len(self.important_memories) > self.max_important_memories:
-                # Remove least important
-                self.important_memories.sort(key=lambda m: m.importance.value)
-                self.important_memories.pop(0)
+        # Add to the hot set (may evict older, less important memories)
+        self.hot_memories.put(memory)
 
         # Update knowledge clusters
         await self._update_knowledge_clusters(memory)
@@ -382,7 +747,8 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         try:
             embedding_bytes = None
             if memory.embedding:
-                embedding_bytes = pickle.dumps(memory.embedding)
+                # Stored as a pickled list so rows stay readable by older workers
+                embedding_bytes = pickle.dumps(memory.embedding.tolist())
 
             async with self.db_pool.acquire() as conn:
                 await conn.execute(
@@ -425,70 +791,53 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         limit: int = 10,
         min_relevance: float = 0.5,
     ) -> List[Memory]:
-        """Recall memories relevant to a query"""
+        """
+        Recall memories relevant to a query.
+
+        The hot set is searched first; when it yields fewer than ``limit``
+        matches, evicted memories are paged back in from PostgreSQL.
+        """
 
         relevant_memories = []
 
         try:
-            # Generate query embedding
-            query_embedding = None
-            if self.embedding_model:
-                query_embedding = self.embedding_model.encode([query])[0]
+            query_embedding = self._query_embedding(query)
+            query_lower = query.lower()
+            query_words = set(query_lower.split())
 
-            # Search through memories
-            search_memories = self.recent_memories + self.important_memories
+            # Search through memories held in process
+            search_memories = self.hot_memories.values()
 
             # Filter by memory type if specified
             if memory_types:
                 search_memories = [m for m in search_memories if m.memory_type in memory_types]
 
             for memory in search_memories:
-                relevance_score = 0.0
-
-                # Text-based relevance
-                query_lower = query.lower()
-                content_lower = memory.content.lower()
-
-                # Simple keyword matching
-                query_words = set(query_lower.split())
-                content_words = set(content_lower.split())
-                keyword_overlap = (
-                    len(query_words.intersection(content_words)) / len(query_words)
-                    if query_words
-                    else 0
-                )
-
-                # Embedding-based similarity
-                if query_embedding is not None and memory.embedding:
-                    try:
-                        cosine_similarity = np.dot(query_embedding, memory.embedding) / (
-                            np.linalg.norm(query_embedding) * np.linalg.norm(memory.embedding)
-                        )
-                        relevance_score = max(relevance_score, cosine_similarity)
-                    except Exception:  # pylint: disable=broad-except
-                        pass
-
-                # Combine scores
-                relevance_score = max(relevance_score, keyword_overlap)
-
-                # Tag matching bonus
-                if memory.tags and any(tag.lower() in query_lower for tag in memory.tags):
-                    relevance_score += 0.2
-
+                relevance_score = self._relevance(memory, query_lower, query_words, query_embedding)
                 if relevance_score >= min_relevance:
-                    # Update access information
-                    memory.last_accessed = datetime.now()
-                    memory.access_count += 1
-
                     relevant_memories.append((memory, relevance_score))
 
+            if len(relevant_memories) < limit:
+                for memory in await self._fetch_candidates(query_words, memory_types, limit):
+                    relevance_score = self._relevance(
+                        memory, query_lower, query_words, query_embedding
+                    )
+                    if relevance_score >= min_relevance:
+                        relevant_memories.append((memory, relevance_score))
+                        self.hot_memories.put(memory)
+                        self.hot_memories.stats["page_ins"] += 1
+                        MEMORY_PAGE_INS.inc()
+
             # Sort by relevance and return top results
             relevant_memories.sort(key=lambda x: x[1], reverse=True)
             result = [memory for memory, _ in relevant_memories[:limit]]
 
-            # Update access counts in database
+            # Update access information, in process and in the database
             for memory in result:
-                await self._update_memory_access(memory)
+                memory.last_accessed = datetime.now()
+                memory.access_count += 1
+                self.hot_memories.touch(memory)
+            await self._update_memory_access(result)
 
             return result
 
@@ -496,19 +845,131 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             self.logger.error("Error recalling memories: %s", e)
             return []
 
-    async def _update_memory_access(self, memory: Memory) -> None:
-        """Update memory access information in PostgreSQL"""
+    def _query_embedding(self, query: str) -> Optional[np.ndarray]:
+        """Embed a query, reusing the last result (recall and cluster lookup share it)"""
+        if not self.embedding_model:
+            return None
+        if self._last_query is not None and self._last_query[0] == query:
+            return self._last_query[1]
+        embedding = np.asarray(self.embedding_model.encode([query])[0], dtype=np.float32)
+        self._last_query = (query, embedding)
+        return embedding
+
+    @staticmethod
+    def _relevance(
+        memory: Memory,
+        query_lower: str,
+        query_words: set,
+        query_embedding: Optional[np.ndarray],
+    ) -> float:
+        """Score a memory against a query (keyword overlap, embedding similarity, tags)"""
+        relevance_score = 0.0
+
+        # Simple keyword matching
+        content_words = set(memory.content.lower().split())
+        keyword_overlap = (
+            len(query_words.intersection(content_words)) / len(query_words) if query_words else 0
+        )
+
+        # Embedding-based similarity
+        if query_embedding is not None and memory.embedding:
+            try:
+                embedding = np.frombuffer(memory.embedding, dtype=np.float32)
+                cosine_similarity = np.dot(query_embedding, embedding) / (
+                    np.linalg.norm(query_embedding) * np.linalg.norm(embedding)
+                )
+                relevance_score = max(relevance_score, float(cosine_similarity))
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+        # Combine scores
+        relevance_score = max(relevance_score, keyword_overlap)
+
+        # Tag matching bonus
+        if memory.tags and any(tag.lower() in query_lower for tag in memory.tags):
+            relevance_score += 0.2
+
+        return relevance_score
+
+    async def _fetch_candidates(
+        self,
+        query_words: set,
+        memory_types: Optional[List[MemoryType]],
+        limit: int,
+    ) -> List[Memory]:
+        """
+        Load memories that are not in the hot set and mention a query word or tag.
+
+        Embeddings are not indexed in PostgreSQL, so candidates are prefiltered
+        by keyword and scored in process like hot memories.
+        """
+        words = sorted({re.sub(r"[^\w-]", "", word) for word in query_words} - {""})
+        words = [word for word in words if len(word) >= 3]
+        if not words:
+            return []
+
+        patterns = ["%" + word.replace("_", "\\_") + "%" for word in words]
+        types = [t.value for t in memory_types] if memory_types else None
         try:
             async with self.db_pool.acquire() as conn:
-                await conn.execute(
+                rows = await conn.fetch(
+                    f"""
+                    SELECT {_MEMORY_COLUMNS}
+                    FROM memories
+                    WHERE NOT (id = ANY($1::uuid[]))
+                    AND ($2::text[] IS NULL OR memory_type = ANY($2::text[]))
+                    AND (content ILIKE ANY($3::text[]) OR tags && $4::text[])
+                    ORDER BY importance DESC, last_accessed DESC
+                    LIMIT $5
+                """,
+                    self.hot_memories.keys(),
+                    types,
+                    patterns,
+                    words,
+                    limit * 3,
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("Error paging in memories: %s", e)
+            return []
+        return [self._row_to_memory(row) for row in rows]
+
+    async def get_memory(self, memory_id: str) -> Optional[Memory]:
+        """Get one memory by id, paging it in from PostgreSQL if it was evicted"""
+        memory = self.hot_memories.get(memory_id)
+        if memory is not None:
+            return memory
+
+        try:
+            async with self.db_pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = $1::uuid",
+                    memory_key(memory_id),
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("Error loading memory %s: %s", memory_id, e)
+            return None
+
+        if row is None:
+            return None
+        memory = self._row_to_memory(row)
+        self.hot_memories.put(memory)
+        self.hot_memories.stats["page_ins"] += 1
+        MEMORY_PAGE_INS.inc()
+        return memory
+
+    async def _update_memory_access(self, memories: List[Memory]) -> None:
+        """Update access information for recalled memories in PostgreSQL"""
+        if not memories:
+            return
+        try:
+            async with self.db_pool.acquire() as conn:
+                await conn.executemany(
                     """
                     UPDATE memories 
                     SET last_accessed = $1, access_count = $2
                     WHERE id = $3::uuid
                 """,
-                    memory.last_accessed,
-                    memory.access_count,
-                    memory.id,
+                    [(m.last_accessed, m.access_count, m.id) for m in memories],
                 )
         except Exception as e:  # pylint: disable=broad-except
             self.logger.error("Error updating memory access: %s", e)
@@ -567,11 +1028,12 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             "context": context or {},
         }
 
+        # Bounded deque keeps only the recent conversation history; keep the
+        # running counts in step with the turn that falls out of the window
+        if len(self.conversation_context) == self.conversation_context.maxlen:
+            self._count_turn(self.conversation_context[0], -1)
         self.conversation_context.append(conversation_memory)
-
-        # Keep only recent conversation history
-        if len(self.conversation_context) > 50:
-            self.conversation_context = self.conversation_context[-50:]
+        self._count_turn(conversation_memory, 1)
 
         # Store important conversations as memories
         if len(content) > 50:  # Only store substantial messages
@@ -592,73 +1054,140 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
 
     async def get_conversation_context(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent conversation context"""
-        return self.conversation_context[-limit:] if limit else self.conversation_context
+        turns = list(self.conversation_context)
+        return turns[-limit:] if limit else turns
+
+    def _count_turn(self, turn: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a turn from the running pattern counts"""
+        if turn["role"] != "user":
+            return
+        self._user_turns += sign
+        if "?" in turn["content"]:
+            self._user_questions += sign
+        for word in self._meaningful_words(turn["content"]):
+            count = self._word_counts[word] + sign
+            if count > 0:
+                self._word_counts[word] = count
+            else:
+                del self._word_counts[word]
+        self._patterns_stale = True
+
+    def _recent_user_turns(self, limit: int, questions_only: bool = False) -> List[str]:
+        """Content of the last few user turns, oldest first"""
+        found = []
+        for turn in reversed(self.conversation_context):
+            if turn["role"] == "user" and (not questions_only or "?" in turn["content"]):
+                found.append(turn["content"])
+                if len(found) == limit:
+                    break
+        return found[::-1]
 
     async def identify_learning_patterns(self) -> List[LearningPattern]:
-        """Identify patterns in user behavior and preferences"""
+        """
+        Identify patterns in user behavior and preferences.
+
+        Reads the running counts kept by store_conversation_turn() instead of
+        rescanning the conversation, then stores the results.
+        """
 
         patterns = []
 
         try:
-            # Analyze conversation patterns
-            user_messages = [turn for turn in self.conversation_context if turn["role"] == "user"]
-
-            if len(user_messages) >= 5:
+            if self._user_turns >= 5:
                 # Common topics pattern
-                all_content = " ".join([msg["content"].lower() for msg in user_messages])
-                common_words = self._extract_common_words(all_content)
+                common_words = [
+                    word for word, count in self._word_counts.most_common() if count >= 2
+                ]
 
                 if common_words:
                     pattern = LearningPattern(
-                        pattern_id="common_topics",
+                        pattern_id=learning_pattern_id("common_topics"),
                         pattern_type="preference",
                         description=f"User frequently discusses: {', '.join(common_words[:5])}",
                         frequency=len(common_words),
                         confidence=0.8,
-                        examples=[msg["content"][:100] for msg in user_messages[-3:]],
+                        examples=[content[:100] for content in self._recent_user_turns(3)],
                         discovered_at=datetime.now(),
                     )
                     patterns.append(pattern)
 
                 # Question pattern analysis
-                questions = [msg for msg in user_messages if "?" in msg["content"]]
-                if len(questions) >= 3:
-                    desc = f"User asks {len(questions)} questions, " "prefers detailed explanations"
+                if self._user_questions >= 3:
+                    desc = (
+                        f"User asks {self._user_questions} questions, "
+                        "prefers detailed explanations"
+                    )
                     pattern = LearningPattern(
-                        pattern_id="question_pattern",
+                        pattern_id=learning_pattern_id("question_pattern"),
                         pattern_type="workflow",
                         description=desc,
-                        frequency=len(questions),
+                        frequency=self._user_questions,
                         confidence=0.7,
-                        examples=[q["content"] for q in questions[-3:]],
+                        examples=self._recent_user_turns(3, questions_only=True),
                         discovered_at=datetime.now(),
                     )
                     patterns.append(pattern)
 
-            # Store patterns
+            # Store patterns, keeping when each was first discovered
             for pattern in patterns:
+                known = self.learning_patterns.get(pattern.pattern_id)
+                if known is not None:
+                    pattern.discovered_at = known.discovered_at
+                self.learning_patterns[pattern.pattern_id] = pattern
                 await self._store_learning_pattern(pattern)
+            self._patterns_stale = False
 
         except Exception as e:  # pylint: disable=broad-except
             self.logger.error("Error identifying learning patterns: %s", e)
 
         return patterns
 
-    def _extract_common_words(self, text: str, min_length: int = 4) -> List[str]:
-        """Extract common meaningful words from text"""
-        # Simple word frequency analysis
-        words = text.split()
-        word_counts = {}
-
-        # Filter and count words
-        for word in words:
+    async def refresh_learning_patterns(self) -> List[LearningPattern]:
+        """Re-run pattern discovery if any conversation turn arrived since the last run"""
+        self._last_pattern_refresh = time.monotonic()
+        if not self._patterns_stale:
+            return list(self.learning_patterns.values())
+        return await self.identify_learning_patterns()
+
+    @staticmethod
+    def _meaningful_words(text: str, min_length: int = 4) -> List[str]:
+        """Lowercased alphabetic words of at least min_length characters"""
+        words = []
+        for word in text.split():
             word = word.strip('.,!?":()[]{}').lower()
             if len(word) >= min_length and word.isalpha():
-                word_counts[word] = word_counts.get(word, 0) + 1
+                words.append(word)
+        return words
 
-        # Return top words
-        sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, count in sorted_words if count >= 2]
+    async def _load_learning_patterns(self) -> None:
+        """Load previously discovered patterns from PostgreSQL"""
+        pattern_ids = [learning_pattern_id(name) for name in ("common_topics", "question_pattern")]
+        try:
+            async with self.db_pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT pattern_id, pattern_type, description, frequency,
+                           confidence, examples, discovered_at
+                    FROM learning_patterns
+                    WHERE pattern_id = ANY($1::uuid[])
+                """,
+                    pattern_ids,
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning("Could not load learning patterns: %s", e)
+            return
+
+        for row in rows:
+            pattern = LearningPattern(
+                pattern_id=str(row["pattern_id"]),
+                pattern_type=row["pattern_type"],
+                description=row["description"],
+                frequency=row["frequency"],
+                confidence=row["confidence"],
+                examples=list(row["examples"] or []),
+                discovered_at=row["discovered_at"],
+            )
+            self.learning_patterns[pattern.pattern_id] = pattern
 
     async def _store_learning_pattern(self, pattern: LearningPattern) -> None:
         """Store learning pattern in PostgreSQL database"""
@@ -688,39 +1217,130 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
             raise
 
     async def _update_knowledge_clusters(self, memory: Memory):
-        """Update knowledge clusters with new memory"""
-
-        # Simple clustering based on memory type and tags
-        cluster_key = f"{memory.memory_type.value}_{'-'.join(memory.tags or ['general'])}"
+        """
+        Add a new memory to its knowledge cluster.
 
-        if cluster_key in self.knowledge_clusters:
-            cluster = self.knowledge_clusters[cluster_key]
-            if memory.id not in cluster.memories:
-                cluster.memories.append(memory.id)
-            cluster.last_updated = datetime.now()
-            cluster.importance_score = self._calculate_cluster_importance(cluster)
+        Memories with embeddings join the nearest centroid when it is similar
+        enough (or the index is full), otherwise they open a new cluster; that
+        is one O(k) lookup plus an O(d) centroid update. Without embeddings,
+        clusters are keyed by memory type and tags.
+        """
+        if memory.embedding:
+            cluster_key, cluster = await self._nearest_cluster(memory)
         else:
-            # Create new cluster with UUID
-            cluster_id = str(uuid4())
-            cluster = KnowledgeCluster(
-                id=cluster_id,
-                name=f"{memory.memory_type.value.replace('_', ' ').title()} Knowledge",
-                description=f"Knowledge cluster for {memory.memory_type.value}",
-                memories=[memory.id],
-                confidence=memory.confidence,
-                last_updated=datetime.now(),
-                importance_score=memory.importance.value,
-                topics=memory.tags if memory.tags else [],
-            )
-            self.knowledge_clusters[cluster_key] = cluster
+            cluster_key = self._cluster_key(memory.memory_type.value, memory.tags)
+            cluster = self.knowledge_clusters.get(cluster_key)
+            if cluster is None:
+                cluster = await self._fetch_cluster(
+                    "description = $1 AND topics IS NOT DISTINCT FROM $2::text[]",
+                    f"{_CLUSTER_DESCRIPTION}{memory.memory_type.value}",
+                    memory.tags if memory.tags else None,
+                )
+
+        if cluster is not None:
+            self._add_cluster_member(cluster, memory)
+            self._cache_cluster(cluster_key, cluster)
+            await self._append_cluster_member(cluster, memory.id)
+            return
+
+        # Create new cluster with UUID
+        cluster = KnowledgeCluster(
+            id=str(uuid4()),
+            name=f"{memory.memory_type.value.replace('_', ' ').title()} Knowledge",
+            description=f"{_CLUSTER_DESCRIPTION}{memory.memory_type.value}",
+            memories=[memory.id],
+            confidence=memory.confidence,
+            last_updated=datetime.now(),
+            importance_score=memory.importance.value,
+            topics=list(memory.tags) if memory.tags else [],
+            member_count=1,
+            centroid=_float32(memory.embedding) if memory.embedding else None,
+        )
+        if cluster.centroid is not None:
+            cluster_key = cluster.id
+            self.centroid_index.add(cluster.id, cluster.centroid)
+        self._cache_cluster(cluster_key, cluster)
 
         # Persist cluster
         await self._persist_knowledge_cluster(cluster)
 
+    async def _nearest_cluster(self, memory: Memory) -> Tuple[str, Optional[KnowledgeCluster]]:
+        """Cluster a new memory should join (None opens a new one), moving its centroid"""
+        matches = self.centroid_index.nearest(memory.embedding)
+        if not matches:
+            return "", None
+        cluster_id, similarity = matches[0]
+        if similarity < self.similarity_threshold and not self.centroid_index.full:
+            return "", None
+
+        cluster = self.knowledge_clusters.get(cluster_id)
+        if cluster is None:
+            cluster = await self._fetch_cluster("id = $1::uuid", cluster_id)
+            if cluster is None:
+                # Deleted (or never stored); let the memory start a fresh cluster
+                self.centroid_index.remove(cluster_id)
+                return "", None
+        cluster.centroid = self.centroid_index.update(cluster_id, memory.embedding)
+        return cluster_id, cluster
+
+    def _add_cluster_member(self, cluster: KnowledgeCluster, memory: Memory) -> None:
+        """Record a new member on the in-process cluster (bounded id and topic lists)"""
+        if memory.id not in cluster.memories:
+            cluster.memories.append(memory.id)
+            del cluster.memories[:-CLUSTER_MEMBER_SAMPLE]
+            cluster.member_count += 1
+        if cluster.centroid is not None:
+            # Tag-keyed clusters are looked up by their topics; only centroid clusters grow them
+            cluster.topics = cluster.topics or []
+            for tag in memory.tags or []:
+                if tag not in cluster.topics:
+                    cluster.topics.append(tag)
+            del cluster.topics[:-CLUSTER_MAX_TOPICS]
+        cluster.last_updated = datetime.now()
+        cluster.importance_score = self._calculate_cluster_importance(cluster)
+
+    @staticmethod
+    def _cluster_key(memory_type: str, tags: Optional[List[str]]) -> str:
+        return f"{memory_type}_{'-'.join(tags or ['general'])}"
+
+    def _cluster_key_for(self, cluster: KnowledgeCluster) -> str:
+        if cluster.centroid is not None:
+            return cluster.id
+        memory_type = cluster.description
+        if memory_type.startswith(_CLUSTER_DESCRIPTION):
+            memory_type = memory_type[len(_CLUSTER_DESCRIPTION) :]
+        return self._cluster_key(memory_type, cluster.topics)
+
+    def _cache_cluster(self, cluster_key: str, cluster: KnowledgeCluster) -> None:
+        """Keep a cluster as most recently used, dropping the oldest past the cap"""
+        self.knowledge_clusters[cluster_key] = cluster
+        self.knowledge_clusters.move_to_end(cluster_key)
+        while len(self.knowledge_clusters) > max(1, self.max_knowledge_clusters):
+            self.knowledge_clusters.popitem(last=False)
+
+    async def _fetch_cluster(self, condition: str, *args: Any) -> Optional[KnowledgeCluster]:
+        """Page in one stored knowledge cluster matching a WHERE condition"""
+        try:
+            async with self.db_pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    f"""
+                    SELECT {_CLUSTER_COLUMNS}
+                    FROM knowledge_clusters
+                    WHERE {condition}
+                    ORDER BY last_updated DESC
+                    LIMIT 1
+                """,
+                    *args,
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("Error loading knowledge cluster: %s", e)
+            return None
+        return self._row_to_cluster(row) if row else None
+
     def _calculate_cluster_importance(self, cluster: KnowledgeCluster) -> float:
         """Calculate importance score for a knowledge cluster"""
         # Simple importance calculation based on memory count and recency
-        base_score = len(cluster.memories) * 0.1
+        base_score = cluster.member_count * 0.1
         recency_bonus = 1.0 if (datetime.now() - cluster.last_updated).days < 7 else 0.5
         return min(5.0, base_score + recency_bonus)
 
@@ -732,13 +1352,15 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
                     """
                     INSERT INTO knowledge_clusters
                     (id, name, description, memories, confidence,
-                     last_updated, importance_score, topics)
-                    VALUES ($1::uuid, $2, $3, $4, $5, $6, $7, $8)
+                     last_updated, importance_score, topics, centroid, member_count)
+                    VALUES ($1::uuid, $2, $3, $4, $5, $6, $7, $8, $9, $10)
                     ON CONFLICT (id) DO UPDATE SET
                         memories = $4,
                         confidence = $5,
                         last_updated = $6,
-                        importance_score = $7
+                        importance_score = $7,
+                        centroid = $9,
+                        member_count = $10
                 """,
                     cluster.id,
                     cluster.name,
@@ -748,15 +1370,50 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
                     cluster.last_updated,
                     cluster.importance_score,
                     cluster.topics if cluster.topics else None,  # Pass list directly
+                    cluster.centroid.tobytes() if cluster.centroid is not None else None,
+                    cluster.member_count,
                 )
         except Exception as e:
             self.logger.error("Error persisting knowledge cluster: %s", e)
             raise
 
+    async def _append_cluster_member(self, cluster: KnowledgeCluster, memory_id: str) -> None:
+        """Append one member to a stored cluster without rewriting its member list"""
+        try:
+            async with self.db_pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE knowledge_clusters SET
+                        memories = array_append(COALESCE(memories, '{}'::uuid[]), $2::uuid),
+                        last_updated = $3,
+                        importance_score = $4,
+                        topics = $5,
+                        centroid = $6,
+                        member_count = $7
+                    WHERE id = $1::uuid
+                """,
+                    cluster.id,
+                    memory_id,
+                    cluster.last_updated,
+                    cluster.importance_score,
+                    cluster.topics if cluster.topics else None,
+                    cluster.centroid.tobytes() if cluster.centroid is not None else None,
+                    cluster.member_count,
+                )
+        except Exception as e:
+            self.logger.error("Error updating knowledge cluster: %s", e)
+            raise
+
     async def get_contextual_knowledge(
         self, query: str, context_type: str = "general"
     ) -> Dict[str, Any]:
-        """Get contextual knowledge relevant to current situation"""
+        """
+        Get contextual knowledge relevant to current situation.
+
+        Clusters come from the centroid index (plus a topic match over the
+        clusters held in process) and learning patterns from the last
+        background discovery run; nothing is rescanned here.
+        """
 
         # Recall relevant memories
         relevant_memories = await self.recall_memories(query, limit=15)
@@ -768,22 +1425,44 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
         conversation_context = await self.get_conversation_context(limit=5)
 
         # Get relevant knowledge clusters
-        relevant_clusters = []
-        for cluster in self.knowledge_clusters.values():
-            if any(topic and topic.lower() in query.lower() for topic in (cluster.topics or [])):
-                relevant_clusters.append(cluster)
+        relevant_clusters = await self._relevant_clusters(query)
 
         return {
-            "relevant_memories": [asdict(memory) for memory in relevant_memories],
+            "relevant_memories": [memory.to_dict() for memory in relevant_memories],
             "user_preferences": preferences,
             "conversation_context": conversation_context,
-            "knowledge_clusters": [asdict(cluster) for cluster in relevant_clusters],
+            "knowledge_clusters": [cluster.to_dict() for cluster in relevant_clusters],
+            "learning_patterns": [asdict(pattern) for pattern in self.learning_patterns.values()],
             "context_type": context_type,
             "generated_at": datetime.now().isoformat(),
         }
 
-    async def forget_outdated_memories(self, days_threshold: int = 90) -> None:
-        """Forget or archive old, low-importance memories from PostgreSQL"""
+    async def _relevant_clusters(self, query: str, limit: int = 3) -> List[KnowledgeCluster]:
+        """Nearest centroid clusters for the query, then topic matches held in process"""
+        clusters: Dict[str, KnowledgeCluster] = {}
+
+        query_embedding = self._query_embedding(query)
+        if query_embedding is not None:
+            for cluster_id, similarity in self.centroid_index.nearest(query_embedding, limit):
+                if similarity < self.similarity_threshold:
+                    break
+                cluster = self.knowledge_clusters.get(cluster_id)
+                if cluster is None:
+                    cluster = await self._fetch_cluster("id = $1::uuid", cluster_id)
+                    if cluster is None:
+                        continue
+                    self._cache_cluster(cluster_id, cluster)
+                clusters[cluster.id] = cluster
+
+        query_lower = query.lower()
+        for cluster in self.knowledge_clusters.values():
+            if any(topic and topic.lower() in query_lower for topic in (cluster.topics or [])):
+                clusters.setdefault(cluster.id, cluster)
+
+        return list(clusters.values())
+
+    async def forget_outdated_memories(self, days_threshold: int = 90) -> int:
+        """Forget old, low-importance memories from PostgreSQL; returns how many"""
         try:
             cutoff_date = datetime.now() - timedelta(days=days_threshold)
 
@@ -813,14 +1492,11 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
                     )
 
                     # Remove from cache
-                    self.recent_memories = [
-                        m for m in self.recent_memories if m.id not in memory_ids
-                    ]
-                    self.important_memories = [
-                        m for m in self.important_memories if m.id not in memory_ids
-                    ]
+                    self.hot_memories.discard(memory_ids)
 
                     self.logger.info("Forgot %s outdated memories", len(memory_ids))
+                    return len(memory_ids)
+                return 0
         except Exception as e:
             self.logger.error("Error forgetting outdated memories: %s", e)
             raise
@@ -849,16 +1525,89 @@ class AIMemorySystem:  # pylint: disable=too-many-instance-attributes
                 "total_preferences": total_preferences,
                 "total_knowledge_clusters": total_clusters,
                 "total_learning_patterns": total_patterns,
-                "recent_memories_count": len(self.recent_memories),
+                "recent_memories_count": len(self.hot_memories),
                 "important_memories_count": len(self.important_memories),
                 "conversation_turns": len(self.conversation_context),
                 "embedding_model_active": self.embedding_model is not None,
+                "cache": self.get_memory_stats(),
                 "last_updated": datetime.now().isoformat(),
             }
         except Exception as e:
             self.logger.error("Error getting memory summary: %s", e)
             raise
 
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """In-process footprint and hot-set counters (no database access)"""
+        return {
+            "hot_memories": len(self.hot_memories),
+            "hot_memory_bytes": self.hot_memories.bytes,
+            "max_hot_memories": self.hot_memories.max_entries,
+            "max_hot_memory_bytes": self.hot_memories.max_bytes,
+            **self.hot_memories.stats,
+            "knowledge_clusters": len(self.knowledge_clusters),
+            "cluster_centroids": len(self.centroid_index),
+            "learning_patterns": len(self.learning_patterns),
+            "conversation_turns": len(self.conversation_context),
+            "background_pruning": self._prune_task is not None and not self._prune_task.done(),
+        }
+
+    async def prune(self) -> Dict[str, int]:
+        """
+        Drop idle memories from process and, when due, forget outdated ones.
+
+        Runs on a schedule once start_background_pruning() is called; safe to
+        call by hand.
+        """
+        expired = self.hot_memories.expire()
+        forgotten = 0
+        if (
+            MEMORY_FORGET_INTERVAL_SECONDS > 0
+            and time.monotonic() - self._last_forget >= MEMORY_FORGET_INTERVAL_SECONDS
+        ):
+            self._last_forget = time.monotonic()
+            forgotten = await self.forget_outdated_memories()
+        if expired:
+            self.logger.info(
+                "Pruned %d idle memories (%d held, ~%d bytes)",
+                expired,
+                len(self.hot_memories),
+                self.hot_memories.bytes,
+            )
+        return {"expired": expired, "forgotten": forgotten}
+
+    async def start_background_pruning(
+        self, interval: float = MEMORY_PRUNE_INTERVAL_SECONDS
+    ) -> None:
+        """Start pruning and pattern discovery on a schedule (no-op if already running)"""
+        if self._prune_task is not None and not self._prune_task.done():
+            return
+        self._prune_task = asyncio.create_task(self._prune_loop(interval))
+        self.logger.info("Memory pruning scheduled every %ss", interval)
+
+    async def stop_background_pruning(self) -> None:
+        """Stop the pruning task"""
+        task, self._prune_task = self._prune_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _prune_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.prune()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error("Error pruning memories: %s", e)
+            if (
+                MEMORY_PATTERN_INTERVAL_SECONDS > 0
+                and time.monotonic() - self._last_pattern_refresh >= MEMORY_PATTERN_INTERVAL_SECONDS
+            ):
+                await self.refresh_learning_patterns()
+
 
 # Example usage (requires database service with connection pool)
 async def main(db_pool: asyncpg.Pool):
@@ -0,0 +1,70 @@
+"""
+Request Metrics Middleware
+
+Records per-route request latency into the in-process metrics registry
+(services.metrics_service) as http_request_duration_seconds.
+
+Implemented as a pure ASGI middleware rather than BaseHTTPMiddleware: it
+adds no extra task or response wrapping per request, only two perf_counter()
+calls and one histogram observation.
+
+It also records http_request_logging_seconds: the event-loop time spent in
+the logging handler while serving each request (services.logger_config).
+
+Requests are labelled with the route template (/api/tasks/{task_id}), never
+the raw path, so label cardinality stays bounded. Unmatched paths (404s,
+scanners) are grouped under "unmatched", and methods outside the standard
+HTTP set (the method is client-supplied) are grouped under "OTHER".
+"""
+
+import time
+
+from services.logger_config import start_request_log_timer
+from services.metrics_service import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_LOGGING,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request"""
+
+    # Scrapes of the metrics endpoint itself would dominate the distribution
+    SKIP_PATHS = {"/api/metrics/prometheus"}
+    KNOWN_METHODS = frozenset(
+        {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"}
+    )
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        log_time = start_request_log_timer()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            if method not in self.KNOWN_METHODS:
+                method = "OTHER"
+            HTTP_REQUEST_DURATION.labels(method, template, status_code).observe(elapsed)
+            HTTP_REQUEST_LOGGING.labels(template).observe(log_time[0])
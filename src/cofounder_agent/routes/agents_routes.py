@@ -384,12 +384,19 @@ async def get_memory_stats(orchestrator=Depends(get_orchestrator)):
                 "last_access": None,
             }
 
+        # In-process footprint of the shared memory system's hot set
+        stats = {}
+        if hasattr(memory_system, "get_memory_stats"):
+            stats = memory_system.get_memory_stats()
+        hot_memories = stats.get("hot_memories", 0)
+        usage_bytes = stats.get("hot_memory_bytes", 0)
+
         return MemoryStats(
-            total_memories=0,
-            short_term_count=0,
+            total_memories=hot_memories,
+            short_term_count=hot_memories,
             long_term_count=0,
-            memory_usage_bytes=0,
-            memory_usage_mb=0.0,
+            memory_usage_bytes=usage_bytes,
+            memory_usage_mb=round(usage_bytes / (1024 * 1024), 2),
             by_agent=by_agent,
         )
     except Exception as e:
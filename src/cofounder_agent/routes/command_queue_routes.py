@@ -17,6 +17,7 @@ from pydantic import BaseModel
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from schemas.command_schemas import (
+    CommandBatchResponse,
     CommandErrorRequest,
     CommandListResponse,
     CommandRequest,
@@ -25,6 +26,7 @@ from schemas.command_schemas import (
 )
 from services.command_queue import (
     CommandStatus,
+    StaleCommandError,
     create_command,
     get_command_queue,
 )
@@ -114,12 +116,9 @@ async def list_commands(
                 detail=f"Invalid status. Must be one of: {', '.join([s.value for s in CommandStatus])}",
             )
 
-    # Get commands
-    commands = await queue.list_commands(status=status_filter)
-
-    # Apply pagination
-    total = len(commands)
-    commands = commands[skip : skip + limit]
+    # Get one page; pagination happens in the backend
+    commands = await queue.list_commands(status=status_filter, limit=limit, offset=skip)
+    total = await queue.count_commands(status=status_filter)
 
     return {
         "commands": [cmd.to_dict() for cmd in commands],
@@ -128,6 +127,46 @@ async def list_commands(
     }
 
 
+@router.post("/dequeue", response_model=CommandBatchResponse)
+async def dequeue_commands(
+    consumer: str = Query(..., min_length=1, description="Consumer name recorded on the lease"),
+    agent_type: Optional[List[str]] = Query(None, description="Consumer group: agent types to receive"),
+    max_count: int = Query(10, ge=1, le=100),
+    wait_seconds: float = Query(0, ge=0, le=30, description="Long-poll duration when idle"),
+    visibility_timeout: Optional[float] = Query(None, ge=1, le=3600),
+) -> Dict[str, Any]:
+    """
+    Lease a batch of commands for an agent worker
+
+    Leased commands must be completed or failed before the visibility timeout
+    expires, otherwise they are redelivered to another consumer.
+
+    Args:
+        consumer: Consumer name
+        agent_type: Only receive commands for these agent types
+        max_count: Maximum commands to lease
+        wait_seconds: How long to wait for work if none is available
+        visibility_timeout: Lease duration override in seconds
+
+    Returns:
+        Leased commands
+    """
+    queue = get_command_queue()
+    commands = await queue.dequeue_batch(
+        max_count=max_count,
+        timeout=wait_seconds,
+        consumer=consumer,
+        agent_types=agent_type,
+        visibility_timeout=visibility_timeout,
+    )
+
+    return {
+        "commands": [cmd.to_dict() for cmd in commands],
+        "consumer": consumer,
+        "visibility_timeout": visibility_timeout or queue.visibility_timeout,
+    }
+
+
 @router.post("/{command_id}/complete", response_model=CommandResponse)
 async def complete_command(command_id: str, request: CommandResultRequest) -> Dict[str, Any]:
     """
@@ -137,13 +176,16 @@ async def complete_command(command_id: str, request: CommandResultRequest) -> Di
 
     Args:
         command_id: Command ID
-        request: Completion result
+        request: Completion result and the consumer holding the lease
 
     Returns:
         Updated command
     """
     queue = get_command_queue()
-    cmd = await queue.complete_command(command_id, request.result)
+    try:
+        cmd = await queue.complete_command(command_id, request.result, consumer=request.consumer)
+    except StaleCommandError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
     if not cmd:
         raise HTTPException(status_code=404, detail=f"Command not found: {command_id}")
@@ -162,13 +204,18 @@ async def fail_command(command_id: str, request: CommandErrorRequest) -> Dict[st
 
     Args:
         command_id: Command ID
-        request: Error details and retry flag
+        request: Error details, retry flag and the consumer holding the lease
 
     Returns:
         Updated command
     """
     queue = get_command_queue()
-    cmd = await queue.fail_command(command_id, request.error, retry=request.retry)
+    try:
+        cmd = await queue.fail_command(
+            command_id, request.error, retry=request.retry, consumer=request.consumer
+        )
+    except StaleCommandError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
     if not cmd:
         raise HTTPException(status_code=404, detail=f"Command not found: {command_id}")
@@ -190,7 +237,10 @@ async def cancel_command(command_id: str) -> Dict[str, Any]:
         Updated command
     """
     queue = get_command_queue()
-    cmd = await queue.cancel_command(command_id)
+    try:
+        cmd = await queue.cancel_command(command_id)
+    except StaleCommandError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
     if not cmd:
         raise HTTPException(status_code=404, detail=f"Command not found: {command_id}")
@@ -200,16 +250,45 @@ async def cancel_command(command_id: str) -> Dict[str, Any]:
     return cmd.to_dict()
 
 
+@router.post("/{command_id}/replay", response_model=CommandResponse)
+async def replay_command(command_id: str) -> Dict[str, Any]:
+    """
+    Requeue a dead-lettered or failed command
+
+    Args:
+        command_id: Command ID
+
+    Returns:
+        Updated command
+    """
+    queue = get_command_queue()
+    try:
+        cmd = await queue.replay_command(command_id)
+    except StaleCommandError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if not cmd:
+        raise HTTPException(status_code=404, detail=f"Command not found: {command_id}")
+
+    if cmd.status != CommandStatus.PENDING:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Only failed or dead-lettered commands can be replayed (status: {cmd.status.value})",
+        )
+
+    return cmd.to_dict()
+
+
 @router.get("/stats/queue-stats", response_model=Dict[str, Any])
 async def get_queue_stats() -> Dict[str, Any]:
     """
     Get command queue statistics
 
     Returns:
-        Queue stats (total, pending, by status)
+        Queue stats (backlog depth, in-flight, dead-letter, throughput, by status)
     """
     queue = get_command_queue()
-    return queue.get_stats()
+    return await queue.get_stats()
 
 
 @router.post("/cleanup/clear-old")
@@ -224,6 +303,6 @@ async def clear_old_commands(max_age_hours: int = Query(24, ge=1, le=720)) -> Di
         Success message
     """
     queue = get_command_queue()
-    await queue.clear_old_commands(max_age_hours=max_age_hours)
+    deleted = await queue.clear_old_commands(max_age_hours=max_age_hours)
 
-    return {"message": f"Old commands (>{max_age_hours}h) cleared"}
+    return {"message": f"Old commands (>{max_age_hours}h) cleared: {deleted}"}
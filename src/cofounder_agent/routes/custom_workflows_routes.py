@@ -296,23 +296,29 @@ async def execute_custom_workflow(
     quality_threshold: Optional[float] = Query(
         None, ge=0.0, le=1.0, description="Override quality threshold"
     ),
+    resume_execution_id: Optional[str] = Query(
+        None, description="Resume this execution from its last checkpoint"
+    ),
 ) -> WorkflowExecutionResponse:
     """
     Execute a saved custom workflow.
 
-    Loads the workflow definition and starts background execution.
+    Loads the workflow definition and starts background execution. With
+    resume_execution_id, a previous execution of this workflow owned by the
+    caller continues from its last checkpoint instead of starting over.
 
     Args:
         workflow_id: Workflow UUID to execute
         request_body: Input data for workflow execution
         skip_phases: Optional phases to skip
         quality_threshold: Optional quality threshold override
+        resume_execution_id: Optional execution ID to resume
 
     Returns:
         Execution response with workflow_id and tracking info
 
     Raises:
-        404: Workflow not found
+        404: Workflow or resumable execution not found
         400: Invalid input
     """
     try:
@@ -323,6 +329,14 @@ async def execute_custom_workflow(
         if not workflow:
             raise HTTPException(status_code=404, detail=f"Workflow '{workflow_id}' not found")
 
+        if resume_execution_id and not await service.load_execution_checkpoint(
+            resume_execution_id, owner_id, workflow_id
+        ):
+            raise HTTPException(
+                status_code=404,
+                detail=f"No resumable execution '{resume_execution_id}' for workflow '{workflow_id}'",
+            )
+
         # Execute workflow using the adapter
         from services.workflow_execution_adapter import execute_custom_workflow
         
@@ -339,7 +353,8 @@ async def execute_custom_workflow(
             custom_workflow=workflow,
             input_data=input_data,
             database_service=database_service,
-            queue_async=True  # Execute in background
+            queue_async=True,  # Execute in background
+            resume_execution_id=resume_execution_id,
         )
         
         logger.info(f"Workflow execution started: {result['execution_id']}")
@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
 from routes.auth_unified import get_current_user
@@ -24,6 +25,7 @@ from schemas.metrics_schemas import (
 )
 from services.cost_aggregation_service import CostAggregationService
 from services.database_service import DatabaseService
+from services.metrics_service import get_metrics_registry
 from services.usage_tracker import get_usage_tracker
 from utils.route_utils import get_database_dependency
 
@@ -456,6 +458,59 @@ async def track_usage(
 # ============================================================================
 
 
+@metrics_router.get("/write-behind")
+async def get_write_behind_metrics(
+    current_user: UserProfile = Depends(get_current_user),
+    db_service: DatabaseService = Depends(get_database_dependency),
+) -> Dict[str, Any]:
+    """
+    Get write-behind buffer metrics for cost_logs and task_status_history
+
+    **Returns (per table):**
+    - pending / max_pending / utilization: current buffer depth
+    - written, failed, batches, last_flush_ms, last_batch_size
+    - backpressure_waits / backpressure_wait_ms: producers slowed by a full buffer
+    """
+    return {"buffers": db_service.get_write_behind_stats()}
+
+
+@metrics_router.get("/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """
+    In-process metrics in Prometheus text exposition format
+
+    Unauthenticated so Prometheus can scrape it; it exposes only latency
+    distributions and counters, never request data.
+
+    **Includes:**
+    - http_request_duration_seconds{method, route, status}
+    - db_query_duration_seconds{operation, table}, db_query_errors_total
+    - llm_request_duration_seconds{provider, operation, outcome}, llm_tokens_total
+    - db_pool_connections, db_pool_idle_connections, http_requests_in_flight
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@metrics_router.get("/latency")
+async def get_latency_metrics(
+    current_user: UserProfile = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    Latency distributions for HTTP routes, DB queries and LLM calls
+
+    **Returns:** per metric and label set: count, sum, avg and estimated
+    p50/p95/p99 (seconds, interpolated from histogram buckets)
+    """
+    snapshot = get_metrics_registry().snapshot()
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "metrics": {name: data for name, data in snapshot.items() if data["type"] == "histogram"},
+    }
+
+
 @metrics_router.get("/costs/breakdown/phase")
 async def get_costs_by_phase(
     current_user: UserProfile = Depends(get_current_user),
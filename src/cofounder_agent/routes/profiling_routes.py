@@ -0,0 +1,121 @@
+"""
+Profiling Routes - event-loop watchdog and on-demand sampling profiles
+
+Endpoints:
+- GET  /api/admin/profiling/loop        watchdog status, lag and recent stalls
+- POST /api/admin/profiling/loop/start  start (or restart) the watchdog
+- POST /api/admin/profiling/loop/stop   stop the watchdog
+- POST /api/admin/profiling/start       start a sampling profile
+- POST /api/admin/profiling/stop        stop it and return a summary
+- GET  /api/admin/profiling/download    folded stacks (flamegraph.pl / speedscope)
+
+All endpoints require authentication.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from routes.auth_unified import get_current_user
+from schemas.auth_schemas import UserProfile
+from services.loop_monitor import (
+    get_loop_watchdog,
+    get_profiler,
+    start_loop_watchdog,
+    start_profiler,
+    stop_loop_watchdog,
+)
+
+logger = logging.getLogger(__name__)
+
+profiling_router = APIRouter(prefix="/api/admin/profiling", tags=["profiling"])
+
+
+@profiling_router.get("/loop")
+async def get_loop_status(current_user: UserProfile = Depends(get_current_user)) -> Dict[str, Any]:
+    """
+    Event-loop watchdog status
+
+    **Returns:**
+    - running, threshold_ms, heartbeat_ms
+    - lag_p50_ms / lag_p99_ms / max_lag_ms: heartbeat lateness
+    - top_offenders: blocking call sites by stall count
+    - recent_stalls: captured stacks (outermost first)
+    """
+    watchdog = get_loop_watchdog()
+    if not watchdog:
+        return {"running": False, "stall_count": 0, "top_offenders": [], "recent_stalls": []}
+    return watchdog.get_status()
+
+
+@profiling_router.post("/loop/start")
+async def start_watchdog(
+    threshold_ms: float = Query(100, ge=5, le=10000, description="Report stalls longer than this"),
+    current_user: UserProfile = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """Start the event-loop watchdog (restarts it if the threshold changes)"""
+    watchdog = await start_loop_watchdog(threshold_ms)
+    logger.info(f"Loop watchdog started by {current_user.email} (threshold {threshold_ms}ms)")
+    return watchdog.get_status()
+
+
+@profiling_router.post("/loop/stop")
+async def stop_watchdog(current_user: UserProfile = Depends(get_current_user)) -> Dict[str, Any]:
+    """Stop the event-loop watchdog (recorded stalls are kept)"""
+    await stop_loop_watchdog()
+    watchdog = get_loop_watchdog()
+    return watchdog.get_status() if watchdog else {"running": False}
+
+
+@profiling_router.post("/start")
+async def start_profile(
+    interval_ms: float = Query(5, ge=1, le=1000, description="Sampling interval"),
+    max_seconds: float = Query(60, ge=1, le=600, description="Stop automatically after this long"),
+    all_threads: bool = Query(False, description="Sample every thread, not just the event loop"),
+    include_idle: bool = Query(False, description="Keep samples where the loop is idle"),
+    current_user: UserProfile = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """Start a sampling profile of the event loop thread"""
+    try:
+        profiler = start_profiler(
+            interval_ms=interval_ms,
+            max_seconds=max_seconds,
+            all_threads=all_threads,
+            include_idle=include_idle,
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    logger.info(f"Sampling profile started by {current_user.email} ({interval_ms}ms, max {max_seconds}s)")
+    return profiler.get_summary()
+
+
+@profiling_router.post("/stop")
+async def stop_profile(current_user: UserProfile = Depends(get_current_user)) -> Dict[str, Any]:
+    """Stop the running profile; download it from /download"""
+    profiler = get_profiler()
+    if not profiler:
+        raise HTTPException(status_code=404, detail="No profile has been started")
+    return profiler.stop()
+
+
+@profiling_router.get("/download", response_class=PlainTextResponse)
+async def download_profile(current_user: UserProfile = Depends(get_current_user)) -> PlainTextResponse:
+    """
+    Download the last profile as folded stacks
+
+    Render with `flamegraph.pl profile.folded > profile.svg`, or open it in
+    speedscope.app. Stops the profile first if it is still running.
+    """
+    profiler = get_profiler()
+    if not profiler:
+        raise HTTPException(status_code=404, detail="No profile has been started")
+    if profiler.running:
+        profiler.stop()
+    filename = f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.folded"
+    return PlainTextResponse(
+        profiler.to_folded(),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
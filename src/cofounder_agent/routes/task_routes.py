@@ -27,7 +27,7 @@ import logging
 import os
 import uuid as uuid_lib
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 import aiohttp
@@ -619,12 +619,16 @@ async def _handle_financial_analysis_creation(
 
 @router.get("", response_model=TaskListResponse, summary="List all tasks with pagination")
 async def list_tasks(
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: int = Query(0, ge=0, description="Pagination offset (ignored when cursor is set)"),
     limit: int = Query(20, ge=1, le=1000, description="Pagination limit"),
     status: Optional[str] = Query(
         None, description="Filter by status (queued, pending, running, completed, failed)"
     ),
     category: Optional[str] = Query(None, description="Filter by category"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Literal["full", "summary"] = Query(
+        "full", description="'summary' omits content/result and other large fields"
+    ),
     current_user: dict = Depends(get_current_user),
     db_service: DatabaseService = Depends(get_database_dependency),
 ):
@@ -636,21 +640,33 @@ async def list_tasks(
     - limit: Pagination limit (default: 20, max: 1000)
     - status: Optional status filter
     - category: Optional category filter
+    - cursor: Keyset cursor; follow next_cursor for constant-time deep pages
+    - fields: 'summary' for table/list views, 'full' (default) for every column
     
     **Returns:**
-    - List of tasks with total count
+    - List of tasks with total count (cached, estimated on very large tables)
+      and next_cursor
     
     **Example cURL:**
     ```bash
-    curl -X GET "http://localhost:8000/api/tasks?offset=0&limit=20" \\
+    curl -X GET "http://localhost:8000/api/tasks?limit=20&fields=summary" \\
       -H "Authorization: Bearer TOKEN"
     ```
     """
     try:
-        # get_tasks_paginated returns a tuple (tasks, total)
-        tasks, total = await db_service.get_tasks_paginated(
-            offset=offset, limit=limit, status=status, category=category
+        page = await db_service.get_tasks_page(
+            limit=limit,
+            status=status,
+            category=category,
+            cursor=cursor,
+            offset=offset,
+            summary=fields == "summary",
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        tasks, total = page["tasks"], page["total"]
 
         # Convert raw task dicts to UnifiedTaskResponse objects if needed
         validated_tasks = []
@@ -684,8 +700,10 @@ async def list_tasks(
         return TaskListResponse(
             tasks=validated_tasks,
             total=total,
-            offset=offset,
+            offset=0 if cursor else offset,
             limit=limit,
+            next_cursor=page["next_cursor"],
+            total_is_estimate=page["total_is_estimate"],
         )
     except Exception as e:
         logger.error(f"Failed to list tasks: {str(e)}")
@@ -1205,10 +1223,7 @@ async def get_task_status_history(
     try:
         # Get status history directly from database service which is more reliable
         # than the enhanced service dependency injection
-        from services.tasks_db import TasksDatabase
-
-        task_db = TasksDatabase(db_service._pool if hasattr(db_service, "_pool") else None)
-        history = await task_db.get_status_history(task_id, limit)
+        history = await db_service.get_status_history(task_id, limit)
 
         return {
             "task_id": task_id,
@@ -3,6 +3,9 @@ WebSocket Routes - Real-time progress streaming for image generation
 
 Provides WebSocket endpoints for streaming generation progress to clients
 in real-time with live progress bars and status updates.
+
+Progress events arrive through ProgressBroadcaster (Redis pub/sub when
+available), so clients receive updates for tasks running on any replica.
 """
 
 import asyncio
@@ -12,7 +15,7 @@ from typing import Dict, Set
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 
-from services.progress_service import get_progress_service
+from services.progress_service import get_progress_broadcaster, get_progress_service
 
 logger = logging.getLogger(__name__)
 websocket_router = APIRouter(prefix="/api/ws", tags=["WebSocket"])
@@ -21,9 +24,11 @@ websocket_router = APIRouter(prefix="/api/ws", tags=["WebSocket"])
 class ConnectionManager:
     """Manages WebSocket connections and broadcasting"""
 
-    def __init__(self):
+    def __init__(self, send_timeout: float = 5.0):
         # Store connections by task_id: {task_id -> {connection -> task_id, ...}}
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # A client that can't accept a message within this time is dropped
+        self.send_timeout = send_timeout
 
     async def connect(self, task_id: str, websocket: WebSocket):
         """Register a new WebSocket connection for a task"""
@@ -44,21 +49,24 @@ class ConnectionManager:
             logger.info(f"🔌 WebSocket disconnected for task {task_id}")
 
     async def broadcast(self, task_id: str, message: Dict):
-        """Broadcast a message to all connected clients for a task"""
-        if task_id not in self.active_connections:
+        """Broadcast a message to all connected clients for a task (sends run concurrently)"""
+        connections = list(self.active_connections.get(task_id, ()))
+        if not connections:
             return
 
-        disconnected = set()
-        for connection in self.active_connections[task_id]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"Failed to send message to WebSocket: {e}")
-                disconnected.add(connection)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_json(message), timeout=self.send_timeout)
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
 
-        # Clean up disconnected connections
-        for connection in disconnected:
-            await self.disconnect(task_id, connection)
+        # Clean up disconnected (or too slow) connections
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send message to WebSocket: {result!r}")
+                await self.disconnect(task_id, connection)
 
     def get_active_connections_count(self, task_id: str) -> int:
         """Get number of active connections for a task"""
@@ -68,6 +76,9 @@ class ConnectionManager:
 # Global connection manager
 connection_manager = ConnectionManager()
 
+# Progress events (local or from other replicas) are delivered to this replica's sockets
+get_progress_broadcaster().set_local_delivery(connection_manager.broadcast)
+
 
 @websocket_router.websocket("/image-generation/{task_id}")
 async def websocket_image_progress(websocket: WebSocket, task_id: str):
@@ -95,10 +106,10 @@ async def websocket_image_progress(websocket: WebSocket, task_id: str):
     try:
         progress_service = get_progress_service()
 
-        # Send initial status
-        progress = progress_service.get_progress(task_id)
+        # Send initial status (the task may be running on another replica)
+        progress = await progress_service.fetch_progress(task_id)
         if progress:
-            await websocket.send_json({"type": "progress", **progress.to_dict()})
+            await websocket.send_json({"type": "progress", **progress})
         else:
             await websocket.send_json(
                 {
@@ -119,9 +130,9 @@ async def websocket_image_progress(websocket: WebSocket, task_id: str):
                 if message.get("type") == "ping":
                     await websocket.send_json({"type": "pong"})
                 elif message.get("type") == "get_progress":
-                    progress = progress_service.get_progress(task_id)
+                    progress = await progress_service.fetch_progress(task_id)
                     if progress:
-                        await websocket.send_json({"type": "progress", **progress.to_dict()})
+                        await websocket.send_json({"type": "progress", **progress})
 
             except asyncio.TimeoutError:
                 # Send keep-alive every 30 seconds
@@ -138,8 +149,15 @@ async def websocket_image_progress(websocket: WebSocket, task_id: str):
 
 
 async def broadcast_progress(task_id: str, progress) -> None:
-    """Broadcast progress update to all connected clients"""
-    await connection_manager.broadcast(task_id, {"type": "progress", **progress.to_dict()})
+    """
+    Broadcast a progress update to all connected clients on every replica
+
+    ProgressService already publishes its own updates; use this for progress
+    objects that are not tracked there.
+    """
+    get_progress_broadcaster().submit(
+        task_id, {"type": "progress", **progress.to_dict()}, immediate=True
+    )
 
 
 def get_connection_manager() -> ConnectionManager:
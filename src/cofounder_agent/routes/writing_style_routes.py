@@ -13,14 +13,17 @@ Endpoints:
 - DELETE /api/writing-style/{sample_id} - Delete sample
 """
 
+import contextlib
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from pydantic import BaseModel
 
 from routes.auth_unified import get_current_user
 from services.database_service import DatabaseService
+from services.sample_upload_service import SampleUploadService, UploadTooLargeError
+from services.writing_style_profile import stored_style_profile
 from utils.route_utils import get_database_dependency
 
 logger = logging.getLogger(__name__)
@@ -58,6 +61,13 @@ class WritingSampleResponse(BaseModel):
     updated_at: Optional[str]
 
 
+class WritingCorpusUploadResponse(BaseModel):
+    """Response for a corpus split into many samples"""
+
+    created_count: int
+    sample_ids: List[str]
+
+
 class WritingSamplesListResponse(BaseModel):
     """Response containing list of samples"""
 
@@ -116,11 +126,12 @@ async def upload_writing_sample(
                 logger.warning(f"File upload rejected: file too large ({file.size} bytes)")
                 raise HTTPException(status_code=413, detail="File too large (max 1MB)")
 
-            file_content = await file.read()
-            
-            # Validate file can be decoded as text
+            # Stream and decode in a worker thread; the cap applies even without file.size
             try:
-                sample_content = file_content.decode("utf-8")
+                sample_content = await SampleUploadService().read_text(file, max_bytes=1_000_000)
+            except UploadTooLargeError:
+                logger.warning("File upload rejected: file too large (streamed past 1MB)")
+                raise HTTPException(status_code=413, detail="File too large (max 1MB)")
             except UnicodeDecodeError:
                 logger.warning("File upload rejected: file is not valid UTF-8 text")
                 raise HTTPException(status_code=422, detail="File must be valid UTF-8 text")
@@ -150,6 +161,78 @@ async def upload_writing_sample(
         raise HTTPException(status_code=500, detail=f"Failed to upload sample: {str(e)}")
 
 
+@router.post("/upload-corpus", response_model=WritingCorpusUploadResponse)
+async def upload_writing_corpus(
+    current_user: str = Depends(get_current_user),
+    db_service: DatabaseService = Depends(get_database_dependency),
+    title: str = Form(...),
+    description: Optional[str] = Form(None),
+    file: UploadFile = File(...),
+):
+    """
+    Upload a large corpus and split it into many writing samples.
+
+    Each CSV row ('content' column), JSON item or '---'-separated section of a
+    text file becomes one sample titled "<title> (n)". The file is parsed (and
+    style profiles built) in a worker thread as a stream, and samples are bulk
+    inserted in batches inside one transaction, so a rejected upload leaves no
+    partial corpus behind.
+
+    Args:
+        title: Title prefix for the created samples
+        description: Optional description applied to every sample
+        file: Corpus file (.txt, .csv, .json)
+
+    Returns:
+        WritingCorpusUploadResponse with the created sample IDs
+    """
+    upload_service = SampleUploadService()
+    is_valid, error = await upload_service.validate_file(file)
+    if not is_valid:
+        raise HTTPException(status_code=422, detail=error)
+
+    try:
+        user_id = current_user.get("id") if isinstance(current_user, dict) else current_user
+        sample_ids: List[str] = []
+        batches = upload_service.iter_sample_batches(file, file.content_type, with_profiles=True)
+        async with db_service.writing_style.transaction() as conn, contextlib.aclosing(
+            batches
+        ):
+            async for batch in batches:
+                created = await db_service.writing_style.create_writing_samples(
+                    user_id,
+                    [
+                        {
+                            "title": f"{title} ({len(sample_ids) + i})",
+                            "content": sample["content"],
+                            "description": description,
+                            "style_profile": sample["style_profile"],
+                        }
+                        for i, sample in enumerate(batch, 1)
+                    ],
+                    conn=conn,
+                )
+                sample_ids.extend(sample["id"] for sample in created)
+
+            if not sample_ids:
+                raise HTTPException(status_code=400, detail="No usable samples found in file")
+
+        logger.info(f"✅ User {user_id} uploaded corpus '{title}': {len(sample_ids)} samples")
+        return WritingCorpusUploadResponse(created_count=len(sample_ids), sample_ids=sample_ids)
+
+    except HTTPException:
+        raise
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=422, detail="File must be valid UTF-8 text")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Error uploading writing corpus: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to upload corpus: {str(e)}")
+
+
 @router.get("/samples", response_model=WritingSamplesListResponse)
 async def list_writing_samples(
     current_user: str = Depends(get_current_user),
@@ -338,6 +421,16 @@ async def delete_writing_sample(
 # ============================================================================
 
 
+def _sample_style_and_tone(sample: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Style and tone set on the sample, else those detected in its stored style profile"""
+    metadata = sample.get("metadata") or {}
+    analysis = (stored_style_profile(sample) or {}).get("analysis") or {}
+    return (
+        metadata.get("style") or analysis.get("detected_style"),
+        metadata.get("tone") or analysis.get("detected_tone"),
+    )
+
+
 def _calculate_topic_similarity(content: str, query: str) -> float:
     """Calculate topic similarity using Jaccard index (keyword overlap)"""
     import re
@@ -416,14 +509,11 @@ async def retrieve_relevant_samples(
             similarity = _calculate_topic_similarity(sample.get("content", ""), query_topic)
 
             # Reduce score if style doesn't match
-            sample_style = (
-                sample.get("metadata", {}).get("style") if sample.get("metadata") else None
-            )
+            sample_style, sample_tone = _sample_style_and_tone(sample)
             if preferred_style and sample_style != preferred_style:
                 similarity *= 0.7  # 30% penalty for style mismatch
 
             # Reduce score if tone doesn't match
-            sample_tone = sample.get("metadata", {}).get("tone") if sample.get("metadata") else None
             if preferred_tone and sample_tone != preferred_tone:
                 similarity *= 0.7  # 30% penalty for tone mismatch
 
@@ -500,19 +590,13 @@ async def retrieve_by_style(
         # Filter by style
         matching = []
         for sample in samples:
-            sample_style = (
-                sample.get("metadata", {}).get("style") if sample.get("metadata") else None
-            )
+            sample_style, sample_tone = _sample_style_and_tone(sample)
             if sample_style and sample_style.lower() == style.lower():
                 matching.append(
                     {
                         "id": sample.get("id"),
                         "title": sample.get("title"),
-                        "tone": (
-                            sample.get("metadata", {}).get("tone")
-                            if sample.get("metadata")
-                            else None
-                        ),
+                        "tone": sample_tone,
                         "word_count": sample.get("word_count", 0),
                     }
                 )
@@ -570,17 +654,13 @@ async def retrieve_by_tone(
         # Filter by tone
         matching = []
         for sample in samples:
-            sample_tone = sample.get("metadata", {}).get("tone") if sample.get("metadata") else None
+            sample_style, sample_tone = _sample_style_and_tone(sample)
             if sample_tone and sample_tone.lower() == tone.lower():
                 matching.append(
                     {
                         "id": sample.get("id"),
                         "title": sample.get("title"),
-                        "style": (
-                            sample.get("metadata", {}).get("style")
-                            if sample.get("metadata")
-                            else None
-                        ),
+                        "style": sample_style,
                         "word_count": sample.get("word_count", 0),
                     }
                 )
@@ -29,6 +29,10 @@ class CommandResponse(BaseModel):
     updated_at: str
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
+    retry_count: int = 0
+    max_retries: int = 3
+    claimed_by: Optional[str] = None
+    visible_at: Optional[str] = None
 
 
 class CommandListResponse(BaseModel):
@@ -39,10 +43,19 @@ class CommandListResponse(BaseModel):
     status_filter: Optional[str] = None
 
 
+class CommandBatchResponse(BaseModel):
+    """Commands leased by a batch dequeue"""
+
+    commands: List[CommandResponse]
+    consumer: str
+    visibility_timeout: float
+
+
 class CommandResultRequest(BaseModel):
     """Request to mark command as completed"""
 
     result: Dict[str, Any]
+    consumer: Optional[str] = None  # Lease holder; rejected (409) if it lost the lease
 
 
 class CommandErrorRequest(BaseModel):
@@ -50,3 +63,4 @@ class CommandErrorRequest(BaseModel):
 
     error: str
     retry: bool = True
+    consumer: Optional[str] = None  # Lease holder; rejected (409) if it lost the lease
@@ -29,6 +29,16 @@ class PhaseConfig(BaseModel):
         None, ge=0.0, le=1.0, description="Quality score threshold (for assessment phases)"
     )
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Phase-specific metadata")
+    inputs: Optional[List[str]] = Field(
+        None,
+        description=(
+            "Phase names or output keys this phase consumes. Omit to depend on the "
+            "previous phase; phases with disjoint inputs run concurrently"
+        ),
+    )
+    outputs: List[str] = Field(
+        default_factory=list, description="Extra output keys this phase publishes"
+    )
 
     @field_validator("name")
     @classmethod
@@ -149,6 +159,9 @@ class AvailablePhase(BaseModel):
     capabilities: List[str] = Field(..., description="Capabilities provided (e.g., web_search)")
     default_retries: int = Field(..., description="Recommended retry count")
     version: str = Field("1.0", description="Phase handler version")
+    default_inputs: Optional[List[str]] = Field(
+        None, description="Phases whose output this phase normally consumes"
+    )
 
 
 class AvailablePhasesResponse(BaseModel):
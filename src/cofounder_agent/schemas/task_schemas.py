@@ -325,6 +325,12 @@ class TaskListResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as ?cursor= to fetch the next page (null on the last page)"
+    )
+    total_is_estimate: bool = Field(
+        False, description="True when total is the planner's row estimate for a large table"
+    )
 
 
 class MetricsResponse(BaseModel):
@@ -11,7 +11,7 @@ Handles administrative database operations including:
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
@@ -29,6 +29,7 @@ from schemas.database_response_models import (
 from schemas.model_converter import ModelConverter
 from utils.sql_safety import ParameterizedQueryBuilder, SQLOperator
 
+from .batch_writer import BatchWriter
 from .database_mixin import DatabaseServiceMixin
 
 logger = logging.getLogger(__name__)
@@ -45,11 +46,80 @@ class AdminDatabase(DatabaseServiceMixin):
             pool: asyncpg connection pool
         """
         self.pool = pool
+        # Write-behind buffer for log_cost_deferred (started by DatabaseService)
+        self.cost_log_writer: Optional[BatchWriter] = None
 
     # ========================================================================
     # COST LOGGING
     # ========================================================================
 
+    COST_LOG_COLUMNS = [
+        "task_id",
+        "user_id",
+        "phase",
+        "model",
+        "provider",
+        "input_tokens",
+        "output_tokens",
+        "total_tokens",
+        "cost_usd",
+        "quality_score",
+        "duration_ms",
+        "success",
+        "error_message",
+        "created_at",
+        "updated_at",
+    ]
+
+    def create_cost_log_writer(self, **kwargs) -> BatchWriter:
+        """Create (but don't start) the write-behind buffer for cost_logs"""
+        self.cost_log_writer = BatchWriter(self.pool, "cost_logs", self.COST_LOG_COLUMNS, **kwargs)
+        return self.cost_log_writer
+
+    @staticmethod
+    def _cost_log_params(cost_log: Dict[str, Any]) -> List[Any]:
+        duration_ms = cost_log.get("duration_ms")
+        return [
+            str(cost_log["task_id"]),
+            str(cost_log["user_id"]) if cost_log.get("user_id") else None,
+            cost_log["phase"],
+            cost_log["model"],
+            cost_log["provider"],
+            cost_log.get("input_tokens", 0),
+            cost_log.get("output_tokens", 0),
+            cost_log.get("total_tokens", 0),
+            float(cost_log.get("cost_usd", 0.0)),
+            cost_log.get("quality_score"),
+            int(duration_ms) if duration_ms is not None else None,
+            cost_log.get("success", True),
+            cost_log.get("error_message"),
+        ]
+
+    async def log_cost_deferred(self, cost_log: Dict[str, Any]) -> bool:
+        """
+        Log an LLM call cost without waiting for the database.
+
+        The row is buffered and written in a batch by cost_log_writer. Use
+        log_cost() instead when the created record is needed. Falls back to
+        a direct insert when the write-behind buffer isn't running.
+
+        Args:
+            cost_log: Same fields as log_cost()
+
+        Returns:
+            True if the row was buffered or written
+        """
+        if not self.cost_log_writer or not self.cost_log_writer.running:
+            try:
+                await self.log_cost(cost_log)
+                return True
+            except Exception:
+                return False
+
+        now = datetime.now(timezone.utc)
+        await self.cost_log_writer.submit(tuple(self._cost_log_params(cost_log) + [now, now]))
+        return True
+
     async def log_cost(self, cost_log: Dict[str, Any]) -> CostLogResponse:
         """
         Log cost of LLM API call to cost_logs table.
@@ -84,21 +154,7 @@ class AdminDatabase(DatabaseServiceMixin):
                 VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW(), NOW())
                 RETURNING *
             """
-            params = [
-                str(cost_log["task_id"]),
-                str(cost_log["user_id"]) if cost_log.get("user_id") else None,
-                cost_log["phase"],
-                cost_log["model"],
-                cost_log["provider"],
-                cost_log.get("input_tokens", 0),
-                cost_log.get("output_tokens", 0),
-                cost_log.get("total_tokens", 0),
-                float(cost_log.get("cost_usd", 0.0)),
-                cost_log.get("quality_score"),
-                cost_log.get("duration_ms"),
-                cost_log.get("success", True),
-                cost_log.get("error_message"),
-            ]
+            params = self._cost_log_params(cost_log)
 
             async with self.pool.acquire() as conn:
                 row = await conn.fetchrow(sql, *params)
@@ -126,6 +182,10 @@ class AdminDatabase(DatabaseServiceMixin):
                 "entries": [...]
             }
         """
+        # Include rows still sitting in the write-behind buffer
+        if self.cost_log_writer:
+            await self.cost_log_writer.flush()
+
         try:
             async with self.pool.acquire() as conn:
                 rows = await conn.fetch(
@@ -0,0 +1,229 @@
+"""
+Per-Process Agent and LLM Client Pool
+
+UnifiedOrchestrator used to build a fresh ResearchAgent, CreativeAgent,
+QAAgent or PublishingAgent (and a fresh LLMClient for the draft and refine
+phases) on every content request. Construction is not free: LLMClient
+re-runs provider initialization, and the content agents load the prompt
+manager and build their CrewAI tool sets. This pool builds each instance
+once per process and hands the same warmed instance to every request.
+
+- Agents are keyed by (agent_name, model_name); LLM clients by model_name
+  (None means the configured default model).
+- Pooled instances are shared between concurrent requests, so they must not
+  hold per-request state. The content agents already take everything they
+  need (BlogPost, topic, critique) as call arguments.
+- Creation is guarded by a lock so concurrent first requests build an
+  instance only once.
+- Lifecycle hooks: on_create(key, instance) runs after an instance is
+  built (e.g. to attach telemetry), on_close(key, instance) before it is
+  dropped. By default close() calls the instance's own close() if it has
+  one (PublishingAgent closes its CMS connection pool).
+- Hits and misses are counted per pool and exported as
+  agent_pool_requests_total{kind,result}.
+
+Usage:
+    pool = get_agent_pool()
+    llm_client = pool.get_llm_client("gemini-2.5-flash")
+    agent = pool.get_agent("creative_agent", lambda: CreativeAgent(llm_client), "gemini-2.5-flash")
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .metrics_service import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+POOL_REQUESTS = get_metrics_registry().counter(
+    "agent_pool_requests_total",
+    "Agent pool lookups by instance kind and hit/miss",
+    ("kind", "result"),
+)
+
+PoolKey = Tuple[str, Optional[str]]
+Hook = Callable[[PoolKey, Any], Any]
+
+
+def _default_llm_client_factory(model_name: Optional[str]) -> Any:
+    from agents.content_agent.services.llm_client import (  # pylint: disable=import-outside-toplevel
+        LLMClient,
+    )
+
+    return LLMClient(model_name=model_name) if model_name else LLMClient()
+
+
+class AgentPool:
+    """Reusable agent and LLM client instances, keyed by name and model"""
+
+    def __init__(
+        self,
+        llm_client_factory: Optional[Callable[[Optional[str]], Any]] = None,
+        on_create: Optional[Hook] = None,
+        on_close: Optional[Hook] = None,
+    ):
+        """
+        Args:
+            llm_client_factory: Builds an LLM client for a model name (LLMClient by default)
+            on_create: Called with (key, instance) after an instance is built
+            on_close: Called with (key, instance) when the pool is closed or an
+                entry evicted (defaults to the instance's own close())
+        """
+        self.llm_client_factory = llm_client_factory or _default_llm_client_factory
+        self.on_create = on_create
+        self.on_close = on_close
+        self._agents: Dict[PoolKey, Any] = {}
+        self._llm_clients: Dict[Optional[str], Any] = {}
+        self._lock = threading.RLock()
+        self._stats: Dict[str, Dict[str, int]] = {
+            "agent": {"hits": 0, "misses": 0},
+            "llm_client": {"hits": 0, "misses": 0},
+        }
+
+    def _record(self, kind: str, hit: bool) -> None:
+        self._stats[kind]["hits" if hit else "misses"] += 1
+        POOL_REQUESTS.labels(kind, "hit" if hit else "miss").inc()
+
+    def get_llm_client(self, model_name: Optional[str] = None) -> Any:
+        """Shared LLM client for model_name (None = configured default)"""
+        client = self._llm_clients.get(model_name)
+        if client is not None:
+            self._record("llm_client", True)
+            return client
+
+        with self._lock:
+            client = self._llm_clients.get(model_name)
+            if client is None:
+                client = self.llm_client_factory(model_name)
+                self._llm_clients[model_name] = client
+                self._record("llm_client", False)
+                logger.info(f"🧰 Pooled LLM client for model {model_name or 'default'}")
+                self._run_hook(self.on_create, ("llm_client", model_name), client)
+            else:
+                self._record("llm_client", True)
+        return client
+
+    def get_agent(
+        self, agent_name: str, factory: Callable[[], Any], model_name: Optional[str] = None
+    ) -> Any:
+        """
+        Shared agent instance for (agent_name, model_name), built with factory on first use.
+
+        Errors raised by factory propagate and nothing is cached, so the next
+        request retries construction.
+        """
+        key = (agent_name, model_name)
+        agent = self._agents.get(key)
+        if agent is not None:
+            self._record("agent", True)
+            return agent
+
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = factory()
+                self._agents[key] = agent
+                self._record("agent", False)
+                logger.info(f"🧰 Pooled {agent_name} (model: {model_name or 'default'})")
+                self._run_hook(self.on_create, key, agent)
+            else:
+                self._record("agent", True)
+        return agent
+
+    def warm(
+        self, specs: Iterable[Tuple[str, Callable[[], Any], Optional[str]]]
+    ) -> Dict[str, bool]:
+        """
+        Build instances ahead of the first request.
+
+        Args:
+            specs: (agent_name, factory, model_name) triples
+
+        Returns:
+            Map of agent name ("name:model" for explicit models) to whether it is
+            now pooled (failures are logged, not raised)
+        """
+        warmed: Dict[str, bool] = {}
+        for agent_name, factory, model_name in specs:
+            label = f"{agent_name}:{model_name}" if model_name else agent_name
+            try:
+                self.get_agent(agent_name, factory, model_name)
+                warmed[label] = True
+            except Exception as e:
+                logger.warning(f"⚠️ Could not warm {label}: {type(e).__name__}: {e}")
+                warmed[label] = False
+        return warmed
+
+    def evict(self, agent_name: str, model_name: Optional[str] = None) -> Optional[Any]:
+        """Drop one pooled agent (e.g. after it failed in a way that may have broken it)"""
+        with self._lock:
+            agent = self._agents.pop((agent_name, model_name), None)
+        if agent is not None:
+            self._run_hook(self.on_close, (agent_name, model_name), agent)
+        return agent
+
+    async def close(self) -> None:
+        """Run close hooks for every pooled instance and empty the pool"""
+        with self._lock:
+            entries = list(self._agents.items()) + [
+                (("llm_client", model), client) for model, client in self._llm_clients.items()
+            ]
+            self._agents.clear()
+            self._llm_clients.clear()
+
+        for key, instance in entries:
+            try:
+                if self.on_close is not None:
+                    result = self.on_close(key, instance)
+                else:
+                    closer = getattr(instance, "close", None)
+                    result = closer() if callable(closer) else None
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"⚠️ Error closing pooled {key[0]}: {e}")
+
+    def _run_hook(self, hook: Optional[Hook], key: PoolKey, instance: Any) -> None:
+        if hook is None:
+            return
+        try:
+            result = hook(key, instance)
+            if inspect.isawaitable(result):
+                # Hooks run from sync lookups; schedule async ones on the running loop
+                try:
+                    asyncio.get_running_loop().create_task(result)
+                except RuntimeError:
+                    result.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Agent pool hook failed for {key[0]}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool sizes, hits, misses and hit rates"""
+
+        def summarize(counts: Dict[str, int]) -> Dict[str, Any]:
+            total = counts["hits"] + counts["misses"]
+            return {
+                **counts,
+                "hit_rate": round(counts["hits"] / total, 4) if total else 0.0,
+            }
+
+        return {
+            "agents": sorted(f"{name}:{model or 'default'}" for name, model in self._agents),
+            "llm_clients": sorted(model or "default" for model in self._llm_clients),
+            "agent_lookups": summarize(self._stats["agent"]),
+            "llm_client_lookups": summarize(self._stats["llm_client"]),
+        }
+
+
+_agent_pool: Optional[AgentPool] = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Process-wide agent pool"""
+    global _agent_pool
+    if _agent_pool is None:
+        _agent_pool = AgentPool()
+    return _agent_pool
@@ -11,6 +11,7 @@ Features:
 - Self-checking and validation throughout generation
 - Quality assurance with refinement loops
 - Content metrics and performance tracking
+- Streaming Ollama generation with early abort on degenerate output
 
 ASYNC-FIRST: All I/O operations use httpx async client (no blocking calls)
 """
@@ -24,11 +25,17 @@ from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
+from .generation_guard import StreamGuard, StreamOutcome, run_guarded_stream
 from .provider_checker import ProviderChecker
 from .prompt_manager import get_prompt_manager
 
 logger = logging.getLogger(__name__)
 
+# Stream Ollama drafts so loops, refusals and off-topic output abort early
+CONTENT_STREAMING_ENABLED = os.getenv("CONTENT_STREAMING_ENABLED", "true").lower() == "true"
+# Time budget for one streamed draft; slower generations are abandoned for the next model
+CONTENT_STREAM_BUDGET_SECONDS = float(os.getenv("CONTENT_STREAM_BUDGET_SECONDS", "120"))
+
 
 class ContentValidationResult:
     """Result of content validation check"""
@@ -49,13 +56,16 @@ class ContentValidationResult:
 class AIContentGenerator:
     """Unified content generation with provider fallback and self-checking"""
 
-    def __init__(self, quality_threshold: float = 7.0):
+    def __init__(self, quality_threshold: float = 7.0, streaming: Optional[bool] = None):
         """Initialize content generator
 
         Args:
             quality_threshold: Minimum quality score (0-10) for content acceptance
+            streaming: Stream Ollama output through StreamGuard (default: CONTENT_STREAMING_ENABLED)
         """
         self.quality_threshold = quality_threshold
+        self.streaming = CONTENT_STREAMING_ENABLED if streaming is None else streaming
+        self.stream_budget_seconds = CONTENT_STREAM_BUDGET_SECONDS
         self.ollama_available = False
         self.ollama_checked = False  # Track if we've checked Ollama async
         self.generation_attempts = 0
@@ -78,13 +88,15 @@ class AIContentGenerator:
         logger.info("🔍 Checking if Ollama server is running...")
         try:
             async with httpx.AsyncClient(timeout=5) as client:
-                logger.debug("   → Sending request to http://localhost:11434/api/tags")
-                response = await client.get("http://localhost:11434/api/tags")
+                from .ollama_client import DEFAULT_BASE_URL
+
+                logger.debug(f"   → Sending request to {DEFAULT_BASE_URL}/api/tags")
+                response = await client.get(f"{DEFAULT_BASE_URL}/api/tags")
                 self.ollama_available = response.status_code == 200
                 logger.debug(f"   ← Response status: {response.status_code}")
 
             if self.ollama_available:
-                logger.info("✅ Ollama IS running at http://localhost:11434")
+                logger.info(f"✅ Ollama IS running at {DEFAULT_BASE_URL}")
             else:
                 logger.warning(f"⚠️ Ollama returned non-200 status: {response.status_code}")
         except Exception as e:
@@ -182,6 +194,57 @@ class AIContentGenerator:
             is_valid=is_valid, quality_score=score, issues=issues, feedback=feedback
         )
 
+    async def _stream_ollama(
+        self,
+        ollama: Any,
+        prompt: str,
+        system: str,
+        model_name: str,
+        max_tokens: int,
+        topic: str,
+        tags: list[str],
+        target_length: int,
+        progress_task_id: Optional[str] = None,
+    ) -> StreamOutcome:
+        """
+        Stream one Ollama generation through a StreamGuard.
+
+        Partial text is pushed to the progress channel for progress_task_id as it
+        arrives. Returns the outcome; when aborted the stream has been closed.
+        """
+        guard = StreamGuard(
+            topic,
+            keywords=tags,
+            target_words=target_length,
+            max_seconds=self.stream_budget_seconds,
+        )
+
+        on_partial = None
+        if progress_task_id:
+            from .progress_service import get_progress_service
+
+            progress_service = get_progress_service()
+            started = time.monotonic()
+
+            def on_partial(text: str, word_count: int) -> None:
+                progress_service.update_progress(
+                    progress_task_id,
+                    current_step=min(word_count, target_length),
+                    total_steps=target_length,
+                    stage="drafting",
+                    elapsed_time=time.monotonic() - started,
+                    message=f"Drafting with {model_name}: {word_count} words",
+                    partial_content=text,
+                )
+
+        return await run_guarded_stream(
+            ollama.stream_generate(
+                prompt=prompt, model=model_name, system=system, max_tokens=max_tokens
+            ),
+            guard,
+            on_partial=on_partial,
+        )
+
     async def generate_blog_post(
         self,
         topic: str,
@@ -191,6 +254,7 @@ class AIContentGenerator:
         tags: list[str],
         preferred_model: Optional[str] = None,
         preferred_provider: Optional[str] = None,
+        progress_task_id: Optional[str] = None,
     ) -> Tuple[str, str, Dict[str, Any]]:
         """
         Generate a blog post using best available model with self-checking.
@@ -200,6 +264,7 @@ class AIContentGenerator:
         - Intelligent provider fallback (Ollama → HuggingFace → Gemini)
         - Self-validation and quality checking
         - Refinement loop for rejected content
+        - Streaming Ollama drafts that abort early on loops, refusals or drift
         - Full metrics tracking
 
         Args:
@@ -210,6 +275,7 @@ class AIContentGenerator:
             tags: Content tags
             preferred_model: User-selected model (e.g., 'gpt-4', 'claude-3-opus', 'gemini-pro')
             preferred_provider: User-selected provider ('openai', 'anthropic', 'gemini', 'ollama', 'huggingface')
+            progress_task_id: Task whose progress receives partial streamed text
 
         Returns:
             Tuple of (content, model_used, metrics_dict)
@@ -326,6 +392,7 @@ class AIContentGenerator:
             "preferred_model": preferred_model,
             "preferred_provider": preferred_provider,
             "models_used_by_phase": {},  # NEW: Track models at each phase
+            "stream_aborts": [],  # Streamed drafts abandoned by StreamGuard
             "model_selection_log": {  # NEW: Track decision tree
                 "requested_provider": preferred_provider,
                 "requested_model": preferred_model,
@@ -583,13 +650,38 @@ class AIContentGenerator:
                             f"      Max tokens: {max_tokens} (target_length: {target_length})"
                         )
 
-                        response = await ollama.generate(
-                            prompt=generation_prompt,
-                            system=system_prompt,
-                            model=model_name,
-                            stream=False,
-                            max_tokens=max_tokens,  # Set explicit token limit for proper word count control
-                        )
+                        if self.streaming:
+                            outcome = await self._stream_ollama(
+                                ollama,
+                                generation_prompt,
+                                system_prompt,
+                                model_name,
+                                max_tokens,
+                                topic,
+                                tags,
+                                target_length,
+                                progress_task_id,
+                            )
+                            if outcome.aborted:
+                                logger.warning(
+                                    f"      🛑 Stream aborted ({outcome.abort_reason}) after {outcome.word_count} words"
+                                )
+                                metrics["stream_aborts"].append(
+                                    {"model": model_name, **outcome.to_dict()}
+                                )
+                                attempts.append(
+                                    ("Ollama", f"{model_name}: aborted ({outcome.abort_reason})")
+                                )
+                                continue
+                            response = outcome.text
+                        else:
+                            response = await ollama.generate(
+                                prompt=generation_prompt,
+                                system=system_prompt,
+                                model=model_name,
+                                stream=False,
+                                max_tokens=max_tokens,  # Set explicit token limit for proper word count control
+                            )
 
                         # Extract text from response dict
                         # OllamaClient.generate() returns dict with 'text' key (not 'response')
@@ -694,18 +786,41 @@ class AIContentGenerator:
                                 # Try to refine with same model
                                 # Calculate max tokens for refinement pass (4.5x multiplier for comprehensive refinement)
                                 max_tokens_refinement = int(target_length * 4.5)
-                                response = await ollama.generate(
-                                    prompt=refinement_prompt,
-                                    system=system_prompt,
-                                    model=model_name,
-                                    stream=False,
-                                    max_tokens=max_tokens_refinement,  # 4.5x multiplier for complete refinement with better word count
-                                )
+                                if self.streaming:
+                                    outcome = await self._stream_ollama(
+                                        ollama,
+                                        refinement_prompt,
+                                        system_prompt,
+                                        model_name,
+                                        max_tokens_refinement,
+                                        topic,
+                                        tags,
+                                        target_length,
+                                        progress_task_id,
+                                    )
+                                    if outcome.aborted:
+                                        logger.warning(
+                                            f"      🛑 Refinement stream aborted ({outcome.abort_reason})"
+                                        )
+                                        metrics["stream_aborts"].append(
+                                            {"model": model_name, "refinement": True, **outcome.to_dict()}
+                                        )
+                                    response = "" if outcome.aborted else outcome.text
+                                else:
+                                    response = await ollama.generate(
+                                        prompt=refinement_prompt,
+                                        system=system_prompt,
+                                        model=model_name,
+                                        stream=False,
+                                        max_tokens=max_tokens_refinement,  # 4.5x multiplier for complete refinement with better word count
+                                    )
 
                                 # Extract text from response dict
                                 refined_content = ""
                                 if isinstance(response, dict):
-                                    refined_content = response.get("response", "")
+                                    refined_content = response.get("text", "") or response.get(
+                                        "response", ""
+                                    )
                                     logger.debug(
                                         f"      📦 Refined response type: dict | Content: {len(refined_content)} chars"
                                     )
@@ -0,0 +1,199 @@
+"""
+Write-Behind Batch Writer
+
+Buffers append-only audit rows (cost_logs, task_status_history) in memory and
+writes them in batches with COPY instead of one INSERT round trip per row.
+
+- Flushes when max_batch rows are buffered or flush_interval seconds pass
+- COPY (copy_records_to_table) first; if the batch is rejected, rows are
+  inserted one at a time so a single bad row doesn't lose the others
+- Backpressure: once max_pending rows are buffered, submit() waits for a
+  flush instead of growing without bound
+- stop() flushes everything that is still buffered (call before closing the pool)
+
+Callers that need the inserted row back (RETURNING) keep using the direct
+INSERT path; this is only for fire-and-forget records.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from asyncpg import Pool
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """Async write-behind buffer for one table"""
+
+    def __init__(
+        self,
+        pool: Pool,
+        table: str,
+        columns: Sequence[str],
+        max_batch: int = 200,
+        flush_interval: float = 1.0,
+        max_pending: int = 5000,
+    ):
+        """
+        Args:
+            pool: asyncpg connection pool
+            table: Target table
+            columns: Column names, in the order of each submitted record
+            max_batch: Flush as soon as this many rows are buffered
+            flush_interval: Flush at least this often (seconds) while rows are buffered
+            max_pending: Buffered rows at which submit() waits for a flush
+        """
+        self.pool = pool
+        self.table = table
+        self.columns = list(columns)
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._buffer: List[Tuple[Any, ...]] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        placeholders = ", ".join(f"${i + 1}" for i in range(len(self.columns)))
+        self._insert_sql = (
+            f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES ({placeholders})"
+        )
+
+        self.stats: Dict[str, Any] = {
+            "submitted": 0,
+            "written": 0,
+            "failed": 0,
+            "batches": 0,
+            "copy_fallbacks": 0,
+            "backpressure_waits": 0,
+            "backpressure_wait_ms": 0.0,
+            "max_pending_seen": 0,
+            "last_flush_ms": 0.0,
+            "last_batch_size": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    async def start(self) -> None:
+        """Start the background flush loop"""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"✅ Write-behind buffer started for {self.table} "
+            f"(batch={self.max_batch}, interval={self.flush_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write everything still buffered"""
+        if not self._running:
+            return
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            try:
+                await self._task
+            except Exception as e:
+                logger.error(f"❌ Write-behind loop for {self.table} ended with error: {e}")
+            self._task = None
+        await self.flush()
+        logger.info(
+            f"Write-behind buffer stopped for {self.table} "
+            f"(written={self.stats['written']}, failed={self.stats['failed']})"
+        )
+
+    async def submit(self, record: Tuple[Any, ...]) -> None:
+        """
+        Buffer one row (values in column order).
+
+        Waits for a flush when the buffer is full, which slows producers
+        down instead of letting memory grow.
+        """
+        if len(self._buffer) >= self.max_pending:
+            started = time.perf_counter()
+            self.stats["backpressure_waits"] += 1
+            await self.flush()
+            self.stats["backpressure_wait_ms"] += (time.perf_counter() - started) * 1000
+
+        self._buffer.append(record)
+        self.stats["submitted"] += 1
+        self.stats["max_pending_seen"] = max(self.stats["max_pending_seen"], len(self._buffer))
+        if len(self._buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write all buffered rows now; returns the number written"""
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[: self.max_batch]
+                del self._buffer[: self.max_batch]
+                try:
+                    written += await self._write(batch)
+                except Exception:
+                    # Couldn't get a connection: keep the rows for the next flush
+                    self._buffer[:0] = batch
+                    raise
+        return written
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Write-behind flush for {self.table} failed: {e}")
+
+    async def _write(self, batch: List[Tuple[Any, ...]]) -> int:
+        started = time.perf_counter()
+        written = 0
+        async with self.pool.acquire() as conn:
+            try:
+                await conn.copy_records_to_table(self.table, records=batch, columns=self.columns)
+                written = len(batch)
+            except Exception as e:
+                # COPY is all-or-nothing; retry row by row so one bad record
+                # (e.g. a dangling foreign key) doesn't drop the whole batch
+                self.stats["copy_fallbacks"] += 1
+                logger.warning(f"⚠️ COPY into {self.table} failed ({e}); inserting rows individually")
+                for record in batch:
+                    try:
+                        await conn.execute(self._insert_sql, *record)
+                        written += 1
+                    except Exception as row_error:
+                        self.stats["failed"] += 1
+                        logger.error(f"❌ Dropped {self.table} row: {row_error}")
+
+        self.stats["written"] += written
+        self.stats["batches"] += 1
+        self.stats["last_batch_size"] = len(batch)
+        self.stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        logger.debug(f"Flushed {written}/{len(batch)} rows into {self.table}")
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Throughput and backpressure metrics"""
+        return {
+            "table": self.table,
+            "running": self._running,
+            "pending": len(self._buffer),
+            "max_pending": self.max_pending,
+            "utilization": round(len(self._buffer) / self.max_pending, 4) if self.max_pending else 0.0,
+            **self.stats,
+        }
@@ -9,12 +9,21 @@ Features:
 - Validates generated tasks against available capabilities
 - Returns suggested tasks with execution option
 - Supports both auto-execution and review modes
+- Caches validated plans so repeat (or near-duplicate) requests skip the LLM
 """
 
+import copy
+import dataclasses
+import difflib
+import hashlib
 import logging
 import json
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field
 
 from services.capability_registry import get_registry
 from services.capability_task_executor import CapabilityTaskDefinition, CapabilityStep
@@ -34,6 +43,272 @@ class TaskCompositionResult:
     error: Optional[str] = None
     confidence: float = 0.0  # 0-1 confidence in the composition
     execution_id: Optional[str] = None  # If auto-executed
+    cache_hit: bool = False  # True if the plan was reused from the plan cache
+
+
+@dataclass
+class _CachedPlan:
+    """A validated task plan stored in the composition plan cache."""
+    normalized_request: str
+    registry_version: int
+    task_dict: Dict[str, Any]
+    confidence: float
+    vector: Dict[int, float]
+    created_at: float = field(default_factory=time.monotonic)
+    hits: int = 0
+
+
+class CompositionPlanCache:
+    """
+    Bounded LRU cache of validated capability plans.
+
+    Plans are keyed on the normalized request text plus the registry version, so
+    registering a new capability invalidates every plan composed against the old
+    capability set. Near-duplicate phrasings are matched with a cosine similarity
+    over hashed unigram/bigram embeddings; no model download is required.
+
+    A near-duplicate is only a structure template: literal inputs bound from the
+    cached request are re-bound to the words that differ in the new request, and
+    the lookup misses when the difference cannot be re-bound safely.
+    """
+
+    # '+' and '#' stay inside tokens so "C++", "C#" and "C" remain distinct requests
+    _TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+    _EMBEDDING_DIM = 512
+    # Words whose presence or absence never changes what a plan should do
+    _FILLER_TOKENS = frozenset(
+        {"please", "can", "could", "would", "you", "i", "me", "we", "us", "want",
+         "like", "need", "to", "a", "an", "the", "just", "kindly"}
+    )
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 6 * 3600,
+        similarity_threshold: float = 0.92,
+    ):
+        """
+        Initialize the plan cache.
+
+        Args:
+            max_entries: Maximum number of plans kept (least recently used evicted first)
+            ttl_seconds: Plans older than this are discarded on lookup
+            similarity_threshold: Minimum cosine similarity for a near-duplicate hit
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, _CachedPlan]" = OrderedDict()
+        self.metrics = {
+            "exact_hits": 0,
+            "similar_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "rebind_failures": 0,
+        }
+
+    @classmethod
+    def normalize(cls, request: str) -> str:
+        """Lowercase, strip punctuation (except in-word '+'/'#') and collapse whitespace."""
+        return " ".join(cls._TOKEN_PATTERN.findall(request.lower()))
+
+    @classmethod
+    def embed(cls, normalized_request: str) -> Dict[int, float]:
+        """Build a sparse, L2-normalized hashed embedding of unigrams and bigrams."""
+        tokens = normalized_request.split()
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        vector: Dict[int, float] = {}
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            bucket = int.from_bytes(digest, "big") % cls._EMBEDDING_DIM
+            vector[bucket] = vector.get(bucket, 0.0) + 1.0
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        if norm:
+            vector = {k: v / norm for k, v in vector.items()}
+        return vector
+
+    @staticmethod
+    def _cosine(a: Dict[int, float], b: Dict[int, float]) -> float:
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+    @staticmethod
+    def _key(normalized_request: str, registry_version: int) -> str:
+        return f"{registry_version}:{normalized_request}"
+
+    def get(self, request: str, registry_version: int) -> Optional[Tuple[_CachedPlan, float]]:
+        """
+        Look up a plan for the request.
+
+        Returns:
+            (cached plan, similarity) or None on a miss. Exact matches report 1.0;
+            near-duplicate hits carry a task dict re-bound to this request.
+        """
+        normalized = self.normalize(request)
+        now = time.monotonic()
+
+        key = self._key(normalized, registry_version)
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.created_at <= self.ttl_seconds:
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self.metrics["exact_hits"] += 1
+            return entry, 1.0
+
+        vector = self.embed(normalized)
+        best: Optional[_CachedPlan] = None
+        best_key: Optional[str] = None
+        best_score = 0.0
+        expired = []
+        for entry_key, candidate in self._entries.items():
+            if now - candidate.created_at > self.ttl_seconds:
+                expired.append(entry_key)
+                continue
+            if candidate.registry_version != registry_version:
+                continue
+            score = self._cosine(vector, candidate.vector)
+            if score > best_score:
+                best, best_key, best_score = candidate, entry_key, score
+        for entry_key in expired:
+            del self._entries[entry_key]
+
+        if best is not None and best_score >= self.similarity_threshold:
+            rebound = self._rebind(best, normalized)
+            if rebound is not None:
+                self._entries.move_to_end(best_key)
+                best.hits += 1
+                self.metrics["similar_hits"] += 1
+                return dataclasses.replace(best, task_dict=rebound), best_score
+            self.metrics["rebind_failures"] += 1
+
+        self.metrics["misses"] += 1
+        return None
+
+    @classmethod
+    def _rebind(cls, plan: _CachedPlan, normalized_request: str) -> Optional[Dict[str, Any]]:
+        """
+        Re-bind a near-duplicate plan's literal parameters to a new request.
+
+        Words replaced between the cached and the new request are substituted in
+        every literal (non-``$reference``) value of the plan. A replacement that
+        matches no literal, or added/dropped words other than filler, cannot be
+        bound to a parameter, so they make the plan unusable for this request.
+
+        Returns:
+            Re-bound copy of the task dict, or None if the plan cannot be reused
+        """
+        old_tokens = plan.normalized_request.split()
+        new_tokens = normalized_request.split()
+        replacements: List[Tuple[str, str]] = []
+        matcher = difflib.SequenceMatcher(a=old_tokens, b=new_tokens, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            old_phrase, new_phrase = old_tokens[i1:i2], new_tokens[j1:j2]
+            if tag == "replace":
+                replacements.append((" ".join(old_phrase), " ".join(new_phrase)))
+            elif not cls._FILLER_TOKENS.issuperset(old_phrase + new_phrase):
+                return None
+
+        task_dict = copy.deepcopy(plan.task_dict)
+        if not replacements:
+            return task_dict
+
+        patterns = [
+            (
+                re.compile(
+                    r"(?<![a-z0-9+#])"
+                    + r"[^a-z0-9]+".join(map(re.escape, old.split()))
+                    + r"(?![a-z0-9+#])",
+                    re.I,
+                ),
+                new,
+            )
+            for old, new in replacements
+        ]
+        bound = [False] * len(replacements)
+
+        def substitute(value: Any) -> Any:
+            if isinstance(value, str):
+                if value.startswith("$"):
+                    return value
+                for index, (pattern, new) in enumerate(patterns):
+                    value, count = pattern.subn(
+                        lambda m, new=new: cls._match_case(m.group(0), new), value
+                    )
+                    bound[index] = bound[index] or count > 0
+                return value
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, int):
+                for index, (old, new) in enumerate(replacements):
+                    if old == str(value) and new.isdigit():
+                        bound[index] = True
+                        return int(new)
+                return value
+            if isinstance(value, list):
+                return [substitute(item) for item in value]
+            if isinstance(value, dict):
+                return {key: substitute(item) for key, item in value.items()}
+            return value
+
+        for field_name in ("name", "description"):
+            if field_name in task_dict:
+                task_dict[field_name] = substitute(task_dict[field_name])
+        for step in task_dict.get("steps", []):
+            if isinstance(step, dict) and "inputs" in step:
+                step["inputs"] = substitute(step["inputs"])
+        return task_dict if all(bound) else None
+
+    @staticmethod
+    def _match_case(original: str, replacement: str) -> str:
+        """Carry the capitalization of the replaced text over to its replacement."""
+        if original.isupper() and len(original) > 1:
+            return replacement.upper()
+        if original[:1].isupper():
+            return replacement[:1].upper() + replacement[1:]
+        return replacement
+
+    def put(
+        self,
+        request: str,
+        registry_version: int,
+        task_dict: Dict[str, Any],
+        confidence: float,
+    ) -> None:
+        """Store a validated plan. Plans from older registry versions are dropped."""
+        normalized = self.normalize(request)
+        stale = [k for k, e in self._entries.items() if e.registry_version != registry_version]
+        for entry_key in stale:
+            del self._entries[entry_key]
+
+        key = self._key(normalized, registry_version)
+        self._entries[key] = _CachedPlan(
+            normalized_request=normalized,
+            registry_version=registry_version,
+            task_dict=copy.deepcopy(task_dict),
+            confidence=confidence,
+            vector=self.embed(normalized),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached plans."""
+        self._entries.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return hit/miss statistics."""
+        hits = self.metrics["exact_hits"] + self.metrics["similar_hits"]
+        total = hits + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": len(self._entries),
+            "hit_rate": round(hits / total * 100, 2) if total else 0.0,
+        }
 
 
 class CapabilityNaturalLanguageComposer:
@@ -43,23 +318,35 @@ class CapabilityNaturalLanguageComposer:
     Uses LLM to understand user intent and map it to available capabilities.
     """
     
-    def __init__(self, model_router: Optional[ModelRouter] = None):
+    def __init__(
+        self,
+        model_router: Optional[ModelRouter] = None,
+        plan_cache: Optional[CompositionPlanCache] = None,
+    ):
         """
         Initialize the composer.
         
         Args:
             model_router: Optional ModelRouter for LLM selection.
                          If not provided, will be instantiated.
+            plan_cache: Optional plan cache. If not provided, a default one is created.
         """
         self.registry = get_registry()
         self.model_router = model_router or ModelRouter()
+        self.plan_cache = plan_cache or CompositionPlanCache()
+        self._registry_context: Optional[Tuple[int, str]] = None  # (registry version, text)
         
     def _get_registry_context(self) -> str:
         """
         Generate registry context for the LLM prompt.
         
-        Returns information about all available capabilities.
+        Returns information about all available capabilities. The text is
+        memoized until the registry version changes.
         """
+        version = self.registry.version
+        if self._registry_context and self._registry_context[0] == version:
+            return self._registry_context[1]
+        
         capabilities = self.registry.list_capabilities()
         
         context = "# Available Capabilities\n\n"
@@ -76,6 +363,7 @@ class CapabilityNaturalLanguageComposer:
             
             context += "\n"
         
+        self._registry_context = (version, context)
         return context
     
     def _create_composition_prompt(self, request: str) -> str:
@@ -129,6 +417,7 @@ Now generate the task JSON for the user's request:"""
         request: str,
         auto_execute: bool = False,
         owner_id: Optional[str] = None,
+        use_cache: bool = True,
     ) -> TaskCompositionResult:
         """
         Compose a capability task from a natural language request.
@@ -137,6 +426,7 @@ Now generate the task JSON for the user's request:"""
             request: Natural language request (e.g., "Write a blog post about AI")
             auto_execute: Whether to execute the task immediately after creation
             owner_id: Owner/user ID for task persistence
+            use_cache: Reuse a cached plan for identical or near-duplicate requests
             
         Returns:
             TaskCompositionResult with suggested or executed task
@@ -144,6 +434,23 @@ Now generate the task JSON for the user's request:"""
         try:
             logger.info(f"[Composer] Processing request: {request[:100]}...")
             
+            registry_version = self.registry.version
+            if use_cache:
+                cached = self.plan_cache.get(request, registry_version)
+                if cached:
+                    plan, similarity = cached
+                    logger.info(
+                        f"[Composer] Plan cache hit (similarity={similarity:.2f}), skipping LLM"
+                    )
+                    task_dict = copy.deepcopy(plan.task_dict)
+                    return await self._build_result(
+                        task_dict,
+                        self._dict_to_task_definition(task_dict),
+                        confidence=plan.confidence * similarity,
+                        auto_execute=auto_execute,
+                        cache_hit=True,
+                    )
+            
             # Create prompt for LLM
             prompt = self._create_composition_prompt(request)
             
@@ -179,30 +486,15 @@ Now generate the task JSON for the user's request:"""
             
             logger.info(f"[Composer] Task composed: {task_definition.name} with {len(task_definition.steps)} steps")
             
-            # Execute if requested
-            execution_id = None
-            if auto_execute:
-                logger.info("[Composer] Auto-executing task...")
-                try:
-                    result = await execute_capability_task(task_definition)
-                    execution_id = result.execution_id
-                    logger.info(f"[Composer] Task executed: {execution_id}")
-                except Exception as e:
-                    logger.error(f"[Composer] Execution failed: {e}")
-                    return TaskCompositionResult(
-                        success=False,
-                        suggested_task=task_dict,
-                        error=f"Task composition succeeded but execution failed: {str(e)}",
-                        explanation=f"Task was generated but failed during execution. Error: {str(e)}"
-                    )
+            confidence = validation_result.get("confidence", 0.8)
+            if use_cache:
+                self.plan_cache.put(request, registry_version, task_dict, confidence)
             
-            return TaskCompositionResult(
-                success=True,
-                task_definition=task_definition,
-                suggested_task=task_dict,  # Always include for reference
-                explanation=f"Composed {len(task_definition.steps)}-step task: {' → '.join([s.capability_name for s in task_definition.steps])}",
-                confidence=validation_result.get("confidence", 0.8),
-                execution_id=execution_id,
+            return await self._build_result(
+                task_dict,
+                task_definition,
+                confidence=confidence,
+                auto_execute=auto_execute,
             )
             
         except Exception as e:
@@ -213,6 +505,55 @@ Now generate the task JSON for the user's request:"""
                 explanation=f"Failed to compose task: {str(e)}"
             )
     
+    async def _build_result(
+        self,
+        task_dict: Dict[str, Any],
+        task_definition: CapabilityTaskDefinition,
+        confidence: float,
+        auto_execute: bool,
+        cache_hit: bool = False,
+    ) -> TaskCompositionResult:
+        """
+        Optionally execute a composed task and wrap it in a TaskCompositionResult.
+        
+        Args:
+            task_dict: Validated task dictionary
+            task_definition: Task definition built from task_dict
+            confidence: Composition confidence (0-1)
+            auto_execute: Whether to execute the task now
+            cache_hit: Whether the plan came from the plan cache
+            
+        Returns:
+            TaskCompositionResult
+        """
+        # Execute if requested
+        execution_id = None
+        if auto_execute:
+            logger.info("[Composer] Auto-executing task...")
+            try:
+                result = await execute_capability_task(task_definition)
+                execution_id = result.execution_id
+                logger.info(f"[Composer] Task executed: {execution_id}")
+            except Exception as e:
+                logger.error(f"[Composer] Execution failed: {e}")
+                return TaskCompositionResult(
+                    success=False,
+                    suggested_task=task_dict,
+                    error=f"Task composition succeeded but execution failed: {str(e)}",
+                    explanation=f"Task was generated but failed during execution. Error: {str(e)}",
+                    cache_hit=cache_hit,
+                )
+        
+        return TaskCompositionResult(
+            success=True,
+            task_definition=task_definition,
+            suggested_task=task_dict,  # Always include for reference
+            explanation=f"Composed {len(task_definition.steps)}-step task: {' → '.join([s.capability_name for s in task_definition.steps])}",
+            confidence=confidence,
+            execution_id=execution_id,
+            cache_hit=cache_hit,
+        )
+    
     async def _call_llm(self, prompt: str) -> str:
         """
         Call LLM with the composition prompt.
@@ -151,6 +151,12 @@ class CapabilityRegistry:
         self._capabilities: Dict[str, Capability] = {}
         self._callable_capabilities: Dict[str, Callable] = {}  # Functions wrapped as capabilities
         self._metadata: Dict[str, CapabilityMetadata] = {}
+        self._version = 0  # Bumped on every registration so consumers can invalidate caches
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter that changes whenever the set of capabilities changes."""
+        return self._version
     
     def register(self, capability: Capability) -> None:
         """
@@ -165,6 +171,7 @@ class CapabilityRegistry:
         
         self._capabilities[name] = capability
         self._metadata[name] = capability.metadata
+        self._version += 1
     
     def register_function(
         self,
@@ -198,6 +205,7 @@ class CapabilityRegistry:
             tags=tags or [],
             cost_tier=cost_tier,
         )
+        self._version += 1
     
     def get(self, name: str) -> Optional[Capability]:
         """Get a capability by name."""
@@ -3,9 +3,13 @@ Capability Task Executor - Executes tasks composed of chained capabilities.
 
 A task is a sequence of capabilities where outputs of one step feed into
 inputs of the next step (pipeline data flow).
+
+When no explicit parallel groups are supplied, execute_parallel_steps infers a
+dependency graph from "$output_key" input references and runs each step as soon
+as the steps it depends on have finished.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import uuid
@@ -90,6 +94,8 @@ class TaskExecutionResult:
     error: Optional[str] = None
     started_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
+    critical_path: List[int] = field(default_factory=list)  # Step indices on the longest dependency chain
+    critical_path_ms: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -104,6 +110,8 @@ class TaskExecutionResult:
             "error": self.error,
             "started_at": self.started_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "critical_path": self.critical_path,
+            "critical_path_ms": self.critical_path_ms,
         }
     
     @property
@@ -115,17 +123,40 @@ class TaskExecutionResult:
         return int((completed / len(self.step_results)) * 100) if self.step_results else 0
 
 
+# Default per-cost-tier concurrency limits for DAG scheduling
+DEFAULT_COST_TIER_LIMITS: Dict[str, int] = {
+    "ultra_cheap": 8,
+    "cheap": 4,
+    "balanced": 2,
+    "premium": 1,
+}
+
+_REFERENCE_PATTERN = re.compile(r'\$([a-zA-Z_][a-zA-Z0-9_]*)')
+
+
 class CapabilityTaskExecutor:
     """Executes capability-based tasks with data flow between steps."""
     
-    def __init__(self, registry=None):
+    def __init__(
+        self,
+        registry=None,
+        max_concurrency: int = 4,
+        cost_tier_limits: Optional[Dict[str, int]] = None,
+    ):
         """
         Initialize executor.
         
         Args:
             registry: CapabilityRegistry instance (defaults to global)
+            max_concurrency: Global cap on steps running at once in DAG mode
+            cost_tier_limits: Per-cost-tier caps in DAG mode (tiers not listed are
+                              only bound by max_concurrency)
         """
         self.registry = registry or get_registry()
+        self.max_concurrency = max(1, max_concurrency)
+        self.cost_tier_limits = (
+            cost_tier_limits if cost_tier_limits is not None else dict(DEFAULT_COST_TIER_LIMITS)
+        )
     
     def _resolve_input_reference(self, value: Any, context: Dict[str, Any]) -> Any:
         """
@@ -142,7 +173,7 @@ class CapabilityTaskExecutor:
             return value
         
         # Match patterns like $step_0.output or $research_data
-        match = re.match(r'\$([a-zA-Z_][a-zA-Z0-9_]*)', value)
+        match = _REFERENCE_PATTERN.match(value)
         if not match:
             return value
         
@@ -287,10 +318,9 @@ class CapabilityTaskExecutor:
             status="running",
         )
         
-        # Default: each step runs serially
+        # Default: infer the dependency graph from input references
         if parallel_groups is None:
-            sorted_steps = sorted(task.steps, key=lambda s: s.order)
-            parallel_groups = [[i] for i in range(len(sorted_steps))]
+            return await self._execute_dag(task, result)
         
         context: Dict[str, Any] = {}
         import time
@@ -329,7 +359,7 @@ class CapabilityTaskExecutor:
                     else:
                         # Success - update context
                         context[step.output_key] = step_result["output"]
-                        result.step_results.append(step_result)
+                        result.step_results.append(StepResult(**step_result))
                 
                 if result.status == "failed":
                     break
@@ -348,6 +378,192 @@ class CapabilityTaskExecutor:
         
         return result
     
+    def build_dependency_graph(
+        self,
+        steps: List[CapabilityStep],
+    ) -> Dict[int, Set[int]]:
+        """
+        Infer step dependencies from "$output_key" references.
+        
+        A step depends on the closest earlier step (in order) whose output_key it
+        references. A step that writes an output_key also waits for the previous
+        writer of that key and for every step that read the previous value, so
+        each reader sees and the final outputs hold what serial execution would
+        produce. References that no step produces are treated as literals, as in
+        _resolve_input_reference.
+        
+        Args:
+            steps: Steps sorted by order
+            
+        Returns:
+            Mapping of step index -> set of step indices it depends on
+        """
+        dependencies: Dict[int, Set[int]] = {i: set() for i in range(len(steps))}
+        last_writer: Dict[str, int] = {}
+        readers: Dict[str, Set[int]] = {}
+        
+        for index, step in enumerate(steps):
+            for value in step.inputs.values():
+                if not isinstance(value, str):
+                    continue
+                match = _REFERENCE_PATTERN.match(value)
+                if match and match.group(1) in last_writer:
+                    dependencies[index].add(last_writer[match.group(1)])
+                    readers.setdefault(match.group(1), set()).add(index)
+            
+            if step.output_key in last_writer:
+                dependencies[index].add(last_writer[step.output_key])
+            # Don't overwrite a value before the steps reading it have run
+            dependencies[index] |= readers.pop(step.output_key, set()) - {index}
+            last_writer[step.output_key] = index
+        
+        return dependencies
+    
+    @staticmethod
+    def _compute_critical_path(
+        dependencies: Dict[int, Set[int]],
+        durations: Dict[int, float],
+    ) -> tuple[List[int], float]:
+        """
+        Find the longest chain of dependent steps by observed duration.
+        
+        Args:
+            dependencies: Step dependency graph (indices are topologically ordered)
+            durations: Observed duration per executed step (ms)
+            
+        Returns:
+            (step indices on the critical path, total duration in ms)
+        """
+        finish: Dict[int, float] = {}
+        previous: Dict[int, Optional[int]] = {}
+        for index in sorted(durations):
+            best_dep, best_finish = None, 0.0
+            for dep in dependencies.get(index, ()):
+                if dep in finish and finish[dep] > best_finish:
+                    best_dep, best_finish = dep, finish[dep]
+            finish[index] = best_finish + durations[index]
+            previous[index] = best_dep
+        
+        if not finish:
+            return [], 0.0
+        
+        tail = max(finish, key=finish.get)
+        path = []
+        node: Optional[int] = tail
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return list(reversed(path)), finish[tail]
+    
+    async def _execute_dag(
+        self,
+        task: CapabilityTaskDefinition,
+        result: TaskExecutionResult,
+    ) -> TaskExecutionResult:
+        """
+        Execute steps as a dependency graph.
+        
+        Each step starts as soon as all of its dependencies have completed,
+        bounded by max_concurrency and the step's cost-tier limit (the tier slot
+        is taken first, so a step queued on a busy tier does not hold one of the
+        global slots other tiers could use). On the first
+        failure no further steps are started; steps already running finish.
+        
+        Args:
+            task: Task to execute
+            result: Result object to populate
+            
+        Returns:
+            Populated TaskExecutionResult
+        """
+        import time
+        start_time = time.time()
+        
+        sorted_steps = sorted(task.steps, key=lambda s: s.order)
+        dependencies = self.build_dependency_graph(sorted_steps)
+        remaining = {i: set(deps) for i, deps in dependencies.items()}
+        
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        tier_limits = {
+            tier: asyncio.Semaphore(max(1, limit))
+            for tier, limit in self.cost_tier_limits.items()
+        }
+        
+        context: Dict[str, Any] = {}
+        durations: Dict[int, float] = {}
+        step_results: Dict[int, StepResult] = {}
+        running: Dict[asyncio.Task, int] = {}
+        launched_at: Dict[int, float] = {}
+        
+        async def run_step(index: int) -> Dict[str, Any]:
+            step = sorted_steps[index]
+            metadata = self.registry.get_metadata(step.capability_name)
+            tier_limit = tier_limits.get(metadata.cost_tier) if metadata else None
+            if tier_limit is None:
+                async with global_limit:
+                    return await self._execute_step(step, index, context)
+            async with tier_limit, global_limit:
+                return await self._execute_step(step, index, context)
+        
+        def launch_ready() -> None:
+            for index in [i for i, deps in remaining.items() if not deps]:
+                del remaining[index]
+                launched_at[index] = time.time()
+                running[asyncio.create_task(run_step(index))] = index
+        
+        try:
+            launch_ready()
+            while running:
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for step_task in done:
+                    index = running.pop(step_task)
+                    step = sorted_steps[index]
+                    error = step_task.exception()
+                    if error is not None:
+                        step_results[index] = StepResult(
+                            step_index=index,
+                            capability_name=step.capability_name,
+                            output_key=step.output_key,
+                            output=None,
+                            duration_ms=(time.time() - launched_at[index]) * 1000,
+                            error=str(error),
+                            status="failed",
+                        )
+                        if result.status != "failed":
+                            result.status = "failed"
+                            result.error = f"Step {index} ({step.capability_name}) failed: {str(error)}"
+                        continue
+                    
+                    step_output = step_task.result()
+                    context[step.output_key] = step_output["output"]
+                    durations[index] = step_output["duration_ms"]
+                    step_results[index] = StepResult(**step_output)
+                    for deps in remaining.values():
+                        deps.discard(index)
+                
+                if result.status != "failed":
+                    launch_ready()
+            
+            if result.status == "running":
+                result.status = "completed"
+                result.final_outputs = context.copy()
+        
+        except Exception as e:
+            for step_task in running:
+                step_task.cancel()
+            result.status = "failed"
+            result.error = f"Task execution failed: {str(e)}"
+        
+        finally:
+            result.step_results = [step_results[i] for i in sorted(step_results)]
+            result.critical_path, result.critical_path_ms = self._compute_critical_path(
+                dependencies, durations
+            )
+            result.total_duration_ms = (time.time() - start_time) * 1000
+            result.completed_at = datetime.utcnow()
+        
+        return result
+    
     async def _execute_step(
         self,
         step: CapabilityStep,
@@ -385,10 +601,13 @@ async def execute_capability_task(
     
     Args:
         task: Task to execute
-        parallel: Whether to attempt parallel execution
+        parallel: Run independent steps concurrently (dependency graph inferred
+                  from input references)
         
     Returns:
         TaskExecutionResult
     """
     executor = CapabilityTaskExecutor()
+    if parallel:
+        return await executor.execute_parallel_steps(task)
     return await executor.execute(task)
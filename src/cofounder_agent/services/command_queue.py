@@ -3,19 +3,36 @@ Command Queue Service - Replaces Pub/Sub Messaging
 Provides API-based async task dispatch for agent communication
 
 Features:
-- In-memory task queue for local development
-- PostgreSQL persistence for production
+- Pluggable storage backend (CommandQueueBackend)
+  - InMemoryCommandBackend: local development and tests
+  - PostgresCommandBackend: durable and shared between replicas (FOR UPDATE SKIP LOCKED)
+- Visibility timeouts: a dequeued command is leased to one consumer and is
+  redelivered if it is not completed or failed before the lease expires
+- Fenced state transitions: complete/fail/cancel only apply if the command is
+  unchanged since it was read, so a consumer whose lease expired cannot
+  overwrite the result of the consumer it was redelivered to
+- Dead-lettering once max_retries is exhausted, with replay
+- Batch dequeue with consumer names and agent_type consumer groups
+- Throughput and backlog metrics via get_stats()
 - Async task dispatch via FastAPI endpoints
 - Agent polling/callback pattern
+
+Configuration:
+    COMMAND_QUEUE_BACKEND=memory|postgres   (default: memory)
+    COMMAND_QUEUE_VISIBILITY_TIMEOUT=300    (seconds)
 """
 
 import asyncio
 import json
 import logging
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
@@ -29,6 +46,7 @@ class CommandStatus(str, Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    DEAD_LETTER = "dead_letter"
 
 
 @dataclass
@@ -48,6 +66,8 @@ class Command:  # pylint: disable=too-many-instance-attributes
     completed_at: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    claimed_by: Optional[str] = None  # Consumer currently holding the lease
+    visible_at: Optional[str] = None  # When the command becomes deliverable (again)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -56,22 +76,515 @@ class Command:  # pylint: disable=too-many-instance-attributes
         return data
 
 
-class CommandQueue:
+class StaleCommandError(Exception):
+    """The command changed since it was read (lease lost or concurrently updated)"""
+
+
+def _parse_ts(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _format_ts(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# ============================================================================
+# Storage backends
+# ============================================================================
+
+
+class CommandQueueBackend(ABC):
     """
-    Local in-memory command queue
+    Storage backend for CommandQueue.
 
-    In production with PostgreSQL, this would be replaced with a database-backed queue.
-    For now, this provides the interface and in-memory implementation.
+    Backends own command state and delivery. claim() must hand each visible
+    command to exactly one consumer and lease it for visibility_timeout seconds.
     """
 
+    name = "abstract"
+
+    @abstractmethod
+    async def add(self, command: Command) -> None:
+        """Store a new pending command"""
+
+    @abstractmethod
+    async def get(self, command_id: str) -> Optional[Command]:
+        """Get a command by ID"""
+
+    @abstractmethod
+    async def update(self, command: Command, expected: Optional[Command] = None) -> bool:
+        """
+        Persist the full state of an existing command.
+
+        With expected, the write is a compare-and-set: it only applies if the
+        stored command still has expected's status, claimed_by and started_at
+        (started_at changes on every claim, so it fences one lease).
+
+        Returns:
+            Whether the command was written
+        """
+
+    @abstractmethod
+    async def claim(
+        self,
+        max_count: int,
+        consumer: str,
+        visibility_timeout: float,
+        agent_types: Optional[List[str]] = None,
+    ) -> Tuple[List[Command], List[Command]]:
+        """
+        Lease up to max_count visible commands to a consumer.
+
+        Commands whose lease expired are redelivered; a redelivery counts as a
+        retry, and commands that exhaust max_retries this way are dead-lettered.
+
+        Returns:
+            (claimed commands, commands dead-lettered during the claim)
+        """
+
+    @abstractmethod
+    async def list(
+        self, status: Optional[CommandStatus], limit: Optional[int], offset: int
+    ) -> List[Command]:
+        """List commands newest first"""
+
+    @abstractmethod
+    async def count(self, status: Optional[CommandStatus] = None) -> int:
+        """Count commands, optionally by status"""
+
+    @abstractmethod
+    async def counts_by_status(self) -> Dict[str, int]:
+        """Command counts keyed by status value"""
+
+    @abstractmethod
+    async def backlog(self) -> Dict[str, Any]:
+        """Backlog depth (deliverable pending commands) and age of the oldest one"""
+
+    @abstractmethod
+    async def delete_before(self, statuses: List[CommandStatus], cutoff: datetime) -> int:
+        """Delete commands in the given statuses last updated before cutoff"""
+
+
+class InMemoryCommandBackend(CommandQueueBackend):
+    """Process-local backend. State is lost on restart; used for development and tests."""
+
+    name = "memory"
+
     def __init__(self):
-        """Initialize command queue"""
         self.commands: Dict[str, Command] = {}
-        self.queue: asyncio.Queue = asyncio.Queue()
+        self._ready: Deque[str] = deque()
+
+    async def add(self, command: Command) -> None:
+        self.commands[command.id] = command
+        self._ready.append(command.id)
+
+    async def get(self, command_id: str) -> Optional[Command]:
+        command = self.commands.get(command_id)
+        # A copy, so callers mutate their snapshot rather than the stored command
+        return replace(command) if command else None
+
+    async def update(self, command: Command, expected: Optional[Command] = None) -> bool:
+        stored = self.commands.get(command.id)
+        if expected is not None and (
+            stored is None
+            or (stored.status, stored.claimed_by, stored.started_at)
+            != (expected.status, expected.claimed_by, expected.started_at)
+        ):
+            return False
+        if stored is None:
+            self.commands[command.id] = command
+        else:
+            vars(stored).update(vars(command))
+        if command.status == CommandStatus.PENDING and command.id not in self._ready:
+            self._ready.append(command.id)
+        return True
+
+    async def claim(
+        self,
+        max_count: int,
+        consumer: str,
+        visibility_timeout: float,
+        agent_types: Optional[List[str]] = None,
+    ) -> Tuple[List[Command], List[Command]]:
+        now = datetime.utcnow()
+        claimed: List[Command] = []
+        dead: List[Command] = []
+
+        # Expired leases are redelivered ahead of new work
+        for command in self.commands.values():
+            if command.status != CommandStatus.PROCESSING or not command.visible_at:
+                continue
+            if _parse_ts(command.visible_at) > now:
+                continue
+            command.retry_count += 1
+            command.claimed_by = None
+            command.updated_at = now.isoformat()
+            if command.retry_count > command.max_retries:
+                command.status = CommandStatus.DEAD_LETTER
+                command.error = command.error or "Visibility timeout exceeded"
+                command.visible_at = None
+                dead.append(command)
+            else:
+                command.status = CommandStatus.PENDING
+                self._ready.appendleft(command.id)
+
+        skipped: List[str] = []
+        while self._ready and len(claimed) < max_count:
+            command_id = self._ready.popleft()
+            command = self.commands.get(command_id)
+            if not command or command.status != CommandStatus.PENDING:
+                continue
+            delayed = command.visible_at and _parse_ts(command.visible_at) > now
+            if delayed or (agent_types and command.agent_type not in agent_types):
+                skipped.append(command_id)
+                continue
+            command.status = CommandStatus.PROCESSING
+            command.claimed_by = consumer
+            command.started_at = now.isoformat()
+            command.updated_at = now.isoformat()
+            command.visible_at = (now + timedelta(seconds=visibility_timeout)).isoformat()
+            claimed.append(command)
+        self._ready.extendleft(reversed(skipped))
+
+        return claimed, dead
+
+    async def list(
+        self, status: Optional[CommandStatus], limit: Optional[int], offset: int
+    ) -> List[Command]:
+        commands = [c for c in self.commands.values() if not status or c.status == status]
+        commands.sort(key=lambda c: c.created_at, reverse=True)
+        if limit is None:
+            return commands[offset:]
+        return commands[offset : offset + limit]
+
+    async def count(self, status: Optional[CommandStatus] = None) -> int:
+        if not status:
+            return len(self.commands)
+        return sum(1 for c in self.commands.values() if c.status == status)
+
+    async def counts_by_status(self) -> Dict[str, int]:
+        by_status: Dict[str, int] = {}
+        for cmd in self.commands.values():
+            by_status[cmd.status.value] = by_status.get(cmd.status.value, 0) + 1
+        return by_status
+
+    async def backlog(self) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        created = [
+            _parse_ts(c.created_at)
+            for c in self.commands.values()
+            if c.status == CommandStatus.PENDING
+            and (not c.visible_at or _parse_ts(c.visible_at) <= now)
+        ]
+        oldest = min(created, default=None)
+        return {
+            "depth": len(created),
+            "oldest_pending_age_seconds": (now - oldest).total_seconds() if oldest else 0.0,
+        }
+
+    async def delete_before(self, statuses: List[CommandStatus], cutoff: datetime) -> int:
+        to_delete = [
+            cmd_id
+            for cmd_id, cmd in self.commands.items()
+            if cmd.status in statuses and _parse_ts(cmd.updated_at) < cutoff
+        ]
+        for cmd_id in to_delete:
+            del self.commands[cmd_id]
+        return len(to_delete)
+
+
+class PostgresCommandBackend(CommandQueueBackend):
+    """
+    Durable backend on the command_queue table (migration 0023).
+
+    Delivery uses SELECT ... FOR UPDATE SKIP LOCKED so any number of replicas
+    can consume concurrently without handing one command to two consumers.
+    """
+
+    name = "postgres"
+
+    COLUMNS = [
+        "id",
+        "agent_type",
+        "action",
+        "payload",
+        "status",
+        "result",
+        "error",
+        "created_at",
+        "updated_at",
+        "started_at",
+        "completed_at",
+        "retry_count",
+        "max_retries",
+        "claimed_by",
+        "visible_at",
+    ]
+
+    def __init__(self, pool):
+        """
+        Args:
+            pool: asyncpg connection pool
+        """
+        self.pool = pool
+        self._select = ", ".join(self.COLUMNS)
+
+    @staticmethod
+    def _row_to_command(row) -> Command:
+        def _json(value):
+            return json.loads(value) if isinstance(value, str) else value
+
+        return Command(
+            id=str(row["id"]),
+            agent_type=row["agent_type"],
+            action=row["action"],
+            payload=_json(row["payload"]) or {},
+            status=CommandStatus(row["status"]),
+            result=_json(row["result"]),
+            error=row["error"],
+            created_at=_format_ts(row["created_at"]),
+            updated_at=_format_ts(row["updated_at"]),
+            started_at=_format_ts(row["started_at"]),
+            completed_at=_format_ts(row["completed_at"]),
+            retry_count=row["retry_count"],
+            max_retries=row["max_retries"],
+            claimed_by=row["claimed_by"],
+            visible_at=_format_ts(row["visible_at"]),
+        )
+
+    async def add(self, command: Command) -> None:
+        await self.pool.execute(
+            """
+            INSERT INTO command_queue
+                (id, agent_type, action, payload, status, created_at, updated_at,
+                 retry_count, max_retries, visible_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, COALESCE($10, NOW()))
+            """,
+            command.id,
+            command.agent_type,
+            command.action,
+            json.dumps(command.payload),
+            command.status.value,
+            _parse_ts(command.created_at),
+            _parse_ts(command.updated_at),
+            command.retry_count,
+            command.max_retries,
+            _parse_ts(command.visible_at),
+        )
+
+    async def get(self, command_id: str) -> Optional[Command]:
+        row = await self.pool.fetchrow(
+            f"SELECT {self._select} FROM command_queue WHERE id = $1", command_id
+        )
+        return self._row_to_command(row) if row else None
+
+    async def update(self, command: Command, expected: Optional[Command] = None) -> bool:
+        fence = (
+            (expected.status.value, expected.claimed_by, _parse_ts(expected.started_at))
+            if expected is not None
+            else (None, None, None)
+        )
+        updated = await self.pool.fetchval(
+            """
+            UPDATE command_queue
+            SET status = $2, result = $3, error = $4, updated_at = $5, started_at = $6,
+                completed_at = $7, retry_count = $8, claimed_by = $9,
+                visible_at = COALESCE($10, NOW())
+            WHERE id = $1
+              AND (NOT $11::bool OR (
+                  status = $12 AND claimed_by IS NOT DISTINCT FROM $13
+                  AND started_at IS NOT DISTINCT FROM $14
+              ))
+            RETURNING id
+            """,
+            command.id,
+            command.status.value,
+            json.dumps(command.result) if command.result is not None else None,
+            command.error,
+            _parse_ts(command.updated_at),
+            _parse_ts(command.started_at),
+            _parse_ts(command.completed_at),
+            command.retry_count,
+            command.claimed_by,
+            _parse_ts(command.visible_at),
+            expected is not None,
+            *fence,
+        )
+        return updated is not None
+
+    async def claim(
+        self,
+        max_count: int,
+        consumer: str,
+        visibility_timeout: float,
+        agent_types: Optional[List[str]] = None,
+    ) -> Tuple[List[Command], List[Command]]:
+        returning = ", ".join(f"q.{c}" for c in self.COLUMNS)
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                # Expired leases that used up their deliveries are dead-lettered
+                dead_rows = await conn.fetch(
+                    f"""
+                    UPDATE command_queue q
+                    SET status = 'dead_letter', retry_count = q.retry_count + 1,
+                        claimed_by = NULL, updated_at = NOW(),
+                        error = COALESCE(q.error, 'Visibility timeout exceeded')
+                    WHERE q.status = 'processing' AND q.visible_at <= NOW()
+                      AND q.retry_count >= q.max_retries
+                    RETURNING {returning}
+                    """
+                )
+
+                # Pending commands and expired leases, oldest first; an expired
+                # lease is a redelivery and counts as a retry
+                rows = await conn.fetch(
+                    f"""
+                    WITH next AS (
+                        SELECT id FROM command_queue
+                        WHERE status IN ('pending', 'processing')
+                          AND visible_at <= NOW()
+                          AND ($3::text[] IS NULL OR agent_type = ANY($3::text[]))
+                        ORDER BY visible_at, created_at
+                        LIMIT $1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE command_queue q
+                    SET retry_count = q.retry_count
+                            + CASE WHEN q.status = 'processing' THEN 1 ELSE 0 END,
+                        status = 'processing',
+                        claimed_by = $2,
+                        started_at = NOW(),
+                        updated_at = NOW(),
+                        visible_at = NOW() + make_interval(secs => $4)
+                    FROM next
+                    WHERE q.id = next.id
+                    RETURNING {returning}
+                    """,
+                    max_count,
+                    consumer,
+                    agent_types,
+                    float(visibility_timeout),
+                )
+
+        return (
+            [self._row_to_command(r) for r in rows],
+            [self._row_to_command(r) for r in dead_rows],
+        )
+
+    async def list(
+        self, status: Optional[CommandStatus], limit: Optional[int], offset: int
+    ) -> List[Command]:
+        rows = await self.pool.fetch(
+            f"""
+            SELECT {self._select} FROM command_queue
+            WHERE ($1::text IS NULL OR status = $1)
+            ORDER BY created_at DESC
+            LIMIT $2 OFFSET $3
+            """,
+            status.value if status else None,
+            limit,
+            offset,
+        )
+        return [self._row_to_command(r) for r in rows]
+
+    async def count(self, status: Optional[CommandStatus] = None) -> int:
+        return await self.pool.fetchval(
+            "SELECT COUNT(*) FROM command_queue WHERE ($1::text IS NULL OR status = $1)",
+            status.value if status else None,
+        )
+
+    async def counts_by_status(self) -> Dict[str, int]:
+        rows = await self.pool.fetch(
+            "SELECT status, COUNT(*) AS count FROM command_queue GROUP BY status"
+        )
+        return {row["status"]: row["count"] for row in rows}
+
+    async def backlog(self) -> Dict[str, Any]:
+        row = await self.pool.fetchrow(
+            """
+            SELECT COUNT(*) AS depth,
+                   COALESCE(EXTRACT(EPOCH FROM NOW() - MIN(created_at)), 0) AS oldest_age
+            FROM command_queue
+            WHERE status = 'pending' AND visible_at <= NOW()
+            """
+        )
+        return {
+            "depth": row["depth"],
+            "oldest_pending_age_seconds": float(row["oldest_age"]),
+        }
+
+    async def delete_before(self, statuses: List[CommandStatus], cutoff: datetime) -> int:
+        result = await self.pool.execute(
+            "DELETE FROM command_queue WHERE status = ANY($1::text[]) AND updated_at < $2",
+            [s.value for s in statuses],
+            cutoff,
+        )
+        # asyncpg returns the command tag, e.g. "DELETE 42"
+        return int(result.split()[-1]) if result else 0
+
+
+class _RateWindow:
+    """Rolling event counter for per-minute throughput"""
+
+    def __init__(self, window_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self._events: Deque[Tuple[float, int]] = deque()
+
+    def record(self, count: int = 1) -> None:
+        self._events.append((time.monotonic(), count))
+        self._trim()
+
+    def _trim(self) -> None:
+        cutoff = time.monotonic() - self.window_seconds
+        while self._events and self._events[0][0] < cutoff:
+            self._events.popleft()
+
+    def per_minute(self) -> float:
+        self._trim()
+        total = sum(count for _, count in self._events)
+        return round(total * 60.0 / self.window_seconds, 2)
+
+
+class CommandQueue:
+    """
+    Command queue with a pluggable storage backend
+
+    Uses the in-memory backend by default (development and tests). Pass a
+    PostgresCommandBackend for commands that survive restarts and are shared
+    between replicas.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CommandQueueBackend] = None,
+        visibility_timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        consumer_name: Optional[str] = None,
+    ):
+        """
+        Initialize command queue
+
+        Args:
+            backend: Storage backend (defaults to InMemoryCommandBackend)
+            visibility_timeout: Seconds a dequeued command stays leased to its consumer
+            poll_interval: Max seconds between backend polls while dequeue() waits
+            consumer_name: Default consumer name recorded on leases
+        """
+        self.backend = backend or InMemoryCommandBackend()
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.consumer_name = consumer_name or f"{os.getenv('HOSTNAME', 'local')}:{os.getpid()}"
         self.handlers: Dict[str, List[Callable]] = {}
-        self._running = False
+        self._work_available = asyncio.Event()
+        self._rates = {
+            "enqueued": _RateWindow(),
+            "dequeued": _RateWindow(),
+            "completed": _RateWindow(),
+            "failed": _RateWindow(),
+            "dead_lettered": _RateWindow(),
+        }
 
-        logger.info("CommandQueue initialized (in-memory)")
+        logger.info(f"CommandQueue initialized ({self.backend.name})")
 
     async def enqueue(self, command: Command) -> str:
         """
@@ -83,8 +596,9 @@ class CommandQueue:
         Returns:
             Command ID
         """
-        self.commands[command.id] = command
-        await self.queue.put(command.id)
+        await self.backend.add(command)
+        self._rates["enqueued"].record()
+        self._work_available.set()
 
         logger.info(
             f"Command enqueued: {command.id} (agent={command.agent_type}, action={command.action})"
@@ -92,57 +606,144 @@ class CommandQueue:
 
         return command.id
 
-    async def dequeue(self, timeout: Optional[float] = None) -> Optional[Command]:
+    async def dequeue(
+        self,
+        timeout: Optional[float] = None,
+        consumer: Optional[str] = None,
+        agent_types: Optional[List[str]] = None,
+    ) -> Optional[Command]:
         """
         Dequeue a command for processing
 
         Args:
             timeout: Optional timeout in seconds
+            consumer: Consumer name recorded on the lease
+            agent_types: Only deliver commands for these agent types (consumer group)
 
         Returns:
             Command or None if timeout
         """
-        try:
-            command_id = await asyncio.wait_for(self.queue.get(), timeout=timeout)
-            command = self.commands.get(command_id)
+        commands = await self.dequeue_batch(
+            max_count=1, timeout=timeout, consumer=consumer, agent_types=agent_types
+        )
+        return commands[0] if commands else None
+
+    async def dequeue_batch(
+        self,
+        max_count: int = 10,
+        timeout: Optional[float] = None,
+        consumer: Optional[str] = None,
+        agent_types: Optional[List[str]] = None,
+        visibility_timeout: Optional[float] = None,
+    ) -> List[Command]:
+        """
+        Lease up to max_count commands, waiting up to timeout for at least one
 
-            if command:
-                command.status = CommandStatus.PROCESSING
-                command.started_at = datetime.utcnow().isoformat()
-                command.updated_at = datetime.utcnow().isoformat()
+        Leased commands must be completed or failed before the visibility
+        timeout, otherwise they are redelivered to another consumer.
 
-            return command
-        except asyncio.TimeoutError:
-            return None
+        Args:
+            max_count: Maximum number of commands to return
+            timeout: Seconds to wait for work (None waits indefinitely, 0 does not wait)
+            consumer: Consumer name recorded on the lease
+            agent_types: Only deliver commands for these agent types (consumer group)
+            visibility_timeout: Lease duration override in seconds
+
+        Returns:
+            Leased commands (empty on timeout)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            self._work_available.clear()
+            claimed, dead = await self.backend.claim(
+                max_count=max_count,
+                consumer=consumer or self.consumer_name,
+                visibility_timeout=visibility_timeout or self.visibility_timeout,
+                agent_types=agent_types,
+            )
+            for command in dead:
+                self._rates["dead_lettered"].record()
+                logger.error(f"Command dead-lettered after lease expiry: {command.id}")
+            if claimed:
+                self._rates["dequeued"].record(len(claimed))
+                return claimed
+
+            wait = self.poll_interval
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return []
+                wait = min(wait, remaining)
+
+            # Local enqueues wake us immediately; other replicas are seen by polling
+            try:
+                await asyncio.wait_for(self._work_available.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
 
     async def get_command(self, command_id: str) -> Optional[Command]:
         """Get command by ID"""
-        return self.commands.get(command_id)
-
-    async def list_commands(self, status: Optional[CommandStatus] = None) -> List[Command]:
-        """List commands, optionally filtered by status"""
-        commands = list(self.commands.values())
-
-        if status:
-            commands = [c for c in commands if c.status == status]
-
-        # Sort by created_at descending
-        commands.sort(key=lambda c: c.created_at, reverse=True)
+        return await self.backend.get(command_id)
+
+    async def list_commands(
+        self,
+        status: Optional[CommandStatus] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Command]:
+        """List commands newest first, optionally filtered by status"""
+        return await self.backend.list(status, limit, offset)
+
+    async def count_commands(self, status: Optional[CommandStatus] = None) -> int:
+        """Count commands, optionally filtered by status"""
+        return await self.backend.count(status)
+
+    @staticmethod
+    def _check_lease(command: Command, consumer: Optional[str]) -> None:
+        """Raise unless the command is in flight (and leased to consumer, if given)"""
+        if command.status != CommandStatus.PROCESSING or (
+            consumer is not None and command.claimed_by != consumer
+        ):
+            raise StaleCommandError(
+                f"Command {command.id} is not leased to {consumer or 'a consumer'} "
+                f"(status={command.status.value}, claimed_by={command.claimed_by})"
+            )
+
+    async def _write(self, command: Command, expected: Command) -> None:
+        """Compare-and-set a transition against the state it was computed from"""
+        if not await self.backend.update(command, expected):
+            raise StaleCommandError(f"Command {command.id} changed while it was being updated")
+
+    async def complete_command(
+        self, command_id: str, result: Dict[str, Any], consumer: Optional[str] = None
+    ) -> Optional[Command]:
+        """
+        Mark command as completed
 
-        return commands
+        Only an in-flight command can be completed. Pass the consumer that
+        dequeued it so a consumer whose lease expired, and whose command was
+        redelivered, cannot complete it on top of the new owner.
 
-    async def complete_command(self, command_id: str, result: Dict[str, Any]) -> Optional[Command]:
-        """Mark command as completed"""
-        command = self.commands.get(command_id)
+        Raises:
+            StaleCommandError: The command is not (or no longer) leased to consumer
+        """
+        command = await self.backend.get(command_id)
 
         if not command:
             logger.warning(f"Command not found: {command_id}")
             return None
 
+        self._check_lease(command, consumer)
+        expected = replace(command)
         command.status = CommandStatus.COMPLETED
         command.result = result
         command.completed_at = datetime.utcnow().isoformat()
         command.updated_at = datetime.utcnow().isoformat()
+        command.claimed_by = None
+        await self._write(command, expected)
+        self._rates["completed"].record()
 
         logger.info(f"Command completed: {command_id}")
 
@@ -152,44 +753,118 @@ class CommandQueue:
         return command
 
     async def fail_command(
-        self, command_id: str, error: str, retry: bool = True
+        self,
+        command_id: str,
+        error: str,
+        retry: bool = True,
+        retry_delay: float = 0.0,
+        consumer: Optional[str] = None,
     ) -> Optional[Command]:
-        """Mark command as failed"""
-        command = self.commands.get(command_id)
+        """
+        Mark command as failed
+
+        With retry=True the command is redelivered (after retry_delay seconds)
+        until max_retries is exhausted, then dead-lettered. With retry=False it
+        is marked failed immediately. Pass consumer to fence the call to the
+        lease holder, as for complete_command.
+
+        Raises:
+            StaleCommandError: The command is finished, not leased to consumer,
+                or changed concurrently
+        """
+        command = await self.backend.get(command_id)
 
         if not command:
             logger.warning(f"Command not found: {command_id}")
             return None
 
+        if consumer is not None:
+            self._check_lease(command, consumer)
+        elif command.status not in (CommandStatus.PENDING, CommandStatus.PROCESSING):
+            raise StaleCommandError(f"Command {command_id} is already {command.status.value}")
+        expected = replace(command)
+        now = datetime.utcnow()
         command.error = error
-        command.updated_at = datetime.utcnow().isoformat()
+        command.updated_at = now.isoformat()
+        command.claimed_by = None
 
         # Retry logic
         if retry and command.retry_count < command.max_retries:
             command.status = CommandStatus.PENDING
             command.retry_count += 1
-            await self.queue.put(command_id)
+            command.visible_at = (now + timedelta(seconds=retry_delay)).isoformat()
             logger.info(f"Command retrying: {command_id} (attempt {command.retry_count})")
+        elif retry:
+            command.status = CommandStatus.DEAD_LETTER
+            command.visible_at = None
+            logger.error(f"Command dead-lettered: {command_id} - {error}")
         else:
             command.status = CommandStatus.FAILED
+            command.visible_at = None
             logger.error(f"Command failed: {command_id} - {error}")
 
+        await self._write(command, expected)
+        self._rates["failed"].record()
+        if command.status == CommandStatus.DEAD_LETTER:
+            self._rates["dead_lettered"].record()
+        if command.status == CommandStatus.PENDING:
+            self._work_available.set()
+
+        return command
+
+    async def replay_command(self, command_id: str) -> Optional[Command]:
+        """Requeue a dead-lettered or failed command with a fresh retry budget"""
+        command = await self.backend.get(command_id)
+
+        if not command:
+            logger.warning(f"Command not found: {command_id}")
+            return None
+
+        if command.status not in [CommandStatus.DEAD_LETTER, CommandStatus.FAILED]:
+            logger.warning(f"Only failed/dead-lettered commands can be replayed: {command_id}")
+            return command
+
+        expected = replace(command)
+        command.status = CommandStatus.PENDING
+        command.retry_count = 0
+        command.error = None
+        command.result = None
+        command.visible_at = None
+        command.updated_at = datetime.utcnow().isoformat()
+        await self._write(command, expected)
+        self._work_available.set()
+
+        logger.info(f"Command replayed: {command_id}")
+
         return command
 
     async def cancel_command(self, command_id: str) -> Optional[Command]:
-        """Cancel a command"""
-        command = self.commands.get(command_id)
+        """
+        Cancel a command
+
+        Raises:
+            StaleCommandError: The command changed between read and write
+        """
+        command = await self.backend.get(command_id)
 
         if not command:
             logger.warning(f"Command not found: {command_id}")
             return None
 
-        if command.status in [CommandStatus.COMPLETED, CommandStatus.FAILED]:
+        if command.status in [
+            CommandStatus.COMPLETED,
+            CommandStatus.FAILED,
+            CommandStatus.DEAD_LETTER,
+        ]:
             logger.warning(f"Cannot cancel completed/failed command: {command_id}")
             return command
 
+        expected = replace(command)
         command.status = CommandStatus.CANCELLED
         command.updated_at = datetime.utcnow().isoformat()
+        command.claimed_by = None
+        command.visible_at = None
+        await self._write(command, expected)
 
         logger.info(f"Command cancelled: {command_id}")
 
@@ -216,35 +891,37 @@ class CommandQueue:
             except Exception as e:
                 logger.error(f"Handler error for {command.agent_type}: {e}")
 
-    async def clear_old_commands(self, max_age_hours: int = 24):
-        """Clear old completed commands"""
-        from datetime import datetime, timedelta
-
-        now = datetime.utcnow()
-        cutoff = now - timedelta(hours=max_age_hours)
+    async def clear_old_commands(self, max_age_hours: int = 24) -> int:
+        """Clear old completed and cancelled commands"""
+        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+        deleted = await self.backend.delete_before(
+            [CommandStatus.COMPLETED, CommandStatus.CANCELLED], cutoff
+        )
 
-        to_delete = []
-        for cmd_id, cmd in self.commands.items():
-            if cmd.status == CommandStatus.COMPLETED:
-                cmd_updated = datetime.fromisoformat(cmd.updated_at)
-                if cmd_updated < cutoff:
-                    to_delete.append(cmd_id)
+        logger.info(f"Cleared {deleted} old commands")
+        return deleted
 
-        for cmd_id in to_delete:
-            del self.commands[cmd_id]
-
-        logger.info(f"Cleared {len(to_delete)} old commands")
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get queue statistics"""
-        by_status = {}
-        for cmd in self.commands.values():
-            status = cmd.status.value
-            by_status[status] = by_status.get(status, 0) + 1
+        Counts and backlog come from the backend, so they cover every replica
+        on a shared backend. Throughput is measured by this process over the
+        last minute.
+        """
+        by_status = await self.backend.counts_by_status()
+        backlog = await self.backend.backlog()
 
         return {
-            "total_commands": len(self.commands),
-            "pending_commands": self.queue.qsize(),
+            "backend": self.backend.name,
+            "total_commands": sum(by_status.values()),
+            "pending_commands": backlog["depth"],
+            "in_flight_commands": by_status.get(CommandStatus.PROCESSING.value, 0),
+            "dead_letter_commands": by_status.get(CommandStatus.DEAD_LETTER.value, 0),
+            "oldest_pending_age_seconds": round(backlog["oldest_pending_age_seconds"], 3),
+            "throughput_per_minute": {
+                name: window.per_minute() for name, window in self._rates.items()
+            },
             "by_status": by_status,
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -264,6 +941,36 @@ def get_command_queue() -> CommandQueue:
     return _command_queue
 
 
+def configure_command_queue(database_service: Any = None) -> CommandQueue:
+    """
+    Configure the global command queue from the environment
+
+    COMMAND_QUEUE_BACKEND=postgres uses the database pool; any other value,
+    or a missing pool, keeps the in-memory backend.
+
+    Args:
+        database_service: DatabaseService exposing an asyncpg pool
+
+    Returns:
+        The configured global CommandQueue
+    """
+    global _command_queue
+
+    backend_name = os.getenv("COMMAND_QUEUE_BACKEND", "memory").lower()
+    visibility_timeout = float(os.getenv("COMMAND_QUEUE_VISIBILITY_TIMEOUT", "300"))
+
+    backend: Optional[CommandQueueBackend] = None
+    if backend_name == "postgres":
+        pool = getattr(database_service, "pool", None)
+        if pool is not None:
+            backend = PostgresCommandBackend(pool)
+        else:
+            logger.warning("COMMAND_QUEUE_BACKEND=postgres but no database pool, using memory")
+
+    _command_queue = CommandQueue(backend=backend, visibility_timeout=visibility_timeout)
+    return _command_queue
+
+
 async def create_command(
     agent_type: str, action: str, payload: Optional[Dict[str, Any]] = None
 ) -> Command:
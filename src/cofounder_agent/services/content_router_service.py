@@ -100,18 +100,18 @@ class ContentTaskStore:
         logger.info(f"   Topic: {topic[:60]}{'...' if len(topic) > 60 else ''}")
         logger.info(f"   Style: {style} | Tone: {tone} | Length: {target_length}w")
         logger.info(f"   Tags: {', '.join(tags) if tags else 'none'}")
-        logger.debug(f"   Type: {request_type} | Image: {generate_featured_image}")
+        logger.debug("   Type: %s | Image: %s", request_type, generate_featured_image)
 
         # Add generate_featured_image to metadata
         metadata = {"generate_featured_image": generate_featured_image}
-        logger.debug(f"   Metadata: {metadata}")
+        logger.debug("   Metadata: %s", metadata)
 
         try:
             # Check if we have database service
             if not self.database_service:
                 raise ValueError("DatabaseService not initialized - cannot persist tasks")
 
-            logger.debug(f"   📝 Calling database_service.add_task() (async)...")
+            logger.debug("   📝 Calling database_service.add_task() (async)...")
 
             # Generate task_name from topic
             task_name = f"{topic[:50]}" if len(topic) <= 50 else f"{topic[:47]}..."
@@ -133,7 +133,7 @@ class ContentTaskStore:
             logger.info(f"✅ [CONTENT_TASK_STORE] Task CREATED and PERSISTED (async)")
             logger.info(f"   Task ID: {task_id}")
             logger.info(f"   Status: pending")
-            logger.debug(f"   🎯 Ready for processing")
+            logger.debug("   🎯 Ready for processing")
             return task_id
 
         except Exception as e:
@@ -323,7 +323,7 @@ async def _generate_canonical_title(topic: str, primary_keyword: str, content_ex
         result = await service.generate(
             prompt=prompt,
             temperature=0.7,
-            # Service will automatically select best available model
+            task_type="seo_title",  # Model router picks the model
         )
 
         if result and result.text:
@@ -332,7 +332,7 @@ async def _generate_canonical_title(topic: str, primary_keyword: str, content_ex
             # Truncate if too long
             if len(title) > 100:
                 title = title[:97] + "..."
-            logger.debug(f"Generated title: {title}")
+            logger.debug("Generated title: %s", title)
             return title
 
         return None
@@ -421,15 +421,18 @@ async def process_content_generation_task(
     try:
         # Initialize unified services
         logger.info(f"[BG-TASK] Starting content generation for task {task_id[:8]}...")
-        logger.debug(f"[BG-TASK] database_service = {database_service}")
+        logger.debug("[BG-TASK] database_service = %s", database_service)
         logger.debug(
-            f"[BG-TASK] database_service.tasks = {database_service.tasks if database_service else None}"
+            "[BG-TASK] database_service.tasks = %s",
+            database_service.tasks if database_service else None,
         )
 
         image_service = get_image_service()
         quality_service = UnifiedQualityService(database_service=database_service)
         logger.debug(
-            f"[BG-TASK] Services initialized: image_service={image_service}, quality_service={quality_service}"
+            "[BG-TASK] Services initialized: image_service=%s, quality_service=%s",
+            image_service,
+            quality_service,
         )
 
         # ================================================================================
@@ -439,7 +442,7 @@ async def process_content_generation_task(
 
         # Task already created by task_routes.py before background task launched
         # Just verify it exists in database
-        logger.debug(f"[BG-TASK] Verifying task {task_id} exists in database...")
+        logger.debug("[BG-TASK] Verifying task %s exists in database...", task_id)
         try:
             existing_task = await database_service.get_task(task_id)
             if existing_task:
@@ -533,6 +536,7 @@ async def process_content_generation_task(
             tags=tags or [],
             preferred_model=preferred_model,
             preferred_provider=preferred_provider,
+            progress_task_id=task_id,
         )
 
         # Validate content_text is not None
@@ -850,8 +854,8 @@ async def process_content_generation_task(
         # 🔑 CRITICAL: Preserve all partially-generated data (content, image, metadata)
         # so it's available for review/approval workflow
         try:
-            logger.debug(f"[BG-TASK] Attempting to update task status to 'failed'...")
-            logger.debug(f"[BG-TASK] Preserving partial results: {list(result.keys())}")
+            logger.debug("[BG-TASK] Attempting to update task status to 'failed'...")
+            logger.debug("[BG-TASK] Preserving partial results: %s", list(result.keys()))
 
             # Build task_metadata with whatever we successfully generated
             failure_metadata = {
@@ -882,7 +886,7 @@ async def process_content_generation_task(
                     "task_metadata": failure_metadata,  # ✅ Preserve all data
                 },
             )
-            logger.debug(f"[BG-TASK] ✅ Task status updated to 'failed' with preserved data")
+            logger.debug("[BG-TASK] ✅ Task status updated to 'failed' with preserved data")
         except Exception as db_error:
             logger.error(f"❌ [BG-TASK] Failed to update task status: {db_error}", exc_info=True)
 
@@ -160,17 +160,19 @@ class ContentService:
         """
         try:
             from agents.content_agent.agents.creative_agent import CreativeAgent
-            from agents.content_agent.services.llm_client import LLMClient
+            from services.agent_pool import get_agent_pool
             from services.writing_style_integration import WritingStyleIntegrationService
 
             # Select LLM for draft phase
             draft_model = model or (self.model_router.select_model("draft") if self.model_router else None)
 
-            # Create LLMClient with selected model
-            llm_client = LLMClient(model_name=draft_model) if draft_model else LLMClient()
-
-            # Instantiate creative agent
-            creative_agent = CreativeAgent(llm_client=llm_client)
+            # Pooled creative agent and LLM client for the selected model
+            pool = get_agent_pool()
+            creative_agent = pool.get_agent(
+                "creative_agent",
+                lambda: CreativeAgent(llm_client=pool.get_llm_client(draft_model)),
+                draft_model,
+            )
 
             # Get writing style guidance
             writing_style_guidance = ""
@@ -281,13 +283,17 @@ class ContentService:
         """
         try:
             from agents.content_agent.agents.creative_agent import CreativeAgent
-            from agents.content_agent.services.llm_client import LLMClient
+            from services.agent_pool import get_agent_pool
 
             # Select LLM for refine phase
             refine_model = model or (self.model_router.select_model("refine") if self.model_router else None)
 
-            llm_client = LLMClient(model_name=refine_model) if refine_model else LLMClient()
-            creative_agent = CreativeAgent(llm_client=llm_client)
+            pool = get_agent_pool()
+            creative_agent = pool.get_agent(
+                "creative_agent",
+                lambda: CreativeAgent(llm_client=pool.get_llm_client(refine_model)),
+                refine_model,
+            )
 
             # Execute refinement
             refined_content = await creative_agent.run(
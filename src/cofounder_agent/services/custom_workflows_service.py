@@ -260,7 +260,7 @@ class CustomWorkflowsService:
         - Name and description not empty
         - At least one phase defined
         - No duplicate phase names
-        - Phases are sequential (no cycles)
+        - Declared phase inputs are produced by an earlier phase (no cycles)
         - All referenced agents exist
 
         Args:
@@ -289,6 +289,7 @@ class CustomWorkflowsService:
             errors.append("Duplicate phase names in workflow")
 
         # Validate each phase
+        produced = set()
         for i, phase in enumerate(workflow.phases):
             try:
                 # Validate component-level constraints
@@ -302,6 +303,14 @@ class CustomWorkflowsService:
                 if not phase.agent or not phase.agent.strip():
                     errors.append(f"Phase '{phase.name}' must specify an agent")
 
+                for key in phase.inputs or []:
+                    if key not in produced:
+                        errors.append(
+                            f"Phase '{phase.name}' input '{key}' is not produced by an earlier phase"
+                        )
+                produced.add(phase.name)
+                produced.update(phase.outputs)
+
             except Exception as e:
                 errors.append(f"Error validating phase '{phase.name}': {str(e)}")
 
@@ -334,6 +343,7 @@ class CustomWorkflowsService:
                 capabilities=["web_search", "data_analysis"],
                 default_retries=3,
                 version="1.0",
+                default_inputs=[],
             ),
             AvailablePhase(
                 name="draft",
@@ -344,6 +354,7 @@ class CustomWorkflowsService:
                 capabilities=["content_generation", "style_matching"],
                 default_retries=2,
                 version="1.0",
+                default_inputs=["research"],
             ),
             AvailablePhase(
                 name="assess",
@@ -354,6 +365,7 @@ class CustomWorkflowsService:
                 capabilities=["quality_scoring", "feedback"],
                 default_retries=1,
                 version="1.0",
+                default_inputs=["draft"],
             ),
             AvailablePhase(
                 name="refine",
@@ -364,6 +376,7 @@ class CustomWorkflowsService:
                 capabilities=["content_refinement", "iteration"],
                 default_retries=2,
                 version="1.0",
+                default_inputs=["draft", "assess"],
             ),
             AvailablePhase(
                 name="image",
@@ -374,6 +387,7 @@ class CustomWorkflowsService:
                 capabilities=["image_generation", "image_selection"],
                 default_retries=2,
                 version="1.0",
+                default_inputs=["research"],
             ),
             AvailablePhase(
                 name="publish",
@@ -409,6 +423,8 @@ class CustomWorkflowsService:
                     "required": p.required,
                     "quality_threshold": p.quality_threshold,
                     "metadata": p.metadata,
+                    "inputs": p.inputs,
+                    "outputs": p.outputs,
                 }
                 for p in workflow.phases
             ]
@@ -445,6 +461,8 @@ class CustomWorkflowsService:
                     "required": p.required,
                     "quality_threshold": p.quality_threshold,
                     "metadata": p.metadata,
+                    "inputs": p.inputs,
+                    "outputs": p.outputs,
                 }
                 for p in workflow.phases
             ]
@@ -481,6 +499,8 @@ class CustomWorkflowsService:
                 required=p.get("required", True),
                 quality_threshold=p.get("quality_threshold"),
                 metadata=p.get("metadata", {}),
+                inputs=p.get("inputs"),
+                outputs=p.get("outputs") or [],
             )
             for p in phases_data
         ]
@@ -561,6 +581,18 @@ class CustomWorkflowsService:
                     $13, $14, $15,
                     $16, $17
                 )
+                ON CONFLICT (id) DO UPDATE SET
+                    execution_status = EXCLUDED.execution_status,
+                    completed_at = EXCLUDED.completed_at,
+                    duration_ms = EXCLUDED.duration_ms,
+                    phase_results = EXCLUDED.phase_results,
+                    final_output = EXCLUDED.final_output,
+                    error_message = EXCLUDED.error_message,
+                    progress_percent = EXCLUDED.progress_percent,
+                    completed_phases = EXCLUDED.completed_phases,
+                    total_phases = EXCLUDED.total_phases,
+                    metadata = workflow_executions.metadata || EXCLUDED.metadata
+                WHERE workflow_executions.owner_id = EXCLUDED.owner_id
                 """,
                 execution_id,
                 workflow_id,
@@ -591,6 +623,86 @@ class CustomWorkflowsService:
             logger.error(f"Failed to persist workflow execution {execution_id}: {e}", exc_info=True)
             return False
 
+    async def save_execution_checkpoint(
+        self,
+        execution_id: str,
+        workflow_id: str,
+        owner_id: str,
+        checkpoint: dict,
+        total_phases: int = 0,
+    ) -> bool:
+        """
+        Upsert an in-progress execution with a resumable WorkflowContext checkpoint.
+
+        Called by the workflow engine after each phase. The checkpoint is stored
+        under metadata["checkpoint"] and can be fed to WorkflowContext.from_dict.
+
+        Args:
+            execution_id: Execution ID
+            workflow_id: ID of the workflow being executed
+            owner_id: User ID who owns the workflow
+            checkpoint: WorkflowContext.to_dict() snapshot
+            total_phases: Total phases in workflow
+
+        Returns:
+            True if successful
+        """
+        try:
+            results = checkpoint.get("results") or {}
+            completed = sum(1 for r in results.values() if r.get("status") == "completed")
+            progress = int(completed / total_phases * 100) if total_phases else 0
+
+            await self.database_service.pool.execute(
+                """
+                INSERT INTO workflow_executions (
+                    id, workflow_id, owner_id, execution_status, started_at,
+                    phase_results, progress_percent, completed_phases, total_phases, metadata
+                ) VALUES ($1, $2, $3, 'running', NOW(), $4, $5, $6, $7, $8)
+                ON CONFLICT (id) DO UPDATE SET
+                    phase_results = EXCLUDED.phase_results,
+                    progress_percent = EXCLUDED.progress_percent,
+                    completed_phases = EXCLUDED.completed_phases,
+                    metadata = workflow_executions.metadata || EXCLUDED.metadata
+                WHERE workflow_executions.owner_id = EXCLUDED.owner_id
+                """,
+                execution_id,
+                workflow_id,
+                owner_id,
+                json.dumps(results, default=str),
+                progress,
+                completed,
+                total_phases,
+                json.dumps({"checkpoint": checkpoint}, default=str),
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint workflow execution {execution_id}: {e}")
+            return False
+
+    async def load_execution_checkpoint(
+        self, execution_id: str, owner_id: str, workflow_id: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Load the last WorkflowContext checkpoint for an execution.
+
+        Args:
+            execution_id: Execution ID
+            owner_id: Owner ID; executions owned by anyone else are not returned
+            workflow_id: Optional workflow ID the execution must belong to
+
+        Returns:
+            Checkpoint dict (WorkflowContext.to_dict() format) or None
+        """
+        if not owner_id:
+            return None
+        execution = await self.get_workflow_execution(execution_id, owner_id)
+        if not execution:
+            return None
+        if workflow_id and str(execution.get("workflow_id")) != str(workflow_id):
+            return None
+        return execution.get("metadata", {}).get("checkpoint")
+
     async def get_workflow_execution(
         self, execution_id: str, owner_id: Optional[str] = None
     ) -> Optional[Dict]:
@@ -23,6 +23,7 @@ import asyncpg
 
 from .admin_db import AdminDatabase
 from .content_db import ContentDatabase
+from .metrics_service import get_metrics_registry, record_db_query
 from .tasks_db import TasksDatabase
 from .users_db import UsersDatabase
 from .writing_style_db import WritingStyleDatabase
@@ -76,6 +77,25 @@ class DatabaseService:
         self.admin: Optional[AdminDatabase] = None
         self.writing_style: Optional[WritingStyleDatabase] = None
 
+    @staticmethod
+    async def _init_connection(conn) -> None:
+        """Per-connection setup: time every query into db_query_duration_seconds."""
+        if os.getenv("METRICS_ENABLED", "true").lower() == "true" and hasattr(
+            conn, "add_query_logger"
+        ):
+            conn.add_query_logger(record_db_query)
+
+    def _register_pool_metrics(self) -> None:
+        """Expose pool occupancy as gauges read at scrape time."""
+        registry = get_metrics_registry()
+        pool = self.pool
+        registry.gauge("db_pool_connections", "Open connections in the asyncpg pool").set_function(
+            pool.get_size
+        )
+        registry.gauge("db_pool_idle_connections", "Idle connections in the asyncpg pool").set_function(
+            pool.get_idle_size
+        )
+
     async def initialize(self) -> None:
         """Initialize connection pool and all delegate modules."""
         try:
@@ -89,7 +109,9 @@ class DatabaseService:
                 max_size=max_size,
                 timeout=30,
                 command_timeout=30,  # Query execution timeout
+                init=self._init_connection,
             )
+            self._register_pool_metrics()
             logger.info(
                 f"✅ Database pool initialized (size: {min_size}-{max_size}, query timeout: 30s)"
             )
@@ -104,12 +126,54 @@ class DatabaseService:
             logger.info(
                 "✅ All database modules initialized (users, tasks, content, admin, writing_style)"
             )
+
+            if os.getenv("DB_WRITE_BEHIND_ENABLED", "true").lower() == "true":
+                await self.start_write_behind()
         except Exception as e:
             logger.error(f"❌ Failed to initialize database: {e}")
             raise
 
+    async def start_write_behind(self) -> None:
+        """
+        Start write-behind buffers for cost_logs and task_status_history.
+
+        Tunable via DB_WRITE_BEHIND_BATCH_SIZE, DB_WRITE_BEHIND_FLUSH_INTERVAL
+        (seconds) and DB_WRITE_BEHIND_MAX_PENDING.
+        """
+        options = {
+            "max_batch": int(os.getenv("DB_WRITE_BEHIND_BATCH_SIZE", "200")),
+            "flush_interval": float(os.getenv("DB_WRITE_BEHIND_FLUSH_INTERVAL", "1.0")),
+            "max_pending": int(os.getenv("DB_WRITE_BEHIND_MAX_PENDING", "5000")),
+        }
+        await self.admin.create_cost_log_writer(**options).start()
+        await self.tasks.create_status_history_writer(**options).start()
+
+    async def stop_write_behind(self) -> None:
+        """Flush and stop write-behind buffers (safe to call more than once)"""
+        for writer in (
+            self.admin.cost_log_writer if self.admin else None,
+            self.tasks.status_history_writer if self.tasks else None,
+        ):
+            if writer:
+                try:
+                    await writer.stop()
+                except Exception as e:
+                    logger.error(f"❌ Failed to flush {writer.table} buffer: {e}")
+
+    def get_write_behind_stats(self) -> Dict:
+        """Buffer depth, throughput and backpressure metrics per table"""
+        stats = {}
+        for writer in (
+            self.admin.cost_log_writer if self.admin else None,
+            self.tasks.status_history_writer if self.tasks else None,
+        ):
+            if writer:
+                stats[writer.table] = writer.get_stats()
+        return stats
+
     async def close(self) -> None:
-        """Close connection pool."""
+        """Flush buffered writes, then close connection pool."""
+        await self.stop_write_behind()
         if self.pool:
             await self.pool.close()
             logger.info("Database pool closed")
@@ -170,6 +234,18 @@ class DatabaseService:
         """Delegate to tasks module."""
         return await self.tasks.get_tasks_paginated(offset, limit, status, category)
 
+    async def get_tasks_page(self, limit: int = 20, status: Optional[str] = None, category: Optional[str] = None, cursor: Optional[str] = None, offset: int = 0, summary: bool = True) -> Dict:
+        """Delegate to tasks module."""
+        return await self.tasks.get_tasks_page(limit, status, category, cursor, offset, summary)
+
+    async def log_status_change(self, task_id: str, old_status: str, new_status: str, reason: Optional[str] = None, metadata: Optional[dict] = None, changed_by: Optional[str] = None, wait: bool = False) -> bool:
+        """Delegate to tasks module."""
+        return await self.tasks.log_status_change(task_id, old_status, new_status, reason, metadata, changed_by, wait)
+
+    async def get_status_history(self, task_id: str, limit: int = 100) -> List[Dict]:
+        """Delegate to tasks module."""
+        return await self.tasks.get_status_history(task_id, limit)
+
     async def get_task_counts(self) -> Dict:
         """Delegate to tasks module."""
         return await self.tasks.get_task_counts()
@@ -260,6 +336,10 @@ class DatabaseService:
         """Delegate to admin module."""
         return await self.admin.log_cost(cost_log)
 
+    async def log_cost_deferred(self, cost_log: dict) -> bool:
+        """Delegate to admin module."""
+        return await self.admin.log_cost_deferred(cost_log)
+
     async def get_task_costs(self, task_id: str) -> Dict:
         """Delegate to admin module."""
         return await self.admin.get_task_costs(task_id)
@@ -12,33 +12,342 @@ Requirements:
   - SMTP_USER: SMTP authentication username
   - SMTP_PASSWORD: SMTP authentication password (use app password for Gmail)
   - SMTP_USE_TLS: true/false (default: true)
+  - SMTP_POOL_SIZE: Persistent SMTP connections (default: 4)
+  - SMTP_RATE_LIMIT: Messages per second (default: per-provider, see PROVIDER_RATE_LIMITS)
+  - NEWSLETTER_UNSUBSCRIBE_URL: One-click unsubscribe URL (email is appended)
+
+Newsletter delivery streams subscribers from newsletter_subscribers with a
+server-side cursor, renders the campaign once, and sends over a small pool of
+authenticated SMTP connections. Progress is checkpointed in
+newsletter_campaigns so an interrupted campaign can be resumed.
 """
 
+import asyncio
+import json
 import logging
 import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional, cast
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import formatdate, make_msgid
+from html import escape
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple, cast
+from urllib.parse import quote
 
 import aiosmtplib
 import html2text
 
+from .batch_writer import BatchWriter
+
 logger = logging.getLogger(__name__)
 
+# Sustained send rate (messages/second) by SMTP host; SMTP_RATE_LIMIT overrides
+PROVIDER_RATE_LIMITS = {
+    "smtp.gmail.com": 1.0,  # Workspace: ~2,000/day, bursts get throttled
+    "smtp.office365.com": 0.5,  # 30 messages/minute
+    "email-smtp.": 14.0,  # Amazon SES default sending rate
+    "smtp.sendgrid.net": 100.0,
+    "smtp.mailgun.org": 100.0,
+    "smtp.postmarkapp.com": 50.0,
+}
+DEFAULT_RATE_LIMIT = 50.0
+
+
+def rate_limit_for_host(host: Optional[str]) -> float:
+    """Messages/second for an SMTP host (SMTP_RATE_LIMIT env overrides)"""
+    override = os.getenv("SMTP_RATE_LIMIT")
+    if override:
+        return float(override)
+    for pattern, rate in PROVIDER_RATE_LIMITS.items():
+        if host and pattern in host:
+            return rate
+    return DEFAULT_RATE_LIMIT
+
+
+class SendRateLimiter:
+    """Token bucket shared by all connections sending through one provider"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waited_seconds = 0.0
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+                self.waited_seconds += delay
+                await asyncio.sleep(delay)
+
+
+@dataclass
+class _PooledConnection:
+    smtp: Any
+    messages_sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SMTPConnectionPool:
+    """
+    Small pool of persistent, authenticated SMTP connections.
+
+    Each connection does the TCP/TLS handshake and login once and is reused
+    for many messages. Connections are recycled after max_messages (providers
+    cap messages per session), checked with NOOP after sitting idle, and
+    discarded after any transport error.
+    """
+
+    IDLE_CHECK_SECONDS = 30.0
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        size: int = 4,
+        max_messages: int = 500,
+        timeout: float = 30.0,
+        smtp_factory: Optional[Callable[..., Any]] = None,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        # Port 465 is implicit TLS; anything else upgrades with STARTTLS
+        self.implicit_tls = use_tls and port == 465
+        self.start_tls = use_tls and port != 465
+        self.size = size
+        self.max_messages = max_messages
+        self.timeout = timeout
+        self._factory = smtp_factory or aiosmtplib.SMTP
+        self._idle: Deque[_PooledConnection] = deque()
+        self._slots = asyncio.Semaphore(size)
+        self._closed = False
+        self.stats = {"connects": 0, "reuses": 0, "recycled": 0, "discarded": 0}
+
+    async def _connect(self) -> _PooledConnection:
+        smtp = self._factory(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.implicit_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        if self.username and self.password:
+            await smtp.login(self.username, self.password)
+        self.stats["connects"] += 1
+        return _PooledConnection(smtp=smtp)
+
+    async def _healthy(self, conn: _PooledConnection) -> bool:
+        if not getattr(conn.smtp, "is_connected", True):
+            return False
+        if time.monotonic() - conn.last_used < self.IDLE_CHECK_SECONDS:
+            return True
+        try:
+            await conn.smtp.noop()
+            return True
+        except Exception:
+            return False
+
+    async def acquire(self) -> _PooledConnection:
+        """Check out a connection (opening one if none is idle)"""
+        if self._closed:
+            raise RuntimeError("SMTP connection pool is closed")
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+                if await self._healthy(conn):
+                    self.stats["reuses"] += 1
+                    return conn
+                await self._quit(conn)
+            return await self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, conn: _PooledConnection, discard: bool = False) -> None:
+        """Return a connection; discard=True after a transport error"""
+        try:
+            if discard or self._closed:
+                self.stats["discarded"] += 1
+                await self._quit(conn)
+            elif conn.messages_sent >= self.max_messages:
+                self.stats["recycled"] += 1
+                await self._quit(conn)
+            else:
+                conn.last_used = time.monotonic()
+                self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self):
+        """async with pool.connection() as conn: await conn.smtp.sendmail(...)"""
+        conn = await self.acquire()
+        discard = False
+        try:
+            yield conn
+        except Exception:
+            discard = True
+            raise
+        finally:
+            await self.release(conn, discard=discard)
+
+    @staticmethod
+    async def _quit(conn: _PooledConnection) -> None:
+        try:
+            await conn.smtp.quit()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        """Close idle connections; checked-out ones close when released"""
+        self._closed = True
+        while self._idle:
+            await self._quit(self._idle.pop())
+
+
+class CampaignMessage:
+    """
+    A newsletter rendered once per campaign.
+
+    Headers and MIME body are serialized a single time; per recipient only
+    To, Message-ID and List-Unsubscribe are prepended to the cached bytes.
+    """
+
+    def __init__(
+        self,
+        subject: str,
+        text: str,
+        html: Optional[str],
+        from_address: str,
+        from_name: Optional[str] = None,
+        preview_text: Optional[str] = None,
+        list_id: Optional[str] = None,
+        unsubscribe_url: Optional[str] = None,
+    ):
+        self.from_address = from_address
+        self.unsubscribe_url = unsubscribe_url
+        self._msgid_domain = from_address.rsplit("@", 1)[-1] if "@" in from_address else None
+
+        if html is None:
+            html = f"<html><body><pre>{escape(text)}</pre></body></html>"
+        if preview_text:
+            # Hidden preheader shown by mail clients next to the subject
+            preheader = (
+                '<div style="display:none;max-height:0;overflow:hidden;">'
+                f"{escape(preview_text)}</div>"
+            )
+            html = html.replace("<body>", "<body>" + preheader, 1) if "<body>" in html else preheader + html
+
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = f"{from_name} <{from_address}>" if from_name else from_address
+        msg["Date"] = formatdate(localtime=False)
+        if list_id:
+            msg["List-Id"] = f"<{list_id}>"
+        msg["Precedence"] = "bulk"
+        msg.attach(MIMEText(text, "plain"))
+        msg.attach(MIMEText(html, "html"))
+        self._rendered = msg.as_bytes(policy=SMTP_POLICY)
+
+    def for_recipient(self, email: str) -> bytes:
+        """Full RFC 5322 message for one recipient"""
+        if "\r" in email or "\n" in email:
+            raise ValueError(f"Invalid recipient address: {email!r}")
+        unsubscribe = [f"<mailto:{self.from_address}?subject=unsubscribe>"]
+        headers = [
+            f"To: {email}",
+            f"Message-ID: {make_msgid(domain=self._msgid_domain)}",
+        ]
+        if self.unsubscribe_url:
+            separator = "&" if "?" in self.unsubscribe_url else "?"
+            unsubscribe.insert(0, f"<{self.unsubscribe_url}{separator}email={quote(email)}>")
+            headers.append("List-Unsubscribe-Post: List-Unsubscribe=One-Click")
+        headers.append(f"List-Unsubscribe: {', '.join(unsubscribe)}")
+        return ("\r\n".join(headers) + "\r\n").encode("utf-8") + self._rendered
+
+
+class CampaignCheckpoint:
+    """
+    Resume watermark for out-of-order completion.
+
+    Subscribers are dispatched in id order but finish in any order; the
+    watermark is the highest id such that every dispatched id up to it is done.
+    """
+
+    def __init__(self, start_after: int = 0):
+        self.watermark = start_after
+        self._dispatched: Deque[int] = deque()
+        self._done: Set[int] = set()
+
+    def dispatched(self, subscriber_id: int) -> None:
+        self._dispatched.append(subscriber_id)
+
+    def done(self, subscriber_id: int) -> None:
+        self._done.add(subscriber_id)
+        while self._dispatched and self._dispatched[0] in self._done:
+            finished = self._dispatched.popleft()
+            self._done.discard(finished)
+            self.watermark = finished
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of one recipient"""
+
+    subscriber_id: int
+    email: str
+    status: str  # sent, failed, bounced
+    error: Optional[str] = None
+    attempts: int = 1
+
 
 class EmailPublisher:
     """Email content publisher"""
 
-    def __init__(self):
-        """Initialize email publisher from environment variables"""
+    def __init__(self, database_service=None, smtp_factory: Optional[Callable[..., Any]] = None):
+        """
+        Initialize email publisher from environment variables
+
+        Args:
+            database_service: DatabaseService (needed for newsletter delivery)
+            smtp_factory: SMTP client class (defaults to aiosmtplib.SMTP)
+        """
         self.smtp_host = os.getenv("SMTP_HOST")
         self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
         self.smtp_user = os.getenv("SMTP_USER")
         self.smtp_password = os.getenv("SMTP_PASSWORD")
         self.email_from = os.getenv("EMAIL_FROM", self.smtp_user)
         self.use_tls = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+        self.pool_size = int(os.getenv("SMTP_POOL_SIZE", "4"))
+        self.unsubscribe_url = os.getenv("NEWSLETTER_UNSUBSCRIBE_URL")
+        self.database_service = database_service
+        self._smtp_factory = smtp_factory
+        self._pool: Optional[SMTPConnectionPool] = None
+        self._rate_limiter: Optional[SendRateLimiter] = None
 
         if not all([self.smtp_host, self.smtp_user, self.smtp_password, self.email_from]):
             logger.warning(
@@ -49,6 +358,34 @@ class EmailPublisher:
             self.available = True
             logger.info(f"✅ Email publisher initialized ({self.smtp_host}:{self.smtp_port})")
 
+    @property
+    def pool(self) -> SMTPConnectionPool:
+        """Shared SMTP connection pool (created on first use)"""
+        if self._pool is None:
+            self._pool = SMTPConnectionPool(
+                hostname=cast(str, self.smtp_host),
+                port=self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_password,
+                use_tls=self.use_tls,
+                size=self.pool_size,
+                smtp_factory=self._smtp_factory,
+            )
+        return self._pool
+
+    @property
+    def rate_limiter(self) -> SendRateLimiter:
+        """Per-provider send rate limiter"""
+        if self._rate_limiter is None:
+            self._rate_limiter = SendRateLimiter(rate_limit_for_host(self.smtp_host))
+        return self._rate_limiter
+
+    async def close(self) -> None:
+        """Close pooled SMTP connections"""
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+
     async def publish(
         self,
         subject: str,
@@ -102,6 +439,7 @@ class EmailPublisher:
                 f"{from_name} <{self.email_from}>" if from_name else cast(str, self.email_from)
             )
             msg["To"] = ", ".join(recipient_emails)
+            msg["Message-ID"] = make_msgid()
 
             # Add plain text part
             text_part = MIMEText(content, "plain")
@@ -117,19 +455,15 @@ class EmailPublisher:
                 html_part = MIMEText(html_content, "html")
                 msg.attach(html_part)
 
-            # Send email
-            async with aiosmtplib.SMTP(
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                use_tls=self.use_tls,
-            ) as smtp:
-                await smtp.login(self.smtp_user, self.smtp_password)
-
-                send_result = await smtp.send_message(
+            # Send email over a pooled, already-authenticated connection
+            await self.rate_limiter.acquire()
+            async with self.pool.connection() as conn:
+                await conn.smtp.send_message(
                     msg,
-                    mail_from=self.email_from,
-                    rcpt_tos=recipient_emails,
+                    sender=self.email_from,
+                    recipients=recipient_emails,
                 )
+                conn.messages_sent += 1
 
             logger.info(f"✅ Email sent to {len(recipient_emails)} recipient(s)")
 
@@ -155,23 +489,27 @@ class EmailPublisher:
         content: str,
         list_name: str,
         preview_text: Optional[str] = None,
+        html_content: Optional[str] = None,
+        from_name: Optional[str] = None,
+        campaign_id: Optional[int] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """
-        Send newsletter to mailing list.
+        Send newsletter to all active, verified subscribers.
 
         Args:
             subject: Newsletter subject
             content: Newsletter content (plain text)
-            list_name: Mailing list identifier (for template/tracking)
+            list_name: Mailing list identifier (campaign name, List-Id)
             preview_text: Optional preview text shown before opening email
-            **kwargs: Additional metadata
+            html_content: Optional HTML version (plain text is wrapped otherwise)
+            from_name: Optional sender display name
+            campaign_id: Resume this campaign from its checkpoint instead of
+                starting a new one (stored content is reused)
+            **kwargs: Delivery options: concurrency, max_retries, checkpoint_every
 
         Returns:
             Newsletter send result
-
-        Note: This is a placeholder that would integrate with newsletter services
-        like ConvertKit, Substack, or custom mailing list databases
         """
         if not self.available:
             return {
@@ -179,23 +517,45 @@ class EmailPublisher:
                 "error": "Email not configured",
                 "subscribers_count": 0,
             }
-
-        try:
-            # In production, this would:
-            # 1. Fetch subscribers from mailing list database
-            # 2. Prepare newsletter template
-            # 3. Send via email service provider
-            # 4. Track opens/clicks
-
-            logger.info(f"✅ Newsletter queued for list: {list_name}")
-
+        if not self.database_service:
             return {
-                "success": True,
-                "list": list_name,
-                "subscribers_count": 0,  # Would come from database
-                "error": None,
+                "success": False,
+                "error": "Newsletter delivery requires a database service",
+                "subscribers_count": 0,
             }
 
+        try:
+            if campaign_id is None:
+                campaign = await self._create_campaign(
+                    list_name,
+                    subject,
+                    {
+                        "text": content,
+                        "html": html_content,
+                        "preview_text": preview_text,
+                        "from_name": from_name,
+                    },
+                )
+            else:
+                campaign = await self._load_campaign(campaign_id)
+                if not campaign:
+                    return {
+                        "success": False,
+                        "error": f"Campaign {campaign_id} not found",
+                        "subscribers_count": 0,
+                    }
+                if campaign["status"] == "completed":
+                    return {
+                        "success": True,
+                        "campaign_id": campaign_id,
+                        "list": campaign["campaign_name"],
+                        "subscribers_count": 0,
+                        "sent": campaign["sent_count"],
+                        "failed": campaign["failed_count"],
+                        "error": None,
+                    }
+            return await self._run_campaign(campaign, **kwargs)
+
         except Exception as e:
             logger.error(f"Newsletter send error: {str(e)}")
             return {
@@ -204,6 +564,296 @@ class EmailPublisher:
                 "subscribers_count": 0,
             }
 
+    async def resume_newsletter(self, campaign_id: int, **kwargs) -> Dict[str, Any]:
+        """Resume an interrupted campaign from its checkpoint"""
+        return await self.send_newsletter("", "", "", campaign_id=campaign_id, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Campaign storage (newsletter_campaigns, campaign_email_logs)
+    # ------------------------------------------------------------------
+
+    async def _create_campaign(
+        self, list_name: str, subject: str, content: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        row = await self.database_service.pool.fetchrow(
+            """
+            INSERT INTO newsletter_campaigns (campaign_name, subject, content, status)
+            VALUES ($1, $2, $3, 'pending')
+            RETURNING *
+            """,
+            list_name,
+            subject,
+            json.dumps(content),
+        )
+        return dict(row)
+
+    async def _load_campaign(self, campaign_id: int) -> Optional[Dict[str, Any]]:
+        row = await self.database_service.pool.fetchrow(
+            "SELECT * FROM newsletter_campaigns WHERE id = $1", campaign_id
+        )
+        return dict(row) if row else None
+
+    async def _save_checkpoint(
+        self,
+        campaign_id: int,
+        status: str,
+        checkpoint: CampaignCheckpoint,
+        sent: int,
+        failed: int,
+        error: Optional[str] = None,
+    ) -> None:
+        await self.database_service.pool.execute(
+            """
+            UPDATE newsletter_campaigns
+            SET status = $2,
+                last_subscriber_id = GREATEST(last_subscriber_id, $3),
+                sent_count = sent_count + $4,
+                failed_count = failed_count + $5,
+                error = $6,
+                started_at = COALESCE(started_at, NOW()),
+                completed_at = CASE WHEN $2 = 'completed' THEN NOW() ELSE completed_at END,
+                updated_at = NOW()
+            WHERE id = $1
+            """,
+            campaign_id,
+            status,
+            checkpoint.watermark,
+            sent,
+            failed,
+            error,
+        )
+
+    async def _stream_subscribers(
+        self, campaign_id: int, after_id: int, fetch_size: int = 500
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Active, verified subscribers after the checkpoint, in id order.
+
+        Uses a server-side cursor so the whole list is never held in memory;
+        subscribers already logged as sent for this campaign are skipped.
+        """
+        async with self.database_service.pool.acquire() as conn:
+            async with conn.transaction(readonly=True):
+                async for row in conn.cursor(
+                    """
+                    SELECT s.id, s.email
+                    FROM newsletter_subscribers s
+                    WHERE s.id > $2
+                      AND s.unsubscribed_at IS NULL
+                      AND s.verified = TRUE
+                      AND NOT EXISTS (
+                          SELECT 1 FROM campaign_email_logs l
+                          WHERE l.campaign_id = $1
+                            AND l.subscriber_id = s.id
+                            AND l.delivery_status = 'sent'
+                      )
+                    ORDER BY s.id
+                    """,
+                    campaign_id,
+                    after_id,
+                    prefetch=fetch_size,
+                ):
+                    yield row["id"], row["email"]
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    async def _run_campaign(
+        self,
+        campaign: Dict[str, Any],
+        concurrency: Optional[int] = None,
+        max_retries: int = 3,
+        checkpoint_every: int = 250,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        content = campaign["content"]
+        if isinstance(content, str):
+            content = json.loads(content)
+        message = CampaignMessage(
+            subject=campaign["subject"],
+            text=content.get("text") or "",
+            html=content.get("html"),
+            from_address=cast(str, self.email_from),
+            from_name=content.get("from_name"),
+            preview_text=content.get("preview_text"),
+            list_id=f"{campaign['campaign_name']}.{self.email_from.rsplit('@', 1)[-1]}",
+            unsubscribe_url=self.unsubscribe_url,
+        )
+
+        log_writer = BatchWriter(
+            self.database_service.pool,
+            "campaign_email_logs",
+            [
+                "subscriber_id",
+                "campaign_name",
+                "campaign_id",
+                "email_subject",
+                "sent_at",
+                "delivery_status",
+                "delivery_error",
+            ],
+        )
+        await log_writer.start()
+
+        campaign_id = campaign["id"]
+        checkpoint = CampaignCheckpoint(campaign["last_subscriber_id"])
+        resumed_from = checkpoint.watermark
+        pending = {"sent": 0, "failed": 0}
+        totals = {"sent": 0, "failed": 0}
+        checkpoint_lock = asyncio.Lock()
+
+        async def on_result(result: DeliveryResult) -> None:
+            await log_writer.submit(
+                (
+                    result.subscriber_id,
+                    campaign["campaign_name"],
+                    campaign_id,
+                    campaign["subject"][:500],
+                    datetime.now(timezone.utc),
+                    result.status,
+                    result.error,
+                )
+            )
+            key = "sent" if result.status == "sent" else "failed"
+            pending[key] += 1
+            totals[key] += 1
+            checkpoint.done(result.subscriber_id)
+            if pending["sent"] + pending["failed"] >= checkpoint_every:
+                await flush_checkpoint("sending")
+
+        async def flush_checkpoint(status: str, error: Optional[str] = None) -> None:
+            async with checkpoint_lock:
+                # Logs first: a resumed campaign skips anything logged as sent
+                await log_writer.flush()
+                sent, failed = pending["sent"], pending["failed"]
+                await self._save_checkpoint(campaign_id, status, checkpoint, sent, failed, error)
+                # Only once saved, so a failed save is retried by the "paused" flush
+                pending["sent"] -= sent
+                pending["failed"] -= failed
+
+        await self._save_checkpoint(campaign_id, "sending", checkpoint, 0, 0)
+        started = time.perf_counter()
+        try:
+            await self.deliver(
+                message,
+                self._stream_subscribers(campaign_id, checkpoint.watermark),
+                on_result=on_result,
+                on_dispatch=checkpoint.dispatched,
+                concurrency=concurrency,
+                max_retries=max_retries,
+            )
+        except BaseException as e:
+            # Cancelled or crashed: keep progress so the campaign can resume
+            await flush_checkpoint("paused", error=str(e) or type(e).__name__)
+            await log_writer.stop()
+            raise
+        await flush_checkpoint("completed")
+        await log_writer.stop()
+
+        duration = time.perf_counter() - started
+        attempted = totals["sent"] + totals["failed"]
+        logger.info(
+            f"✅ Newsletter '{campaign['campaign_name']}' (campaign {campaign_id}): "
+            f"{totals['sent']} sent, {totals['failed']} failed in {duration:.1f}s"
+        )
+        return {
+            "success": True,
+            "campaign_id": campaign_id,
+            "list": campaign["campaign_name"],
+            "subscribers_count": attempted,
+            "sent": totals["sent"],
+            "failed": totals["failed"],
+            "resumed_from": resumed_from or None,
+            "duration_s": round(duration, 2),
+            "messages_per_minute": round(attempted / duration * 60, 1) if duration > 0 else 0.0,
+            "error": None,
+        }
+
+    async def deliver(
+        self,
+        message: CampaignMessage,
+        recipients: AsyncIterator[Tuple[int, str]],
+        on_result: Optional[Callable[[DeliveryResult], Any]] = None,
+        on_dispatch: Optional[Callable[[int], Any]] = None,
+        concurrency: Optional[int] = None,
+        max_retries: int = 3,
+    ) -> Dict[str, int]:
+        """
+        Send a rendered message to a stream of (subscriber_id, email).
+
+        One worker per pooled connection pulls from a bounded queue, so the
+        subscriber stream is only read as fast as mail goes out. If a worker
+        (e.g. its on_result callback) or the recipient stream fails, everything
+        else is cancelled and the error is re-raised.
+
+        Returns:
+            Counts by delivery status
+        """
+        workers_count = concurrency or self.pool.size
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers_count * 50)
+        counts: Dict[str, int] = {"sent": 0, "failed": 0, "bounced": 0}
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                result = await self._send_one(message, *item, max_retries=max_retries)
+                counts[result.status] += 1
+                if on_result:
+                    await on_result(result)
+
+        async def produce() -> None:
+            async for subscriber_id, email in recipients:
+                if on_dispatch:
+                    on_dispatch(subscriber_id)
+                await queue.put((subscriber_id, email))
+            for _ in range(workers_count):
+                await queue.put(None)
+
+        # A dead worker stops draining the bounded queue, so the producer
+        # would block on put() forever; fail fast instead
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(worker()) for _ in range(workers_count)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return counts
+
+    async def _send_one(
+        self, message: CampaignMessage, subscriber_id: int, email: str, max_retries: int
+    ) -> DeliveryResult:
+        """Send to one recipient, retrying transient failures with backoff"""
+        try:
+            payload = message.for_recipient(email)
+        except ValueError as e:
+            return DeliveryResult(subscriber_id, email, "failed", str(e), attempts=0)
+
+        error: Optional[str] = None
+        for attempt in range(1, max_retries + 2):
+            await self.rate_limiter.acquire()
+            try:
+                async with self.pool.connection() as conn:
+                    await conn.smtp.sendmail(message.from_address, [email], payload)
+                    conn.messages_sent += 1
+                return DeliveryResult(subscriber_id, email, "sent", attempts=attempt)
+            except Exception as e:
+                code = getattr(e, "code", None)
+                error = f"{type(e).__name__}: {e}"
+                if isinstance(e, aiosmtplib.SMTPRecipientsRefused) or (code and code >= 500):
+                    # Permanent rejection (unknown mailbox, policy): don't retry
+                    return DeliveryResult(subscriber_id, email, "bounced", error, attempts=attempt)
+                if attempt <= max_retries:
+                    await asyncio.sleep(min(30.0, 0.5 * 2 ** (attempt - 1)))
+        return DeliveryResult(subscriber_id, email, "failed", error, attempts=max_retries + 1)
+
     async def send_notification(
         self, recipient: str, title: str, message: str, action_url: Optional[str] = None, **kwargs
     ) -> Dict[str, Any]:
@@ -0,0 +1,405 @@
+"""
+Shared Cache and Quota Governor for External Search APIs
+
+Pexels, Serper and SearXNG are called with the same queries over and over
+(featured-image fallbacks, research angles, fact checks), and each provider
+rate-limits us. Every client goes through ExternalAPICache.get_or_fetch():
+
+1. Keys are built from the endpoint and a normalized query (lowercased,
+   whitespace collapsed) plus the request parameters, so "AI  Trends" and
+   "ai trends" share an entry.
+2. A bounded in-process LRU answers repeats. Entries expire after a
+   per-endpoint TTL (news expires sooner than image search).
+3. When Redis is attached, it is a second tier shared by every replica.
+4. Concurrent requests for the same key share one upstream call.
+5. Misses take a token from the provider's bucket (QuotaGovernor) before
+   calling upstream. Requests run concurrently while tokens last. When the
+   bucket is empty they queue by priority, so interactive searches go ahead
+   of background fact checks. A request that would wait longer than the
+   limit raises QuotaExceededError, and the client treats it like any other
+   upstream failure.
+
+Empty or failed responses are never cached.
+
+Environment Variables:
+    EXTERNAL_API_CACHE_MAX_ENTRIES: In-process entries kept (default: 2000)
+    EXTERNAL_API_QUOTA_MAX_WAIT: Seconds a request may queue for a token (default: 30)
+    PEXELS_REQUESTS_PER_MINUTE: Pexels refill rate (default: 3, i.e. 200/hour)
+    SERPER_REQUESTS_PER_MINUTE: Serper refill rate (default: 300)
+    SEARXNG_REQUESTS_PER_MINUTE: SearXNG refill rate (default: 60)
+"""
+
+import asyncio
+import copy
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .metrics_service import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+EXTERNAL_API_CACHE_MAX_ENTRIES = int(os.getenv("EXTERNAL_API_CACHE_MAX_ENTRIES", "2000"))
+EXTERNAL_API_QUOTA_MAX_WAIT = float(os.getenv("EXTERNAL_API_QUOTA_MAX_WAIT", "30"))
+
+# Seconds each endpoint's responses stay fresh
+ENDPOINT_TTLS: Dict[str, int] = {
+    "pexels.search": 24 * 3600,
+    "serper.search": 6 * 3600,
+    "serper.news": 3600,
+    "serper.shopping": 6 * 3600,
+    "searxng.general": 6 * 3600,
+    "searxng.news": 3600,
+}
+DEFAULT_TTL = 3600
+
+# provider -> (requests per minute, burst capacity)
+PROVIDER_LIMITS: Dict[str, Tuple[float, int]] = {
+    "pexels": (float(os.getenv("PEXELS_REQUESTS_PER_MINUTE", "3")), 20),
+    "serper": (float(os.getenv("SERPER_REQUESTS_PER_MINUTE", "300")), 10),
+    "searxng": (float(os.getenv("SEARXNG_REQUESTS_PER_MINUTE", "60")), 10),
+}
+
+# Lower runs first when a provider's bucket is empty
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+REDIS_PREFIX = "extapi:"
+
+_registry = get_metrics_registry()
+CACHE_REQUESTS = _registry.counter(
+    "external_api_cache_requests_total",
+    "External API lookups by endpoint and outcome (hit, redis_hit, coalesced, miss)",
+    ("endpoint", "result"),
+)
+QUOTA_WAITS = _registry.counter(
+    "external_api_quota_waits_total",
+    "External API requests that queued for a rate-limit token",
+    ("provider", "result"),
+)
+
+
+class QuotaExceededError(Exception):
+    """A request could not get a rate-limit token in time"""
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return " ".join(str(query).lower().split())
+
+
+def make_cache_key(endpoint: str, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable key for endpoint + normalized query + parameters"""
+    payload = json.dumps([normalize_query(query), params or {}], sort_keys=True, default=str)
+    return f"{REDIS_PREFIX}{endpoint}:{hashlib.sha1(payload.encode()).hexdigest()}"
+
+
+class TokenBucket:
+    """Async token bucket with a priority queue for waiters"""
+
+    def __init__(self, rate_per_minute: float, capacity: int):
+        self.rate = max(rate_per_minute, 0.001) / 60.0  # tokens per second
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._drainer: Optional[asyncio.Task] = None
+        self.granted = 0
+        self.queued = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL, timeout: Optional[float] = None) -> None:
+        """
+        Take one token, queueing by priority when none are left.
+
+        Raises:
+            QuotaExceededError: No token became available within timeout
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self.granted += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self.queued += 1
+        if self._drainer is None or self._drainer.done() or self._drainer.get_loop() is not loop:
+            self._drainer = loop.create_task(self._drain())
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise QuotaExceededError(f"no rate-limit token within {timeout:.0f}s")
+
+    async def _drain(self) -> None:
+        """Hand out tokens to queued waiters as they refill, highest priority first"""
+        while self._waiters:
+            while self._waiters and self._waiters[0][2].done():
+                heapq.heappop(self._waiters)  # Timed out or cancelled
+            if not self._waiters:
+                break
+            self._refill()
+            if self._tokens >= 1:
+                _, _, future = heapq.heappop(self._waiters)
+                self._tokens -= 1
+                self.granted += 1
+                future.set_result(None)
+            else:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests_per_minute": round(self.rate * 60, 3),
+            "capacity": self.capacity,
+            "tokens": round(self.tokens, 2),
+            "waiting": sum(1 for _, _, future in self._waiters if not future.done()),
+            "granted": self.granted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+        }
+
+
+class QuotaGovernor:
+    """One token bucket per provider"""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.limits = dict(PROVIDER_LIMITS if limits is None else limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, provider: str) -> Optional[TokenBucket]:
+        """Bucket for provider (None when the provider isn't rate limited)"""
+        if provider not in self._buckets and provider in self.limits:
+            rate, capacity = self.limits[provider]
+            self._buckets[provider] = TokenBucket(rate, capacity)
+        return self._buckets.get(provider)
+
+    async def acquire(
+        self, provider: str, priority: int = PRIORITY_NORMAL, timeout: Optional[float] = None
+    ) -> None:
+        bucket = self.bucket(provider)
+        if bucket is None:
+            return
+        queued = bucket.queued
+        try:
+            await bucket.acquire(priority, timeout)
+        except QuotaExceededError:
+            QUOTA_WAITS.labels(provider, "rejected").inc()
+            logger.warning(f"⏳ {provider} quota exhausted, request dropped after {timeout}s")
+            raise
+        if bucket.queued != queued:
+            QUOTA_WAITS.labels(provider, "granted").inc()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {provider: bucket.to_dict() for provider, bucket in self._buckets.items()}
+
+
+class _InFlight:
+    """An upstream call and the number of requests waiting on it"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class ExternalAPICache:
+    """Memory + optional Redis cache in front of rate-limited search APIs"""
+
+    def __init__(
+        self,
+        max_entries: int = EXTERNAL_API_CACHE_MAX_ENTRIES,
+        ttls: Optional[Dict[str, int]] = None,
+        governor: Optional[QuotaGovernor] = None,
+        redis_cache: Optional[Any] = None,
+        max_wait: float = EXTERNAL_API_QUOTA_MAX_WAIT,
+    ):
+        """
+        Args:
+            max_entries: In-process LRU size
+            ttls: Seconds to keep each endpoint's responses (ENDPOINT_TTLS by default)
+            governor: QuotaGovernor for upstream calls
+            redis_cache: RedisCache for the shared tier (see attach_redis)
+            max_wait: Seconds a miss may queue for a rate-limit token
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(ENDPOINT_TTLS if ttls is None else ttls)
+        self.governor = governor or QuotaGovernor()
+        self.redis_cache = redis_cache
+        self.max_wait = max_wait
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def attach_redis(self, redis_cache: Optional[Any]) -> None:
+        """Use Redis as a shared second tier (None detaches)"""
+        self.redis_cache = redis_cache
+
+    def ttl_for(self, endpoint: str) -> int:
+        return self.ttls.get(endpoint, DEFAULT_TTL)
+
+    def _record(self, endpoint: str, result: str) -> None:
+        counts = self._stats.setdefault(endpoint, {})
+        counts[result] = counts.get(result, 0) + 1
+        CACHE_REQUESTS.labels(endpoint, result).inc()
+
+    def _memory_get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _memory_set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _redis_available(self) -> bool:
+        if self.redis_cache is None:
+            return False
+        try:
+            return await self.redis_cache.is_available()
+        except Exception:
+            return False
+
+    async def get_or_fetch(
+        self,
+        endpoint: str,
+        query: str,
+        fetch: Callable[[], Awaitable[Any]],
+        params: Optional[Dict[str, Any]] = None,
+        priority: int = PRIORITY_NORMAL,
+        cacheable: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        Return the cached response for (endpoint, query, params) or call fetch().
+
+        Args:
+            endpoint: "<provider>.<endpoint>", e.g. "serper.news"
+            query: Search query (normalized for the key)
+            fetch: Zero-argument coroutine function calling the upstream API
+            params: Other request parameters that change the response
+            priority: Queue position when the provider's bucket is empty
+            cacheable: Predicate deciding whether a response is stored
+
+        Raises:
+            QuotaExceededError: No rate-limit token within max_wait
+            Whatever fetch() raises
+        """
+        key = make_cache_key(endpoint, query, params)
+
+        found, value = self._memory_get(key)
+        if found:
+            self._record(endpoint, "hit")
+            return copy.deepcopy(value)
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch_through(endpoint, key, fetch, priority, cacheable)
+            )
+            inflight = self._inflight[key] = _InFlight(task)
+            task.add_done_callback(lambda _: self._release_inflight(key, inflight))
+        else:
+            self._record(endpoint, "coalesced")
+
+        # The upstream call belongs to everyone waiting on it: it is cancelled
+        # only when the last waiter goes away (e.g. a fan-out loser)
+        inflight.waiters += 1
+        try:
+            value = await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not inflight.task.done():
+                # Unregister now, not in the done callback: a caller arriving
+                # before that runs must start a fresh fetch, not join this one
+                if self._inflight.get(key) is inflight:
+                    del self._inflight[key]
+                inflight.task.cancel()
+        return copy.deepcopy(value)
+
+    def _release_inflight(self, key: str, inflight: "_InFlight") -> None:
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+        if not inflight.task.cancelled():
+            inflight.task.exception()  # Retrieved here when nobody was left waiting
+
+    async def _fetch_through(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        priority: int,
+        cacheable: Callable[[Any], bool],
+    ) -> Any:
+        ttl = self.ttl_for(endpoint)
+        if await self._redis_available():
+            value = await self.redis_cache.get(key)
+            if value is not None:
+                self._record(endpoint, "redis_hit")
+                self._memory_set(key, value, ttl)
+                return value
+
+        self._record(endpoint, "miss")
+        await self.governor.acquire(endpoint.split(".", 1)[0], priority, self.max_wait)
+        value = await fetch()
+        if cacheable(value):
+            self._memory_set(key, value, ttl)
+            if await self._redis_available():
+                await self.redis_cache.set(key, value, ttl)
+        return value
+
+    def clear(self) -> None:
+        """Drop in-process entries (Redis entries expire on their own)"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, counts in self._stats.items():
+            total = sum(counts.values())
+            served = total - counts.get("miss", 0)
+            endpoints[endpoint] = {**counts, "hit_rate": round(served / total, 4) if total else 0.0}
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "redis": self.redis_cache is not None,
+            "endpoints": endpoints,
+            "quota": self.governor.get_stats(),
+        }
+
+
+_external_api_cache: Optional[ExternalAPICache] = None
+
+
+def get_external_api_cache() -> ExternalAPICache:
+    """Process-wide external API cache"""
+    global _external_api_cache
+    if _external_api_cache is None:
+        _external_api_cache = ExternalAPICache()
+    return _external_api_cache
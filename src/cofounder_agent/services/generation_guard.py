@@ -0,0 +1,193 @@
+"""
+Streaming Generation Guard
+
+A non-streaming generation is only checked once the whole article has been
+written, so a run that goes off the rails still spends its full token
+budget. StreamGuard runs cheap checks on the growing buffer while the model
+streams, and run_guarded_stream() stops reading (closing the upstream
+stream) as soon as one fails:
+
+- refusal: the opening reads like a refusal ("I'm sorry, but I can't...")
+- repetition: an n-gram repeats several times in the recent text (a loop)
+- off_topic: no topic keyword appears once the grace length is reached
+- runaway_length: the text is far past the target length
+- too_slow: at the current words-per-second rate the article cannot finish
+  within the time budget
+
+Checks run every check_every_chars characters and only look at a bounded
+tail of the buffer, so the cost per check is constant.
+
+Usage:
+    guard = StreamGuard(topic, keywords=tags, target_words=1500)
+    outcome = await run_guarded_stream(ollama.stream_generate(prompt), guard)
+    if outcome.aborted:
+        ...retry with another model...
+"""
+
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+_REFUSAL_RE = re.compile(
+    r"^\W*(i'?m sorry|i am sorry|i apologi[sz]e|i cannot|i can'?t|i'?m unable|i am unable|"
+    r"as an ai\b|as a language model)",
+    re.IGNORECASE,
+)
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_STOPWORDS = {
+    "about", "after", "also", "and", "are", "for", "from", "guide", "how", "into", "its",
+    "the", "that", "their", "this", "what", "when", "where", "which", "why", "with", "your",
+}
+
+
+def topic_keywords(topic: str, extra: Optional[Iterable[str]] = None) -> List[str]:
+    """Distinctive words of the topic and tags, cut to a 5-letter stem"""
+    words = _WORD_RE.findall(" ".join([topic, *(extra or [])]).lower())
+    return list(dict.fromkeys(w[:5] for w in words if len(w) >= 4 and w not in _STOPWORDS))
+
+
+@dataclass
+class StreamOutcome:
+    """What a guarded stream produced"""
+
+    text: str
+    abort_reason: Optional[str] = None
+    word_count: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def aborted(self) -> bool:
+        return self.abort_reason is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "abort_reason": self.abort_reason,
+            "word_count": self.word_count,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+
+class StreamGuard:
+    """Incremental sanity checks for a streaming generation"""
+
+    def __init__(
+        self,
+        topic: str,
+        keywords: Optional[Iterable[str]] = None,
+        target_words: int = 1500,
+        max_seconds: Optional[float] = None,
+        check_every_chars: int = 400,
+        ngram_size: int = 8,
+        max_ngram_repeats: int = 3,
+        repetition_window_words: int = 400,
+        max_length_ratio: float = 2.0,
+        min_elapsed_for_rate: float = 15.0,
+    ):
+        """
+        Args:
+            topic: Article topic (its keywords must show up early)
+            keywords: Extra on-topic keywords (e.g. tags)
+            target_words: Requested article length
+            max_seconds: Time budget for the whole article (None disables too_slow)
+            check_every_chars: Run the checks after this many new characters
+            ngram_size: Words per n-gram for loop detection
+            max_ngram_repeats: An n-gram seen this often in the window is a loop
+            repetition_window_words: Recent words scanned for loops
+            max_length_ratio: Abort beyond target_words * ratio
+            min_elapsed_for_rate: Seconds of data needed before judging the rate
+        """
+        self.keywords = topic_keywords(topic, keywords)
+        self.target_words = max(1, target_words)
+        self.max_seconds = max_seconds
+        self.check_every_chars = check_every_chars
+        self.ngram_size = ngram_size
+        self.max_ngram_repeats = max_ngram_repeats
+        self.repetition_window_words = repetition_window_words
+        self.max_length_ratio = max_length_ratio
+        self.min_elapsed_for_rate = min_elapsed_for_rate
+        # Off-topic is judged once, after a quarter of the article (at most 200 words)
+        self.keyword_grace_words = max(50, min(200, self.target_words // 4))
+        self._topic_confirmed = not self.keywords
+        self._opening_checked = False
+
+    def check(self, text: str, word_count: int, elapsed: float) -> Optional[str]:
+        """Return an abort reason, or None to keep streaming"""
+        if not self._opening_checked and len(text) >= 40:
+            self._opening_checked = True
+            if _REFUSAL_RE.match(text[:300]):
+                return "refusal"
+
+        if word_count > self.target_words * self.max_length_ratio:
+            return "runaway_length"
+
+        if self._repeats(text):
+            return "repetition"
+
+        if not self._topic_confirmed and word_count >= self.keyword_grace_words:
+            lowered = text.lower()
+            if not any(keyword in lowered for keyword in self.keywords):
+                return "off_topic"
+            self._topic_confirmed = True
+
+        if self.max_seconds and elapsed >= self.min_elapsed_for_rate and word_count:
+            projected = elapsed * self.target_words / word_count
+            if projected > self.max_seconds:
+                return "too_slow"
+
+        return None
+
+    def _repeats(self, text: str) -> bool:
+        # ~8 characters per word bounds the tail we tokenize
+        tail = text[-self.repetition_window_words * 8 :]
+        words = _WORD_RE.findall(tail.lower())[-self.repetition_window_words :]
+        n = self.ngram_size
+        if len(words) < n * self.max_ngram_repeats:
+            return False
+        counts = Counter(tuple(words[i : i + n]) for i in range(len(words) - n + 1))
+        return counts.most_common(1)[0][1] >= self.max_ngram_repeats
+
+
+async def run_guarded_stream(
+    chunks: AsyncIterator[str],
+    guard: StreamGuard,
+    on_partial: Optional[Callable[[str, int], Any]] = None,
+) -> StreamOutcome:
+    """
+    Consume a text stream, checking it with guard as it grows.
+
+    Args:
+        chunks: Async iterator of text chunks (e.g. OllamaClient.stream_generate)
+        guard: StreamGuard for this generation
+        on_partial: Called with (text so far, word count) at every check
+
+    Returns:
+        StreamOutcome; on abort the stream is closed so the model stops generating
+    """
+    parts: List[str] = []
+    length = 0
+    next_check = guard.check_every_chars
+    start = time.monotonic()
+    try:
+        async for chunk in chunks:
+            parts.append(chunk)
+            length += len(chunk)
+            if length < next_check:
+                continue
+            next_check = length + guard.check_every_chars
+            text = "".join(parts)
+            words = len(text.split())
+            elapsed = time.monotonic() - start
+            if on_partial is not None:
+                on_partial(text, words)
+            reason = guard.check(text, words, elapsed)
+            if reason:
+                return StreamOutcome(text, reason, words, elapsed)
+
+        text = "".join(parts)
+        return StreamOutcome(text, None, len(text.split()), time.monotonic() - start)
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
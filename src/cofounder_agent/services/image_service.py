@@ -70,6 +70,9 @@ try:
 except ImportError:
     OPTIMUM_AVAILABLE = False
 
+from .external_api_cache import get_external_api_cache
+from .pexels_client import fan_out_search, is_content_appropriate
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,7 +152,7 @@ class ImageService:
                 "Pexels API key not configured - featured image search will be unavailable"
             )
 
-        self.pexels_base_url = "https://api.pexels.com/v1"
+        self.pexels_base_url = os.getenv("PEXELS_BASE_URL", "https://api.pexels.com/v1")
         self.pexels_headers = {"Authorization": self.pexels_api_key} if self.pexels_api_key else {}
 
         # SDXL Image Generation (optional, GPU-dependent)
@@ -162,7 +165,8 @@ class ImageService:
         # NOTE: SDXL is lazily initialized only when generate_image() is called
         # This avoids loading huge models if only Pexels search is needed
 
-        self.search_cache: Dict[str, List[FeaturedImageMetadata]] = {}
+        # Raw Pexels responses are cached process-wide (services/external_api_cache.py)
+        self.search_cache = get_external_api_cache()
 
     def _initialize_sdxl(self) -> None:
         """Initialize Stable Diffusion XL model with optimization and refinement if GPU available"""
@@ -395,22 +399,28 @@ class ImageService:
         search_queries.append(f"{topic} abstract")
         search_queries.extend(concept_keywords[:2])
 
-        for query in search_queries:
-            try:
-                logger.info(f"Searching Pexels for: '{query}' (page {page})")
-                images = await self._pexels_search(
-                    query, per_page=5, orientation=orientation, size=size, page=page
-                )
-                if images:
-                    # RANDOMIZE IMAGE SELECTION: Pick random image from results instead of always first
-                    # This prevents all posts from using the same image when topics are similar
-                    metadata = random.choice(images)
-                    logger.info(
-                        f"✅ Found featured image for '{topic}' using query '{query}' (page {page}) - randomly selected from {len(images)} results"
-                    )
-                    return metadata
-            except Exception as e:
-                logger.warning(f"Error searching for '{query}': {e}")
+        async def search(query: str) -> List[FeaturedImageMetadata]:
+            logger.info(f"Searching Pexels for: '{query}' (page {page})")
+            images = await self._pexels_search(
+                query, per_page=5, orientation=orientation, size=size, page=page
+            )
+            return [
+                image
+                for image in images
+                if is_content_appropriate(image.alt_text, image.photographer)
+            ]
+
+        # Fallback queries run concurrently; the highest-priority query with results wins
+        found = await fan_out_search(search_queries, search)
+        if found:
+            query, images = found[0]
+            # RANDOMIZE IMAGE SELECTION: Pick random image from results instead of always first
+            # This prevents all posts from using the same image when topics are similar
+            metadata = random.choice(images)
+            logger.info(
+                f"✅ Found featured image for '{topic}' using query '{query}' (page {page}) - randomly selected from {len(images)} results"
+            )
+            return metadata
 
         logger.warning(f"No featured image found for topic: {topic}")
         return None
@@ -440,19 +450,16 @@ class ImageService:
         if keywords:
             search_queries.extend(keywords)
 
-        all_images = []
-
-        for query in search_queries[:3]:  # Try up to 3 queries
-            try:
-                images = await self._pexels_search(query, per_page=count)
-                all_images.extend(images)
-
-                if len(all_images) >= count:
-                    logger.info(f"Found {len(all_images)} gallery images")
-                    return all_images[:count]
+        found = await fan_out_search(
+            search_queries[:3],  # Try up to 3 queries
+            lambda query: self._pexels_search(query, per_page=count),
+            needed=count,
+        )
+        all_images = [image for _, images in found for image in images]
 
-            except Exception as e:
-                logger.warning(f"Error searching for gallery images '{query}': {e}")
+        if len(all_images) >= count:
+            logger.info(f"Found {len(all_images)} gallery images")
+            return all_images[:count]
 
         logger.info(f"Found {len(all_images)} gallery images (less than requested)")
         return all_images
@@ -492,34 +499,41 @@ class ImageService:
                 "page": page,
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.pexels_base_url}/search",
-                    headers=self.pexels_headers,
-                    params=params,
-                )
-                response.raise_for_status()
-                data = response.json()
+            async def fetch() -> List[Dict[str, Any]]:
+                async with httpx.AsyncClient(timeout=10.0) as client:
+                    response = await client.get(
+                        f"{self.pexels_base_url}/search",
+                        headers=self.pexels_headers,
+                        params=params,
+                    )
+                    response.raise_for_status()
+                    photos = response.json().get("photos", [])
+                    logger.info(
+                        f"Pexels search for '{query}' (page {page}) returned {len(photos)} results"
+                    )
+                    return photos
 
-                photos = data.get("photos", [])
-                logger.info(
-                    f"Pexels search for '{query}' (page {page}) returned {len(photos)} results"
-                )
+            photos = await self.search_cache.get_or_fetch(
+                "pexels.search",
+                query,
+                fetch,
+                params={k: v for k, v in params.items() if k != "query"},
+            )
 
-                return [
-                    FeaturedImageMetadata(
-                        url=photo["src"]["large"],
-                        thumbnail=photo["src"]["small"],
-                        photographer=photo.get("photographer", "Unknown"),
-                        photographer_url=photo.get("photographer_url", ""),
-                        width=photo.get("width"),
-                        height=photo.get("height"),
-                        alt_text=photo.get("alt", ""),
-                        search_query=query,
-                        source="pexels",
-                    )
-                    for photo in photos
-                ]
+            return [
+                FeaturedImageMetadata(
+                    url=photo["src"]["large"],
+                    thumbnail=photo["src"]["small"],
+                    photographer=photo.get("photographer", "Unknown"),
+                    photographer_url=photo.get("photographer_url", ""),
+                    width=photo.get("width"),
+                    height=photo.get("height"),
+                    alt_text=photo.get("alt", ""),
+                    search_query=query,
+                    source="pexels",
+                )
+                for photo in photos
+            ]
 
         except Exception as e:
             logger.error(f"Pexels search error: {e}")
@@ -608,15 +622,10 @@ class ImageService:
             if task_id:
                 from services.progress_service import get_progress_service
 
+                # Published to WebSocket clients by the progress broadcaster
                 progress_service = get_progress_service()
                 progress_service.mark_complete(task_id, "Image generation complete")
 
-                # Broadcast via WebSocket
-                from routes.websocket_routes import broadcast_progress
-
-                progress = progress_service.get_progress(task_id)
-                await broadcast_progress(task_id, progress)
-
             return True
 
         except Exception as e:
@@ -626,15 +635,10 @@ class ImageService:
             if task_id:
                 from services.progress_service import get_progress_service
 
+                # Published to WebSocket clients by the progress broadcaster
                 progress_service = get_progress_service()
                 progress_service.mark_failed(task_id, str(e))
 
-                # Broadcast via WebSocket
-                from routes.websocket_routes import broadcast_progress
-
-                progress = progress_service.get_progress(task_id)
-                await broadcast_progress(task_id, progress)
-
             return False
 
     def _generate_image_sync(
@@ -823,13 +827,9 @@ class ImageService:
             "note": "Image optimization not yet implemented",
         }
 
-    def get_search_cache(self, query: str) -> Optional[List[FeaturedImageMetadata]]:
-        """Get cached search results"""
-        return self.search_cache.get(query)
-
-    def set_search_cache(self, query: str, results: List[FeaturedImageMetadata]) -> None:
-        """Cache search results (24-hour TTL in production)"""
-        self.search_cache[query] = results
+    def get_search_cache_stats(self) -> Dict[str, Any]:
+        """Hit rates, size and quota state of the shared search cache"""
+        return self.search_cache.get_stats()
 
 
 def get_image_service() -> ImageService:
@@ -11,6 +11,23 @@ Environment Variables:
                Default: json for production, text for development
     ENVIRONMENT: Deployment environment (development, staging, production)
                Default: development
+    LOG_QUEUE_ENABLED: Hand records to a background listener thread (true/false)
+               Default: true
+    LOG_QUEUE_SIZE: Max records waiting for the listener; more are dropped
+               Default: 10000
+    LOG_FILE: Also write logs to this file (written by the listener thread)
+    LOG_SAMPLE_RATES: Comma-separated logger=rate pairs; records below WARNING
+               from those loggers (and their children) are sampled
+               Default: services.task_executor.loop=0.1
+
+Non-blocking logging:
+    The root logger has a single QueueHandler. Records are enqueued unformatted
+    (message %-args, structlog event dicts and tracebacks are rendered later),
+    and a QueueListener thread does the formatting and the stdout/file writes.
+    Only LogRecord creation and a queue put stay on the event loop. If the
+    listener falls behind, records are dropped and counted instead of blocking.
+    Use %-style arguments (logger.debug("x=%s", x)) on hot paths so disabled
+    levels cost nothing and enabled ones are formatted off the loop.
 
 Usage:
     In any module, instead of:
@@ -24,10 +41,15 @@ Usage:
 This ensures all loggers use the centralized configuration.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from typing import Optional
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
 
 # Try to import structlog for structured logging support
 try:
@@ -45,17 +67,295 @@ ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FORMAT = os.getenv("LOG_FORMAT", "json" if ENVIRONMENT == "production" else "text")
 
+LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE_ENABLED", "true").lower() == "true"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_FILE = os.getenv("LOG_FILE")
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "services.task_executor.loop=0.1")
+
 # Validate log level
 VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 if LOG_LEVEL not in VALID_LOG_LEVELS:
     LOG_LEVEL = "INFO"
 
 
+def parse_sample_rates(value: Optional[str]) -> Dict[str, float]:
+    """Parse "logger.a=0.1,logger.b=0.5" into {logger: rate}"""
+    rates: Dict[str, float] = {}
+    for item in (value or "").split(","):
+        name, _, rate = item.strip().partition("=")
+        if name and rate:
+            try:
+                rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+            except ValueError:
+                print(f"Warning: Ignoring invalid LOG_SAMPLE_RATES entry: {item}", file=sys.stderr)
+    return rates
+
+
+# ============================================================================
+# NON-BLOCKING HANDLERS
+# ============================================================================
+
+# Seconds spent in the logging handler during the current request (set by
+# the metrics middleware); None outside a request
+_request_log_time: ContextVar[Optional[List[float]]] = ContextVar("request_log_time", default=None)
+
+
+def start_request_log_timer() -> List[float]:
+    """Start accumulating handler time for the current request/task context"""
+    holder = [0.0]
+    _request_log_time.set(holder)
+    return holder
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep 1 in N records below WARNING for configured loggers.
+
+    Sampling is deterministic (every Nth record per logger), so a rate of 0.1
+    keeps exactly one in ten. Warnings and errors always pass. A rate applies
+    to the logger and its children; the longest matching prefix wins.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self.rates: Dict[str, float] = dict(rates or {})
+        self._resolved: Dict[str, Optional[int]] = {}
+        self._counters: Dict[str, int] = {}
+        self.sampled_out = 0
+
+    def set_rate(self, logger_name: str, rate: float) -> None:
+        self.rates[logger_name] = min(1.0, max(0.0, rate))
+        self._resolved.clear()
+
+    def _keep_every(self, name: str) -> Optional[int]:
+        if name not in self._resolved:
+            match = None
+            for prefix in self.rates:
+                if (name == prefix or name.startswith(prefix + ".")) and (
+                    match is None or len(prefix) > len(match)
+                ):
+                    match = prefix
+            if match is None or self.rates[match] >= 1.0:
+                self._resolved[name] = None
+            else:
+                rate = self.rates[match]
+                self._resolved[name] = 0 if rate <= 0 else max(1, round(1 / rate))
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        every = self._keep_every(record.name)
+        if every is None:
+            return True
+        count = self._counters.get(record.name, 0)
+        self._counters[record.name] = count + 1
+        if every and count % every == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that defers all formatting to the listener thread.
+
+    The stock QueueHandler.prepare() formats the message on the caller's
+    thread; here the record is enqueued as-is. A full queue drops the record
+    (counted) rather than blocking the event loop.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+        self.handle_seconds = 0.0
+        self.max_handle_seconds = 0.0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        started = time.perf_counter()
+        try:
+            return super().handle(record)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.handle_seconds += elapsed
+            if elapsed > self.max_handle_seconds:
+                self.max_handle_seconds = elapsed
+            holder = _request_log_time.get()
+            if holder is not None:
+                holder[0] += elapsed
+
+
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+_sampling_filter = SamplingFilter(parse_sample_rates(LOG_SAMPLE_RATES))
+
+
+def _output_handlers(formatter: logging.Formatter) -> List[logging.Handler]:
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if LOG_FILE:
+        handlers.append(logging.FileHandler(LOG_FILE, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def install_root_handlers(formatter: logging.Formatter) -> None:
+    """
+    Route the root logger through the queue (or directly, if disabled).
+
+    Replaces any handlers previously installed by this module.
+    """
+    global _queue_handler, _listener
+    root = logging.getLogger()
+    stop_logging()
+    for handler in list(root.handlers):
+        if getattr(handler, "_glad_labs_handler", False):
+            root.removeHandler(handler)
+
+    outputs = _output_handlers(formatter)
+    if LOG_QUEUE_ENABLED:
+        _queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+        _queue_handler.addFilter(_sampling_filter)
+        _listener = QueueListener(_queue_handler.queue, *outputs, respect_handler_level=True)
+        _listener.start()
+        installed: List[logging.Handler] = [_queue_handler]
+    else:
+        for handler in outputs:
+            handler.addFilter(_sampling_filter)
+        installed = outputs
+
+    for handler in installed:
+        handler._glad_labs_handler = True  # type: ignore[attr-defined]
+        root.addHandler(handler)
+    root.setLevel(getattr(logging, LOG_LEVEL))
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread (call at shutdown)"""
+    global _listener
+    if _listener is not None:
+        try:
+            _listener.stop()
+        except Exception:
+            pass
+        _listener = None
+
+
+def set_sample_rate(logger_name: str, rate: float) -> None:
+    """
+    Sample records below WARNING from logger_name (and children) at rate.
+
+    Example:
+        set_sample_rate("services.task_executor.loop", 0.05)  # keep 1 in 20
+    """
+    _sampling_filter.set_rate(logger_name, rate)
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Queue depth, drops, sampling and event-loop time spent in the handler"""
+    handler = _queue_handler
+    return {
+        "queue_enabled": LOG_QUEUE_ENABLED,
+        "queue_size": handler.queue.qsize() if handler else 0,
+        "queue_capacity": LOG_QUEUE_SIZE,
+        "enqueued": handler.enqueued if handler else 0,
+        "dropped": handler.dropped if handler else 0,
+        "sampled_out": _sampling_filter.sampled_out,
+        "sample_rates": dict(_sampling_filter.rates),
+        "handler_seconds_total": round(handler.handle_seconds, 6) if handler else 0.0,
+        "handler_seconds_max": round(handler.max_handle_seconds, 6) if handler else 0.0,
+    }
+
+
+def register_logging_metrics(registry) -> None:
+    """Expose logging queue health as gauges on a MetricsRegistry"""
+    registry.gauge("log_queue_depth", "Log records waiting for the listener thread").set_function(
+        lambda: get_logging_stats()["queue_size"]
+    )
+    registry.gauge("log_records_dropped", "Log records dropped because the queue was full").set_function(
+        lambda: get_logging_stats()["dropped"]
+    )
+    registry.gauge("log_records_sampled_out", "Log records skipped by per-logger sampling").set_function(
+        lambda: get_logging_stats()["sampled_out"]
+    )
+
+
+atexit.register(stop_logging)
+
+
 # ============================================================================
 # STRUCTURED LOGGING CONFIGURATION (Primary)
 # ============================================================================
 
 
+def _capture_exc_info(logger, method_name, event_dict):
+    """Resolve exc_info on the calling thread; the listener thread has no exception context"""
+    exc_info = event_dict.get("exc_info")
+    if exc_info is True or (exc_info is None and method_name == "exception"):
+        event_dict["exc_info"] = sys.exc_info()
+    elif isinstance(exc_info, BaseException):
+        event_dict["exc_info"] = (type(exc_info), exc_info, exc_info.__traceback__)
+    return event_dict
+
+
+def _structlog_processors() -> list:
+    """Processors that run on the calling thread (cheap: no rendering)"""
+    return [
+        # Filter by log level
+        structlog.stdlib.filter_by_level,
+        # Add context information
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        # Add timestamps in ISO format (at call time, not when written)
+        structlog.processors.TimeStamper(fmt="ISO"),
+        # Include stack information (must inspect the caller's stack)
+        structlog.processors.StackInfoRenderer(),
+        _capture_exc_info,
+        # Hand the event dict to the handler; ProcessorFormatter renders it
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    ]
+
+
+def _structlog_formatter() -> "structlog.stdlib.ProcessorFormatter":
+    """Renders structlog events and plain stdlib records (on the listener thread)"""
+    if LOG_FORMAT == "json":
+        # Output as JSON for production
+        render = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ]
+    else:
+        # Plain text for development (ConsoleRenderer formats exceptions itself)
+        render = [structlog.dev.ConsoleRenderer()]
+    return structlog.stdlib.ProcessorFormatter(
+        # Records from logging.getLogger() loggers get the same context fields
+        foreign_pre_chain=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="ISO"),
+        ],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            # Format positional arguments
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            # Decode unicode properly
+            structlog.processors.UnicodeDecoder(),
+            *render,
+        ],
+    )
+
+
 def configure_structlog() -> bool:
     """
     Configure structlog for structured JSON logging.
@@ -66,34 +366,13 @@ def configure_structlog() -> bool:
 
     try:
         structlog.configure(
-            processors=[
-                # Filter by log level
-                structlog.stdlib.filter_by_level,
-                # Add context information
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                # Format positional arguments
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                # Add timestamps in ISO format
-                structlog.processors.TimeStamper(fmt="ISO"),
-                # Include stack information for exceptions
-                structlog.processors.StackInfoRenderer(),
-                # Format exception information
-                structlog.processors.format_exc_info,
-                # Decode unicode properly
-                structlog.processors.UnicodeDecoder(),
-                # Output as JSON for production, plain text for development
-                (
-                    structlog.processors.JSONRenderer()
-                    if LOG_FORMAT == "json"
-                    else structlog.dev.ConsoleRenderer()
-                ),
-            ],
+            processors=_structlog_processors(),
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
+        install_root_handlers(_structlog_formatter())
         return True
     except Exception as e:
         print(f"Warning: Failed to configure structlog: {e}", file=sys.stderr)
@@ -123,14 +402,8 @@ def configure_standard_logging() -> None:
         # Human-readable format for development
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL),
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    # Configure root logger (through the queue unless LOG_QUEUE_ENABLED=false)
+    install_root_handlers(logging.Formatter(log_format))
 
 
 # ============================================================================
@@ -193,33 +466,8 @@ def set_log_level(level: str) -> None:
     if level_upper not in VALID_LOG_LEVELS:
         raise ValueError(f"Invalid log level: {level}. Must be one of {VALID_LOG_LEVELS}")
 
-    if STRUCTLOG_AVAILABLE and _structlog_configured:
-        # For structlog, we need to update the processors
-        # This is a simplified approach - a full implementation would be more complex
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="ISO"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                (
-                    structlog.processors.JSONRenderer()
-                    if LOG_FORMAT == "json"
-                    else structlog.dev.ConsoleRenderer()
-                ),
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
-    else:
-        # For standard logging
-        logging.getLogger().setLevel(getattr(logging, level_upper))
+    # structlog's filter_by_level checks the stdlib level, so this covers both
+    logging.getLogger().setLevel(getattr(logging, level_upper))
 
 
 # ============================================================================
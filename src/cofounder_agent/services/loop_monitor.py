@@ -0,0 +1,377 @@
+"""
+Event-Loop Stall Detection and Sampling Profiler
+
+EventLoopWatchdog (opt-in, LOOP_WATCHDOG_ENABLED=true):
+- A heartbeat coroutine wakes every interval and records how late it woke
+  (event_loop_lag_seconds histogram).
+- A watchdog thread checks the heartbeat. If the loop hasn't run for longer
+  than the threshold, it captures the loop thread's stack while it is still
+  blocked, so the report points at the blocking call (sync HTTP client,
+  BeautifulSoup parse, file write, regex scoring) rather than at whatever
+  ran next.
+- Stalls are logged once, counted per offender (event_loop_stalls_total) and
+  kept in a short history for GET /api/admin/profiling/loop.
+
+SamplingProfiler:
+- A background thread samples a thread's stack (the event loop thread by
+  default) every few milliseconds and aggregates collapsed stacks.
+- to_folded() returns Brendan Gregg's folded format ("a;b;c 42"), which
+  flamegraph.pl, speedscope and inferno read directly.
+
+Environment Variables:
+    LOOP_WATCHDOG_ENABLED: Start the watchdog at startup (default: false)
+    LOOP_WATCHDOG_THRESHOLD_MS: Report callbacks blocking longer than this (default: 100)
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics_service import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_THIS_FILE = os.path.abspath(__file__)
+
+_registry = get_metrics_registry()
+LOOP_LAG = _registry.histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop heartbeat woke up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+LOOP_STALLS = _registry.counter(
+    "event_loop_stalls_total", "Event loop blocked longer than the watchdog threshold", ("offender",)
+)
+
+
+def _frame_location(frame) -> str:
+    filename = frame.f_code.co_filename
+    if filename.startswith(APP_ROOT):
+        filename = os.path.relpath(filename, APP_ROOT)
+    return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def find_offender(frame) -> str:
+    """Innermost frame in application code (falls back to the innermost frame)"""
+    innermost = None
+    while frame is not None:
+        if innermost is None:
+            innermost = frame
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if (
+            filename.startswith(APP_ROOT)
+            and filename != _THIS_FILE
+            and "site-packages" not in filename
+        ):
+            return _frame_location(frame)
+        frame = frame.f_back
+    return _frame_location(innermost) if innermost is not None else "unknown"
+
+
+def format_stack(frame, limit: int = 30) -> List[str]:
+    """Outermost-first list of "file:line in func" (last `limit` frames)"""
+    frames = []
+    while frame is not None:
+        frames.append(_frame_location(frame))
+        frame = frame.f_back
+    return list(reversed(frames))[-limit:]
+
+
+@dataclass
+class LoopStall:
+    """One detected stall"""
+
+    detected_at: str
+    offender: str
+    stack: List[str]
+    blocked_ms: float  # Blocked time when the stack was captured
+    duration_ms: Optional[float] = None  # Full stall, filled in when the loop resumes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class EventLoopWatchdog:
+    """Measures loop lag and captures the blocking stack of long stalls"""
+
+    def __init__(
+        self,
+        threshold_ms: Optional[float] = None,
+        interval_ms: Optional[float] = None,
+        max_stalls: int = 50,
+    ):
+        self.threshold = (
+            threshold_ms if threshold_ms is not None else float(os.getenv("LOOP_WATCHDOG_THRESHOLD_MS", "100"))
+        ) / 1000
+        # Heartbeat often enough that a stall is noticed soon after the threshold
+        self.interval = (interval_ms / 1000) if interval_ms else max(0.005, min(0.05, self.threshold / 4))
+        self.stalls: Deque[LoopStall] = deque(maxlen=max_stalls)
+        self.offenders: Counter = Counter()
+        self.max_lag_ms = 0.0
+
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._pending_stall: Optional[LoopStall] = None
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    @property
+    def loop_thread_id(self) -> Optional[int]:
+        return self._loop_thread_id
+
+    async def start(self) -> None:
+        """Start the heartbeat (on the current loop) and the watchdog thread"""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"✅ Event loop watchdog started (threshold: {self.threshold * 1000:.0f}ms, "
+            f"heartbeat: {self.interval * 1000:.0f}ms)"
+        )
+
+    async def stop(self) -> None:
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+        logger.info(f"Event loop watchdog stopped ({len(self.stalls)} stall(s) recorded)")
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            LOOP_LAG.observe(lag)
+            self.max_lag_ms = max(self.max_lag_ms, lag * 1000)
+            stall, self._pending_stall = self._pending_stall, None
+            if stall is not None:
+                stall.duration_ms = round(lag * 1000, 1)
+                logger.info(f"Event loop resumed after {stall.duration_ms:.0f}ms ({stall.offender})")
+            self._last_beat = now
+
+    def _watch(self) -> None:
+        captured_for = None
+        poll = max(0.002, min(self.interval, self.threshold / 4))
+        while not self._stop.wait(poll):
+            beat = self._last_beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked < self.threshold or captured_for == beat:
+                continue
+            captured_for = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self._record_stall(frame, blocked)
+
+    def _record_stall(self, frame, blocked: float) -> None:
+        stall = LoopStall(
+            detected_at=datetime.now(timezone.utc).isoformat(),
+            offender=find_offender(frame),
+            stack=format_stack(frame),
+            blocked_ms=round(blocked * 1000, 1),
+        )
+        self.stalls.append(stall)
+        self.offenders[stall.offender] += 1
+        LOOP_STALLS.labels(stall.offender).inc()
+        self._pending_stall = stall
+        logger.warning(
+            f"🐢 Event loop blocked >{stall.blocked_ms:.0f}ms at {stall.offender}\n"
+            + "\n".join(f"    {line}" for line in stall.stack[-12:])
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        lag = LOOP_LAG.labels()
+        return {
+            "running": self.running,
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "heartbeat_ms": round(self.interval * 1000, 1),
+            "lag_p50_ms": round((lag.percentile(50) or 0) * 1000, 2),
+            "lag_p99_ms": round((lag.percentile(99) or 0) * 1000, 2),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+            "stall_count": sum(self.offenders.values()),
+            "top_offenders": [
+                {"offender": offender, "stalls": count}
+                for offender, count in self.offenders.most_common(10)
+            ],
+            "recent_stalls": [stall.to_dict() for stall in reversed(self.stalls)],
+        }
+
+
+class SamplingProfiler:
+    """Periodic stack sampler producing folded (flamegraph) stacks"""
+
+    # Innermost frame of an idle event loop (selectors.*Selector.select)
+    IDLE_FUNCTIONS = {"select", "poll"}
+
+    def __init__(
+        self,
+        thread_id: Optional[int] = None,
+        interval_ms: float = 5.0,
+        max_seconds: float = 300.0,
+        include_idle: bool = False,
+    ):
+        """
+        Args:
+            thread_id: Thread to sample (default: the main thread); None samples all threads
+            interval_ms: Time between samples
+            max_seconds: Stop automatically after this long
+            include_idle: Keep samples where the loop is waiting in the selector
+        """
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000
+        self.max_seconds = max_seconds
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            raise RuntimeError("Profiler already running")
+        self.stacks.clear()
+        self.samples = self.idle_samples = 0
+        self.started_at = time.monotonic()
+        self.stopped_at = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict[str, Any]:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self.stopped_at is None:
+            self.stopped_at = time.monotonic()
+        return self.get_summary()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            if self.thread_id is not None:
+                targets = [frames.get(self.thread_id)]
+            else:
+                targets = [frame for tid, frame in frames.items() if tid != own_id]
+            for frame in targets:
+                if frame is not None:
+                    self._sample(frame)
+            if time.monotonic() - self.started_at >= self.max_seconds:
+                break
+        self.stopped_at = time.monotonic()
+
+    def _sample(self, frame) -> None:
+        if not self.include_idle and frame.f_code.co_name in self.IDLE_FUNCTIONS:
+            self.idle_samples += 1
+            return
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
+            if filename.startswith(APP_ROOT):
+                filename = os.path.relpath(filename, APP_ROOT)
+            else:
+                filename = os.path.basename(filename)
+            names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        self.stacks[";".join(reversed(names))] += 1
+        self.samples += 1
+
+    def to_folded(self) -> str:
+        """Collapsed stacks, one "frame;frame;frame count" line per unique stack"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def get_summary(self) -> Dict[str, Any]:
+        end = self.stopped_at or time.monotonic()
+        hottest = Counter()
+        for stack, count in self.stacks.items():
+            hottest[stack.rsplit(";", 1)[-1]] += count
+        return {
+            "running": self.running,
+            "duration_s": round(end - self.started_at, 2) if self.started_at else 0.0,
+            "interval_ms": self.interval * 1000,
+            "samples": self.samples,
+            "idle_samples": self.idle_samples,
+            "unique_stacks": len(self.stacks),
+            "top_frames": [
+                {"frame": frame, "samples": count} for frame, count in hottest.most_common(10)
+            ],
+        }
+
+
+_watchdog: Optional[EventLoopWatchdog] = None
+_profiler: Optional[SamplingProfiler] = None
+
+
+def get_loop_watchdog() -> Optional[EventLoopWatchdog]:
+    """The running (or last) watchdog, if one was started"""
+    return _watchdog
+
+
+async def start_loop_watchdog(threshold_ms: Optional[float] = None) -> EventLoopWatchdog:
+    """Start (or restart with a new threshold) the global watchdog"""
+    global _watchdog
+    if _watchdog and _watchdog.running:
+        await _watchdog.stop()
+    _watchdog = EventLoopWatchdog(threshold_ms=threshold_ms)
+    await _watchdog.start()
+    return _watchdog
+
+
+async def stop_loop_watchdog() -> None:
+    if _watchdog and _watchdog.running:
+        await _watchdog.stop()
+
+
+def get_profiler() -> Optional[SamplingProfiler]:
+    """The running (or last finished) profiler"""
+    return _profiler
+
+
+def start_profiler(
+    interval_ms: float = 5.0, max_seconds: float = 60.0, all_threads: bool = False, include_idle: bool = False
+) -> SamplingProfiler:
+    """Start sampling the calling thread (call from the event loop) or every thread"""
+    global _profiler
+    if _profiler and _profiler.running:
+        raise RuntimeError("Profiler already running")
+    thread_id = None if all_threads else threading.get_ident()
+    _profiler = SamplingProfiler(
+        thread_id=thread_id, interval_ms=interval_ms, max_seconds=max_seconds, include_idle=include_idle
+    )
+    _profiler.start()
+    return _profiler
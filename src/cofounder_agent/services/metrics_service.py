@@ -2,9 +2,26 @@
 Metrics Service for Glad Labs AI Co-Founder
 
 This module provides centralized metrics collection and reporting.
+
+MetricsRegistry is an in-process registry of counters, gauges and
+fixed-bucket histograms for hot paths (HTTP requests, DB queries, LLM calls):
+
+- Observations are plain attribute/list updates with no locks. They happen on
+  the event loop thread; a rare lost update from a worker thread costs one
+  sample, never a crash.
+- Label children are created once and cached, so callers on hot paths should
+  keep the child: ``child = histogram.labels("GET", "/api/tasks", "200")``.
+- render_prometheus() produces the Prometheus text exposition format
+  (served at GET /api/metrics/prometheus).
+
+Overhead per observation is a few hundred nanoseconds on CPython
+(see ``python -m benchmarks.micro_metrics``).
 """
 
-from typing import Dict, Any, Optional
+import math
+import re
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 # Import configuration
 from config import get_config
@@ -12,13 +29,419 @@ from config import get_config
 # Get configuration
 config = get_config()
 
+# Seconds; covers fast DB queries (ms) through slow LLM generations (minutes)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+_METRIC_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _label_string(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Estimate a percentile by linear interpolation within its bucket"""
+        if not self.count:
+            return None
+        rank = self.count * pct / 100
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = self.upper_bounds[i - 1] if i > 0 else 0.0
+                if i == len(self.upper_bounds):
+                    return lower  # Beyond the last bucket: report its bound
+                upper = self.upper_bounds[i]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.upper_bounds[-1]
+
+
+class _Metric:
+    """Base for metric families keyed by label values"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        if not _METRIC_NAME.match(name):
+            raise ValueError(f"Invalid metric name: {name}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        # Raw label values -> child, so repeat lookups skip str() conversion
+        self._lookup: Dict[Tuple[Any, ...], Any] = {}
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any) -> Any:
+        """Child for one label combination (cached; keep it on hot paths)"""
+        child = self._lookup.get(values)
+        if child is None:
+            key = tuple(str(v) for v in values)
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+            self._lookup[values] = child
+        return child
+
+    def clear(self) -> None:
+        self._children.clear()
+        self._lookup.clear()
+        if not self.labelnames:
+            self._default = self._new_child()
+            self._children[()] = self._default
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.value += amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in self._children.items():
+            lines.append(f"{self.name}{_label_string(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {",".join(key) or "_": child.value for key, child in self._children.items()}
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback at scrape time"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the (unlabelled) value from function() at render time"""
+        self._function = function
+
+    def _refresh(self) -> None:
+        if self._function is not None:
+            try:
+                self._default.value = float(self._function())
+            except Exception:
+                pass
+
+    def render(self) -> List[str]:
+        self._refresh()
+        lines = self._header()
+        for key, child in self._children.items():
+            lines.append(f"{self.name}{_label_string(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._refresh()
+        return {",".join(key) or "_": child.value for key, child in self._children.items()}
+
+
+class Histogram(_Metric):
+    """Fixed-bucket distribution (bucket bounds are upper bounds, inclusive)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        if not bounds:
+            raise ValueError("Histogram needs at least one finite bucket")
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in self._children.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_label_string(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _label_string(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+    def snapshot(self) -> Dict[str, Any]:
+        result = {}
+        for key, child in self._children.items():
+            if not child.count:
+                continue
+            result[",".join(key) or "_"] = {
+                "count": child.count,
+                "sum": round(child.sum, 6),
+                "avg": round(child.sum / child.count, 6),
+                "p50": child.percentile(50),
+                "p95": child.percentile(95),
+                "p99": child.percentile(99),
+            }
+        return result
+
+
+class MetricsRegistry:
+    """Named metric families; get-or-create so modules can declare at import time"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+        elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered with a different type or labels")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """All metrics in Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly view; histograms include estimated p50/p95/p99 (seconds)"""
+        return {
+            name: {"type": metric.kind, "values": metric.snapshot()}
+            for name, metric in self._metrics.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all recorded values (keeps registrations)"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+# Global registry
+metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return metrics_registry
+
+
+# Hot-path metric families shared by the middleware, database pool and LLM clients
+HTTP_REQUEST_DURATION = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_LOGGING = metrics_registry.histogram(
+    "http_request_logging_seconds",
+    "Event-loop time spent in the logging handler per request",
+    ("route",),
+    buckets=(0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01),
+)
+HTTP_REQUESTS_IN_FLIGHT = metrics_registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled"
+)
+DB_QUERY_DURATION = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "PostgreSQL query latency by statement type and table",
+    ("operation", "table"),
+)
+DB_QUERY_ERRORS = metrics_registry.counter(
+    "db_query_errors_total", "PostgreSQL queries that raised", ("operation", "table")
+)
+# operation="consolidated" is a call through ModelConsolidationService (any
+# provider); generate/chat are direct client calls (e.g. OllamaClient)
+LLM_REQUEST_DURATION = metrics_registry.histogram(
+    "llm_request_duration_seconds",
+    "LLM call latency by provider and outcome",
+    ("provider", "operation", "outcome"),
+)
+LLM_TOKENS = metrics_registry.counter(
+    "llm_tokens_total", "Tokens reported by LLM providers", ("provider",)
+)
+
+_SQL_OPERATION = re.compile(r"^\s*(?:--[^\n]*\n\s*)*(\w+)")
+_SQL_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|JOIN)\s+([a-zA-Z_][\w.]*)", re.IGNORECASE)
+_MAX_QUERY_SHAPES = 2000
+_query_labels: Dict[str, Tuple[str, str]] = {}
+
+
+def _query_shape(query: str) -> Tuple[str, str]:
+    labels = _query_labels.get(query)
+    if labels is None:
+        op_match = _SQL_OPERATION.match(query)
+        operation = op_match.group(1).upper() if op_match else "OTHER"
+        table_match = _SQL_TABLE.search(query)
+        table = table_match.group(1).lower() if table_match else "none"
+        labels = (operation, table)
+        if len(_query_labels) < _MAX_QUERY_SHAPES:
+            _query_labels[query] = labels
+    return labels
+
+
+def record_db_query(record: Any) -> None:
+    """
+    asyncpg query logger (Connection.add_query_logger).
+
+    record is an asyncpg LoggedQuery: query, args, timeout, elapsed (seconds),
+    exception, conn_addr, conn_params.
+    """
+    labels = _query_shape(record.query)
+    DB_QUERY_DURATION.labels(*labels).observe(record.elapsed)
+    if record.exception is not None:
+        DB_QUERY_ERRORS.labels(*labels).inc()
+
+
+def record_llm_call(
+    provider: str,
+    operation: str,
+    seconds: float,
+    success: bool = True,
+    tokens: Optional[int] = None,
+) -> None:
+    """Record one LLM provider call"""
+    LLM_REQUEST_DURATION.labels(provider, operation, "success" if success else "error").observe(
+        seconds
+    )
+    if tokens:
+        LLM_TOKENS.labels(provider).inc(tokens)
+
 
 class MetricsService:
     """Centralized metrics collection service."""
-    
-    def __init__(self):
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
         self._metrics: Dict[str, Any] = {}
-    
+        self.registry = registry or metrics_registry
+
     async def get_metrics(self) -> Dict[str, Any]:
         """Get aggregated task and system metrics."""
         # This would typically query the database for metrics
@@ -32,15 +455,19 @@ class MetricsService:
             "avg_execution_time": 0.0,
             "total_cost": 0.0,
         }
-    
+
     def update_metrics(self, **kwargs) -> None:
         """Update metrics with new values."""
         self._metrics.update(kwargs)
-    
+
     def get_metric(self, key: str) -> Any:
         """Get a specific metric value."""
         return self._metrics.get(key)
 
+    def render_prometheus(self) -> str:
+        """Registry contents in Prometheus text format."""
+        return self.registry.render_prometheus()
+
 
 # Global metrics service instance
 metrics_service = MetricsService()
@@ -48,4 +475,4 @@ metrics_service = MetricsService()
 
 def get_metrics_service() -> MetricsService:
     """Get the global metrics service instance."""
-    return metrics_service
\ No newline at end of file
+    return metrics_service
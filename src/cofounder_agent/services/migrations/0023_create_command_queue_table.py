@@ -0,0 +1,65 @@
+"""
+Database migration: Create command_queue table.
+
+Backs PostgresCommandBackend (services/command_queue.py). Consumers claim rows
+with SELECT ... FOR UPDATE SKIP LOCKED; visible_at is the lease expiry for
+processing rows and the earliest delivery time for pending rows.
+"""
+
+
+async def up(pool):
+    """Create command_queue table and delivery indexes."""
+
+    await pool.execute(
+        """
+        CREATE TABLE IF NOT EXISTS command_queue (
+            id VARCHAR(36) PRIMARY KEY,
+            agent_type VARCHAR(100) NOT NULL,
+            action VARCHAR(255) NOT NULL,
+            payload JSONB DEFAULT '{}'::jsonb,
+
+            -- pending, processing, completed, failed, cancelled, dead_letter
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            result JSONB,
+            error TEXT,
+
+            -- Delivery / lease
+            retry_count INTEGER NOT NULL DEFAULT 0,
+            max_retries INTEGER NOT NULL DEFAULT 3,
+            claimed_by VARCHAR(255),
+            visible_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+            -- Timestamps
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            started_at TIMESTAMP WITH TIME ZONE,
+            completed_at TIMESTAMP WITH TIME ZONE
+        );
+        """
+    )
+
+    # Delivery scan: only rows that can still be claimed (pending or leased)
+    await pool.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_command_queue_deliverable
+        ON command_queue(visible_at, created_at)
+        WHERE status IN ('pending', 'processing');
+        """
+    )
+    await pool.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_command_queue_agent_deliverable
+        ON command_queue(agent_type, visible_at)
+        WHERE status IN ('pending', 'processing');
+        """
+    )
+
+    # Listing and cleanup
+    await pool.execute("CREATE INDEX IF NOT EXISTS ix_command_queue_status_created ON command_queue(status, created_at DESC);")
+    await pool.execute("CREATE INDEX IF NOT EXISTS ix_command_queue_status_updated ON command_queue(status, updated_at);")
+
+
+async def down(pool):
+    """Drop command_queue table."""
+
+    await pool.execute("DROP TABLE IF EXISTS command_queue CASCADE;")
@@ -0,0 +1,60 @@
+"""
+Database migration: Create newsletter_campaigns table.
+
+Backs bulk newsletter delivery (EmailPublisher.send_newsletter). A campaign
+stores its rendered content and a checkpoint (last_subscriber_id): every
+subscriber with id <= checkpoint has been handled, so an interrupted campaign
+resumes where it stopped. Per-recipient outcomes go to campaign_email_logs.
+"""
+
+
+async def up(pool):
+    """Create newsletter_campaigns table and delivery-log index."""
+
+    await pool.execute(
+        """
+        CREATE TABLE IF NOT EXISTS newsletter_campaigns (
+            id SERIAL PRIMARY KEY,
+            campaign_name VARCHAR(255) NOT NULL,
+            subject VARCHAR(500) NOT NULL,
+            content JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+            -- pending, sending, paused, completed, failed
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            last_subscriber_id INTEGER NOT NULL DEFAULT 0,
+            sent_count INTEGER NOT NULL DEFAULT 0,
+            failed_count INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            started_at TIMESTAMP WITH TIME ZONE,
+            completed_at TIMESTAMP WITH TIME ZONE
+        );
+        """
+    )
+    await pool.execute(
+        "CREATE INDEX IF NOT EXISTS ix_newsletter_campaigns_status ON newsletter_campaigns(status, created_at DESC);"
+    )
+
+    # Resume check: "was this subscriber already sent this campaign?"
+    # (campaign_email_logs comes from migrations/010_newsletter_subscribers.sql)
+    await pool.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('campaign_email_logs') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS ix_campaign_email_logs_campaign_subscriber
+                ON campaign_email_logs(campaign_id, subscriber_id)
+                WHERE delivery_status = 'sent';
+            END IF;
+        END $$;
+        """
+    )
+
+
+async def down(pool):
+    """Drop newsletter_campaigns table."""
+
+    await pool.execute("DROP INDEX IF EXISTS ix_campaign_email_logs_campaign_subscriber;")
+    await pool.execute("DROP TABLE IF EXISTS newsletter_campaigns CASCADE;")
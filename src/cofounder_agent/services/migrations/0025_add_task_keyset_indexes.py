@@ -0,0 +1,33 @@
+"""
+Database migration: Keyset pagination indexes for content_tasks.
+
+Task listing pages with ORDER BY created_at DESC, id DESC and a
+(created_at, id) < (cursor) seek (TasksDatabase.get_tasks_page). These
+composite indexes let every page, at any depth, start with an index seek
+instead of scanning and discarding OFFSET rows. The status and category
+variants serve the filtered list views.
+
+Built CONCURRENTLY so existing deployments don't lock content_tasks writes
+while the indexes build.
+"""
+
+INDEXES = {
+    "idx_content_tasks_created_id": "(created_at DESC, id DESC)",
+    "idx_content_tasks_status_created_id": "(status, created_at DESC, id DESC)",
+    "idx_content_tasks_category_created_id": "(category, created_at DESC, id DESC)",
+}
+
+
+async def up(pool):
+    """Create keyset pagination indexes on content_tasks."""
+
+    for name, columns in INDEXES.items():
+        # CONCURRENTLY can't run inside a transaction block: one statement per call
+        await pool.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON content_tasks {columns};")
+
+
+async def down(pool):
+    """Drop keyset pagination indexes."""
+
+    for name in INDEXES:
+        await pool.execute(f"DROP INDEX IF EXISTS {name};")
@@ -0,0 +1,124 @@
+"""
+Database migration: Active-status partial indexes and task_status_counts.
+
+- Partial indexes on content_tasks for the states that are polled
+  (pending, in_progress, awaiting_approval). They only hold active rows, so
+  the executor's pending poll stays an index seek over a handful of entries
+  however many completed tasks accumulate.
+- task_status_counts keeps one row per status, maintained by triggers on
+  content_tasks (insert, delete, and updates that change status). Every
+  write path is covered, including direct SQL, so get_task_counts reads a
+  few rows instead of running GROUP BY over the whole table.
+
+The counts are backfilled in the same transaction that installs the
+triggers, under a lock that blocks concurrent writes, so no change is
+missed or counted twice.
+"""
+
+ACTIVE_STATUSES = ("pending", "in_progress", "awaiting_approval")
+
+
+async def up(pool):
+    """Create partial indexes, task_status_counts and its triggers."""
+
+    for status in ACTIVE_STATUSES:
+        await pool.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_tasks_{status}_created "
+            f"ON content_tasks (created_at DESC) WHERE status = '{status}';"
+        )
+
+    await pool.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_status_counts (
+            status VARCHAR(50) PRIMARY KEY,
+            count BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+        );
+        """
+    )
+
+    await pool.execute(
+        """
+        CREATE OR REPLACE FUNCTION content_tasks_count_status() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE task_status_counts
+                SET count = count - 1, updated_at = NOW()
+                WHERE status = COALESCE(OLD.status, 'unknown');
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO task_status_counts (status, count)
+                VALUES (COALESCE(NEW.status, 'unknown'), 1)
+                ON CONFLICT (status)
+                DO UPDATE SET count = task_status_counts.count + 1, updated_at = NOW();
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    await pool.execute(
+        """
+        CREATE OR REPLACE FUNCTION content_tasks_reset_status_counts() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM task_status_counts;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    async with pool.acquire() as conn:
+        installed = await conn.fetchval(
+            "SELECT 1 FROM pg_trigger WHERE tgname = 'trg_content_tasks_status_counts_write'"
+        )
+        if installed:
+            return
+
+        async with conn.transaction():
+            # Blocks inserts/updates/deletes (not reads) until the backfill commits
+            await conn.execute("LOCK TABLE content_tasks IN SHARE ROW EXCLUSIVE MODE;")
+            await conn.execute(
+                """
+                CREATE TRIGGER trg_content_tasks_status_counts_write
+                AFTER INSERT OR DELETE ON content_tasks
+                FOR EACH ROW EXECUTE FUNCTION content_tasks_count_status();
+                """
+            )
+            await conn.execute(
+                """
+                CREATE TRIGGER trg_content_tasks_status_counts_update
+                AFTER UPDATE OF status ON content_tasks
+                FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+                EXECUTE FUNCTION content_tasks_count_status();
+                """
+            )
+            await conn.execute(
+                """
+                CREATE TRIGGER trg_content_tasks_status_counts_truncate
+                AFTER TRUNCATE ON content_tasks
+                FOR EACH STATEMENT EXECUTE FUNCTION content_tasks_reset_status_counts();
+                """
+            )
+            await conn.execute("DELETE FROM task_status_counts;")
+            await conn.execute(
+                """
+                INSERT INTO task_status_counts (status, count)
+                SELECT COALESCE(status, 'unknown'), COUNT(*)
+                FROM content_tasks
+                GROUP BY COALESCE(status, 'unknown');
+                """
+            )
+
+
+async def down(pool):
+    """Drop triggers, task_status_counts and the partial indexes."""
+
+    await pool.execute("DROP TRIGGER IF EXISTS trg_content_tasks_status_counts_write ON content_tasks;")
+    await pool.execute("DROP TRIGGER IF EXISTS trg_content_tasks_status_counts_update ON content_tasks;")
+    await pool.execute("DROP TRIGGER IF EXISTS trg_content_tasks_status_counts_truncate ON content_tasks;")
+    await pool.execute("DROP FUNCTION IF EXISTS content_tasks_count_status();")
+    await pool.execute("DROP FUNCTION IF EXISTS content_tasks_reset_status_counts();")
+    await pool.execute("DROP TABLE IF EXISTS task_status_counts;")
+    for status in ACTIVE_STATUSES:
+        await pool.execute(f"DROP INDEX IF EXISTS idx_content_tasks_{status}_created;")
@@ -0,0 +1,48 @@
+"""
+Database migration: Centroids and member counts on knowledge_clusters.
+
+AIMemorySystem clusters memories with an online k-means index. Each
+cluster stores its running-mean centroid (raw float32 bytes) so the index
+can be rebuilt at startup, and its member count so importance scoring and
+new members don't need the full memories array. New members are appended
+with array_append instead of rewriting the array.
+
+member_count is backfilled from the existing arrays. The table is created
+outside the migration set, so each statement is a no-op when it is absent.
+"""
+
+
+async def up(pool):
+    """Add centroid and member_count to knowledge_clusters."""
+
+    await pool.execute(
+        """
+        ALTER TABLE IF EXISTS knowledge_clusters
+            ADD COLUMN IF NOT EXISTS centroid BYTEA,
+            ADD COLUMN IF NOT EXISTS member_count INTEGER NOT NULL DEFAULT 0;
+        """
+    )
+    await pool.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('knowledge_clusters') IS NOT NULL THEN
+                UPDATE knowledge_clusters
+                SET member_count = COALESCE(array_length(memories, 1), 0)
+                WHERE member_count = 0;
+            END IF;
+        END $$;
+        """
+    )
+
+
+async def down(pool):
+    """Drop centroid and member_count from knowledge_clusters."""
+
+    await pool.execute(
+        """
+        ALTER TABLE IF EXISTS knowledge_clusters
+            DROP COLUMN IF EXISTS centroid,
+            DROP COLUMN IF EXISTS member_count;
+        """
+    )
@@ -18,6 +18,12 @@ Features:
 - Metrics tracking per provider
 - Easy provider addition
 - Graceful degradation
+- Hedged mode: if a provider is slower than its observed p95, the next provider
+  is raced in parallel and the first success wins (MODEL_HEDGING_ENABLED=true).
+  Every adapter is async, so cancelling a losing attempt closes its request;
+  paid providers may still bill the prompt, which is charged as hedge_cost
+- Adaptive routing: calls tagged with a task_type ask the global ModelRouter
+  for a model and report every attempt's latency and outcome back to it
 
 Usage:
     service = get_model_consolidation_service()
@@ -29,7 +35,9 @@ Usage:
 """
 
 import asyncio
+import bisect
 import os
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -38,6 +46,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
+from .metrics_service import record_llm_call
+from .model_router import get_model_router
 from .provider_checker import ProviderChecker
 
 logger = structlog.get_logger(__name__)
@@ -58,6 +68,35 @@ class ProviderType(str, Enum):
     OPENAI = "openai"  # GPT API (expensive)
 
 
+# ModelRouter model names -> (provider, provider model ID); "ollama/<model>" is implicit
+ROUTER_MODEL_PROVIDERS: Dict[str, Tuple[ProviderType, str]] = {
+    "gpt-3.5-turbo": (ProviderType.OPENAI, "gpt-3.5-turbo"),
+    "gpt-4": (ProviderType.OPENAI, "gpt-4"),
+    "gpt-4-turbo": (ProviderType.OPENAI, "gpt-4-turbo"),
+    "claude-haiku-3": (ProviderType.ANTHROPIC, "claude-3-haiku-20240307"),
+    "claude-sonnet-3": (ProviderType.ANTHROPIC, "claude-3-sonnet-20240229"),
+    "claude-opus-3": (ProviderType.ANTHROPIC, "claude-3-opus-20240229"),
+}
+
+
+def resolve_router_model(router_model: str) -> Optional[Tuple[ProviderType, str]]:
+    """Map a ModelRouter model name to the provider and model ID that serve it"""
+    if router_model.startswith("ollama/"):
+        name = router_model[len("ollama/"):]
+        return ProviderType.OLLAMA, name if ":" in name else f"{name}:latest"
+    return ROUTER_MODEL_PROVIDERS.get(router_model)
+
+
+def router_model_name(provider_type: ProviderType, model: str) -> str:
+    """Inverse of resolve_router_model, so telemetry lands on the router's candidates"""
+    if provider_type == ProviderType.OLLAMA:
+        return "ollama/" + (model[: -len(":latest")] if model.endswith(":latest") else model)
+    for name, (provider, model_id) in ROUTER_MODEL_PROVIDERS.items():
+        if provider == provider_type and model_id == model:
+            return name
+    return model
+
+
 @dataclass
 class ProviderStatus:
     """Status of a model provider"""
@@ -84,6 +123,72 @@ class ModelResponse:
     tokens_used: int
     cost: float
     response_time_ms: float
+    hedged: bool = False  # Another provider was raced against this one
+    hedge_cost: float = 0.0  # Cost of losing attempts (actual or estimated)
+
+
+class LatencyHistogram:
+    """
+    Bucketed latency histogram with exponential decay.
+
+    Buckets grow geometrically (~1.5x) from 25ms to ~5min. Once the total
+    weight reaches max_weight all counts are halved, so recent behaviour
+    dominates the percentiles.
+
+    Attempts cancelled before answering are recorded with record_censored:
+    their latency is only known to exceed the elapsed time, and dropping them
+    would bias the percentiles towards the fast attempts that were allowed to
+    finish.
+    """
+
+    BOUNDS_MS: List[float] = [25.0 * (1.5**i) for i in range(24)]
+
+    def __init__(self, max_weight: float = 500.0):
+        self.max_weight = max_weight
+        self.counts: List[float] = [0.0] * (len(self.BOUNDS_MS) + 1)
+        self.total = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Add one observation"""
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, latency_ms)] += 1.0
+        self._added(1.0)
+
+    def record_censored(self, elapsed_ms: float) -> None:
+        """
+        Add an observation known only to be at least elapsed_ms.
+
+        The sample's weight is spread over the buckets from elapsed_ms upward in
+        proportion to their counts. With no data there it is recorded at
+        elapsed_ms as a lower bound.
+        """
+        start = bisect.bisect_left(self.BOUNDS_MS, elapsed_ms)
+        above = sum(self.counts[start:])
+        if above <= 0:
+            self.counts[start] += 1.0
+        else:
+            for i in range(start, len(self.counts)):
+                self.counts[i] += self.counts[i] / above
+        self._added(1.0)
+
+    def _added(self, weight: float) -> None:
+        self.total += weight
+        if self.total >= self.max_weight:
+            self.counts = [c / 2 for c in self.counts]
+            self.total /= 2
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency at the given percentile (0-100), interpolated within its bucket"""
+        if self.total <= 0:
+            return None
+        target = self.total * pct / 100.0
+        cumulative = 0.0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= target:
+                low = self.BOUNDS_MS[i - 1] if i > 0 else 0.0
+                high = self.BOUNDS_MS[i] if i < len(self.BOUNDS_MS) else self.BOUNDS_MS[-1] * 1.5
+                return low + (high - low) * ((target - cumulative) / count)
+            cumulative += count
+        return self.BOUNDS_MS[-1]
 
 
 # ============================================================================
@@ -335,10 +440,10 @@ class AnthropicAdapter(ProviderAdapter):
             self.client = None
         else:
             try:
-                from anthropic import Anthropic
+                from anthropic import AsyncAnthropic
 
                 self.api_key = ProviderChecker.get_anthropic_api_key()
-                self.client = Anthropic(api_key=self.api_key)
+                self.client = AsyncAnthropic(api_key=self.api_key)
             except ImportError:
                 logger.warning("Anthropic SDK not installed. Install with: pip install anthropic")
                 self.client = None
@@ -367,7 +472,8 @@ class AnthropicAdapter(ProviderAdapter):
         start_time = datetime.utcnow()
 
         try:
-            response = self.client.messages.create(
+            # Async client: cancelling a hedged attempt closes the request
+            response = await self.client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}],
@@ -408,10 +514,10 @@ class OpenAIAdapter(ProviderAdapter):
             self.client = None
         else:
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI
 
                 self.api_key = ProviderChecker.get_openai_api_key()
-                self.client = OpenAI(api_key=self.api_key)
+                self.client = AsyncOpenAI(api_key=self.api_key)
             except ImportError:
                 logger.warning("OpenAI SDK not installed. Install with: pip install openai")
                 self.client = None
@@ -440,7 +546,8 @@ class OpenAIAdapter(ProviderAdapter):
         start_time = datetime.utcnow()
 
         try:
-            response = self.client.chat.completions.create(
+            # Async client: cancelling a hedged attempt closes the request
+            response = await self.client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
@@ -487,8 +594,21 @@ class ModelConsolidationService:
     3. Google Gemini
     4. Anthropic Claude
     5. OpenAI GPT (expensive, last resort)
+
+    Hedged mode races providers instead of waiting out a slow one: if the
+    current provider has not responded within its budget (observed p95 x
+    HEDGE_P95_MULTIPLIER), the next available provider is launched in
+    parallel. The first success wins and the other attempt is cancelled.
     """
 
+    # Hedge budget = provider p95 * multiplier, clamped to [min, max]
+    HEDGE_P95_MULTIPLIER = 1.2
+    HEDGE_MIN_BUDGET_MS = 500.0
+    HEDGE_MAX_BUDGET_MS = 120_000.0
+    # Budget used until a provider has HEDGE_MIN_SAMPLES successful responses
+    HEDGE_DEFAULT_BUDGET_MS = 30_000.0
+    HEDGE_MIN_SAMPLES = 5
+
     # Fallback chain (order matters!)
     FALLBACK_CHAIN = [
         ProviderType.OLLAMA,
@@ -498,16 +618,36 @@ class ModelConsolidationService:
         ProviderType.OPENAI,
     ]
 
-    def __init__(self):
-        """Initialize all model providers"""
+    def __init__(self, hedging_enabled: Optional[bool] = None, max_parallel_attempts: int = 2):
+        """
+        Initialize all model providers
+
+        Args:
+            hedging_enabled: Default for generate(hedge=...); falls back to the
+                MODEL_HEDGING_ENABLED environment variable
+            max_parallel_attempts: Maximum providers in flight at once in hedged mode
+        """
         self.adapters: Dict[ProviderType, ProviderAdapter] = {}
         self.provider_status: Dict[ProviderType, ProviderStatus] = {}
+        self.latency: Dict[ProviderType, LatencyHistogram] = {}
+        self.hedging_enabled = (
+            hedging_enabled
+            if hedging_enabled is not None
+            else os.getenv("MODEL_HEDGING_ENABLED", "false").lower() in ("true", "1", "yes")
+        )
+        self.max_parallel_attempts = max(1, max_parallel_attempts)
         self.metrics = {
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
             "total_cost": 0.0,
             "by_provider": {},
+            "hedging": {
+                "hedged_requests": 0,  # Requests where a second provider was launched
+                "hedge_wins": 0,  # ... and the later provider won
+                "cancelled_attempts": 0,
+                "hedge_cost": 0.0,  # Cost spent on losing attempts
+            },
         }
 
         # Initialize all adapters
@@ -576,6 +716,128 @@ class ModelConsolidationService:
 
             return False
 
+    def _build_chain(self, preferred_provider: Optional[ProviderType]) -> List[ProviderType]:
+        """Fallback chain with the preferred provider first"""
+        chain = []
+        if preferred_provider:
+            chain.append(preferred_provider)
+
+        for provider in self.FALLBACK_CHAIN:
+            if provider not in chain:
+                chain.append(provider)
+        return chain
+
+    def _provider_metrics(self, provider_type: ProviderType) -> Dict[str, Any]:
+        if provider_type.value not in self.metrics["by_provider"]:
+            self.metrics["by_provider"][provider_type.value] = {
+                "requests": 0,
+                "cost": 0.0,
+            }
+        return self.metrics["by_provider"][provider_type.value]
+
+    def _record_success(
+        self,
+        provider_type: ProviderType,
+        response: ModelResponse,
+        task_type: Optional[str] = None,
+    ) -> None:
+        """Track cost, request counts and latency for a successful response"""
+        self.metrics["total_cost"] += response.cost
+
+        provider_metrics = self._provider_metrics(provider_type)
+        provider_metrics["requests"] += 1
+        provider_metrics["cost"] += response.cost
+
+        self.latency.setdefault(provider_type, LatencyHistogram()).record(
+            response.response_time_ms
+        )
+        status = self.provider_status.get(provider_type)
+        if status:
+            status.response_time_ms = response.response_time_ms
+        record_llm_call(
+            provider_type.value,
+            "consolidated",
+            response.response_time_ms / 1000,
+            success=True,
+            tokens=response.tokens_used,
+        )
+        self._record_routing_outcome(
+            task_type,
+            provider_type,
+            response.model,
+            response.response_time_ms,
+            tokens=response.tokens_used,
+            success=True,
+        )
+
+    def _record_failure(
+        self,
+        provider_type: ProviderType,
+        model: Optional[str],
+        elapsed_s: float,
+        task_type: Optional[str] = None,
+    ) -> None:
+        """Track a failed provider attempt"""
+        record_llm_call(provider_type.value, "consolidated", elapsed_s, success=False)
+        self._record_routing_outcome(
+            task_type, provider_type, model, elapsed_s * 1000, tokens=0, success=False
+        )
+
+    @staticmethod
+    def _record_routing_outcome(
+        task_type: Optional[str],
+        provider_type: ProviderType,
+        model: Optional[str],
+        latency_ms: float,
+        tokens: int,
+        success: bool,
+    ) -> None:
+        """Feed one attempt to the model router; only routed (task_type) calls count"""
+        router = get_model_router()
+        if not task_type or not model or router is None:
+            return
+        router.record_outcome(
+            task_type,
+            router_model_name(provider_type, model),
+            latency_ms=latency_ms,
+            tokens=tokens,
+            success=success,
+        )
+
+    def _route_model(
+        self, task_type: str, max_tokens: int, routing_context: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[ProviderType, str]]:
+        """Ask the model router which model should serve task_type"""
+        router = get_model_router()
+        if router is None:
+            return None
+        routed_model, _, _ = router.route_request(
+            task_type, context=dict(routing_context or {}), estimated_tokens=max_tokens
+        )
+        resolved = resolve_router_model(routed_model)
+        if resolved is None or resolved[0] not in self.adapters:
+            logger.info("Routed model has no adapter, using fallback chain", model=routed_model)
+            return None
+        return resolved
+
+    def _estimated_cost(self, provider_type: ProviderType) -> float:
+        """Average cost per successful request, used for attempts cancelled mid-flight"""
+        provider_metrics = self.metrics["by_provider"].get(provider_type.value)
+        if not provider_metrics or not provider_metrics["requests"]:
+            return 0.0
+        return provider_metrics["cost"] / provider_metrics["requests"]
+
+    def hedge_budget_ms(self, provider_type: ProviderType) -> float:
+        """How long to wait on a provider before racing the next one"""
+        histogram = self.latency.get(provider_type)
+        if not histogram or histogram.total < self.HEDGE_MIN_SAMPLES:
+            return self.HEDGE_DEFAULT_BUDGET_MS
+        p95 = histogram.percentile(95) or self.HEDGE_DEFAULT_BUDGET_MS
+        return min(
+            self.HEDGE_MAX_BUDGET_MS,
+            max(self.HEDGE_MIN_BUDGET_MS, p95 * self.HEDGE_P95_MULTIPLIER),
+        )
+
     async def generate(
         self,
         prompt: str,
@@ -583,6 +845,9 @@ class ModelConsolidationService:
         max_tokens: int = 2000,
         temperature: float = 0.7,
         preferred_provider: Optional[ProviderType] = None,
+        hedge: Optional[bool] = None,
+        task_type: Optional[str] = None,
+        routing_context: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> ModelResponse:
         """
@@ -594,6 +859,12 @@ class ModelConsolidationService:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0-1.0)
             preferred_provider: Try this provider first
+            hedge: Race the next provider when the current one exceeds its
+                latency budget (defaults to self.hedging_enabled)
+            task_type: Task type for adaptive routing (e.g. "research"). When set
+                and no model is given, the model router picks the model and
+                its provider goes first; every attempt is reported to the router.
+            routing_context: Extra context for ModelRouter.route_request
             **kwargs: Additional arguments for providers
 
         Returns:
@@ -604,20 +875,35 @@ class ModelConsolidationService:
         """
         self.metrics["total_requests"] += 1
 
-        # Build chain (preferred provider first)
-        chain = []
-        if preferred_provider:
-            chain.append(preferred_provider)
+        # Routed model applies to its own provider only; the rest keep `model`
+        models: Dict[ProviderType, Optional[str]] = {}
+        if task_type and model is None:
+            routed = self._route_model(task_type, max_tokens, routing_context)
+            if routed:
+                routed_provider, models[routed_provider] = routed
+                preferred_provider = preferred_provider or routed_provider
 
-        for provider in self.FALLBACK_CHAIN:
-            if provider not in chain:
-                chain.append(provider)
+        # Build chain (preferred provider first)
+        chain = self._build_chain(preferred_provider)
+
+        if hedge if hedge is not None else self.hedging_enabled:
+            return await self._generate_hedged(
+                chain,
+                prompt,
+                model,
+                max_tokens,
+                temperature,
+                task_type=task_type,
+                models=models,
+                **kwargs,
+            )
 
         # Try each provider in order
         last_error = None
         logger.info(f"🔗 Starting provider fallback chain ({len(chain)} providers to try)", chain=[p.value for p in chain])
         
         for provider_type in chain:
+            attempt_started = None
             try:
                 # Check availability
                 logger.debug(f"⏳ Checking {provider_type.value} availability...")
@@ -634,9 +920,10 @@ class ModelConsolidationService:
 
                 logger.info(f"🚀 Attempting generation with {provider_type.value}...", provider=provider_type.value)
 
+                attempt_started = time.perf_counter()
                 response = await adapter.generate(
                     prompt=prompt,
-                    model=model,
+                    model=models.get(provider_type, model),
                     max_tokens=max_tokens,
                     temperature=temperature,
                     **kwargs,
@@ -644,16 +931,7 @@ class ModelConsolidationService:
 
                 # Track metrics
                 self.metrics["successful_requests"] += 1
-                self.metrics["total_cost"] += response.cost
-
-                if provider_type.value not in self.metrics["by_provider"]:
-                    self.metrics["by_provider"][provider_type.value] = {
-                        "requests": 0,
-                        "cost": 0.0,
-                    }
-
-                self.metrics["by_provider"][provider_type.value]["requests"] += 1
-                self.metrics["by_provider"][provider_type.value]["cost"] += response.cost
+                self._record_success(provider_type, response, task_type)
 
                 logger.info(
                     f"✅ {provider_type.value} generation successful",
@@ -666,6 +944,13 @@ class ModelConsolidationService:
 
             except Exception as e:
                 last_error = e
+                if attempt_started is not None:
+                    self._record_failure(
+                        provider_type,
+                        models.get(provider_type, model),
+                        time.perf_counter() - attempt_started,
+                        task_type,
+                    )
                 logger.warning(
                     f"❌ {provider_type.value} generation failed", provider=provider_type.value, error=str(e)
                 )
@@ -677,6 +962,173 @@ class ModelConsolidationService:
         logger.error("🚨 All providers exhausted", error=error_msg)
         raise Exception(error_msg)
 
+    async def _generate_hedged(
+        self,
+        chain: List[ProviderType],
+        prompt: str,
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        task_type: Optional[str] = None,
+        models: Optional[Dict[ProviderType, Optional[str]]] = None,
+        **kwargs,
+    ) -> ModelResponse:
+        """
+        Race providers along the chain.
+
+        The next provider is launched when the newest attempt exceeds its
+        hedge budget, or immediately when an attempt fails. At most
+        max_parallel_attempts run at once. The first success wins and the
+        remaining attempts are cancelled. Cancelling closes the provider request,
+        but a paid provider may already have billed the prompt, so each
+        cancelled attempt is charged its provider's average cost as hedge_cost.
+        """
+        # Availability checks run concurrently instead of one after another
+        checks = await asyncio.gather(
+            *(self._check_provider_availability(p) for p in chain), return_exceptions=True
+        )
+        candidates = [
+            p for p, ok in zip(chain, checks) if ok is True and self.adapters.get(p) is not None
+        ]
+        logger.info("🏁 Hedged generation", candidates=[p.value for p in candidates])
+
+        pending: Dict[asyncio.Task, Tuple[ProviderType, float]] = {}
+        remaining = list(candidates)
+        launched = 0
+        last_error: Optional[Exception] = None
+        hedge_cost = 0.0
+        models = models or {}
+
+        def launch() -> None:
+            nonlocal launched
+            provider_type = remaining.pop(0)
+            task = asyncio.create_task(
+                self.adapters[provider_type].generate(
+                    prompt=prompt,
+                    model=models.get(provider_type, model),
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs,
+                )
+            )
+            pending[task] = (provider_type, time.monotonic())
+            launched += 1
+            if launched == 2:
+                self.metrics["hedging"]["hedged_requests"] += 1
+            logger.info(f"🚀 Attempting generation with {provider_type.value}...", provider=provider_type.value)
+
+        if remaining:
+            launch()
+
+        try:
+            while pending:
+                # Budget applies to the most recently launched attempt
+                timeout = None
+                if remaining and len(pending) < self.max_parallel_attempts:
+                    newest_provider, newest_start = max(pending.values(), key=lambda v: v[1])
+                    budget_s = self.hedge_budget_ms(newest_provider) / 1000
+                    timeout = max(0.0, newest_start + budget_s - time.monotonic())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    slow_provider = max(pending.values(), key=lambda v: v[1])[0]
+                    logger.info(
+                        f"⏱️  {slow_provider.value} exceeded hedge budget, racing next provider",
+                        provider=slow_provider.value,
+                        budget_ms=round(self.hedge_budget_ms(slow_provider)),
+                    )
+                    launch()
+                    continue
+
+                winner: Optional[Tuple[ProviderType, ModelResponse]] = None
+                for task in done:
+                    provider_type, started = pending.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        self._record_failure(
+                            provider_type,
+                            models.get(provider_type, model),
+                            time.monotonic() - started,
+                            task_type,
+                        )
+                        logger.warning(
+                            f"❌ {provider_type.value} generation failed",
+                            provider=provider_type.value,
+                            error=str(last_error),
+                        )
+                        continue
+                    response = task.result()
+                    if winner is None:
+                        winner = (provider_type, response)
+                    else:
+                        # Finished in the same tick as the winner: real, wasted cost.
+                        # _record_success already adds it to total_cost.
+                        self._record_success(provider_type, response, task_type)
+                        hedge_cost += response.cost
+
+                if winner is None:
+                    # Fail over immediately instead of waiting for a budget
+                    while remaining and len(pending) < self.max_parallel_attempts:
+                        launch()
+                    continue
+
+                provider_type, response = winner
+                if launched > 1 and provider_type != candidates[0]:
+                    self.metrics["hedging"]["hedge_wins"] += 1
+                cancelled_cost = await self._cancel_attempts(pending)
+                hedge_cost += cancelled_cost
+
+                self.metrics["successful_requests"] += 1
+                self._record_success(provider_type, response, task_type)
+                self.metrics["total_cost"] += cancelled_cost
+                self.metrics["hedging"]["hedge_cost"] += hedge_cost
+                response.hedged = launched > 1
+                response.hedge_cost = hedge_cost
+
+                logger.info(
+                    f"✅ {provider_type.value} generation successful",
+                    provider=provider_type.value,
+                    response_time_ms=response.response_time_ms,
+                    cost=response.cost,
+                    hedged=response.hedged,
+                    hedge_cost=hedge_cost,
+                )
+                return response
+        finally:
+            # Caller cancelled or an unexpected error: don't leak provider calls
+            if pending:
+                await self._cancel_attempts(pending)
+
+        # All providers failed
+        self.metrics["failed_requests"] += 1
+        error_msg = f"All model providers failed. Last error: {str(last_error)}"
+        logger.error("🚨 All providers exhausted", error=error_msg)
+        raise Exception(error_msg)
+
+    async def _cancel_attempts(
+        self, pending: Dict[asyncio.Task, Tuple[ProviderType, float]]
+    ) -> float:
+        """Cancel in-flight attempts; returns the cost charged for them"""
+        cost = 0.0
+        now = time.monotonic()
+        for task, (provider_type, started) in list(pending.items()):
+            task.cancel()
+            # The attempt was at least this slow; keep it in the p95 the budgets use
+            self.latency.setdefault(provider_type, LatencyHistogram()).record_censored(
+                (now - started) * 1000
+            )
+            # Paid providers bill the prompt (and any generated tokens) even when
+            # we stop waiting, so charge the provider's average request cost
+            cost += self._estimated_cost(provider_type)
+            self.metrics["hedging"]["cancelled_attempts"] += 1
+            logger.debug("Cancelled losing attempt", provider=provider_type.value)
+        await asyncio.gather(*pending, return_exceptions=True)
+        pending.clear()
+        return cost
+
     def get_status(self) -> Dict[str, Any]:
         """Get status of all providers"""
         return {
@@ -686,12 +1138,21 @@ class ModelConsolidationService:
                     "last_checked": status.last_checked.isoformat(),
                     "response_time_ms": status.response_time_ms,
                     "last_error": status.last_error,
+                    "latency_p50_ms": self._latency_percentile(provider, 50),
+                    "latency_p95_ms": self._latency_percentile(provider, 95),
+                    "hedge_budget_ms": round(self.hedge_budget_ms(provider), 1),
                 }
                 for provider, status in self.provider_status.items()
             },
+            "hedging_enabled": self.hedging_enabled,
             "metrics": self.metrics,
         }
 
+    def _latency_percentile(self, provider: ProviderType, pct: float) -> Optional[float]:
+        histogram = self.latency.get(provider)
+        value = histogram.percentile(pct) if histogram else None
+        return round(value, 1) if value is not None else None
+
     def list_models(self, provider: Optional[ProviderType] = None) -> Dict[str, List[str]]:
         """List available models"""
         if provider:
@@ -16,11 +16,21 @@ Cost Comparison (per 1K tokens):
 Expected Savings: $10,000-$15,000/year with smart routing
 Additional Savings: $2,400-$3,600/year with token limiting
 Zero-Cost Option: 100% savings with Ollama local models
+
+Adaptive routing: the router keeps rolling per-model, per-task-type telemetry
+(latency, tokens/sec, failure rate, downstream quality score) and picks the
+cheapest model that meets the latency SLO and quality floor, exploring
+occasionally. Stats persist in the settings table across restarts.
 """
 
 import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -124,6 +134,111 @@ MAX_TOKENS_BY_TASK = {
 }
 
 
+# Order used to compare a model's capability with a task's complexity
+COMPLEXITY_RANK = {
+    TaskComplexity.SIMPLE: 0,
+    TaskComplexity.MEDIUM: 1,
+    TaskComplexity.COMPLEX: 2,
+    TaskComplexity.CRITICAL: 3,
+}
+
+
+@dataclass
+class ModelStats:
+    """Rolling telemetry for one model on one task type (EWMA + recent latencies)"""
+
+    samples: int = 0
+    latency_ms: float = 0.0
+    tokens_per_sec: float = 0.0
+    failure_rate: float = 0.0
+    quality_score: Optional[float] = None  # 0-100, from quality evaluations
+    quality_samples: int = 0
+    recent_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    last_updated: float = 0.0
+
+    ALPHA = 0.2  # EWMA weight of the newest observation
+
+    def _ewma(self, current: float, value: float, first: bool) -> float:
+        return value if first else current + self.ALPHA * (value - current)
+
+    def record(self, latency_ms: float, tokens: int, success: bool) -> None:
+        first = self.samples == 0
+        self.failure_rate = self._ewma(self.failure_rate, 0.0 if success else 1.0, first)
+        if success:
+            self.latency_ms = self._ewma(self.latency_ms, latency_ms, not self.recent_latencies)
+            self.recent_latencies.append(latency_ms)
+            if tokens and latency_ms > 0:
+                rate = tokens / (latency_ms / 1000)
+                self.tokens_per_sec = self._ewma(self.tokens_per_sec, rate, not self.tokens_per_sec)
+        self.samples += 1
+        self.last_updated = time.time()
+
+    def record_quality(self, score: float) -> None:
+        self.quality_score = self._ewma(self.quality_score or 0.0, score, self.quality_samples == 0)
+        self.quality_samples += 1
+        self.last_updated = time.time()
+
+    @property
+    def p95_latency_ms(self) -> float:
+        if not self.recent_latencies:
+            return 0.0
+        ordered = sorted(self.recent_latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "latency_ms": round(self.latency_ms, 1),
+            "p95_latency_ms": round(self.p95_latency_ms, 1),
+            "tokens_per_sec": round(self.tokens_per_sec, 2),
+            "failure_rate": round(self.failure_rate, 4),
+            "quality_score": round(self.quality_score, 2) if self.quality_score is not None else None,
+            "quality_samples": self.quality_samples,
+            "recent_latencies": [round(v, 1) for v in self.recent_latencies],
+            "last_updated": self.last_updated,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelStats":
+        stats = cls(
+            samples=int(data.get("samples", 0)),
+            latency_ms=float(data.get("latency_ms", 0.0)),
+            tokens_per_sec=float(data.get("tokens_per_sec", 0.0)),
+            failure_rate=float(data.get("failure_rate", 0.0)),
+            quality_score=data.get("quality_score"),
+            quality_samples=int(data.get("quality_samples", 0)),
+            last_updated=float(data.get("last_updated", 0.0)),
+        )
+        stats.recent_latencies.extend(float(v) for v in data.get("recent_latencies", []))
+        return stats
+
+
+@dataclass
+class RoutingDecision:
+    """Why the router picked a model (kept in a bounded log)"""
+
+    task_type: str
+    complexity: TaskComplexity
+    model: str
+    strategy: str  # static, adaptive, explore
+    reason: str
+    estimated_cost: float
+    candidates: List[Dict[str, Any]] = field(default_factory=list)
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "task_type": self.task_type,
+            "complexity": self.complexity.value,
+            "model": self.model,
+            "strategy": self.strategy,
+            "reason": self.reason,
+            "estimated_cost": round(self.estimated_cost, 6),
+            "candidates": self.candidates,
+        }
+
+
 class ModelRouter:
     """
     Smart router that selects cost-effective AI models based on task requirements.
@@ -134,6 +249,17 @@ class ModelRouter:
     3. Select cheapest model that meets requirements
     4. Track cost savings vs. always using premium models
 
+    Adaptive routing (once telemetry exists for the task type):
+    - A model is eligible when it has MIN_SAMPLES observations, its p95
+      latency is within the SLO, its failure rate is below MAX_FAILURE_RATE
+      and its quality score meets the floor. A model with no quality scores
+      yet is eligible only if its static tier covers the task's complexity.
+    - The cheapest eligible model wins (ties broken by p95 latency).
+    - With probability exploration_rate the router instead tries the
+      least-sampled candidate, including one tier below the static choice,
+      so cheaper models can prove themselves.
+    - With no eligible model it falls back to the static recommendation.
+
     Example:
         router = ModelRouter()
         model, estimated_cost = router.route_request(
@@ -244,7 +370,23 @@ class ModelRouter:
         },
     }
 
-    def __init__(self, default_model: str = "ollama/mistral", use_ollama: bool | None = None):
+    # Adaptive routing thresholds
+    MIN_SAMPLES = 5
+    MAX_FAILURE_RATE = 0.2
+    DECISION_LOG_SIZE = 200
+    STATS_SETTING_KEY = "model_router_stats"
+    PERSIST_INTERVAL_SECONDS = 60.0
+
+    def __init__(
+        self,
+        default_model: str = "ollama/mistral",
+        use_ollama: bool | None = None,
+        adaptive: bool | None = None,
+        latency_slo_ms: float | None = None,
+        quality_floor: float | None = None,
+        exploration_rate: float | None = None,
+        rng: Optional[random.Random] = None,
+    ):
         """
         Initialize model router.
 
@@ -252,6 +394,12 @@ class ModelRouter:
             default_model: Fallback model if routing fails
             use_ollama: Use Ollama for zero-cost local inference.
                        If None, checks USE_OLLAMA environment variable.
+            adaptive: Route on observed telemetry (MODEL_ROUTER_ADAPTIVE, default true)
+            latency_slo_ms: p95 latency a model must meet (MODEL_ROUTER_LATENCY_SLO_MS)
+            quality_floor: Minimum 0-100 quality score (MODEL_ROUTER_QUALITY_FLOOR)
+            exploration_rate: Probability of trying an under-sampled model
+                (MODEL_ROUTER_EXPLORATION_RATE)
+            rng: Random source (for deterministic tests)
         """
         self.default_model = default_model
 
@@ -261,6 +409,32 @@ class ModelRouter:
 
         self.use_ollama = use_ollama
 
+        if adaptive is None:
+            adaptive = os.getenv("MODEL_ROUTER_ADAPTIVE", "true").lower() == "true"
+        self.adaptive = adaptive
+        self.latency_slo_ms = (
+            latency_slo_ms
+            if latency_slo_ms is not None
+            else float(os.getenv("MODEL_ROUTER_LATENCY_SLO_MS", "30000"))
+        )
+        self.quality_floor = (
+            quality_floor
+            if quality_floor is not None
+            else float(os.getenv("MODEL_ROUTER_QUALITY_FLOOR", "70"))
+        )
+        self.exploration_rate = (
+            exploration_rate
+            if exploration_rate is not None
+            else float(os.getenv("MODEL_ROUTER_EXPLORATION_RATE", "0.05"))
+        )
+        self._rng = rng or random.Random()
+
+        # Telemetry: task_type -> model -> stats
+        self.stats: Dict[str, Dict[str, ModelStats]] = {}
+        self.decisions: Deque[RoutingDecision] = deque(maxlen=self.DECISION_LOG_SIZE)
+        self._stats_dirty = False
+        self._last_persisted = 0.0
+
         # Metrics
         self.metrics = {
             "total_requests": 0,
@@ -308,7 +482,6 @@ class ModelRouter:
         # Use Ollama if enabled (100% FREE local inference!)
         if self.use_ollama and "ollama" in recommendation:
             model = recommendation["ollama"]
-            self.metrics["ollama_uses"] += 1
             logger.info(
                 "Using Ollama for zero-cost local inference",
                 model=model,
@@ -321,6 +494,17 @@ class ModelRouter:
             if context.get("prefer_fallback"):
                 model = recommendation["fallback"]
 
+        strategy, reason, candidates = "static", "static recommendation for complexity", []
+        if self.adaptive and not context.get("prefer_fallback") and context.get("adaptive", True):
+            adaptive_model, strategy, reason, candidates = self._select_adaptive(
+                task_type, complexity, context
+            )
+            if adaptive_model:
+                model = adaptive_model
+
+        if model.startswith("ollama/"):
+            self.metrics["ollama_uses"] += 1
+
         # Calculate estimated cost
         cost_per_1k = MODEL_COSTS.get(model, 0.045)
         estimated_cost = (estimated_tokens / 1000) * cost_per_1k
@@ -330,7 +514,8 @@ class ModelRouter:
         cost_saved = premium_cost - estimated_cost
 
         # Update metrics
-        if recommendation["tier"] == ModelTier.BUDGET:
+        tier = recommendation["tier"] if strategy == "static" else self._model_tier(model, recommendation["tier"])
+        if tier in (ModelTier.FREE, ModelTier.BUDGET):
             self.metrics["budget_model_uses"] += 1
         else:
             self.metrics["premium_model_uses"] += 1
@@ -346,11 +531,187 @@ class ModelRouter:
             model=model,
             estimated_cost=round(estimated_cost, 4),
             cost_saved=round(cost_saved, 4),
-            tier=recommendation["tier"].value,
+            tier=tier.value,
+            strategy=strategy,
+            reason=reason,
+        )
+
+        self.decisions.append(
+            RoutingDecision(
+                task_type=task_type,
+                complexity=complexity,
+                model=model,
+                strategy=strategy,
+                reason=reason,
+                estimated_cost=estimated_cost,
+                candidates=candidates,
+            )
         )
 
         return model, estimated_cost, complexity
 
+    def _candidate_models(self) -> Dict[str, int]:
+        """Models the router may choose, mapped to the highest complexity rank they serve"""
+        keys = ["ollama"] if self.use_ollama else ["primary", "fallback"]
+        capability: Dict[str, int] = {}
+        for complexity, recommendation in self.MODEL_RECOMMENDATIONS.items():
+            for key in keys:
+                model = recommendation.get(key)
+                if model:
+                    capability[model] = max(capability.get(model, 0), COMPLEXITY_RANK[complexity])
+        return capability
+
+    def _model_tier(self, model: str, default: ModelTier) -> ModelTier:
+        if model.startswith("ollama/"):
+            return ModelTier.FREE
+        for recommendation in self.MODEL_RECOMMENDATIONS.values():
+            if model == recommendation["primary"]:
+                return recommendation["tier"]
+        return default
+
+    def _select_adaptive(
+        self, task_type: str, complexity: TaskComplexity, context: Dict[str, Any]
+    ) -> Tuple[Optional[str], str, str, List[Dict[str, Any]]]:
+        """
+        Pick a model from telemetry.
+
+        Returns:
+            (model or None for static fallback, strategy, reason, candidate summaries)
+        """
+        task_stats = self.stats.get(self._task_key(task_type), {})
+        slo = float(context.get("latency_slo_ms", self.latency_slo_ms))
+        floor = float(context.get("quality_floor", self.quality_floor))
+        rank = COMPLEXITY_RANK[complexity]
+
+        candidates: List[Dict[str, Any]] = []
+        eligible: List[Tuple[float, float, str]] = []
+        explorable: List[Tuple[int, str]] = []
+        for model, capability in self._candidate_models().items():
+            stats = task_stats.get(model)
+            cost = MODEL_COSTS.get(model, 0.045)
+            summary = {"model": model, "cost_per_1k": cost, "samples": stats.samples if stats else 0}
+            # Explore the static tier and one below it (where savings come from)
+            if rank - 1 <= capability <= rank:
+                explorable.append((summary["samples"], model))
+
+            if not stats or stats.samples < self.MIN_SAMPLES:
+                summary["rejected"] = "insufficient telemetry"
+            elif stats.p95_latency_ms > slo:
+                summary["rejected"] = f"p95 {stats.p95_latency_ms:.0f}ms > SLO {slo:.0f}ms"
+            elif stats.failure_rate > self.MAX_FAILURE_RATE:
+                summary["rejected"] = f"failure rate {stats.failure_rate:.0%}"
+            elif stats.quality_samples and stats.quality_score < floor:
+                summary["rejected"] = f"quality {stats.quality_score:.1f} < floor {floor:.1f}"
+            elif not stats.quality_samples and capability < rank:
+                summary["rejected"] = "no quality data and below static tier"
+            else:
+                eligible.append((cost, stats.p95_latency_ms, model))
+            candidates.append(summary)
+
+        if explorable and self.exploration_rate > 0 and self._rng.random() < self.exploration_rate:
+            fewest = min(samples for samples, _ in explorable)
+            model = self._rng.choice([m for samples, m in explorable if samples == fewest])
+            return model, "explore", f"exploring {model} ({fewest} samples)", candidates
+
+        if not eligible:
+            return None, "static", "no model meets SLO/quality floor with enough telemetry", candidates
+
+        cost, p95, model = min(eligible)
+        reason = f"cheapest eligible (${cost}/1K, p95 {p95:.0f}ms <= {slo:.0f}ms)"
+        return model, "adaptive", reason, candidates
+
+    @staticmethod
+    def _task_key(task_type: str) -> str:
+        return (task_type or "default").strip().lower()
+
+    def record_outcome(
+        self,
+        task_type: str,
+        model: str,
+        latency_ms: float,
+        tokens: int = 0,
+        success: bool = True,
+        quality_score: Optional[float] = None,
+    ) -> None:
+        """
+        Record how a model performed on a task type.
+
+        Args:
+            task_type: Task type the model was routed for
+            model: Model name as returned by route_request
+            latency_ms: Wall-clock latency of the call
+            tokens: Tokens generated (for tokens/sec)
+            success: Whether the call succeeded
+            quality_score: Optional 0-100 downstream quality score
+        """
+        stats = self.stats.setdefault(self._task_key(task_type), {}).setdefault(model, ModelStats())
+        stats.record(latency_ms, tokens, success)
+        if quality_score is not None:
+            stats.record_quality(quality_score)
+        self._stats_dirty = True
+
+    def record_quality(self, task_type: str, model: str, quality_score: float) -> None:
+        """Record a downstream quality score (0-100) for content produced by a model"""
+        stats = self.stats.setdefault(self._task_key(task_type), {}).setdefault(model, ModelStats())
+        stats.record_quality(quality_score)
+        self._stats_dirty = True
+
+    def get_model_stats(self, task_type: Optional[str] = None) -> Dict[str, Any]:
+        """Telemetry per task type and model"""
+        if task_type is not None:
+            selected = {self._task_key(task_type): self.stats.get(self._task_key(task_type), {})}
+        else:
+            selected = self.stats
+        return {
+            task: {model: stats.to_dict() for model, stats in models.items()}
+            for task, models in selected.items()
+        }
+
+    def get_routing_decisions(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent routing decisions, newest first"""
+        return [decision.to_dict() for decision in list(self.decisions)[::-1][:limit]]
+
+    async def load_stats(self, database_service) -> bool:
+        """Restore telemetry persisted by save_stats (settings table)"""
+        try:
+            data = await database_service.get_setting_value(self.STATS_SETTING_KEY, None)
+        except Exception as e:
+            logger.warning("Failed to load model router stats", error=str(e))
+            return False
+        if not isinstance(data, dict):
+            return False
+
+        self.stats = {
+            task: {model: ModelStats.from_dict(values) for model, values in models.items()}
+            for task, models in data.get("stats", {}).items()
+        }
+        self._last_persisted = time.time()
+        logger.info("Model router stats restored", task_types=len(self.stats))
+        return True
+
+    async def save_stats(self, database_service, force: bool = False) -> bool:
+        """
+        Persist telemetry to the settings table.
+
+        Writes at most once per PERSIST_INTERVAL_SECONDS unless force=True.
+        """
+        if not self._stats_dirty:
+            return False
+        if not force and time.time() - self._last_persisted < self.PERSIST_INTERVAL_SECONDS:
+            return False
+
+        saved = await database_service.set_setting(
+            self.STATS_SETTING_KEY,
+            {"version": 1, "stats": self.get_model_stats()},
+            category="model_router",
+            display_name="Model router telemetry",
+            description="Rolling per-model, per-task-type routing statistics",
+        )
+        if saved:
+            self._stats_dirty = False
+            self._last_persisted = time.time()
+        return bool(saved)
+
     def _assess_complexity(self, task_type: str, context: Dict[str, Any]) -> TaskComplexity:
         """
         Assess task complexity based on type and context.
@@ -462,6 +823,9 @@ class ModelRouter:
                 self.metrics["estimated_cost_premium_baseline"], 2
             ),
             "estimated_cost_saved": round(self.metrics["estimated_cost_saved"], 2),
+            "adaptive": self.adaptive,
+            "adaptive_decisions": sum(1 for d in self.decisions if d.strategy == "adaptive"),
+            "exploration_decisions": sum(1 for d in self.decisions if d.strategy == "explore"),
             "savings_percentage": round(
                 (
                     (
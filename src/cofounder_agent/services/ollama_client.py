@@ -21,11 +21,15 @@ Pull models: ollama pull llama2
 """
 
 import json
+import os
+import time
 from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 import structlog
 
+from .metrics_service import record_llm_call
+
 logger = structlog.get_logger(__name__)
 
 
@@ -34,7 +38,7 @@ logger = structlog.get_logger(__name__)
 # ============================================================================
 
 DEFAULT_MODEL = "llama2"  # Good balance of speed/quality
-DEFAULT_BASE_URL = "http://localhost:11434"
+DEFAULT_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
 # Model capabilities and recommended use cases
 MODEL_PROFILES = {
@@ -217,6 +221,7 @@ class OllamaClient:
         if max_tokens:
             payload["options"]["num_predict"] = max_tokens
 
+        started = time.perf_counter()
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -225,6 +230,9 @@ class OllamaClient:
                 response.raise_for_status()
 
                 result = response.json()
+                record_llm_call(
+                    "ollama", "generate", time.perf_counter() - started, tokens=result.get("eval_count")
+                )
 
                 logger.info(
                     "Ollama generation complete",
@@ -247,6 +255,7 @@ class OllamaClient:
                 }
 
         except httpx.HTTPError as e:
+            record_llm_call("ollama", "generate", time.perf_counter() - started, success=False)
             logger.error("Ollama generation failed", error=str(e), model=model)
             raise
 
@@ -294,6 +303,7 @@ class OllamaClient:
         if max_tokens:
             payload["options"]["num_predict"] = max_tokens
 
+        started = time.perf_counter()
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -302,6 +312,9 @@ class OllamaClient:
                 response.raise_for_status()
 
                 result = response.json()
+                record_llm_call(
+                    "ollama", "chat", time.perf_counter() - started, tokens=result.get("eval_count")
+                )
 
                 # Extract only the assistant response (remove the prompt we sent)
                 full_response = result.get("response", "")
@@ -335,6 +348,7 @@ class OllamaClient:
                 }
 
         except httpx.HTTPError as e:
+            record_llm_call("ollama", "chat", time.perf_counter() - started, success=False)
             logger.error("Ollama chat failed", error=str(e), model=model)
             raise
 
@@ -7,18 +7,112 @@ Free tier with unlimited searches.
 Cost: $0/month (vs $0.02/image with DALL-E)
 
 ASYNC-FIRST: All operations use httpx async client (no blocking I/O)
+
+Searches go through the shared external API cache and Pexels rate limit
+(see services/external_api_cache.py). Fallback query lists are searched
+concurrently by fan_out_search(), so finding an image costs about one round
+trip instead of one per fallback query.
 """
 
 import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
+from .external_api_cache import get_external_api_cache
+
 logger = logging.getLogger(__name__)
 
+# Concurrent Pexels queries per image search (1 = try fallbacks one at a time)
+IMAGE_SEARCH_FAN_OUT = max(1, int(os.getenv("IMAGE_SEARCH_FAN_OUT", "3")))
+
+INAPPROPRIATE_PATTERNS = (
+    "nsfw",
+    "adult",
+    "nude",
+    "sexy",
+    "lingerie",
+    "bikini",
+    "swimsuit",
+    "erotic",
+    "sensual",
+    "intimate",
+    "private",
+    "naked",
+    "bare",
+    "exposed",
+    "provocative",
+    "risque",
+)
+
+
+def is_content_appropriate(alt: Optional[str], photographer: Optional[str] = "") -> bool:
+    """False if the image's alt text or photographer matches a blocked pattern"""
+    alt = (alt or "").lower()
+    photographer = (photographer or "").lower()
+    for pattern in INAPPROPRIATE_PATTERNS:
+        if pattern in alt or pattern in photographer:
+            logger.debug(f"Filtering inappropriate image: {alt}")
+            return False
+    return True
+
+
+async def fan_out_search(
+    queries: Sequence[str],
+    search: Callable[[str], Awaitable[List[Any]]],
+    needed: int = 1,
+    max_concurrency: int = IMAGE_SEARCH_FAN_OUT,
+) -> List[Tuple[str, List[Any]]]:
+    """
+    Search fallback queries concurrently, keeping their priority order.
+
+    At most max_concurrency searches are in flight. Results are consumed in
+    query order, so a lower-priority query that answers first never wins
+    over a higher-priority one. Once the queries resolved so far have
+    produced `needed` results, the remaining searches are cancelled.
+
+    Args:
+        queries: Candidate queries, highest priority first
+        search: Async function returning the (already filtered) results for a query
+        needed: Stop after this many results
+        max_concurrency: Searches in flight at once
+
+    Returns:
+        (query, results) pairs for queries that returned results, in priority order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(query: str) -> List[Any]:
+        async with semaphore:
+            return await search(query)
+
+    queries = list(dict.fromkeys(queries))
+    tasks = [asyncio.create_task(run(query)) for query in queries]
+    found: List[Tuple[str, List[Any]]] = []
+    total = 0
+    try:
+        for query, task in zip(queries, tasks):
+            try:
+                results = await task
+            except Exception as e:
+                logger.warning(f"Error searching for '{query}': {e}")
+                continue
+            if results:
+                found.append((query, results))
+                total += len(results)
+                if total >= needed:
+                    break
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    return found
+
 
 class PexelsClient:
     """
@@ -31,7 +125,7 @@ class PexelsClient:
     - Fallback to curated images
     """
 
-    BASE_URL = "https://api.pexels.com/v1"
+    BASE_URL = os.getenv("PEXELS_BASE_URL", "https://api.pexels.com/v1")
 
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -54,38 +148,15 @@ class PexelsClient:
             True if image is appropriate for blog content, False otherwise
         """
         # Check alt text and photographer for content warnings
-        alt = (photo.get("alt", "") or "").lower()
-        photographer = (photo.get("photographer", "") or "").lower()
-
-        # Block known NSFW/inappropriate patterns
-        inappropriate_patterns = [
-            "nsfw",
-            "adult",
-            "nude",
-            "sexy",
-            "lingerie",
-            "bikini",
-            "swimsuit",
-            "erotic",
-            "sensual",
-            "intimate",
-            "private",
-            "naked",
-            "bare",
-            "exposed",
-            "provocative",
-            "risque",
-        ]
-
-        for pattern in inappropriate_patterns:
-            if pattern in alt or pattern in photographer:
-                logger.debug(f"Filtering inappropriate image: {alt}")
-                return False
-
-        return True
+        return is_content_appropriate(photo.get("alt"), photo.get("photographer"))
 
     async def search_images(
-        self, query: str, per_page: int = 5, orientation: str = "landscape", size: str = "medium"
+        self,
+        query: str,
+        per_page: int = 5,
+        orientation: str = "landscape",
+        size: str = "medium",
+        page: int = 1,
     ) -> List[Dict[str, Any]]:
         """
         Search for images matching query (async-only via httpx).
@@ -95,6 +166,7 @@ class PexelsClient:
             per_page: Number of results per page
             orientation: Image orientation
             size: Image size
+            page: Results page number
 
         Returns:
             List of filtered, appropriate image dictionaries
@@ -109,41 +181,47 @@ class PexelsClient:
                 "per_page": min(per_page * 2, 80),  # Fetch more to filter out inappropriate ones
                 "orientation": orientation,
                 "size": size,
+                "page": page,
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/search", headers=self.headers, params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                photos = data.get("photos", [])
-                logger.info(f"Pexels search for '{query}' returned {len(photos)} results")
-
-                # Filter for appropriate content
-                appropriate_photos = [
-                    photo for photo in photos if self._is_content_appropriate(photo)
-                ]
-
-                filtered_count = len(photos) - len(appropriate_photos)
-                if filtered_count > 0:
-                    logger.info(f"Filtered out {filtered_count} inappropriate images")
-
-                return [
-                    {
-                        "url": photo["src"]["large"],
-                        "thumbnail": photo["src"]["small"],
-                        "photographer": photo.get("photographer", "Unknown"),
-                        "photographer_url": photo.get("photographer_url", ""),
-                        "width": photo.get("width"),
-                        "height": photo.get("height"),
-                        "alt": photo.get("alt", ""),
-                        "source": "pexels",
-                        "searched_query": query,
-                    }
-                    for photo in appropriate_photos[:per_page]
-                ]
+            async def fetch() -> List[Dict[str, Any]]:
+                async with httpx.AsyncClient(timeout=10.0) as client:
+                    response = await client.get(
+                        f"{self.BASE_URL}/search", headers=self.headers, params=params
+                    )
+                    response.raise_for_status()
+                    photos = response.json().get("photos", [])
+                    logger.info(f"Pexels search for '{query}' returned {len(photos)} results")
+                    return photos
+
+            photos = await get_external_api_cache().get_or_fetch(
+                "pexels.search",
+                query,
+                fetch,
+                params={k: v for k, v in params.items() if k != "query"},
+            )
+
+            # Filter for appropriate content
+            appropriate_photos = [photo for photo in photos if self._is_content_appropriate(photo)]
+
+            filtered_count = len(photos) - len(appropriate_photos)
+            if filtered_count > 0:
+                logger.info(f"Filtered out {filtered_count} inappropriate images")
+
+            return [
+                {
+                    "url": photo["src"]["large"],
+                    "thumbnail": photo["src"]["small"],
+                    "photographer": photo.get("photographer", "Unknown"),
+                    "photographer_url": photo.get("photographer_url", ""),
+                    "width": photo.get("width"),
+                    "height": photo.get("height"),
+                    "alt": photo.get("alt", ""),
+                    "source": "pexels",
+                    "searched_query": query,
+                }
+                for photo in appropriate_photos[:per_page]
+            ]
 
         except Exception as e:
             logger.error(f"Pexels search failed: {e}")
@@ -166,14 +244,13 @@ class PexelsClient:
         if keywords:
             search_queries.extend(keywords[:3])
 
-        for query in search_queries:
-            try:
-                images = await self.search_images(query, per_page=1)
-                if images:
-                    logger.info(f"Found featured image for '{query}' via Pexels")
-                    return images[0]
-            except Exception as e:
-                logger.warning(f"Error searching for '{query}': {e}")
+        found = await fan_out_search(
+            search_queries, lambda query: self.search_images(query, per_page=1)
+        )
+        if found:
+            query, images = found[0]
+            logger.info(f"Found featured image for '{query}' via Pexels")
+            return images[0]
 
         logger.warning(f"No featured image found for topic: {topic}")
         return None
@@ -196,18 +273,16 @@ class PexelsClient:
         if keywords:
             search_queries.extend(keywords)
 
-        all_images = []
-
-        for query in search_queries[:3]:  # Try up to 3 queries
-            try:
-                images = await self.search_images(query, per_page=count, page=1)
-                all_images.extend(images)
+        found = await fan_out_search(
+            search_queries[:3],  # Try up to 3 queries
+            lambda query: self.search_images(query, per_page=count, page=1),
+            needed=count,
+        )
+        all_images = [image for _, images in found for image in images]
 
-                if len(all_images) >= count:
-                    logger.info(f"Found {len(all_images)} images for gallery")
-                    return all_images[:count]
-            except Exception as e:
-                logger.warning(f"Error searching for gallery images '{query}': {e}")
+        if len(all_images) >= count:
+            logger.info(f"Found {len(all_images)} images for gallery")
+            return all_images[:count]
 
         logger.info(f"Found {len(all_images)} gallery images")
         return all_images
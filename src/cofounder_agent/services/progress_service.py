@@ -3,12 +3,19 @@ Progress Service - Real-time progress tracking for long-running tasks
 
 Provides callbacks and storage for tracking generation progress
 to be streamed to WebSocket clients in real-time.
+
+Progress events go through ProgressBroadcaster, which coalesces updates per
+task and, when Redis is available, publishes them on a pub/sub channel so every
+replica can fan them out to its own WebSocket clients.
 """
 
+import asyncio
+import json
 import logging
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +34,7 @@ class GenerationProgress:
     estimated_remaining: float = 0.0
     error: Optional[str] = None
     message: str = ""
+    partial_content: str = ""  # Text streamed so far (empty when not streaming)
     timestamp: str = ""
 
     def __post_init__(self):
@@ -46,6 +54,12 @@ class ProgressService:
         self._progress: Dict[str, GenerationProgress] = {}
         # Store callbacks by task_id: {task_id -> [callback1, callback2, ...]}
         self._callbacks: Dict[str, list[Callable]] = {}
+        # Cross-replica fan-out (see attach_broadcaster)
+        self._broadcaster: Optional["ProgressBroadcaster"] = None
+
+    def attach_broadcaster(self, broadcaster: Optional["ProgressBroadcaster"]) -> None:
+        """Publish every progress change through a ProgressBroadcaster"""
+        self._broadcaster = broadcaster
 
     def create_progress(self, task_id: str, total_steps: int = 50) -> GenerationProgress:
         """Initialize progress tracking for a new task"""
@@ -71,6 +85,7 @@ class ProgressService:
         stage: Optional[str] = None,
         elapsed_time: Optional[float] = None,
         message: Optional[str] = None,
+        partial_content: Optional[str] = None,
     ) -> GenerationProgress:
         """Update progress for a generation step"""
         progress = self._progress.get(task_id)
@@ -102,6 +117,9 @@ class ProgressService:
         if message:
             progress.message = message
 
+        if partial_content is not None:
+            progress.partial_content = partial_content
+
         progress.timestamp = datetime.now().isoformat()
 
         # Call registered callbacks
@@ -158,14 +176,226 @@ class ProgressService:
             except Exception as e:
                 logger.error(f"Error in progress callback: {e}")
 
+        if self._broadcaster:
+            # Terminal states bypass throttling so clients always see them
+            self._broadcaster.submit(
+                task_id,
+                {"type": "progress", **progress.to_dict()},
+                immediate=progress.status in ("completed", "failed"),
+            )
+
+    async def fetch_progress(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get progress for a task as a dict, including tasks running on other replicas
+
+        Falls back to the latest snapshot published through the broadcaster.
+        """
+        progress = self._progress.get(task_id)
+        if progress:
+            return progress.to_dict()
+        if self._broadcaster:
+            return await self._broadcaster.get_snapshot(task_id)
+        return None
+
     def cleanup(self, task_id: str) -> None:
         """Clean up progress and callbacks for a task"""
         self._progress.pop(task_id, None)
         self._callbacks.pop(task_id, None)
 
 
+class ProgressBroadcaster:
+    """
+    Fans progress events out to WebSocket clients on every replica.
+
+    - submit() is thread-safe (SDXL step callbacks run in an executor thread)
+    - Updates for the same task are coalesced: at most one message per
+      min_interval is delivered, always carrying the latest state
+    - With Redis, messages are published on a pub/sub channel and each replica
+      delivers what it receives to its local sockets (including its own
+      publications); without Redis, messages are delivered locally only
+    - The latest message per task is stored in Redis so any replica can answer
+      the initial status request for a task running elsewhere
+    """
+
+    CHANNEL = "progress:events"
+    SNAPSHOT_PREFIX = "progress:"
+    SNAPSHOT_TTL = 3600
+
+    def __init__(self, min_interval: float = 0.25):
+        """
+        Args:
+            min_interval: Minimum seconds between delivered updates for one task
+        """
+        self.min_interval = min_interval
+        self._deliver: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None
+        self._redis = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._scheduled: Set[str] = set()
+        self._last_sent: Dict[str, float] = {}
+        self._stats = {"submitted": 0, "delivered": 0, "coalesced": 0, "publish_errors": 0}
+
+    def set_local_delivery(
+        self, deliver: Callable[[str, Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        """Set the coroutine that sends a message to this replica's sockets"""
+        self._deliver = deliver
+
+    async def start(self, redis_cache=None) -> None:
+        """
+        Bind to the running loop and subscribe to the Redis channel if available
+
+        Args:
+            redis_cache: RedisCache instance (optional)
+        """
+        self._loop = asyncio.get_running_loop()
+        if redis_cache is not None and await redis_cache.is_available():
+            self._redis = redis_cache
+            self._listener = asyncio.create_task(self._listen())
+            logger.info(f"📡 Progress broadcaster subscribed to Redis channel {self.CHANNEL}")
+        else:
+            logger.info("📡 Progress broadcaster running in local-only mode")
+
+    async def stop(self) -> None:
+        """Flush pending updates and stop the Redis listener"""
+        for task_id in list(self._pending):
+            await self._flush(task_id)
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._redis = None
+
+    def submit(self, task_id: str, message: Dict[str, Any], immediate: bool = False) -> None:
+        """
+        Queue a progress message for delivery. Safe to call from any thread.
+
+        Args:
+            task_id: Task the message belongs to
+            message: JSON-serializable message
+            immediate: Deliver now instead of waiting for the throttle window
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is not None:
+            self._loop = self._loop or running
+            if running is self._loop:
+                self._submit(task_id, message, immediate)
+                return
+
+        if self._loop is None or self._loop.is_closed():
+            return  # No loop to deliver on (e.g. broadcaster never started)
+        self._loop.call_soon_threadsafe(self._submit, task_id, message, immediate)
+
+    def _submit(self, task_id: str, message: Dict[str, Any], immediate: bool) -> None:
+        self._stats["submitted"] += 1
+        if task_id in self._pending:
+            self._stats["coalesced"] += 1
+        self._pending[task_id] = message
+
+        if immediate:
+            self._scheduled.discard(task_id)
+            asyncio.ensure_future(self._flush(task_id))
+            return
+        if task_id in self._scheduled:
+            return
+
+        self._scheduled.add(task_id)
+        delay = self._last_sent.get(task_id, 0.0) + self.min_interval - time.monotonic()
+        self._loop.call_later(max(0.0, delay), self._flush_scheduled, task_id)
+
+    def _flush_scheduled(self, task_id: str) -> None:
+        if task_id in self._scheduled:
+            self._scheduled.discard(task_id)
+            asyncio.ensure_future(self._flush(task_id))
+
+    async def _flush(self, task_id: str) -> None:
+        message = self._pending.pop(task_id, None)
+        if message is None:
+            return
+        self._last_sent[task_id] = time.monotonic()
+        if message.get("status") in ("completed", "failed"):
+            self._last_sent.pop(task_id, None)
+
+        if self._redis is not None:
+            envelope = {"task_id": task_id, "message": message}
+            try:
+                await self._redis.set(
+                    f"{self.SNAPSHOT_PREFIX}{task_id}", message, ttl=self.SNAPSHOT_TTL
+                )
+                if await self._redis.publish(self.CHANNEL, envelope) > 0:
+                    return  # Our own listener delivers it locally
+            except Exception as e:
+                self._stats["publish_errors"] += 1
+                logger.warning(f"Progress publish failed for {task_id}: {e}")
+
+        await self._deliver_local(task_id, message)
+
+    async def _deliver_local(self, task_id: str, message: Dict[str, Any]) -> None:
+        if not self._deliver:
+            return
+        self._stats["delivered"] += 1
+        try:
+            await self._deliver(task_id, message)
+        except Exception as e:
+            logger.error(f"Progress delivery failed for {task_id}: {e}")
+
+    async def _listen(self) -> None:
+        """Deliver messages from the Redis channel to local sockets, reconnecting on error"""
+        backoff = 1.0
+        while True:
+            pubsub = self._redis.pubsub() if self._redis else None
+            if pubsub is None:
+                return
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                backoff = 1.0
+                async for item in pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    try:
+                        envelope = json.loads(item["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    await self._deliver_local(envelope["task_id"], envelope["message"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress subscription error: {e} (retrying in {backoff:.0f}s)")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    async def get_snapshot(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Latest published progress for a task (from Redis), if any"""
+        if self._redis is None:
+            return None
+        snapshot = await self._redis.get(f"{self.SNAPSHOT_PREFIX}{task_id}")
+        return snapshot if isinstance(snapshot, dict) else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Delivery counters"""
+        return {
+            **self._stats,
+            "redis_enabled": self._redis is not None,
+            "pending": len(self._pending),
+        }
+
+
 # Global progress service instance
 _progress_service: Optional[ProgressService] = None
+_progress_broadcaster: Optional[ProgressBroadcaster] = None
 
 
 def get_progress_service() -> ProgressService:
@@ -173,4 +403,13 @@ def get_progress_service() -> ProgressService:
     global _progress_service
     if _progress_service is None:
         _progress_service = ProgressService()
+        _progress_service.attach_broadcaster(get_progress_broadcaster())
     return _progress_service
+
+
+def get_progress_broadcaster() -> ProgressBroadcaster:
+    """Get or create the global progress broadcaster"""
+    global _progress_broadcaster
+    if _progress_broadcaster is None:
+        _progress_broadcaster = ProgressBroadcaster()
+    return _progress_broadcaster
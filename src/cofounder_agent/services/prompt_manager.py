@@ -209,6 +209,38 @@ Improved version:""",
             notes="v2.0: Added creative section title guidance and examples, avoiding generic titles"
         )
 
+        self._register_prompt(
+            key="blog_generation.section_refinement",
+            category=PromptCategory.BLOG_GENERATION,
+            template="""Rewrite ONE section of a blog post about '{topic}' for {target_audience}.
+The rest of the post is staying as it is, so keep this section's scope and facts.
+
+SECTION HEADING: {heading}
+PRIMARY KEYWORD: '{primary_keyword}'
+⭐ WORD COUNT: {word_count_constraint}
+
+---SECTION---
+{section}
+---END SECTION---
+
+---CRITIQUE---
+{critique}
+---END CRITIQUE---
+
+⭐ CRITICAL REQUIREMENTS:
+1. Return ONLY the rewritten section body - no heading, no preamble, no notes
+2. Preserve every fact, figure, link and code block from the original
+3. Address the critique points that apply to this section
+4. Keep Markdown formatting (lists, emphasis, sub-headings) where it helps
+
+Rewritten section:""",
+            description="Rewrite a single low-scoring section during QA refinement",
+            output_format="markdown",
+            notes="v1.0: Section-level refinement; untouched sections are spliced back in",
+            created_date="2026-10-18",
+            last_modified="2026-10-18",
+        )
+
         # ======================================================================
         # CONTENT QA / CRITIQUE PROMPTS
         # ======================================================================
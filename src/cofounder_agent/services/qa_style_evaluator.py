@@ -20,6 +20,8 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+from .writing_style_profile import profile_analysis
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,14 +159,21 @@ class StyleConsistencyValidator:
 
         Args:
             generated_content: The generated content to validate
-            reference_metrics: Metrics from reference sample (from Phase 3.3)
-            reference_style: Expected style (technical, narrative, etc.)
-            reference_tone: Expected tone (formal, casual, etc.)
+            reference_metrics: Metrics from reference sample (from Phase 3.3), or the
+                sample's stored style profile
+            reference_style: Expected style (defaults to the profile's detected style)
+            reference_tone: Expected tone (defaults to the profile's detected tone)
 
         Returns:
             StyleConsistencyResult with detailed evaluation
         """
         try:
+            # The reference side comes precomputed from the sample's stored profile
+            reference_metrics = profile_analysis(reference_metrics)
+            if reference_metrics:
+                reference_style = reference_style or reference_metrics.get("detected_style")
+                reference_tone = reference_tone or reference_metrics.get("detected_tone")
+
             if not generated_content:
                 logger.warning("Empty generated content for style validation")
                 return self._create_failed_result(
@@ -192,7 +201,7 @@ class StyleConsistencyValidator:
             )
 
             format_score = self._calculate_formatting_consistency(
-                generated_content, reference_metrics
+                generated_metrics, reference_metrics
             )
 
             # Calculate overall consistency
@@ -396,13 +405,12 @@ class StyleConsistencyValidator:
             return 0.60
 
     def _calculate_formatting_consistency(
-        self, content: str, reference_metrics: Optional[Dict[str, Any]]
+        self, metrics: Dict[str, Any], reference_metrics: Optional[Dict[str, Any]]
     ) -> float:
         """Calculate formatting consistency score (0-1)"""
         if not reference_metrics:
             return 0.7
 
-        metrics = self._analyze_content(content)
         ref_format = reference_metrics.get("style_characteristics", {})
         gen_format = {
             "has_lists": metrics["has_lists"],
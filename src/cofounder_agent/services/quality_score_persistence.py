@@ -9,6 +9,7 @@ import logging
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
+from services.model_router import get_model_router
 from services.quality_service import QualityScore
 
 logger = logging.getLogger(__name__)
@@ -107,6 +108,16 @@ class QualityScorePersistence:
                 f"✅ Stored evaluation for content {content_id}: score={quality_score.overall_score}, passing={quality_score.passing}"
             )
 
+            # Downstream quality feeds adaptive model routing
+            model_used = (context_data or {}).get("model")
+            router = get_model_router()
+            if model_used and router:
+                router.record_quality(
+                    (context_data or {}).get("task_type", "content_generation"),
+                    model_used,
+                    quality_score.overall_score,
+                )
+
             return {
                 "stored": True,
                 "evaluation_id": result[0] if result else None,
@@ -34,6 +34,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
+from .model_router import get_model_router
+
 logger = logging.getLogger(__name__)
 
 
@@ -228,7 +230,9 @@ class UnifiedQualityService:
 
         Args:
             content: Content to evaluate
-            context: Optional context (topic, keywords, audience, etc.)
+            context: Optional context (topic, keywords, audience, etc.). When it
+                carries "model" (the ModelRouter name of the model that wrote the
+                content) and optionally "task_type", the score feeds adaptive routing.
             method: Evaluation method to use
             store_result: Whether to store result in database
 
@@ -266,6 +270,8 @@ class UnifiedQualityService:
             if store_result and self.database_service:
                 await self._store_evaluation(assessment, context)
 
+            self._record_routing_quality(assessment, context)
+
             logger.info(
                 f"✅ Evaluation complete: {assessment.overall_score:.0f}/100 "
                 f"({'PASS' if assessment.passing else 'FAIL'})"
@@ -377,6 +383,44 @@ class UnifiedQualityService:
 
         return pattern_assessment
 
+    def score_section(
+        self, content: str, expected_words: Optional[int] = None
+    ) -> Tuple[float, List[str]]:
+        """
+        Score one heading-delimited section of an article (0-100).
+
+        Only the dimensions that are meaningful for a fragment are used:
+        clarity, readability and, when expected_words is given, length
+        relative to the section's share of the article. Relevance, SEO and
+        engagement are article-level and stay with evaluate().
+
+        Args:
+            content: Section body (without its heading)
+            expected_words: Target words for this section
+
+        Returns:
+            Tuple of (score, suggestions)
+        """
+        words = content.split()
+        sentence_count = len(re.split(r"[.!?]+", content))
+        scores = {
+            "clarity": self._score_clarity(content, sentence_count, len(words)) * 10,
+            "readability": self._score_readability(content) * 10,
+        }
+        if expected_words:
+            scores["completeness"] = min(100.0, 100.0 * len(words) / expected_words)
+
+        suggestions = []
+        if scores["clarity"] < 70:
+            suggestions.append("Simplify sentence structure and use shorter sentences")
+        if scores["readability"] < 70:
+            suggestions.append("Use plainer words and shorter sentences to improve readability")
+        if scores.get("completeness", 100) < 70:
+            suggestions.append(
+                f"Expand this section with concrete detail (about {expected_words} words)"
+            )
+        return sum(scores.values()) / len(scores), suggestions
+
     # ========================================================================
     # SCORING METHODS (Pattern-Based Heuristics)
     # ========================================================================
@@ -572,6 +616,22 @@ class UnifiedQualityService:
         except Exception as e:
             logger.error(f"Failed to store evaluation: {e}")
 
+    @staticmethod
+    def _record_routing_quality(assessment: QualityAssessment, context: Dict[str, Any]) -> None:
+        """Feed the score to the model router, keyed by the model that wrote the content"""
+        model_used = context.get("model")
+        router = get_model_router()
+        if not model_used or router is None:
+            return
+        try:
+            router.record_quality(
+                context.get("task_type", "content_generation"),
+                model_used,
+                assessment.overall_score,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record routing quality: {e}")
+
     # ========================================================================
     # STATISTICS & REPORTING
     # ========================================================================
@@ -340,6 +340,39 @@ class RedisCache:
             logger.warning(f"Cache incr error for {key}: {e}")
             return amount
 
+    async def publish(self, channel: str, message: Any) -> int:
+        """
+        Publish a message on a pub/sub channel.
+
+        Args:
+            channel: Channel name
+            message: Message (dicts/lists are JSON serialized)
+
+        Returns:
+            Number of subscribers that received the message (0 if unavailable)
+        """
+        if not await self.is_available():
+            return 0
+
+        try:
+            payload = json.dumps(message) if isinstance(message, (dict, list)) else message
+            # Type guard: we know _instance is not None here due to is_available check
+            return await self._instance.publish(channel, payload)  # type: ignore
+        except Exception as e:
+            logger.warning(f"Cache publish error for {channel}: {e}")
+            return 0
+
+    def pubsub(self):
+        """
+        Create a pub/sub handle on the shared connection pool.
+
+        Returns:
+            redis.asyncio PubSub instance, or None if Redis is unavailable
+        """
+        if not (self._enabled and self._instance is not None):
+            return None
+        return self._instance.pubsub()
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check Redis health status.
@@ -4,20 +4,129 @@ Phase 3.1 Implementation
 
 Handles file validation, parsing, metadata extraction, and database storage
 for writing samples.
+
+Uploads are parsed as a stream: the file is read in UPLOAD_CHUNK_SIZE chunks in
+a worker thread, the byte cap is enforced as soon as it is crossed, and CSV
+rows / JSON items are decoded one at a time. A large corpus can be split into
+many samples (iter_sample_batches) and bulk inserted batch by batch, so memory
+stays bounded by the batch size rather than the file size.
 """
 
+import asyncio
 import csv
 import io
 import json
 import re
+import threading
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional, Tuple
 
 from fastapi import UploadFile
-from sqlalchemy import insert
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.database_models import WritingSample
+from .writing_style_profile import build_style_profile, is_profile_current
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Line that separates samples in a plain-text corpus
+CORPUS_SEPARATOR = "---"
+
+_DONE = object()
+
+
+class UploadTooLargeError(ValueError):
+    """Upload exceeded its byte cap"""
+
+
+class _CappedReader(io.RawIOBase):
+    """Raw reader over an upload's file object that fails once max_bytes is exceeded"""
+
+    def __init__(self, source: IO[bytes], max_bytes: int):
+        self.source = source
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.source.read(min(len(buffer), UPLOAD_CHUNK_SIZE))
+        self.bytes_read += len(data)
+        if self.bytes_read > self.max_bytes:
+            raise UploadTooLargeError(f"File too large. Max size: {self.max_bytes / 1024 / 1024}MB")
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _open_text(source: IO[bytes], max_bytes: int) -> io.TextIOWrapper:
+    """Incrementally decoded UTF-8 text stream over source, capped at max_bytes"""
+    raw = io.BufferedReader(_CappedReader(source, max_bytes), buffer_size=UPLOAD_CHUNK_SIZE)
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def _json_document(value: Any) -> str:
+    """Sample text for one decoded JSON value"""
+    if isinstance(value, dict):
+        return value.get("content", json.dumps(value))
+    return value if isinstance(value, str) else str(value)
+
+
+def _iter_json_values(stream: io.TextIOBase) -> Iterator[Any]:
+    """
+    Decode JSON values one at a time.
+
+    A top-level array yields its items; otherwise every top-level value is
+    yielded (a single object, or JSON Lines). Only the value being decoded is
+    buffered.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+    started = in_array = False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer:
+            if not started and buffer[0] == "[":
+                started = in_array = True
+                buffer = buffer[1:]
+                continue
+            if in_array and buffer[0] in ",]":
+                in_array = buffer[0] == ","
+                buffer = buffer[1:]
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A value that ends exactly at the buffer edge may be a truncated number
+                if end < len(buffer) or eof:
+                    started = True
+                    buffer = buffer[end:]
+                    yield value
+                    continue
+        elif eof:
+            return
+        # Read at least as much as is buffered so a large value is not re-scanned per chunk
+        chunk = stream.read(max(UPLOAD_CHUNK_SIZE, len(buffer)))
+        eof = not chunk
+        buffer += chunk
+
+
+def _iter_text_documents(stream: io.TextIOBase, max_chars: int) -> Iterator[str]:
+    """Split a plain-text corpus on CORPUS_SEPARATOR lines (entries stop growing past max_chars)"""
+    parts: List[str] = []
+    size = 0
+    for line in stream:
+        if line.strip() == CORPUS_SEPARATOR:
+            yield "".join(parts)
+            parts, size = [], 0
+        elif size <= max_chars:
+            parts.append(line)
+            size += len(line)
+    yield "".join(parts)
 
 
 class SampleUploadService:
@@ -25,6 +134,8 @@ class SampleUploadService:
 
     # Configuration
     MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+    MAX_CORPUS_SIZE = 50 * 1024 * 1024  # 50MB, split into many samples
+    BULK_BATCH_SIZE = 100
     MIN_CONTENT_LENGTH = 100
     MAX_CONTENT_LENGTH = 50000
     ALLOWED_MIME_TYPES = {"text/plain": "txt", "text/csv": "csv", "application/json": "json"}
@@ -71,57 +182,23 @@ class SampleUploadService:
         - CSV: CSV with 'content' column
         - JSON: JSON array or object with 'content' field
 
+        The upload is streamed in a worker thread; the byte and character caps
+        abort parsing as soon as they are crossed.
+
         Returns:
         Extracted content or None if parsing fails
         """
         try:
-            content = await file.read()
-
-            # Check file size
-            if len(content) > self.MAX_FILE_SIZE:
-                raise ValueError(f"File too large. Max size: {self.MAX_FILE_SIZE / 1024 / 1024}MB")
-
-            if content_type == "text/plain":
-                text = content.decode("utf-8")
-
-            elif content_type == "text/csv":
-                # Parse CSV
-                csv_reader = csv.DictReader(io.StringIO(content.decode("utf-8")))
-                rows = list(csv_reader)
-
-                if not rows:
-                    raise ValueError("CSV file is empty")
-
-                # Get content from 'content' column
-                if "content" not in rows[0]:
-                    raise ValueError("CSV must have 'content' column")
-
-                # Combine all content from CSV
-                text = "\n".join(row["content"] for row in rows if row.get("content"))
-
-            elif content_type == "application/json":
-                # Parse JSON
-                data = json.loads(content.decode("utf-8"))
-
-                if isinstance(data, list):
-                    # Array of objects
-                    text = "\n".join(item.get("content", str(item)) for item in data if item)
-                elif isinstance(data, dict):
-                    # Single object
-                    text = data.get("content", json.dumps(data))
-                else:
-                    # Primitive value
-                    text = str(data)
-            else:
-                raise ValueError(f"Unsupported content type: {content_type}")
+            if file.size and file.size > self.MAX_FILE_SIZE:
+                raise UploadTooLargeError(
+                    f"File too large. Max size: {self.MAX_FILE_SIZE / 1024 / 1024}MB"
+                )
+            text = await asyncio.to_thread(self._parse_stream, file.file, content_type)
 
             # Validate content length
             if len(text) < self.MIN_CONTENT_LENGTH:
                 raise ValueError(f"Content too short. Min: {self.MIN_CONTENT_LENGTH} characters")
 
-            if len(text) > self.MAX_CONTENT_LENGTH:
-                raise ValueError(f"Content too long. Max: {self.MAX_CONTENT_LENGTH} characters")
-
             return text.strip()
 
         except json.JSONDecodeError as e:
@@ -131,6 +208,151 @@ class SampleUploadService:
         except Exception as e:
             raise ValueError(f"File parsing error: {str(e)}")
 
+    def _parse_stream(self, source: IO[bytes], content_type: str) -> str:
+        """Join an upload's documents into one text, stopping at MAX_CONTENT_LENGTH"""
+        parts: List[str] = []
+        size = 0
+        separator = "" if content_type == "text/plain" else "\n"
+        for document in self._iter_documents(source, content_type, self.MAX_FILE_SIZE, split=False):
+            size += len(document) + (len(separator) if parts else 0)
+            if size > self.MAX_CONTENT_LENGTH:
+                raise ValueError(f"Content too long. Max: {self.MAX_CONTENT_LENGTH} characters")
+            parts.append(document)
+        return separator.join(parts)
+
+    def _iter_documents(
+        self, source: IO[bytes], content_type: str, max_bytes: int, split: bool
+    ) -> Iterator[str]:
+        """
+        Yield the documents in an upload one at a time.
+
+        CSV rows and JSON items are always separate documents. Plain text is one
+        document, or with split=True one per CORPUS_SEPARATOR-delimited section.
+        """
+        stream = _open_text(source, max_bytes)
+        if content_type == "text/plain":
+            if split:
+                yield from _iter_text_documents(stream, self.MAX_CONTENT_LENGTH)
+            else:
+                while True:
+                    chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        elif content_type == "text/csv":
+            reader = csv.DictReader(stream)
+            if not reader.fieldnames:
+                raise ValueError("CSV file is empty")
+            if "content" not in reader.fieldnames:
+                raise ValueError("CSV must have 'content' column")
+            for row in reader:
+                if row.get("content"):
+                    yield row["content"]
+
+        elif content_type == "application/json":
+            for value in _iter_json_values(stream):
+                if value:
+                    yield _json_document(value)
+
+        else:
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+    async def read_text(self, file: UploadFile, max_bytes: Optional[int] = None) -> str:
+        """
+        Read an upload as UTF-8 text without buffering the raw bytes.
+
+        Raises:
+            UploadTooLargeError: The upload is larger than max_bytes
+            UnicodeDecodeError: The upload is not valid UTF-8
+        """
+        max_bytes = max_bytes or self.MAX_FILE_SIZE
+        if file.size and file.size > max_bytes:
+            raise UploadTooLargeError(f"File too large. Max size: {max_bytes / 1024 / 1024}MB")
+        return await asyncio.to_thread(lambda: _open_text(file.file, max_bytes).read())
+
+    async def iter_sample_batches(
+        self,
+        file: UploadFile,
+        content_type: str,
+        batch_size: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        with_profiles: bool = False,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Split a corpus upload into samples, yielded in batches for bulk insert.
+
+        Each CSV row, JSON item or CORPUS_SEPARATOR-delimited text section is one
+        sample; entries outside MIN/MAX_CONTENT_LENGTH are skipped. Parsing runs
+        in a worker thread that stays at most two batches ahead of the consumer.
+
+        Args:
+            file: Uploaded corpus
+            content_type: MIME type (see ALLOWED_MIME_TYPES)
+            batch_size: Samples per yielded batch
+            max_bytes: Byte cap for the upload (default MAX_CORPUS_SIZE)
+            with_profiles: Yield {"content", "style_profile"} dicts instead of
+                strings, building the profiles in the worker thread as well
+
+        Raises:
+            UploadTooLargeError, ValueError: Oversized or malformed upload
+        """
+        batch_size = batch_size or self.BULK_BATCH_SIZE
+        max_bytes = max_bytes or self.MAX_CORPUS_SIZE
+        if file.size and file.size > max_bytes:
+            raise UploadTooLargeError(f"File too large. Max size: {max_bytes / 1024 / 1024}MB")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce() -> None:
+            batch: List[Any] = []
+            try:
+                documents = self._iter_documents(file.file, content_type, max_bytes, split=True)
+                for document in documents:
+                    if stop.is_set():
+                        return
+                    document = document.strip()
+                    if not self.MIN_CONTENT_LENGTH <= len(document) <= self.MAX_CONTENT_LENGTH:
+                        continue
+                    if with_profiles:
+                        batch.append(
+                            {"content": document, "style_profile": build_style_profile(document)}
+                        )
+                    else:
+                        batch.append(document)
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                if batch:
+                    put(batch)
+            except Exception as e:
+                put(e)
+            finally:
+                put(_DONE)
+
+        producer = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Unblock and retire the worker if the consumer stopped early
+            stop.set()
+            while not producer.done():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0.01)
+
     async def extract_metadata(
         self, content: str, style: Optional[str] = None, tone: Optional[str] = None
     ) -> dict:
@@ -148,6 +370,7 @@ class SampleUploadService:
         - style_detected: String (if not provided)
         - tone_markers: List of detected tone words
         - style_characteristics: List of style features
+        - style_profile: Versioned analysis reused by generation, RAG and QA
         """
         try:
             metadata = {}
@@ -186,6 +409,9 @@ class SampleUploadService:
             # Extract style characteristics
             metadata["style_characteristics"] = self._extract_style_characteristics(content)
 
+            # Stored with the sample so later readers never re-analyze it
+            metadata["style_profile"] = build_style_profile(content)
+
             return metadata
 
         except Exception as e:
@@ -298,7 +524,7 @@ class SampleUploadService:
         style: Optional[str] = None,
         tone: Optional[str] = None,
         metadata: Optional[dict] = None,
-        db: AsyncSession = None,
+        db: "AsyncSession" = None,
     ) -> int:
         """
         Store writing sample in database.
@@ -306,6 +532,10 @@ class SampleUploadService:
         Returns:
         Sample ID
         """
+        from sqlalchemy import insert
+
+        from ..models.database_models import WritingSample
+
         try:
             if not db:
                 raise ValueError("Database session required")
@@ -316,6 +546,8 @@ class SampleUploadService:
 
             # Merge metadata
             sample_metadata = metadata or {}
+            if not is_profile_current(sample_metadata.get("style_profile"), content):
+                sample_metadata["style_profile"] = build_style_profile(content)
             if style:
                 sample_metadata["style"] = style
             if tone:
@@ -0,0 +1,270 @@
+"""
+Section-Level Content Refinement
+
+When an article fails QA, rewriting the whole post costs a full article's
+worth of output tokens on every iteration, even when only one section is
+weak. This module refines incrementally instead:
+
+1. split_sections() cuts the Markdown into heading-delimited sections
+   (headings inside fenced code blocks are ignored). join_sections()
+   reassembles them byte-for-byte.
+2. Each section is scored with UnifiedQualityService.score_section().
+   Scores are cached by section text, so after a pass only the rewritten
+   sections are scored again.
+3. Sections below the threshold are rewritten concurrently by a caller
+   supplied rewrite function (one LLM call per section). Headings are kept
+   verbatim and every other section is spliced back unchanged.
+4. A rewrite that comes back empty, too short, or not scoring higher than
+   the original is discarded.
+
+If the article fails for article-level reasons (length, SEO, engagement)
+and no individual section is weak, refine_pass() reports
+needs_full_rewrite and the caller falls back to whole-article refinement.
+
+Usage:
+    refiner = SectionRefiner(rewrite_fn, quality_service)
+    outcome = await refiner.refine_pass(content, context, critique)
+    if not outcome.needs_full_rewrite:
+        content = outcome.content
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .quality_service import UnifiedQualityService
+
+logger = logging.getLogger(__name__)
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+\S")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+@dataclass
+class ContentSection:
+    """A heading line and the text up to the next heading"""
+
+    heading: str  # Raw heading line including its newline ("" for text before the first heading)
+    body: str
+    level: int = 0  # Heading level (0 for the preamble)
+    score: Optional[float] = None
+    suggestions: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return self.heading + self.body
+
+    @property
+    def title(self) -> str:
+        return self.heading.strip().lstrip("#").strip()
+
+    @property
+    def word_count(self) -> int:
+        return len(self.body.split())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "level": self.level,
+            "word_count": self.word_count,
+            "score": round(self.score, 1) if self.score is not None else None,
+            "suggestions": self.suggestions,
+        }
+
+
+# rewrite_fn(section, context, critique) -> new section body (or heading + body)
+RewriteFn = Callable[[ContentSection, Dict[str, Any], str], Awaitable[str]]
+
+
+def split_sections(content: str) -> List[ContentSection]:
+    """Split Markdown into heading-delimited sections (lossless)"""
+    sections: List[ContentSection] = []
+    heading, level, body = "", 0, []
+    in_fence = False
+
+    for line in content.splitlines(keepends=True):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            if heading or body:
+                sections.append(ContentSection(heading, "".join(body), level))
+            heading, level, body = line, len(match.group(1)), []
+        else:
+            body.append(line)
+
+    if heading or body:
+        sections.append(ContentSection(heading, "".join(body), level))
+    return sections
+
+
+def join_sections(sections: List[ContentSection]) -> str:
+    """Inverse of split_sections"""
+    return "".join(section.text for section in sections)
+
+
+@dataclass
+class SectionRefinementPass:
+    """Outcome of one refinement pass"""
+
+    content: str
+    sections: List[ContentSection]
+    rewritten: List[str] = field(default_factory=list)  # Titles of accepted rewrites
+    rejected: List[str] = field(default_factory=list)  # Titles of discarded rewrites
+    rewritten_chars: int = 0  # Original size of the sections sent for rewriting
+    article_chars: int = 0
+    needs_full_rewrite: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sections": [section.to_dict() for section in self.sections],
+            "rewritten": self.rewritten,
+            "rejected": self.rejected,
+            "rewritten_chars": self.rewritten_chars,
+            "article_chars": self.article_chars,
+            "needs_full_rewrite": self.needs_full_rewrite,
+        }
+
+
+class SectionRefiner:
+    """Rewrites only the sections of an article that score below threshold"""
+
+    def __init__(
+        self,
+        rewrite_fn: RewriteFn,
+        quality_service: Optional[UnifiedQualityService] = None,
+        threshold: float = 70.0,
+        max_sections_per_pass: int = 3,
+        max_concurrency: int = 3,
+        min_rewrite_words: int = 20,
+    ):
+        """
+        Args:
+            rewrite_fn: Async callable returning the rewritten section
+            quality_service: Scorer (a local UnifiedQualityService by default)
+            threshold: Sections scoring below this (0-100) are rewritten
+            max_sections_per_pass: Rewrite at most this many (lowest first)
+            max_concurrency: Concurrent rewrite calls
+            min_rewrite_words: Rewrites shorter than this are discarded
+        """
+        self.rewrite_fn = rewrite_fn
+        self.quality_service = quality_service or UnifiedQualityService()
+        self.threshold = threshold
+        self.max_sections_per_pass = max_sections_per_pass
+        self.min_rewrite_words = min_rewrite_words
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # (sha1(body), expected_words) -> (score, suggestions); kept across passes
+        self._score_cache: Dict[Tuple[str, Optional[int]], Tuple[float, List[str]]] = {}
+        self.sections_scored = 0
+
+    @staticmethod
+    def _expected_words(sections: List[ContentSection], target_length: Optional[int]) -> Optional[int]:
+        """Each section's share of the article's target length"""
+        scorable = sum(1 for section in sections if section.word_count)
+        if not target_length or not scorable:
+            return None
+        return max(1, int(target_length) // scorable)
+
+    def score_sections(
+        self, sections: List[ContentSection], target_length: Optional[int] = None
+    ) -> None:
+        """Score sections in place, reusing cached scores for unchanged text"""
+        expected = self._expected_words(sections, target_length)
+        for section in sections:
+            if section.word_count:
+                section.score, section.suggestions = self._score(section.body, expected)
+
+    def _score(self, body: str, expected_words: Optional[int]) -> Tuple[float, List[str]]:
+        key = (hashlib.sha1(body.encode()).hexdigest(), expected_words)
+        cached = self._score_cache.get(key)
+        if cached is None:
+            cached = self.quality_service.score_section(body, expected_words)
+            self._score_cache[key] = cached
+            self.sections_scored += 1
+        return cached
+
+    async def refine_pass(
+        self, content: str, context: Optional[Dict[str, Any]] = None, critique: str = ""
+    ) -> SectionRefinementPass:
+        """
+        Rewrite the weakest sections of content once.
+
+        Args:
+            content: Markdown article
+            context: topic, primary_keyword, target_length, ... (passed to
+                rewrite_fn with section_word_target added)
+            critique: Article-level feedback from the QA step
+
+        Returns:
+            SectionRefinementPass with the spliced content
+        """
+        context = context or {}
+        sections = split_sections(content)
+        self.score_sections(sections, context.get("target_length"))
+        expected = self._expected_words(sections, context.get("target_length"))
+
+        weak = sorted(
+            (s for s in sections if s.score is not None and s.score < self.threshold),
+            key=lambda s: s.score,
+        )[: self.max_sections_per_pass]
+
+        outcome = SectionRefinementPass(content=content, sections=sections, article_chars=len(content))
+        if len(sections) < 2 or not weak:
+            # One block of text, or the defect isn't local to any section
+            outcome.needs_full_rewrite = True
+            return outcome
+
+        outcome.rewritten_chars = sum(len(section.text) for section in weak)
+        logger.info(
+            f"✂️ Refining {len(weak)}/{len(sections)} sections "
+            f"({outcome.rewritten_chars} of {outcome.article_chars} chars): "
+            + ", ".join(f"'{s.title or 'intro'}' {s.score:.0f}" for s in weak)
+        )
+
+        rewrite_context = {**context, "section_word_target": expected}
+        results = await asyncio.gather(
+            *(self._rewrite(section, rewrite_context, critique) for section in weak),
+            return_exceptions=True,
+        )
+        for section, result in zip(weak, results):
+            title = section.title or "intro"
+            if isinstance(result, BaseException):
+                logger.warning(f"⚠️ Section rewrite failed for '{title}': {result}")
+                outcome.rejected.append(title)
+                continue
+            new_body = self._clean_rewrite(result, section)
+            if len(new_body.split()) < self.min_rewrite_words:
+                outcome.rejected.append(title)
+                continue
+            new_score, new_suggestions = self._score(new_body, expected)
+            if new_score <= section.score:
+                logger.debug("Discarded rewrite of '%s' (%.0f <= %.0f)", title, new_score, section.score)
+                outcome.rejected.append(title)
+                continue
+            section.body, section.score, section.suggestions = new_body, new_score, new_suggestions
+            outcome.rewritten.append(title)
+
+        outcome.content = join_sections(sections)
+        return outcome
+
+    async def _rewrite(self, section: ContentSection, context: Dict[str, Any], critique: str) -> str:
+        notes = "\n".join(f"- {s}" for s in section.suggestions)
+        section_critique = f"{critique}\n{notes}".strip() if notes else critique
+        async with self._semaphore:
+            return await self.rewrite_fn(section, context, section_critique)
+
+    @staticmethod
+    def _clean_rewrite(text: Any, original: ContentSection) -> str:
+        """Strip a repeated heading and keep the original trailing whitespace"""
+        text = str(text or "").strip()
+        lines = text.split("\n")
+        if lines and original.heading and _HEADING_RE.match(lines[0]):
+            text = "\n".join(lines[1:]).strip()
+        if not text:
+            return ""
+        trailing = original.body[len(original.body.rstrip()) :]
+        leading = original.body[: len(original.body) - len(original.body.lstrip())]
+        return leading + text + trailing
@@ -7,18 +7,34 @@ Free tier: 100 searches/month
 Cost: $0/month (vs spending on expensive searches)
 
 ASYNC-FIRST: All operations use httpx async client (no blocking I/O)
+
+Searches go through the shared external API cache, so repeated queries are
+served without spending quota and upstream calls respect the Serper rate
+limit (see services/external_api_cache.py). Each client keeps one pooled
+httpx.AsyncClient, and search_many() runs a batch of queries over it
+concurrently with bounded parallelism and a per-query timeout.
+
+Environment Variables:
+    SERPER_MAX_CONCURRENCY: Queries in flight per batch (default: 5)
+    SERPER_QUERY_TIMEOUT: Seconds before a batched query is given up (default: 15)
 """
 
+import asyncio
 import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import httpx
 
+from .external_api_cache import PRIORITY_LOW, PRIORITY_NORMAL, get_external_api_cache
+
 logger = logging.getLogger(__name__)
 
+SERPER_MAX_CONCURRENCY = int(os.getenv("SERPER_MAX_CONCURRENCY", "5"))
+SERPER_QUERY_TIMEOUT = float(os.getenv("SERPER_QUERY_TIMEOUT", "15"))
+
 
 class SerperClient:
     """
@@ -49,9 +65,32 @@ class SerperClient:
             "Content-Type": "application/json",
         }
         self.monthly_usage = 0  # Track free tier usage
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, reused across searches (keep-alive connections)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(
+                    max_connections=SERPER_MAX_CONCURRENCY,
+                    max_keepalive_connections=SERPER_MAX_CONCURRENCY,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def search(
-        self, query: str, num: int = 10, search_type: str = "search"
+        self,
+        query: str,
+        num: int = 10,
+        search_type: str = "search",
+        priority: int = PRIORITY_NORMAL,
     ) -> Dict[str, Any]:
         """
         Perform web search via Serper API (ASYNC).
@@ -60,6 +99,7 @@ class SerperClient:
             query: Search query
             num: Number of results (default 10)
             search_type: Type of search - "search", "news", "shopping"
+            priority: Queue position if the Serper rate limit is reached
 
         Returns:
             Search results dictionary
@@ -69,13 +109,25 @@ class SerperClient:
             return {}
 
         try:
-            payload = {"q": query, "num": min(num, 30), "type": search_type}
+            return await self._search(query, num, search_type, priority)
+        except httpx.HTTPError as e:
+            logger.error(f"Serper API request failed: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"Serper search error: {e}")
+            return {}
 
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/{search_type}", json=payload, headers=self.headers
-                )
-                response.raise_for_status()
+    async def _search(
+        self, query: str, num: int, search_type: str, priority: int
+    ) -> Dict[str, Any]:
+        """search() without the error handling (raises on failure)"""
+        payload = {"q": query, "num": min(num, 30), "type": search_type}
+
+        async def fetch() -> Dict[str, Any]:
+            response = await self._get_client().post(
+                f"{self.BASE_URL}/{search_type}", json=payload, headers=self.headers
+            )
+            response.raise_for_status()
 
             self.monthly_usage += 1
             if self.monthly_usage % 10 == 0:
@@ -85,12 +137,65 @@ class SerperClient:
             logger.info(f"Serper search '{query}' returned {len(data.get('organic', []))} results")
             return data
 
-        except httpx.HTTPError as e:
-            logger.error(f"Serper API request failed: {e}")
-            return {}
-        except Exception as e:
-            logger.error(f"Serper search error: {e}")
-            return {}
+        return await get_external_api_cache().get_or_fetch(
+            f"serper.{search_type}",
+            query,
+            fetch,
+            params={"num": payload["num"]},
+            priority=priority,
+        )
+
+    async def search_many(
+        self,
+        queries: List[str],
+        num: int = 10,
+        search_type: str = "search",
+        priority: int = PRIORITY_NORMAL,
+        max_concurrency: int = SERPER_MAX_CONCURRENCY,
+        timeout: float = SERPER_QUERY_TIMEOUT,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run a batch of searches concurrently over the pooled client (ASYNC).
+
+        A query that fails or takes longer than timeout gets {"error": "..."}
+        instead of results; the rest of the batch is unaffected.
+
+        Args:
+            queries: Search queries (duplicates are searched once)
+            num: Number of results per query
+            search_type: Type of search - "search", "news", "shopping"
+            priority: Queue position if the Serper rate limit is reached
+            max_concurrency: Queries in flight at once
+            timeout: Seconds allowed per query (including any rate-limit wait)
+
+        Returns:
+            Map of query to its search results (or error)
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        if not self.api_key:
+            logger.warning("Serper API key not configured")
+            return {query: {"error": "Serper API key not configured"} for query in unique_queries}
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._search(query, num, search_type, priority), timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Serper search '{query}' timed out after {timeout}s")
+                    return {"error": f"timed out after {timeout}s"}
+                except Exception as e:
+                    logger.error(f"Serper search '{query}' failed: {e}")
+                    return {"error": str(e)}
+
+        results = await asyncio.gather(*(run(query) for query in unique_queries))
+        failed = sum(1 for result in results if "error" in result)
+        if failed:
+            logger.info(f"Serper batch: {len(results) - failed}/{len(results)} queries succeeded")
+        return dict(zip(unique_queries, results))
 
     async def news_search(self, query: str, num: int = 10) -> Dict[str, Any]:
         """
@@ -130,7 +235,7 @@ class SerperClient:
             Structured search summary
         """
         try:
-            results = self.search(query, num=max_results)
+            results = await self.search(query, num=max_results)
 
             return {
                 "query": query,
@@ -155,34 +260,38 @@ class SerperClient:
         """
         Search for fact-checking information on claims (ASYNC).
 
+        Claims are searched as one low-priority batch (see search_many).
+        Repeated claims are answered from the cache, and the quota governor
+        keeps the batch under the Serper rate limit. A claim whose search
+        fails or times out gets {"error": ...}; the others still return.
+
         Args:
             claims: List of claims to fact-check
 
         Returns:
             Fact-checking results for each claim
         """
-        results = {}
-
-        for claim in claims[:3]:  # Limit to 3 to conserve API quota
-            try:
-                search_results = await self.search(f'fact check: "{claim}"', num=3)
-
-                results[claim] = {
-                    "claim": claim,
-                    "sources_found": len(search_results.get("organic", [])),
-                    "top_sources": [
-                        {
-                            "title": item.get("title"),
-                            "url": item.get("link"),
-                            "snippet": item.get("snippet"),
-                        }
-                        for item in search_results.get("organic", [])[:2]
-                    ],
-                }
-            except Exception as e:
-                logger.error(f"Error fact-checking '{claim}': {e}")
-                results[claim] = {"error": str(e)}
+        queries = {claim: f'fact check: "{claim}"' for claim in dict.fromkeys(claims)}
+        batch = await self.search_many(list(queries.values()), num=3, priority=PRIORITY_LOW)
 
+        results = {}
+        for claim, query in queries.items():
+            search_results = batch.get(query, {})
+            if "error" in search_results:
+                results[claim] = {"error": search_results["error"]}
+                continue
+            results[claim] = {
+                "claim": claim,
+                "sources_found": len(search_results.get("organic", [])),
+                "top_sources": [
+                    {
+                        "title": item.get("title"),
+                        "url": item.get("link"),
+                        "snippet": item.get("snippet"),
+                    }
+                    for item in search_results.get("organic", [])[:2]
+                ],
+            }
         return results
 
     async def get_trending_topics(self, category: str = "general") -> List[Dict[str, str]]:
@@ -234,8 +343,13 @@ class SerperClient:
         research = {"topic": topic, "research_date": datetime.now().isoformat(), "aspects": {}}
 
         try:
-            # Search for main topic
-            main_results = await self.search(topic, num=3)
+            # Main topic and each aspect are searched concurrently
+            # (aspects limited to conserve quota)
+            aspect_queries = {aspect: f"{topic} {aspect}" for aspect in aspects[:2]}
+            main_results, aspect_batch = await asyncio.gather(
+                self.search(topic, num=3),
+                self.search_many(list(aspect_queries.values()), num=2),
+            )
             research["main_sources"] = [
                 {
                     "title": item.get("title"),
@@ -245,11 +359,8 @@ class SerperClient:
                 for item in main_results.get("organic", [])
             ]
 
-            # Search for each aspect
-            for aspect in aspects[:2]:  # Limit searches to conserve quota
-                aspect_query = f"{topic} {aspect}"
-                aspect_results = await self.search(aspect_query, num=2)
-
+            for aspect, aspect_query in aspect_queries.items():
+                aspect_results = aspect_batch.get(aspect_query, {})
                 research["aspects"][aspect] = [
                     {
                         "title": item.get("title"),
@@ -312,7 +423,39 @@ class SerperClient:
         }
 
 
+_serper_client: Optional[SerperClient] = None
+_closing: Set[asyncio.Task] = set()
+
+
+def _close_replaced(client: SerperClient) -> None:
+    """Schedule aclose() for a client swapped out after an API key change."""
+    if client._client is None:
+        return
+    try:
+        task = asyncio.get_running_loop().create_task(client.aclose())
+    except RuntimeError:
+        # No running loop: the pool's connections belong to a loop that is gone
+        client._client = None
+        return
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
 # Initialize client with API key from environment
 def get_serper_client() -> SerperClient:
-    """Factory function to create Serper client."""
-    return SerperClient(os.getenv("SERPER_API_KEY"))
+    """Shared Serper client (one pooled HTTP client per process)."""
+    global _serper_client
+    api_key = os.getenv("SERPER_API_KEY")
+    if _serper_client is None or _serper_client.api_key != api_key:
+        if _serper_client is not None:
+            _close_replaced(_serper_client)
+        _serper_client = SerperClient(api_key)
+    return _serper_client
+
+
+async def close_serper_client() -> None:
+    """Close the shared Serper client's HTTP pool (called on app shutdown)."""
+    global _serper_client
+    if _serper_client is not None:
+        await _serper_client.aclose()
+        _serper_client = None
@@ -25,6 +25,12 @@ from routes.task_routes import get_model_for_phase
 # Import AI content generator for fallback
 from .ai_content_generator import AIContentGenerator
 
+# Import per-task logging time measurement
+from .logger_config import start_request_log_timer
+
+# Import model router for persisting routing telemetry
+from .model_router import get_model_router
+
 # Import unified quality service for content validation
 from .quality_service import UnifiedQualityService
 
@@ -35,6 +41,8 @@ from .prompt_manager import get_prompt_manager
 from .usage_tracker import get_usage_tracker
 
 logger = logging.getLogger(__name__)
+# Poll-loop chatter; sampled by default (LOG_SAMPLE_RATES in services.logger_config)
+loop_logger = logging.getLogger(f"{__name__}.loop")
 
 
 class TaskExecutor:
@@ -135,14 +143,20 @@ class TaskExecutor:
         while self.running:
             try:
                 # Get pending tasks from database
-                logger.debug(f"🔍 [TASK_EXEC_LOOP] Polling for pending tasks...")
+                loop_logger.debug("🔍 [TASK_EXEC_LOOP] Polling for pending tasks...")
                 pending_tasks = await self.database_service.get_pending_tasks(limit=10)
 
                 if pending_tasks:
-                    logger.info(f"� [TASK_EXEC_LOOP] Found {len(pending_tasks)} pending task(s)")
+                    loop_logger.info(
+                        "📥 [TASK_EXEC_LOOP] Found %d pending task(s)", len(pending_tasks)
+                    )
                     for idx, task in enumerate(pending_tasks, 1):
-                        logger.info(
-                            f"   [{idx}] Task ID: {task.get('id')}, Name: {task.get('task_name')}, Status: {task.get('status')}"
+                        loop_logger.info(
+                            "   [%d] Task ID: %s, Name: %s, Status: %s",
+                            idx,
+                            task.get("id"),
+                            task.get("task_name"),
+                            task.get("status"),
                         )
 
                     # Process each task
@@ -154,12 +168,16 @@ class TaskExecutor:
                         task_id = task.get("id")
                         task_name = task.get("task_name", "Untitled")
 
+                        # Event-loop time this task spends in the logging handler
+                        log_time = start_request_log_timer()
                         try:
                             logger.info(f"⚡ [TASK_EXEC_LOOP] Starting to process task: {task_id}")
                             await self._process_single_task(task)
                             self.success_count += 1
                             logger.info(
-                                f"✅ [TASK_EXEC_LOOP] Task succeeded (total success: {self.success_count})"
+                                "✅ [TASK_EXEC_LOOP] Task succeeded (total success: %d, logging: %.2fms)",
+                                self.success_count,
+                                log_time[0] * 1000,
                             )
                         except Exception as e:
                             logger.error(
@@ -192,8 +210,8 @@ class TaskExecutor:
                         finally:
                             self.task_count += 1
                 else:
-                    logger.debug(
-                        f"⏳ [TASK_EXEC_LOOP] No pending tasks - sleeping for {self.poll_interval}s"
+                    loop_logger.debug(
+                        "⏳ [TASK_EXEC_LOOP] No pending tasks - sleeping for %ss", self.poll_interval
                     )
 
                 # Sleep before next poll
@@ -262,9 +280,9 @@ class TaskExecutor:
                 }
 
             logger.info(f"✅ [TASK_SINGLE] Task execution completed")
-            logger.debug(f"   Result type: {type(result).__name__}")
+            logger.debug("   Result type: %s", type(result).__name__)
             if isinstance(result, dict):
-                logger.debug(f"   Result keys: {list(result.keys())}")
+                logger.debug("   Result keys: %s", list(result.keys()))
 
             # 3. Update task status (awaiting_approval or failed based on result)
             final_status = (
@@ -362,6 +380,17 @@ class TaskExecutor:
             # Status already updated to 'failed' in _process_loop
             raise
 
+    async def _critique(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate content with the quality service, as a plain critique dict"""
+        assessment = await self.quality_service.evaluate(content=content, context=context)
+        return {
+            "quality_score": round(assessment.overall_score, 1),
+            "approved": assessment.passing,
+            "feedback": assessment.feedback,
+            "suggestions": assessment.suggestions,
+            "needs_refinement": not assessment.passing,
+        }
+
     async def _execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute task through production pipeline:
@@ -408,6 +437,8 @@ class TaskExecutor:
 
         # ===== PHASE 1: Generate Content via Orchestrator =====
         generated_content = None
+        # Router name of the model that wrote the draft; None once a fallback took over
+        draft_model = model_used
         orchestrator_error = None
         generation_start_time = time.time()
 
@@ -471,7 +502,8 @@ class TaskExecutor:
                 if hasattr(result, "final_formatting"):
                     final_formatting = result.final_formatting
                     logger.debug(
-                        f"   Found final_formatting attribute: {len(str(final_formatting)) if final_formatting else 0} chars"
+                        "   Found final_formatting attribute: %s chars",
+                        len(str(final_formatting)) if final_formatting else 0,
                     )
                 elif isinstance(result, dict):
                     # Check multiple possible fields for content
@@ -480,7 +512,7 @@ class TaskExecutor:
                     if isinstance(execution_output, dict):
                         # ExecutionResult wraps the actual output, drill down
                         logger.debug(
-                            f"   Found ExecutionResult wrapper, drilling down into 'output' field"
+                            "   Found ExecutionResult wrapper, drilling down into 'output' field"
                         )
                         final_formatting = execution_output.get(
                             "final_formatting"
@@ -507,25 +539,28 @@ class TaskExecutor:
                             final_formatting = None
 
                         logger.debug(
-                            f"   Checked dict for final_formatting: {final_formatting is not None}"
+                            "   Checked dict for final_formatting: %s", final_formatting is not None
                         )
-                        logger.debug(f"   Checked dict for outputs: {outputs is not None}")
+                        logger.debug("   Checked dict for outputs: %s", outputs is not None)
 
                 if final_formatting:
                     if isinstance(final_formatting, (dict, list)):
                         generated_content = json.dumps(final_formatting)
                         logger.debug(
-                            f"   Serialized final_formatting dict/list to JSON: {len(generated_content)} chars"
+                            "   Serialized final_formatting dict/list to JSON: %s chars",
+                            len(generated_content),
                         )
                     else:
                         generated_content = str(final_formatting)
                         logger.debug(
-                            f"   Using final_formatting as string: {len(generated_content)} chars"
+                            "   Using final_formatting as string: %s chars", len(generated_content)
                         )
                 elif outputs or (isinstance(result, dict) and result.get("outputs")):
                     result_outputs = outputs if outputs else result.get("outputs", {})
                     logger.debug(
-                        f"   Using outputs field, type: {type(result_outputs).__name__}, len: {len(str(result_outputs))}"
+                        "   Using outputs field, type: %s, len: %s",
+                        type(result_outputs).__name__,
+                        len(str(result_outputs)),
                     )
                     if isinstance(result_outputs, dict):
                         # Try to find content in outputs
@@ -533,28 +568,32 @@ class TaskExecutor:
                             if isinstance(val, dict) and "content" in val:
                                 generated_content = val["content"]
                                 logger.debug(
-                                    f"   Found content in outputs[{key}]['content']: {len(str(generated_content))} chars"
+                                    "   Found content in outputs[%s]['content']: %s chars",
+                                    key,
+                                    len(str(generated_content)),
                                 )
                                 break
                             if isinstance(val, str) and len(val) > 100:
                                 generated_content = val
                                 logger.debug(
-                                    f"   Found long string in outputs[{key}]: {len(val)} chars"
+                                    "   Found long string in outputs[%s]: %s chars", key, len(val)
                                 )
                                 break
                         else:
                             generated_content = str(result_outputs)
                             logger.debug(
-                                f"   No suitable content found, serialized outputs: {len(generated_content)} chars"
+                                "   No suitable content found, serialized outputs: %s chars",
+                                len(generated_content),
                             )
                     else:
                         generated_content = str(result_outputs)
                         logger.debug(
-                            f"   Outputs is not dict, converting to string: {len(generated_content)} chars"
+                            "   Outputs is not dict, converting to string: %s chars",
+                            len(generated_content),
                         )
                 else:
                     generated_content = None
-                    logger.debug(f"   No content found in result, setting to None")
+                    logger.debug("   No content found in result, setting to None")
 
                 # Debug logging for content generation
                 logger.info(
@@ -579,6 +618,7 @@ class TaskExecutor:
 
                     # Try fallback content generation instead of retrying orchestrator
                     logger.info(f"   ⚙️ Attempting fallback content generation...")
+                    draft_model = None
                     try:
                         generated_content = await self._fallback_generate_content(task)
                         logger.info(
@@ -600,9 +640,11 @@ class TaskExecutor:
                     exc_info=True,
                 )
                 generated_content = f"Error in content generation: {orchestrator_error}"
+                draft_model = None
         else:
             logger.warning(f"⚠️ [TASK_EXECUTE] Orchestrator available: NO - Using fallback")
             # Fallback: Simple template-based generation
+            draft_model = None
             generated_content = await self._fallback_generate_content(task)
             logger.info(
                 f"✅ [TASK_EXECUTE] PHASE 1 Complete (fallback): Generated {len(generated_content)} chars"
@@ -614,41 +656,85 @@ class TaskExecutor:
             f"   Input content length: {len(generated_content) if generated_content else 0} chars"
         )
 
+        quality_context = {
+            "topic": topic,
+            "keywords": [primary_keyword] if primary_keyword else [],
+            "target_audience": target_audience,
+            "category": category,
+            "style": style,
+            "tone": tone,
+            "target_length": target_length,
+        }
+
         # Only validate if we have content
         if generated_content:
-            quality_result = await self.quality_service.evaluate(
-                content=generated_content,
-                context={
-                    "topic": topic,
-                    "keywords": primary_keyword,
-                    "target_audience": target_audience,
-                    "category": category,
-                    "style": style,
-                    "tone": tone,
-                    "target_length": target_length,
-                },
+            # The first verdict scores the draft model's own output, so it feeds the
+            # model router's quality floor; re-critiques after refinement do not
+            critique_result = await self._critique(
+                generated_content,
+                {**quality_context, "model": draft_model, "task_type": "creative"},
             )
         else:
             # No content to validate
-            quality_result = {
-                "score": 0,
+            critique_result = {
+                "quality_score": 0,
                 "approved": False,
                 "feedback": "No content provided for validation",
                 "suggestions": ["Content is empty or None"],
+                "needs_refinement": False,
             }
 
-        quality_score = quality_result.get("score", 0)
-        approved = quality_result.get("approved", False)
+        quality_score = critique_result["quality_score"]
+        approved = critique_result["approved"]
 
         logger.info(f"   Quality Score: {quality_score}/100")
         logger.info(f"   Approved: {approved}")
-        logger.debug(f"   Quality result keys: {list(quality_result.keys())}")
 
         if approved:
             logger.info(f"✅ [TASK_EXECUTE] PHASE 2 Complete: Content approved")
         else:
             logger.warning(f"⚠️ [TASK_EXECUTE] PHASE 2 Complete: Content needs improvement")
-            logger.debug(f"   Feedback: {critique_result.get('feedback')}")
+            logger.debug("   Feedback: %s", critique_result.get('feedback'))
+
+            # Rewrite only the weak sections when the orchestrator supports it;
+            # the whole-article path below is the fallback for article-level defects
+            if critique_result.get("needs_refinement") and hasattr(
+                self.orchestrator, "refine_content"
+            ):
+                try:
+                    refined = await self.orchestrator.refine_content(
+                        generated_content,
+                        context={
+                            **quality_context,
+                            "primary_keyword": primary_keyword,
+                            "model_selections": model_selections,
+                            "quality_preference": quality_preference,
+                        },
+                        feedback="\n".join(
+                            [critique_result["feedback"], *critique_result["suggestions"]]
+                        ),
+                    )
+                    # Re-critique the spliced article; its verdict decides whether the
+                    # whole-article rewrite still runs. With every rewrite rejected
+                    # nothing changed, so the fallback runs as before.
+                    if not refined["needs_full_rewrite"] and refined["rewritten"]:
+                        generated_content = refined["content"]
+                        critique_result = await self._critique(generated_content, quality_context)
+                        quality_score = critique_result["quality_score"]
+                        approved = critique_result["approved"]
+                        logger.info(
+                            f"   ✂️ Section refinement: {len(refined['rewritten'])} rewritten, "
+                            f"score now {quality_score:.0f}/100"
+                        )
+                    elif not refined["needs_full_rewrite"]:
+                        logger.info(
+                            "   ✂️ Section refinement: every rewrite rejected, "
+                            "falling back to a whole-article rewrite"
+                        )
+                except Exception as refine_err:
+                    logger.error(
+                        f"❌ [TASK_EXECUTE] Section refinement failed: {refine_err}", exc_info=True
+                    )
 
             # If not approved but can refine, attempt refinement
             if critique_result.get("needs_refinement") and self.orchestrator:
@@ -702,7 +788,7 @@ class TaskExecutor:
                     # Extract content from refinement result
                     refined_content = None
                     if isinstance(refinement_result, dict):
-                        logger.debug(f"   Refinement result keys: {list(refinement_result.keys())}")
+                        logger.debug("   Refinement result keys: %s", list(refinement_result.keys()))
                         if "content" in refinement_result:
                             refined_content = refinement_result["content"]
                         elif "output" in refinement_result:
@@ -743,13 +829,7 @@ class TaskExecutor:
                         logger.info(f"   ✅ Using refined content ({len(generated_content)} chars)")
 
                         # Re-critique refined content
-                        critique_result = await self.critique_loop.critique(
-                            content=generated_content,
-                            context={
-                                "topic": topic,
-                                "keywords": primary_keyword,
-                            },
-                        )
+                        critique_result = await self._critique(generated_content, quality_context)
 
                         quality_score = critique_result.get("quality_score", 0)
                         approved = critique_result.get("approved", False)
@@ -857,11 +937,21 @@ class TaskExecutor:
                     "duration_ms": int(operation_metrics.get("duration_ms", 0)),
                     "success": True,
                 }
-                await self.database_service.log_cost(cost_log)
-                logger.debug(f"✅ Logged task cost: ${cost_log['cost_usd']:.6f} to database")
+                # Buffered: the row isn't needed here, so keep the insert off the hot path
+                await self.database_service.log_cost_deferred(cost_log)
+                logger.debug("✅ Logged task cost: $%.6f to database", cost_log['cost_usd'])
             except Exception as e:
                 logger.warning(f"⚠️ Failed to persist cost metrics: {e}")
 
+            # Persist the per-call routing telemetry this task's LLM calls produced
+            # (recorded by ModelConsolidationService; throttled inside save_stats)
+            try:
+                router = get_model_router()
+                if router:
+                    await router.save_stats(self.database_service)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to persist routing telemetry: {e}")
+
         # Store metadata in result
         metadata = {
             "task_id": str(task_id),
@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from .model_router import ModelRouter
+from .model_router import ModelRouter, get_model_router
 from .task_intent_router import TaskIntentRequest
 from .unified_orchestrator import UnifiedOrchestrator
 
@@ -137,7 +137,7 @@ class TaskPlanningService:
     def __init__(self):
         """Initialize planning service."""
         self.orchestrator = UnifiedOrchestrator()
-        self.model_router = ModelRouter()
+        self.model_router = get_model_router() or ModelRouter()
 
     async def generate_plan(
         self,
@@ -9,22 +9,83 @@ Handles all task-related database operations including:
 """
 
 import asyncio
+import base64
 import json
 import logging
+import os
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from asyncpg import Pool
+from asyncpg import Pool, UndefinedTableError
 
 from schemas.database_response_models import TaskCountsResponse, TaskResponse
 from schemas.model_converter import ModelConverter
 from utils.sql_safety import ParameterizedQueryBuilder, SQLOperator
 
+from .batch_writer import BatchWriter
 from .database_mixin import DatabaseServiceMixin
 
 logger = logging.getLogger(__name__)
 
+# Columns a task table/list view renders. Leaves out content, result,
+# task_metadata and the other large JSON/text blobs (fetch those per task).
+TASK_SUMMARY_COLUMNS = [
+    "id",
+    "task_id",
+    "task_type",
+    "request_type",
+    "status",
+    "approval_status",
+    "stage",
+    "percentage",
+    "message",
+    "title",
+    "topic",
+    "category",
+    "primary_keyword",
+    "style",
+    "tone",
+    "target_length",
+    "quality_score",
+    "model_used",
+    "estimated_cost",
+    "featured_image_url",
+    "excerpt",
+    "error_message",
+    "agent_id",
+    "created_at",
+    "updated_at",
+    "completed_at",
+]
+
+# Seconds a task count is reused before it is recomputed
+TASK_COUNT_CACHE_TTL = float(os.getenv("TASK_COUNT_CACHE_TTL", "30"))
+# Above this many rows the unfiltered total comes from the planner estimate
+TASK_COUNT_ESTIMATE_THRESHOLD = int(os.getenv("TASK_COUNT_ESTIMATE_THRESHOLD", "100000"))
+
+
+def encode_task_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque keyset cursor for the row a page ended on"""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_task_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Inverse of encode_task_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
 
 def serialize_value_for_postgres(value: Any) -> Any:
     """Serialize Python value for PostgreSQL."""
@@ -65,6 +126,22 @@ class TasksDatabase(DatabaseServiceMixin):
             pool: asyncpg connection pool
         """
         self.pool = pool
+        # Write-behind buffer for status history (started by DatabaseService)
+        self.status_history_writer: Optional[BatchWriter] = None
+        # (status, category) -> (computed_at, total, is_estimate)
+        self._count_cache: Dict[tuple, tuple[float, int, bool]] = {}
+        # False once we know task_status_counts (migration 0026) is missing
+        self._status_counts_available = True
+
+    def create_status_history_writer(self, **kwargs) -> BatchWriter:
+        """Create (but don't start) the write-behind buffer for task_status_history"""
+        self.status_history_writer = BatchWriter(
+            self.pool,
+            "task_status_history",
+            ["task_id", "old_status", "new_status", "reason", "metadata", "timestamp"],
+            **kwargs,
+        )
+        return self.status_history_writer
 
     async def get_pending_tasks(self, limit: int = 10) -> List[dict]:
         """
@@ -224,6 +301,7 @@ class TasksDatabase(DatabaseServiceMixin):
 
             async with self.pool.acquire() as conn:
                 result = await conn.fetchval(sql, *params)
+                self._count_cache.clear()
                 logger.info(f"✅ Task added: {task_id}")
                 return str(result)
         except Exception as e:
@@ -492,28 +570,18 @@ class TasksDatabase(DatabaseServiceMixin):
         if category:
             where_clauses.append(("category", SQLOperator.EQ, category))
 
-        # Build count query
-        count_sql, count_params = builder.select(
-            columns=["COUNT(*) as count"],
-            table="content_tasks",
-            where_clauses=where_clauses if where_clauses else None,
-        )
-
-        # Reset builder for main query
-        builder = ParameterizedQueryBuilder()
         sql_list, list_params = builder.select(
             columns=["*"],
             table="content_tasks",
             where_clauses=where_clauses if where_clauses else None,
-            order_by=[("created_at", "DESC")],
+            order_by=[("created_at", "DESC"), ("id", "DESC")],
             limit=limit,
             offset=offset,
         )
 
         try:
             async with self.pool.acquire() as conn:
-                count_result = await conn.fetchval(count_sql, *count_params)
-                total = count_result or 0
+                total, _ = await self._count_tasks(conn, status, category)
 
                 rows = await conn.fetch(sql_list, *list_params)
 
@@ -524,9 +592,160 @@ class TasksDatabase(DatabaseServiceMixin):
             logger.error(f"❌ Failed to list tasks: {e}")
             return [], 0
 
+    async def get_tasks_page(
+        self,
+        limit: int = 20,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        summary: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of tasks with keyset (created_at, id) pagination.
+
+        Each page seeks straight to the row after the cursor through the
+        (created_at DESC, id DESC) indexes, so page latency doesn't grow with
+        depth the way OFFSET does. The total comes from task_status_counts,
+        or is cached for TASK_COUNT_CACHE_TTL seconds (and estimated for very
+        large tables) instead of being counted on every page.
+
+        Args:
+            limit: Maximum results per page
+            status: Filter by status
+            category: Filter by category
+            cursor: next_cursor from the previous page (None for the first page)
+            offset: Legacy offset, only used when no cursor is given
+            summary: Select TASK_SUMMARY_COLUMNS instead of every column
+
+        Returns:
+            Dict with tasks, total, total_is_estimate and next_cursor
+            (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        conditions = []
+        params: List[Any] = []
+        if status:
+            params.append(status)
+            conditions.append(f"status = ${len(params)}")
+        if category:
+            params.append(category)
+            conditions.append(f"category = ${len(params)}")
+        if cursor:
+            cursor_created_at, cursor_id = decode_task_cursor(cursor)
+            params.extend([cursor_created_at, cursor_id])
+            conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+
+        columns = ", ".join(TASK_SUMMARY_COLUMNS) if summary else "*"
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        # Fetch one extra row to know whether another page exists
+        params.append(limit + 1)
+        sql = (
+            f"SELECT {columns} FROM content_tasks{where} "
+            f"ORDER BY created_at DESC, id DESC LIMIT ${len(params)}"
+        )
+        if offset and not cursor:
+            params.append(offset)
+            sql += f" OFFSET ${len(params)}"
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(sql, *params)
+                total, is_estimate = await self._count_tasks(conn, status, category)
+        except Exception as e:
+            logger.error(f"❌ Failed to list tasks: {e}")
+            return {"tasks": [], "total": 0, "total_is_estimate": False, "next_cursor": None}
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_task_cursor(last["created_at"], last["id"])
+
+        tasks = [self._convert_row_to_dict(row) for row in rows]
+        logger.debug("Listed %d tasks (total: %d, more: %s)", len(tasks), total, bool(next_cursor))
+        return {
+            "tasks": tasks,
+            "total": total,
+            "total_is_estimate": is_estimate,
+            "next_cursor": next_cursor,
+        }
+
+    async def _fetch_status_counts(self, conn) -> Optional[Dict[str, int]]:
+        """
+        Per-status totals from the trigger-maintained task_status_counts table.
+
+        Returns:
+            Dict of status -> count, or None if the table doesn't exist yet
+        """
+        if not self._status_counts_available:
+            return None
+        try:
+            rows = await conn.fetch("SELECT status, count FROM task_status_counts")
+        except UndefinedTableError:
+            logger.info("task_status_counts not found - counting content_tasks directly")
+            self._status_counts_available = False
+            return None
+        return {row["status"]: row["count"] for row in rows}
+
+    async def _count_tasks(
+        self, conn, status: Optional[str] = None, category: Optional[str] = None
+    ) -> tuple[int, bool]:
+        """
+        Total tasks matching the filters.
+
+        Status-only (and unfiltered) totals come from task_status_counts.
+        Category filters fall back to COUNT(*), cached for TASK_COUNT_CACHE_TTL.
+
+        Returns:
+            Tuple of (total, is_estimate)
+        """
+        if not category:
+            counts = await self._fetch_status_counts(conn)
+            if counts is not None:
+                total = counts.get(status, 0) if status else sum(counts.values())
+                return total, False
+
+        key = (status, category)
+        cached = self._count_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < TASK_COUNT_CACHE_TTL:
+            return cached[1], cached[2]
+
+        is_estimate = False
+        total = None
+        if not status and not category:
+            # reltuples is maintained by VACUUM/ANALYZE (-1 if never analyzed)
+            estimate = await conn.fetchval(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = 'content_tasks'::regclass"
+            )
+            if estimate is not None and estimate >= TASK_COUNT_ESTIMATE_THRESHOLD:
+                total, is_estimate = int(estimate), True
+        if total is None:
+            builder = ParameterizedQueryBuilder()
+            where_clauses = []
+            if status:
+                where_clauses.append(("status", SQLOperator.EQ, status))
+            if category:
+                where_clauses.append(("category", SQLOperator.EQ, category))
+            count_sql, count_params = builder.select(
+                columns=["COUNT(*) as count"],
+                table="content_tasks",
+                where_clauses=where_clauses or None,
+            )
+            total = await conn.fetchval(count_sql, *count_params) or 0
+
+        self._count_cache[key] = (now, total, is_estimate)
+        return total, is_estimate
+
     async def get_task_counts(self) -> TaskCountsResponse:
         """
-        Get task counts by status from content_tasks.
+        Get task counts by status.
+
+        Reads task_status_counts (a few rows) and only falls back to a
+        GROUP BY over content_tasks when the summary table doesn't exist.
 
         Returns:
             TaskCountsResponse model with status-based counts
@@ -538,8 +757,10 @@ class TasksDatabase(DatabaseServiceMixin):
         """
         try:
             async with self.pool.acquire() as conn:
-                rows = await conn.fetch(sql)
-                counts = {row["status"]: row["count"] for row in rows}
+                counts = await self._fetch_status_counts(conn)
+                if counts is None:
+                    rows = await conn.fetch(sql)
+                    counts = {row["status"]: row["count"] for row in rows}
                 return TaskCountsResponse(
                     total=sum(counts.values()),
                     pending=counts.get("pending", 0),
@@ -669,6 +890,7 @@ class TasksDatabase(DatabaseServiceMixin):
                 result = await conn.execute(sql, *params)
                 deleted = "DELETE 1" in result or result == "DELETE 1"
                 if deleted:
+                    self._count_cache.clear()
                     logger.info(f"✅ Task deleted: {task_id}")
                 return deleted
         except Exception as e:
@@ -719,19 +941,26 @@ class TasksDatabase(DatabaseServiceMixin):
         new_status: str,
         reason: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        changed_by: Optional[str] = None,
+        wait: bool = False,
     ) -> bool:
         """
         Log a status change to task_status_history table.
 
+        When the write-behind buffer is running the row is buffered and
+        written in a batch; pass wait=True to insert it immediately.
+
         Args:
             task_id: Task ID
             old_status: Previous status
             new_status: New status
             reason: Optional reason for the change
             metadata: Optional additional metadata (validation errors, etc.)
+            changed_by: Optional user who made the change (stored in metadata)
+            wait: Insert synchronously even if the buffer is running
 
         Returns:
-            True if logged successfully, False on error
+            True if logged (or buffered) successfully, False on error
         """
         try:
             sql = """
@@ -740,8 +969,17 @@ class TasksDatabase(DatabaseServiceMixin):
             """
 
             now = datetime.utcnow()
+            if changed_by:
+                metadata = {**(metadata or {}), "changed_by": changed_by}
             metadata_json = json.dumps(metadata or {})
 
+            writer = self.status_history_writer
+            if writer and writer.running and not wait:
+                await writer.submit(
+                    (task_id, old_status, new_status, reason or "", metadata_json, now)
+                )
+                return True
+
             async with self.pool.acquire() as conn:
                 await conn.execute(
                     sql, task_id, old_status, new_status, reason or "", metadata_json, now
@@ -763,6 +1001,10 @@ class TasksDatabase(DatabaseServiceMixin):
         Returns:
             List of status change records
         """
+        # Include changes still sitting in the write-behind buffer
+        if self.status_history_writer:
+            await self.status_history_writer.flush()
+
         try:
             sql = """
                 SELECT id, task_id, old_status, new_status, reason, metadata, timestamp
@@ -806,6 +1048,10 @@ class TasksDatabase(DatabaseServiceMixin):
         Returns:
             List of validation failure records with details
         """
+        # Include changes still sitting in the write-behind buffer
+        if self.status_history_writer:
+            await self.status_history_writer.flush()
+
         try:
             sql = """
                 SELECT id, task_id, old_status, new_status, reason, metadata, timestamp
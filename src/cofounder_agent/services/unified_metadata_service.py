@@ -327,7 +327,7 @@ class UnifiedMetadataService:
             result = await service.generate(
                 prompt=prompt,
                 temperature=0.7,
-                # model consolidation service handles model selection automatically
+                task_type="seo_title",  # Model router picks the model
             )
             return result.text[:100] if result and result.text else None
 
@@ -513,6 +513,7 @@ class UnifiedMetadataService:
             result = await service.generate(
                 prompt=prompt,
                 temperature=0.7,
+                task_type="seo_description",
             )
             return result.text[:155] if result and result.text else None
 
@@ -536,6 +537,7 @@ class UnifiedMetadataService:
             result = await service.generate(
                 prompt=prompt,
                 temperature=0.7,
+                task_type="extract_keywords",
             )
 
             if result and result.text:
@@ -36,7 +36,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +173,7 @@ class UnifiedOrchestrator:
         model_router=None,
         quality_service=None,
         memory_system=None,
+        agent_pool=None,
         **agents,
     ):
         """
@@ -183,6 +184,8 @@ class UnifiedOrchestrator:
             model_router: ModelRouter for LLM access
             quality_service: ContentQualityService for quality assessment
             memory_system: Memory system for learning
+            agent_pool: AgentPool for reusable agent/LLM client instances
+                (defaults to the process-wide pool)
             **agents: Injected agent instances
                 - content_orchestrator: ContentOrchestrator
                 - financial_agent: FinancialAgent (optional)
@@ -193,6 +196,11 @@ class UnifiedOrchestrator:
         self.model_router = model_router
         self.quality_service = quality_service
         self.memory_system = memory_system
+        if agent_pool is None:
+            from services.agent_pool import get_agent_pool  # pylint: disable=import-outside-toplevel
+
+            agent_pool = get_agent_pool()
+        self.agent_pool = agent_pool
 
         # Register agents
         self.agents = agents or {}
@@ -208,9 +216,73 @@ class UnifiedOrchestrator:
             ", ".join(self.agents.keys()),
         )
 
-    def _get_agent_instance(self, agent_name: str, **kwargs) -> Any:
+    # Pooled agents that take the shared LLM client for their model
+    LLM_AGENTS = ("creative_agent", "qa_agent")
+
+    def _get_agent_instance(self, agent_name: str, model_name: Optional[str] = None, **kwargs) -> Any:
+        """
+        Get a warmed agent instance from the process-wide agent pool.
+
+        Instances are keyed by (agent_name, model_name) and shared between
+        concurrent requests, so per-request state (post, topic, critique) is
+        always passed to the agent's methods, never stored on the agent.
+        Agents in LLM_AGENTS get the pooled LLM client for model_name.
+
+        Args:
+            agent_name: Name of the agent (e.g., "research_agent", "creative_agent")
+            model_name: Model for LLM-backed agents (None = configured default)
+            **kwargs: Explicit constructor arguments. When given, a fresh,
+                unpooled instance is built instead.
+
+        Returns:
+            Agent instance
+
+        Example:
+            ```python
+            research_agent = self._get_agent_instance("research_agent")
+            creative_agent = self._get_agent_instance("creative_agent", model_name="gpt-4")
+            ```
+        """
+        if kwargs:
+            return self._create_agent_instance(agent_name, **kwargs)
+        return self.agent_pool.get_agent(
+            agent_name, self._agent_factory(agent_name, model_name), model_name
+        )
+
+    def _agent_factory(self, agent_name: str, model_name: Optional[str]):
+        """Builder the pool calls on a miss"""
+
+        def factory():
+            if agent_name in self.LLM_AGENTS:
+                llm_client = self.agent_pool.get_llm_client(model_name)
+                return self._create_agent_instance(agent_name, llm_client=llm_client)
+            return self._create_agent_instance(agent_name)
+
+        return factory
+
+    def warm_agent_pool(
+        self,
+        agent_names=("research_agent", "creative_agent", "qa_agent", "publishing_agent"),
+        model_name: Optional[str] = None,
+        creative_models: Iterable[Optional[str]] = (),
+    ) -> Dict[str, bool]:
+        """
+        Build the content pipeline agents before the first request arrives.
+
+        Draft and refine look creative_agent up under the phase's model, so it
+        is also warmed once per model in creative_models.
+        """
+        specs = [(name, self._agent_factory(name, model_name), model_name) for name in agent_names]
+        specs += [
+            ("creative_agent", self._agent_factory("creative_agent", model), model)
+            for model in dict.fromkeys(creative_models)
+            if model != model_name
+        ]
+        return self.agent_pool.warm(specs)
+
+    def _create_agent_instance(self, agent_name: str, **kwargs) -> Any:
         """
-        Get an agent instance from the registry, with fallback to direct import.
+        Instantiate an agent from the registry, with fallback to direct import.
 
         This method enables dynamic agent selection and instantiation, allowing:
         - Runtime agent discovery via AgentRegistry
@@ -223,22 +295,6 @@ class UnifiedOrchestrator:
 
         Returns:
             Instantiated agent object
-
-        Example:
-            ```python
-            # Dynamic instantiation from registry
-            research_agent = self._get_agent_instance("research_agent")
-
-            # With custom parameters
-            llm_client = LLMClient(model_name="claude-3-sonnet")
-            creative_agent = self._get_agent_instance(
-                "creative_agent",
-                llm_client=llm_client
-            )
-
-            # Fallback to direct import if registry not populated
-            # Will still work if agent classes are importable
-            ```
         """
         try:
             from agents.registry import get_agent_registry
@@ -563,6 +619,88 @@ class UnifiedOrchestrator:
         )
         return None
 
+    # ========================================================================
+    # SECTION-LEVEL REFINEMENT
+    # ========================================================================
+
+    async def refine_content(
+        self,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+        feedback: str = "",
+        creative_agent: Any = None,
+        refiner: Any = None,
+    ) -> Dict[str, Any]:
+        """
+        Rewrite only the sections of an article that score below threshold.
+
+        Untouched sections are spliced back verbatim, so the cost of a
+        refinement scales with the size of the defect rather than the size
+        of the article (see services.section_refinement).
+
+        Args:
+            content: Markdown article that failed QA
+            context: topic, primary_keyword, target_audience, category, style,
+                target_length, model_selections, quality_preference,
+                writing_style_guidance
+            feedback: Article-level QA feedback
+            creative_agent: Agent to rewrite with (default: one on the refine-phase model)
+            refiner: SectionRefiner to reuse across iterations (keeps its score cache)
+
+        Returns:
+            Dict with content, needs_full_rewrite, rewritten, rejected,
+            rewritten_chars, article_chars and per-section scores
+        """
+        from agents.content_agent.utils.data_models import (  # pylint: disable=import-outside-toplevel
+            BlogPost,
+        )
+        from services.section_refinement import (  # pylint: disable=import-outside-toplevel
+            SectionRefiner,
+        )
+
+        context = context or {}
+        if creative_agent is None:
+            refine_model = self._get_model_for_phase(
+                "refine",
+                context.get("model_selections") or {},
+                context.get("quality_preference", "balanced"),
+            )
+            creative_agent = self._get_agent_instance("creative_agent", refine_model)
+
+        topic = context.get("topic") or ""
+        post = BlogPost(
+            topic=topic,
+            primary_keyword=context.get("primary_keyword") or topic,
+            target_audience=context.get("target_audience") or "general",
+            category=context.get("category") or "general",
+            status="draft",
+            writing_style=context.get("style"),
+        )
+        if context.get("writing_style_guidance"):
+            post.metadata = {"writing_sample_guidance": context["writing_style_guidance"]}
+
+        async def rewrite(section, section_context, critique):
+            return await creative_agent.refine_section(
+                post,
+                heading=section.title,
+                section=section.body,
+                critique=critique,
+                word_count_target=section_context.get("section_word_target") or section.word_count,
+            )
+
+        refiner = refiner or SectionRefiner(rewrite)
+        refiner.rewrite_fn = rewrite
+        outcome = await refiner.refine_pass(content, context, feedback)
+        logger.info(
+            "Section refinement: rewrote %d, rejected %d (%d of %d chars), full rewrite needed: %s",
+            len(outcome.rewritten),
+            len(outcome.rejected),
+            outcome.rewritten_chars,
+            outcome.article_chars,
+            outcome.needs_full_rewrite,
+        )
+        return {"content": outcome.content, **outcome.to_dict()}
+
     # ========================================================================
     # REQUEST HANDLERS
     # ========================================================================
@@ -639,7 +777,7 @@ class UnifiedOrchestrator:
             # ====================================================================
             logger.info("[%s] STAGE 1: Research", request.request_id)
             
-            # Instantiate research agent (with registry fallback support)
+            # Pooled research agent (built once per process)
             research_agent = self._get_agent_instance("research_agent")
             research_data = await research_agent.run(topic, keywords[:5])
             research_text = research_data if isinstance(research_data, str) else str(research_data)
@@ -661,9 +799,6 @@ class UnifiedOrchestrator:
             # STAGE 2: CREATIVE DRAFT (25% → 45%)
             # ====================================================================
             logger.info("[%s] STAGE 2: Creative Draft", request.request_id)
-            from agents.content_agent.services.llm_client import (  # pylint: disable=import-outside-toplevel
-                LLMClient,
-            )
             from agents.content_agent.utils.data_models import (  # pylint: disable=import-outside-toplevel
                 BlogPost,
             )
@@ -674,11 +809,8 @@ class UnifiedOrchestrator:
             # Get model selection for draft phase
             draft_model = self._get_model_for_phase("draft", model_selections, quality_preference)
 
-            # Create LLMClient with selected model
-            llm_client = LLMClient(model_name=draft_model) if draft_model else LLMClient()
-            
-            # Instantiate creative agent with custom parameter (registry fallback support)
-            creative_agent = self._get_agent_instance("creative_agent", llm_client=llm_client)
+            # Pooled creative agent and LLM client for the selected model
+            creative_agent = self._get_agent_instance("creative_agent", draft_model)
 
             # Retrieve writing style guidance - either from specific writing_style_id or active sample
             writing_style_guidance = ""
@@ -776,6 +908,7 @@ class UnifiedOrchestrator:
             feedback = ""
             quality_score = 75
             max_iterations = 2
+            section_refiner = None
 
             for iteration in range(1, max_iterations + 1):
                 quality_context = {"topic": topic}
@@ -826,16 +959,44 @@ class UnifiedOrchestrator:
                         "refine", model_selections, quality_preference
                     )
                     if refine_model:
-                        # Create new LLMClient with refine model for refinement
-                        refine_llm_client = LLMClient(model_name=refine_model)
-                        creative_agent = self._get_agent_instance("creative_agent", llm_client=refine_llm_client)
-                    content = await creative_agent.run(
-                        content,
-                        is_refinement=True,
-                        word_count_target=phase_targets.get("creative", 300),
-                        constraints=constraints,
+                        creative_agent = self._get_agent_instance("creative_agent", refine_model)
+
+                    # Rewrite only the weak sections; fall back to a whole-post
+                    # rewrite when the defect isn't local to any section
+                    from services.section_refinement import (  # pylint: disable=import-outside-toplevel
+                        SectionRefiner,
                     )
 
+                    section_refiner = section_refiner or SectionRefiner(None, quality_service)
+                    refined = None
+                    current_text = getattr(content, "raw_content", None)
+                    if current_text and hasattr(creative_agent, "refine_section"):
+                        refined = await self.refine_content(
+                            current_text,
+                            context={
+                                **quality_context,
+                                "primary_keyword": topic,
+                                "style": style,
+                                "target_length": phase_targets.get("creative"),
+                            },
+                            feedback=feedback,
+                            creative_agent=creative_agent,
+                            refiner=section_refiner,
+                        )
+
+                    # If every section rewrite was rejected nothing improved, so
+                    # the whole-post rewrite still has to run
+                    if refined and not refined["needs_full_rewrite"] and refined["rewritten"]:
+                        content.raw_content = refined["content"]
+                    else:
+                        content.qa_feedback.append(feedback)
+                        content = await creative_agent.run(
+                            content,
+                            is_refinement=True,
+                            word_count_target=phase_targets.get("creative", 300),
+                            constraints=constraints,
+                        )
+
             qa_compliance = validate_constraints(
                 getattr(content, "body", str(content)),
                 constraints,
@@ -867,7 +1028,7 @@ class UnifiedOrchestrator:
             # ====================================================================
             logger.info("[%s] STAGE 5: Formatting", request.request_id)
             
-            # Instantiate publishing agent (with registry fallback support)
+            # Pooled publishing agent (keeps its CMS connection between requests)
             publishing_agent = self._get_agent_instance("publishing_agent")
             result_post = await publishing_agent.run(content)
 
@@ -1114,6 +1275,7 @@ class UnifiedOrchestrator:
                 else 0
             ),
             "available_agents": list(self.agents.keys()),
+            "agent_pool": self.agent_pool.get_stats(),
         }
 
     async def _store_execution_result(self, result: ExecutionResult) -> None:
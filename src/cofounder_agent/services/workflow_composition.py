@@ -5,6 +5,9 @@ Provides:
 - WorkflowBuilder: Fluent API for constructing workflows
 - AgentPhase: Convenience wrapper for agent-based phases
 - Content workflow builders: Pre-built workflows for common content types
+
+Template phases declare their inputs so WorkflowEngine can run phases without a
+data dependency on each other (e.g. image selection alongside drafting) concurrently.
 """
 
 import logging
@@ -50,8 +53,8 @@ async def create_agent_phase_handler(agent_name: str, phase_method: str = "run")
             # Instantiate agent
             agent = agent_class()
 
-            # Get input from context (either accumulated_output or initial_input)
-            phase_input = context.accumulated_output or context.initial_input
+            # Get input from context (previous phase's output or initial_input)
+            phase_input = context.get_phase_input(None)
 
             # Call the phase method
             if hasattr(agent, phase_method):
@@ -99,6 +102,8 @@ class WorkflowBuilder:
         skip_on_error: bool = False,
         required: bool = True,
         metadata: Optional[Dict[str, Any]] = None,
+        inputs: Optional[List[str]] = None,
+        outputs: Optional[List[str]] = None,
     ) -> "WorkflowBuilder":
         """
         Add a phase to the workflow.
@@ -112,6 +117,8 @@ class WorkflowBuilder:
             skip_on_error: Skip if previous phase failed
             required: Whether workflow fails if this phase fails
             metadata: Additional metadata
+            inputs: Phases/output keys this phase consumes (None = previous phase)
+            outputs: Extra variable keys this phase publishes
 
         Returns:
             Self for chaining
@@ -125,6 +132,8 @@ class WorkflowBuilder:
             skip_on_error=skip_on_error,
             required=required,
             metadata=metadata or {},
+            inputs=inputs,
+            outputs=outputs or [],
         )
         self.phases.append(phase)
         return self
@@ -138,6 +147,8 @@ class WorkflowBuilder:
         skip_on_error: bool = False,
         required: bool = True,
         agent_method: str = "run",
+        inputs: Optional[List[str]] = None,
+        outputs: Optional[List[str]] = None,
     ) -> "WorkflowBuilder":
         """
         Add a phase that executes a registered agent.
@@ -150,6 +161,8 @@ class WorkflowBuilder:
             skip_on_error: Skip if previous phase failed
             required: Whether workflow fails if this phase fails
             agent_method: Method to call on agent
+            inputs: Phases/output keys whose outputs feed this agent (None = previous phase)
+            outputs: Extra variable keys this phase publishes
 
         Returns:
             Self for chaining
@@ -168,7 +181,7 @@ class WorkflowBuilder:
                     raise ValueError(f"Agent '{agent_name}' not found in registry")
 
                 agent = agent_class()
-                phase_input = context.accumulated_output or context.initial_input
+                phase_input = context.get_phase_input(inputs)
 
                 if hasattr(agent, agent_method):
                     method = getattr(agent, agent_method)
@@ -188,6 +201,8 @@ class WorkflowBuilder:
             max_retries=max_retries,
             skip_on_error=skip_on_error,
             required=required,
+            inputs=inputs,
+            outputs=outputs,
         )
 
     def build(self) -> List[WorkflowPhase]:
@@ -220,6 +235,9 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
     - finalize: Format and publish-ready preparation
     - image_selection: Select or generate images
     - publish: Final publishing step
+
+    image_selection only needs the research output, so it runs alongside the
+    draft/assess/refine chain.
     """
     builder = WorkflowBuilder()
 
@@ -229,6 +247,7 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
         timeout_seconds=180,
         max_retries=2,
         required=True,
+        inputs=[],
     )
 
     builder.add_agent_phase(
@@ -237,6 +256,8 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
         timeout_seconds=300,
         max_retries=3,
         required=True,
+        inputs=["research"],
+        outputs=["article"],
     )
 
     builder.add_agent_phase(
@@ -245,6 +266,7 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
         timeout_seconds=120,
         max_retries=2,
         required=True,
+        inputs=["draft"],
     )
 
     # Refinement: use creative agent with is_refinement=True
@@ -256,14 +278,18 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
         max_retries=3,
         required=False,
         skip_on_error=True,
+        inputs=["draft", "assess"],
+        outputs=["article"],
     )
 
+    # "article" is the refined draft when refinement succeeded, otherwise the draft
     builder.add_agent_phase(
         "publishing_agent",
         phase_name="finalize",
         timeout_seconds=120,
         max_retries=2,
         required=True,
+        inputs=["article"],
     )
 
     builder.add_agent_phase(
@@ -273,13 +299,14 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
         max_retries=2,
         required=False,
         skip_on_error=True,
+        inputs=["research"],
     )
 
     # Publishing step (placeholder - can be custom Publishing agent)
     async def publish_handler(context: WorkflowContext) -> Any:
         """Publish workflow - currently a no-op"""
         logger.info("[%s] Publishing workflow result", context.workflow_id)
-        return context.accumulated_output
+        return context.get_phase_output("finalize")
 
     builder.add_phase(
         name="publish",
@@ -287,6 +314,7 @@ async def build_blog_post_workflow() -> List[WorkflowPhase]:
         timeout_seconds=60,
         max_retries=1,
         required=False,
+        inputs=["finalize", "image_selection"],
     )
 
     return builder.build()
@@ -310,6 +338,7 @@ async def build_social_media_workflow() -> List[WorkflowPhase]:
         phase_name="research",
         timeout_seconds=120,
         max_retries=2,
+        inputs=[],
     )
 
     builder.add_agent_phase(
@@ -317,6 +346,7 @@ async def build_social_media_workflow() -> List[WorkflowPhase]:
         phase_name="draft",
         timeout_seconds=180,
         max_retries=2,
+        inputs=["research"],
     )
 
     builder.add_agent_phase(
@@ -325,6 +355,7 @@ async def build_social_media_workflow() -> List[WorkflowPhase]:
         timeout_seconds=90,
         max_retries=2,
         required=False,
+        inputs=["draft"],
     )
 
     builder.add_agent_phase(
@@ -338,13 +369,14 @@ async def build_social_media_workflow() -> List[WorkflowPhase]:
     async def publish_handler(context: WorkflowContext) -> Any:
         """Publish to social media"""
         logger.info("[%s] Publishing to social media", context.workflow_id)
-        return context.accumulated_output
+        return context.get_phase_output("finalize")
 
     builder.add_phase(
         name="publish",
         handler=publish_handler,
         timeout_seconds=30,
         required=False,
+        inputs=["finalize"],
     )
 
     return builder.build()
@@ -367,6 +399,7 @@ async def build_email_workflow() -> List[WorkflowPhase]:
         phase_name="draft",
         timeout_seconds=180,
         max_retries=2,
+        inputs=[],
     )
 
     builder.add_agent_phase(
@@ -374,6 +407,7 @@ async def build_email_workflow() -> List[WorkflowPhase]:
         phase_name="assess",
         timeout_seconds=90,
         max_retries=2,
+        inputs=["draft"],
     )
 
     builder.add_agent_phase(
@@ -387,12 +421,13 @@ async def build_email_workflow() -> List[WorkflowPhase]:
     async def send_handler(context: WorkflowContext) -> Any:
         """Send email"""
         logger.info("[%s] Sending email", context.workflow_id)
-        return context.accumulated_output
+        return context.get_phase_output("finalize")
 
     builder.add_phase(
         name="publish",
         handler=send_handler,
         timeout_seconds=30,
+        inputs=["finalize"],
     )
 
     return builder.build()
@@ -3,6 +3,8 @@ Workflow Engine - Orchestrates task execution with retry logic, status tracking,
 
 Handles:
 - Phase-based workflow execution
+- Concurrent execution of phases with no data dependency on each other
+- Checkpointing after each phase so resumed workflows skip finished work
 - Automatic retry with exponential backoff
 - Status tracking (pending, running, completed, failed)
 - Result accumulation across phases
@@ -15,18 +17,33 @@ Architecture:
 - WorkflowContext: Manages state, results, and metadata during execution
 - WorkflowEngine: Orchestrates phase execution with comprehensive error handling
 - PhaseResult: Encapsulates phase output with metadata (duration, status, errors)
+
+Phase dependencies:
+- A phase with inputs=None depends on the phase listed before it (sequential, the
+  historical behaviour)
+- A phase with an explicit inputs list depends only on the phases that produce those
+  names (a phase name, or a key listed in another phase's outputs); phases whose
+  inputs are satisfied run concurrently, bounded by max_parallel_phases
+- Phases never write shared context fields themselves; the scheduler merges each
+  finished phase's result in declaration order, so concurrent phases cannot race
 """
 
 import asyncio
 import json
 import logging
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+_NO_LEGACY_INPUT = object()
+
+# Input for the running legacy (inputs=None) phase, set per phase task by the scheduler
+_legacy_phase_input: ContextVar[Any] = ContextVar("legacy_phase_input", default=_NO_LEGACY_INPUT)
+
 
 class PhaseStatus(str, Enum):
     """Execution status of a phase"""
@@ -78,6 +95,12 @@ class WorkflowPhase:
     metadata: Dict[str, Any] = field(default_factory=dict)
     """Additional metadata for this phase"""
 
+    inputs: Optional[List[str]] = None
+    """Phase names or output keys this phase consumes. None means 'depends on the previous phase'"""
+
+    outputs: List[str] = field(default_factory=list)
+    """Variable keys this phase publishes (in addition to its own name) for downstream phases"""
+
 
 @dataclass
 class PhaseResult:
@@ -134,7 +157,7 @@ class WorkflowContext:
     """Results from each phase (phase_name -> PhaseResult)"""
 
     accumulated_output: Any = None
-    """Accumulated output passed between phases"""
+    """Output of the latest-declared completed phase"""
 
     status: WorkflowStatus = WorkflowStatus.PENDING
     """Overall workflow status"""
@@ -145,10 +168,44 @@ class WorkflowContext:
     tags: List[str] = field(default_factory=list)
     """Tags for categorization and filtering"""
 
+    phase_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    """Per-phase timing (phase_name -> started_at, completed_at, queued_ms, duration_ms)"""
+
+    active_ms: float = 0.0
+    """Time spent executing, summed over every run (excludes downtime between resumes)"""
+
     def get_phase_result(self, phase_name: str) -> Optional[PhaseResult]:
         """Get result from a previously executed phase"""
         return self.results.get(phase_name)
 
+    def get_phase_output(self, name: str, default: Any = None) -> Any:
+        """Get the output of a completed phase, or a variable published via WorkflowPhase.outputs"""
+        result = self.results.get(name)
+        if result is not None and result.status == PhaseStatus.COMPLETED:
+            return result.output
+        return self.variables.get(name, default)
+
+    def get_phase_input(self, inputs: Optional[List[str]]) -> Any:
+        """
+        Resolve the input for a phase from its declared inputs.
+
+        - None: legacy behaviour (output of the nearest completed earlier phase,
+          falling back to initial input)
+        - []: the workflow's initial input
+        - one name: that phase's output
+        - several names: dict of name -> output
+        """
+        if inputs is None:
+            legacy_input = _legacy_phase_input.get()
+            if legacy_input is not _NO_LEGACY_INPUT:
+                return legacy_input
+            return self.accumulated_output or self.initial_input
+        if not inputs:
+            return self.initial_input
+        if len(inputs) == 1:
+            return self.get_phase_output(inputs[0])
+        return {name: self.get_phase_output(name) for name in inputs}
+
     def set_variable(self, key: str, value: Any) -> None:
         """Set a workflow variable for inter-phase communication"""
         self.variables[key] = value
@@ -176,10 +233,55 @@ class WorkflowContext:
             "status": self.status.value,
             "phases_executed": self.phases_executed,
             "results": {name: result.to_dict() for name, result in self.results.items()},
+            "initial_input": self.initial_input,
+            "accumulated_output": self.accumulated_output,
             "variables": self.variables,
             "tags": self.tags,
+            "phase_timings": self.phase_timings,
+            "active_ms": self.active_ms,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], initial_input: Any = None) -> "WorkflowContext":
+        """
+        Rebuild a context from a to_dict() checkpoint so a workflow can be resumed.
+
+        Completed phase results are restored, so execute_workflow skips them.
+        """
+        results = {}
+        for name, raw in (data.get("results") or {}).items():
+            results[name] = PhaseResult(
+                phase_name=raw.get("phase_name", name),
+                status=PhaseStatus(raw.get("status", PhaseStatus.PENDING.value)),
+                output=raw.get("output"),
+                error=raw.get("error"),
+                duration_ms=raw.get("duration_ms", 0.0),
+                retry_count=raw.get("retry_count", 0),
+                started_at=datetime.fromisoformat(raw["started_at"])
+                if raw.get("started_at")
+                else datetime.now(timezone.utc),
+                completed_at=datetime.fromisoformat(raw["completed_at"])
+                if raw.get("completed_at")
+                else None,
+                metadata=raw.get("metadata") or {},
+            )
+
+        return cls(
+            workflow_id=data["workflow_id"],
+            request_id=data["request_id"],
+            initial_input=initial_input if initial_input is not None else data.get("initial_input"),
+            started_at=datetime.fromisoformat(data["started_at"])
+            if data.get("started_at")
+            else datetime.now(timezone.utc),
+            phases_executed=list(data.get("phases_executed") or []),
+            results=results,
+            accumulated_output=data.get("accumulated_output"),
+            variables=dict(data.get("variables") or {}),
+            tags=list(data.get("tags") or []),
+            phase_timings=dict(data.get("phase_timings") or {}),
+            active_ms=data.get("active_ms", 0.0),
+        )
+
 
 class WorkflowEngine:
     """
@@ -187,6 +289,8 @@ class WorkflowEngine:
 
     Features:
     - Phase-based execution with flexible ordering
+    - Independent phases run concurrently (see WorkflowPhase.inputs)
+    - Checkpoint hook after every phase; completed phases are skipped on resume
     - Automatic retry with exponential backoff
     - Timeout enforcement per phase
     - Status tracking and result accumulation
@@ -241,6 +345,8 @@ class WorkflowEngine:
         quality_service: Optional[Any] = None,
         error_handler: Optional[Callable] = None,
         enable_training_data: bool = True,
+        checkpoint_handler: Optional[Callable] = None,
+        max_parallel_phases: int = 4,
     ):
         """
         Initialize workflow engine.
@@ -250,21 +356,68 @@ class WorkflowEngine:
             quality_service: Optional quality service for feedback integration
             error_handler: Optional custom error handler callable
             enable_training_data: Whether to collect training data from executions
+            checkpoint_handler: Optional async callable(context) invoked after each phase
+                                finishes, used to persist resumable state
+            max_parallel_phases: Maximum number of independent phases running at once
         """
         self.database_service = database_service
         self.quality_service = quality_service
         self.error_handler = error_handler
         self.enable_training_data = enable_training_data
+        self.checkpoint_handler = checkpoint_handler
+        self.max_parallel_phases = max(1, max_parallel_phases)
         self.executed_workflows: Dict[str, WorkflowContext] = {}
 
         logger.info("WorkflowEngine initialized")
 
+    @staticmethod
+    def build_phase_dependencies(phases: List[WorkflowPhase]) -> Dict[str, Set[str]]:
+        """
+        Build the phase dependency graph.
+
+        Args:
+            phases: Phases in declaration order
+
+        Returns:
+            Mapping of phase name -> names of phases it must wait for
+
+        Raises:
+            ValueError: If a phase declares an input no earlier phase produces
+        """
+        producers: Dict[str, str] = {}
+        dependencies: Dict[str, Set[str]] = {}
+        previous: Optional[str] = None
+
+        for phase in phases:
+            if phase.inputs is None:
+                dependencies[phase.name] = {previous} if previous else set()
+            else:
+                deps = set()
+                for key in phase.inputs:
+                    if key not in producers:
+                        raise ValueError(
+                            f"Phase '{phase.name}' input '{key}' is not produced by an earlier phase"
+                        )
+                    deps.add(producers[key])
+                dependencies[phase.name] = deps
+
+            producers[phase.name] = phase.name
+            for key in phase.outputs:
+                producers[key] = phase.name
+            previous = phase.name
+
+        return dependencies
+
     async def execute_workflow(
         self, phases: List[WorkflowPhase], context: WorkflowContext
     ) -> WorkflowContext:
         """
         Execute a workflow with multiple phases.
 
+        Phases run as soon as the phases they depend on have finished. Phases that
+        already completed in ``context`` (e.g. restored from a checkpoint with
+        WorkflowContext.from_dict) are skipped.
+
         Args:
             phases: List of WorkflowPhase definitions
             context: WorkflowContext managing execution state
@@ -273,41 +426,165 @@ class WorkflowEngine:
             Updated WorkflowContext with results and status
         """
         context.status = WorkflowStatus.RUNNING
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        active_before = context.active_ms
+        dependencies = self.build_phase_dependencies(phases)
+        phases_by_name = {phase.name: phase for phase in phases}
+        order = {phase.name: index for index, phase in enumerate(phases)}
+
+        def legacy_input(phase: WorkflowPhase) -> Any:
+            # Sequential semantics: the nearest earlier phase that completed
+            for earlier in reversed(phases[: order[phase.name]]):
+                result = context.results.get(earlier.name)
+                if result is not None and result.status == PhaseStatus.COMPLETED:
+                    return result.output
+            return context.initial_input
+
+        def merge(results: List[PhaseResult]) -> None:
+            # Merge in declaration order so the shared fields end up the same
+            # whichever concurrent phase finished first
+            for result in results:
+                context.results[result.phase_name] = result
+                if result.status == PhaseStatus.COMPLETED:
+                    context.phases_executed.append(result.phase_name)
+            context.phases_executed.sort(key=lambda name: order.get(name, -1))
+            latest = [
+                phase.name
+                for phase in phases
+                if context.results.get(phase.name) is not None
+                and context.results[phase.name].status == PhaseStatus.COMPLETED
+            ]
+            if latest:
+                context.accumulated_output = context.results[latest[-1]].output
+
+        def update_current_phase() -> None:
+            active = sorted(running.values(), key=order.__getitem__)
+            context.current_phase = active[0] if active else None
+
+        def update_active_time() -> None:
+            context.active_ms = active_before + (loop.time() - start_time) * 1000
+
+        completed = {
+            name
+            for name, result in context.results.items()
+            if name in phases_by_name and result.status == PhaseStatus.COMPLETED
+        }
+        pending = [phase.name for phase in phases if phase.name not in completed]
+        finished = set(completed)
+        failed: Set[str] = set()
+        ready_at: Dict[str, float] = {}
+        running: Dict[asyncio.Task, str] = {}
+        semaphore = asyncio.Semaphore(self.max_parallel_phases)
+        stop = False
 
         logger.info(
-            "[%s] Starting workflow with %d phases: %s",
+            "[%s] Starting workflow with %d phases: %s%s",
             context.workflow_id,
             len(phases),
             ", ".join(p.name for p in phases),
+            f" (resuming, {len(completed)} already completed)" if completed else "",
         )
 
-        for phase in phases:
+        async def run_phase(phase: WorkflowPhase) -> PhaseResult:
+            async with semaphore:
+                started = loop.time()
+                timing = context.phase_timings.setdefault(phase.name, {})
+                timing["started_at"] = datetime.now(timezone.utc).isoformat()
+                timing["queued_ms"] = round((started - ready_at[phase.name]) * 1000, 2)
+                if phase.inputs is None:
+                    _legacy_phase_input.set(legacy_input(phase))
+                result = await self._execute_phase(phase, context)
+                timing["completed_at"] = datetime.now(timezone.utc).isoformat()
+                timing["duration_ms"] = round((loop.time() - started) * 1000, 2)
+                timing["status"] = result.status.value
+                timing["retry_count"] = result.retry_count
+                return result
+
+        while pending or running:
             if context.status in (WorkflowStatus.CANCELLED, WorkflowStatus.PAUSED):
                 logger.info("[%s] Workflow paused or cancelled, stopping", context.workflow_id)
-                break
-
-            phase_result = await self._execute_phase(phase, context)
-
-            # Check if we should continue
-            if phase_result.status == PhaseStatus.FAILED:
-                if phase.required:
+                stop = True
+
+            if not stop:
+                for name in list(pending):
+                    if not dependencies[name] <= finished:
+                        continue
+                    pending.remove(name)
+                    phase = phases_by_name[name]
+
+                    if phase.skip_on_error and dependencies[name] & failed:
+                        logger.info(
+                            "[%s] Skipping phase '%s' because an upstream phase failed",
+                            context.workflow_id,
+                            name,
+                        )
+                        context.results[name] = PhaseResult(
+                            phase_name=name,
+                            status=PhaseStatus.SKIPPED,
+                            completed_at=datetime.now(timezone.utc),
+                        )
+                        context.phase_timings[name] = {"status": PhaseStatus.SKIPPED.value}
+                        finished.add(name)
+                        failed.add(name)
+                        continue
+
+                    ready_at[name] = loop.time()
+                    running[asyncio.create_task(run_phase(phase))] = name
+
+            update_current_phase()
+
+            if not running:
+                if pending and not stop:
+                    # Every remaining phase waits on a phase that can no longer finish
                     logger.error(
-                        "[%s] Required phase '%s' failed, stopping workflow",
-                        context.workflow_id,
-                        phase.name,
+                        "[%s] Unschedulable phases remain: %s", context.workflow_id, pending
                     )
                     context.status = WorkflowStatus.FAILED
-                    break
+                break
+
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            done_results = [task.result() for task in done]
+            for task in done:
+                running.pop(task)
+            merge(done_results)
+            update_current_phase()
+
+            for phase_result in sorted(done_results, key=lambda r: order[r.phase_name]):
+                name = phase_result.phase_name
+                phase = phases_by_name[name]
+                finished.add(name)
+
+                if phase_result.status == PhaseStatus.COMPLETED:
+                    for key in phase.outputs:
+                        output = phase_result.output
+                        if isinstance(output, dict) and key in output:
+                            output = output[key]
+                        context.set_variable(key, output)
                 else:
-                    logger.warning(
-                        "[%s] Optional phase '%s' failed, continuing",
-                        context.workflow_id,
-                        phase.name,
-                    )
+                    failed.add(name)
+                    # Check if we should continue
+                    if phase.required:
+                        logger.error(
+                            "[%s] Required phase '%s' failed, stopping workflow",
+                            context.workflow_id,
+                            phase.name,
+                        )
+                        context.status = WorkflowStatus.FAILED
+                        stop = True
+                    else:
+                        logger.warning(
+                            "[%s] Optional phase '%s' failed, continuing",
+                            context.workflow_id,
+                            phase.name,
+                        )
+
+            update_active_time()
+            await self._checkpoint(context)
 
         # Mark as completed
-        duration_ms = (asyncio.get_event_loop().time() - start_time) * 1000
+        update_active_time()
+        duration_ms = context.active_ms
 
         if context.status == WorkflowStatus.RUNNING:
             if context.has_failures():
@@ -331,12 +608,24 @@ class WorkflowEngine:
 
         return context
 
+    async def _checkpoint(self, context: WorkflowContext) -> None:
+        """Invoke the checkpoint handler, never letting it fail the workflow"""
+        if not self.checkpoint_handler:
+            return
+        try:
+            await self.checkpoint_handler(context)
+        except Exception as e:
+            logger.warning("[%s] Checkpoint failed: %s", context.workflow_id, e)
+
     async def _execute_phase(
         self, phase: WorkflowPhase, context: WorkflowContext
     ) -> PhaseResult:
         """
         Execute a single phase with retry logic and error handling.
 
+        The result is returned rather than written to ``context``; execute_workflow
+        merges it once the phase has finished.
+
         Args:
             phase: WorkflowPhase definition
             context: WorkflowContext managing execution state
@@ -344,7 +633,6 @@ class WorkflowEngine:
         Returns:
             PhaseResult with execution details
         """
-        context.current_phase = phase.name
         result = PhaseResult(phase_name=phase.name, status=PhaseStatus.PENDING)
         start_time = asyncio.get_event_loop().time()
 
@@ -380,11 +668,6 @@ class WorkflowEngine:
                         phase.name,
                     )
 
-                    # Update context
-                    context.accumulated_output = phase_output
-                    context.phases_executed.append(phase.name)
-                    context.results[phase.name] = result
-
                     # Set duration
                     result.duration_ms = (asyncio.get_event_loop().time() - start_time) * 1000
 
@@ -435,14 +718,11 @@ class WorkflowEngine:
                                 handler_error,
                             )
 
-                    # Update context
-                    context.results[phase.name] = result
                     return result
 
         # Should not reach here, but return failed result if we do
         result.status = PhaseStatus.FAILED
         result.completed_at = datetime.now(timezone.utc)
-        context.results[phase.name] = result
         return result
 
     def pause_workflow(self, workflow_id: str) -> bool:
@@ -498,6 +778,7 @@ class WorkflowEngine:
                 "has_failures": context.has_failures(),
                 "started_at": context.started_at.isoformat(),
                 "results": {name: result.to_dict() for name, result in context.results.items()},
+                "phase_timings": context.phase_timings,
             }
 
             logger.debug(
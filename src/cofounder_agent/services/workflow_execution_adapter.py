@@ -8,9 +8,9 @@ with appropriate handlers.
 Architecture:
 1. Load CustomWorkflow from database
 2. Convert phases to WorkflowPhase objects with handlers
-3. Create WorkflowContext 
-4. Execute with WorkflowEngine
-5. Track results in workflow_executions table
+3. Create WorkflowContext (or restore it from a checkpoint when resuming)
+4. Execute with WorkflowEngine (independent phases run concurrently)
+5. Checkpoint after each phase and track results in workflow_executions table
 """
 
 import asyncio
@@ -24,7 +24,10 @@ logger = logging.getLogger(__name__)
 
 
 async def create_phase_handler(
-    phase_name: str, agent_name: str, database_service: Any
+    phase_name: str,
+    agent_name: str,
+    database_service: Any,
+    inputs: Optional[List[str]] = None,
 ) -> Callable:
     """
     Create an async handler for a workflow phase.
@@ -36,6 +39,8 @@ async def create_phase_handler(
         phase_name: Name of the phase (e.g., 'research', 'draft')
         agent_name: Name of the agent to execute (e.g., 'content_agent', 'financial_agent')
         database_service: Database service for persistence
+        inputs: Declared phase inputs; when set, the agent receives those phases'
+                outputs instead of the workflow's initial input
         
     Returns:
         Async callable handler function
@@ -71,7 +76,10 @@ async def create_phase_handler(
             )
             
             # Get phase input from context
-            phase_input = context.initial_input or {}
+            if inputs:
+                phase_input = context.get_phase_input(inputs)
+            else:
+                phase_input = context.initial_input or {}
             
             # Get and instantiate agent
             agent_instance = await _get_agent_instance_async(agent_name)
@@ -237,11 +245,42 @@ async def _execute_agent_method(
         }
 
 
+def _create_checkpoint_handler(
+    custom_workflow: Any, database_service: Any, total_phases: int
+) -> Callable:
+    """
+    Create a WorkflowEngine checkpoint handler that upserts the execution row.
+    
+    Args:
+        custom_workflow: CustomWorkflow being executed
+        database_service: DatabaseService instance
+        total_phases: Number of phases in the workflow
+        
+    Returns:
+        Async callable(context)
+    """
+    from services.custom_workflows_service import CustomWorkflowsService
+    
+    workflows_service = CustomWorkflowsService(database_service)
+    
+    async def checkpoint_handler(context: Any) -> None:
+        await workflows_service.save_execution_checkpoint(
+            execution_id=context.request_id,
+            workflow_id=str(custom_workflow.id),
+            owner_id=custom_workflow.owner_id,
+            checkpoint=context.to_dict(),
+            total_phases=total_phases,
+        )
+    
+    return checkpoint_handler
+
+
 async def execute_custom_workflow(
     custom_workflow: Any,
     input_data: Dict[str, Any],
     database_service: Any,
     queue_async: bool = True,
+    resume_execution_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Execute a custom workflow.
@@ -252,33 +291,63 @@ async def execute_custom_workflow(
         database_service: DatabaseService instance
         queue_async: If True, execute asynchronously and return execution ID
                     If False, execute synchronously and return results
+        resume_execution_id: Resume a previous execution from its last checkpoint,
+                    skipping phases that already completed. The execution must
+                    belong to this workflow and its owner.
         
     Returns:
         Execution response with execution_id, status, and progress
+        
+    Raises:
+        ValueError: resume_execution_id has no checkpoint visible to the workflow owner
     """
     
     from services.workflow_engine import WorkflowEngine, WorkflowContext, WorkflowPhase
     
     try:
-        execution_id = str(uuid.uuid4())
+        context = None
+        if resume_execution_id:
+            from services.custom_workflows_service import CustomWorkflowsService
+            
+            checkpoint = await CustomWorkflowsService(database_service).load_execution_checkpoint(
+                resume_execution_id,
+                owner_id=custom_workflow.owner_id,
+                workflow_id=str(custom_workflow.id),
+            )
+            if not checkpoint:
+                raise ValueError(
+                    f"Execution '{resume_execution_id}' has no resumable checkpoint"
+                )
+            context = WorkflowContext.from_dict(checkpoint, initial_input=input_data or None)
+            logger.info(
+                f"[{resume_execution_id}] Resuming from checkpoint "
+                f"({len(context.phases_executed)} phases already executed)"
+            )
+        
+        execution_id = resume_execution_id or str(uuid.uuid4())
         
         # Create workflow context
-        context = WorkflowContext(
-            workflow_id=str(custom_workflow.id),
-            request_id=execution_id,
-            initial_input=input_data,
-            tags=custom_workflow.tags or []
-        )
+        if context is None:
+            context = WorkflowContext(
+                workflow_id=str(custom_workflow.id),
+                request_id=execution_id,
+                initial_input=input_data,
+                tags=custom_workflow.tags or []
+            )
         
         # Convert CustomWorkflow phases to WorkflowPhase objects
         phases: List[WorkflowPhase] = []
         
         for phase_config in custom_workflow.phases:
+            if hasattr(phase_config, "model_dump"):
+                phase_config = phase_config.model_dump()
+            
             # Get handler for this phase
             handler = await create_phase_handler(
                 phase_name=phase_config.get("name"),
                 agent_name=phase_config.get("agent"),
-                database_service=database_service
+                database_service=database_service,
+                inputs=phase_config.get("inputs"),
             )
             
             # Create WorkflowPhase with configuration from custom workflow
@@ -290,7 +359,9 @@ async def execute_custom_workflow(
                 max_retries=phase_config.get("max_retries", 2),
                 skip_on_error=phase_config.get("skip_on_error", False),
                 required=phase_config.get("required", True),
-                metadata=phase_config.get("metadata", {})
+                metadata=phase_config.get("metadata", {}),
+                inputs=phase_config.get("inputs"),
+                outputs=phase_config.get("outputs") or [],
             )
             phases.append(phase)
         
@@ -322,7 +393,12 @@ async def execute_custom_workflow(
             }
         else:
             # Execute synchronously
-            engine = WorkflowEngine(database_service=database_service)
+            engine = WorkflowEngine(
+                database_service=database_service,
+                checkpoint_handler=_create_checkpoint_handler(
+                    custom_workflow, database_service, len(phases)
+                ),
+            )
             final_context = await engine.execute_workflow(phases, context)
             
             return {
@@ -337,6 +413,7 @@ async def execute_custom_workflow(
                 }
                 if final_context.results
                 else {},
+                "phase_timings": final_context.phase_timings,
                 "progress_percent": 100 if final_context.status.value == "completed" else 0,
             }
         
@@ -366,7 +443,12 @@ async def _execute_workflow_background(
         
         logger.info(f"[{context.workflow_id}] Starting background execution")
         
-        engine = WorkflowEngine(database_service=database_service)
+        engine = WorkflowEngine(
+            database_service=database_service,
+            checkpoint_handler=_create_checkpoint_handler(
+                custom_workflow, database_service, len(phases)
+            ),
+        )
         final_context = await engine.execute_workflow(phases, context)
         
         logger.info(
@@ -375,15 +457,9 @@ async def _execute_workflow_background(
         )
         
         # Calculate duration and prepare results
-        from datetime import datetime, timezone
-        
-        # Calculate duration from phase results
-        duration_ms = 0
-        if final_context.results:
-            duration_ms = int(sum(
-                r.duration_ms for r in final_context.results.values() 
-                if r.duration_ms is not None
-            ))
+        # Active time across every run; phases may overlap, so summing them
+        # over-counts, and started_at would include downtime before a resume
+        duration_ms = int(final_context.active_ms)
         
         # Convert phase results to JSON-serializable dict
         phase_results = {}
@@ -425,6 +501,7 @@ async def _execute_workflow_background(
                 "execution_id": context.request_id,
                 "workflow_name": custom_workflow.name,
                 "phase_count": total_phases_count,
+                "phase_timings": final_context.phase_timings,
             }
         )
         
@@ -10,6 +10,7 @@ Enables semantic similarity search to find relevant samples by:
 
 This service enhances content generation by automatically selecting the most
 relevant writing samples based on the task topic and user preferences.
+Scoring reads each sample's stored style profile instead of re-analyzing it.
 """
 
 import logging
@@ -68,14 +69,11 @@ class WritingSampleRAGService:
             scored_samples = []
 
             for sample in samples:
-                sample_id = sample.get("id")
                 sample_text = sample.get("content", "")
                 sample_title = sample.get("title", "")
 
-                # Get sample analysis
-                sample_data = await self.integration_svc.get_sample_for_content_generation(
-                    writing_style_id=sample_id
-                )
+                # Get sample analysis from its stored style profile (no refetch)
+                sample_data = await self.integration_svc.prepare_sample(sample)
 
                 if not sample_data:
                     continue
@@ -147,10 +145,7 @@ class WritingSampleRAGService:
             matched_samples = []
 
             for sample in samples:
-                sample_id = sample.get("id")
-                sample_data = await self.integration_svc.get_sample_for_content_generation(
-                    writing_style_id=sample_id
-                )
+                sample_data = await self.integration_svc.prepare_sample(sample)
 
                 if not sample_data:
                     continue
@@ -191,10 +186,7 @@ class WritingSampleRAGService:
             matched_samples = []
 
             for sample in samples:
-                sample_id = sample.get("id")
-                sample_data = await self.integration_svc.get_sample_for_content_generation(
-                    writing_style_id=sample_id
-                )
+                sample_data = await self.integration_svc.prepare_sample(sample)
 
                 if not sample_data:
                     continue
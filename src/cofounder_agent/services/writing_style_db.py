@@ -5,14 +5,18 @@ Handles all writing sample operations including:
 - Create, read, update, delete writing samples
 - Manage active writing sample for a user
 - Retrieve writing samples for style matching
+- Store the versioned style profile (metadata.style_profile) on create/edit
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from asyncpg import Pool
+from asyncpg import Connection, Pool
 
 from .database_mixin import DatabaseServiceMixin
+from .writing_style_profile import build_style_profile
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,18 @@ class WritingStyleDatabase(DatabaseServiceMixin):
         """
         self.pool = pool
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Connection]:
+        """
+        Yield a pooled connection inside a transaction.
+
+        Pass the connection to create_writing_samples to make several bulk
+        inserts commit (or roll back) together.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
     async def create_writing_sample(
         self,
         user_id: str,
@@ -52,6 +68,7 @@ class WritingStyleDatabase(DatabaseServiceMixin):
         """
         word_count = len(content.split())
         char_count = len(content)
+        metadata = {"style_profile": build_style_profile(content)}
 
         try:
             async with self.pool.acquire() as conn:
@@ -66,11 +83,11 @@ class WritingStyleDatabase(DatabaseServiceMixin):
                     """
                     INSERT INTO writing_samples (
                         user_id, title, description, content, 
-                        is_active, word_count, char_count, created_at, updated_at
+                        is_active, word_count, char_count, metadata, created_at, updated_at
                     )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, NOW(), NOW())
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb, NOW(), NOW())
                     RETURNING id, user_id, title, description, content, is_active, 
-                              word_count, char_count, created_at, updated_at
+                              word_count, char_count, metadata, created_at, updated_at
                     """,
                     user_id,
                     title,
@@ -79,6 +96,7 @@ class WritingStyleDatabase(DatabaseServiceMixin):
                     set_as_active,
                     word_count,
                     char_count,
+                    json.dumps(metadata),
                 )
 
                 sample_id = row.get("id") if row else None
@@ -89,6 +107,73 @@ class WritingStyleDatabase(DatabaseServiceMixin):
             logger.error("Failed to create writing sample: %s", e)
             raise
 
+    async def create_writing_samples(
+        self,
+        user_id: str,
+        samples: List[Dict[str, Any]],
+        conn: Optional[Connection] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk-insert writing samples in one statement (none are set active).
+
+        Args:
+            user_id: User ID (from auth)
+            samples: Dicts with title, content, optional description and
+                optional precomputed style_profile
+            conn: Connection to insert on (e.g. from transaction()); a pooled
+                connection is used when omitted
+
+        Returns:
+            Created sample dicts, in input order
+        """
+        if not samples:
+            return []
+        if conn is None:
+            async with self.pool.acquire() as conn:
+                return await self.create_writing_samples(user_id, samples, conn=conn)
+
+        contents = [sample["content"] for sample in samples]
+        try:
+            rows = await conn.fetch(
+                """
+                INSERT INTO writing_samples (
+                    user_id, title, description, content,
+                    is_active, word_count, char_count, metadata, created_at, updated_at
+                )
+                SELECT $1, s.title, s.description, s.content,
+                       FALSE, s.word_count, s.char_count, s.metadata::jsonb, NOW(), NOW()
+                FROM unnest(
+                    $2::text[], $3::text[], $4::text[], $5::int[], $6::int[], $7::text[]
+                ) WITH ORDINALITY
+                    AS s(title, description, content, word_count, char_count, metadata, n)
+                ORDER BY s.n
+                RETURNING id, user_id, title, description, content, is_active,
+                          word_count, char_count, metadata, created_at, updated_at
+                """,
+                user_id,
+                [sample["title"] for sample in samples],
+                [sample.get("description") or "" for sample in samples],
+                contents,
+                [len(content.split()) for content in contents],
+                [len(content) for content in contents],
+                [
+                    json.dumps(
+                        {
+                            "style_profile": sample.get("style_profile")
+                            or build_style_profile(sample["content"])
+                        }
+                    )
+                    for sample in samples
+                ],
+            )
+
+            logger.info("Created %d writing samples for user %s", len(rows), user_id)
+            return [self._format_sample(row) for row in rows]
+
+        except Exception as e:
+            logger.error("Failed to bulk create writing samples: %s", e)
+            raise
+
     async def get_writing_sample(self, sample_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific writing sample by ID.
@@ -260,6 +345,12 @@ class WritingStyleDatabase(DatabaseServiceMixin):
                 param_count += 1
                 updates.append(f"char_count = ${param_count}")
                 params.append(char_count)
+                # Re-analyze only when the text changes
+                param_count += 1
+                updates.append(
+                    f"metadata = COALESCE(metadata, '{{}}'::jsonb) || ${param_count}::jsonb"
+                )
+                params.append(json.dumps({"style_profile": build_style_profile(content)}))
 
             if not updates:
                 raise ValueError("No fields to update")
@@ -289,6 +380,32 @@ class WritingStyleDatabase(DatabaseServiceMixin):
             logger.error("Failed to update writing sample: %s", e)
             raise
 
+    async def save_style_profile(self, sample_id: str, profile: Dict[str, Any]) -> None:
+        """
+        Store a (re)computed style profile without touching updated_at.
+
+        Used to backfill samples created before profiles existed or analyzed by
+        an older analyzer version.
+
+        Args:
+            sample_id: Sample ID
+            profile: Profile from build_style_profile()
+        """
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE writing_samples
+                    SET metadata = COALESCE(metadata, '{}'::jsonb) || $2::jsonb
+                    WHERE id = $1
+                    """,
+                    sample_id,
+                    json.dumps({"style_profile": profile}),
+                )
+        except Exception as e:
+            logger.error("Failed to save style profile: %s", e)
+            raise
+
     async def delete_writing_sample(self, sample_id: str, user_id: str) -> bool:
         """
         Delete a writing sample.
@@ -330,8 +447,6 @@ class WritingStyleDatabase(DatabaseServiceMixin):
         # Get metadata - ensure it's a dict
         metadata = row.get("metadata", {})
         if isinstance(metadata, str):
-            import json
-
             try:
                 metadata = json.loads(metadata)
             except (json.JSONDecodeError, ValueError):
@@ -4,7 +4,7 @@ Writing Style Integration Service - Phase 3.3
 Provides enhanced integration of writing samples into content generation pipeline.
 Handles:
 1. Sample retrieval by ID
-2. Sample analysis (tone, style, characteristics)
+2. Sample analysis (tone, style, characteristics), read from the stored style profile
 3. Prompt injection for creative agent
 4. Style matching verification
 
@@ -13,10 +13,14 @@ and content generation (Phase 3.3).
 """
 
 import logging
-import re
 from typing import Any, Dict, Optional
 
 from services.database_service import DatabaseService
+from services.writing_style_profile import (
+    analyze_writing_style,
+    build_style_profile,
+    is_profile_current,
+)
 from services.writing_style_service import WritingStyleService
 
 logger = logging.getLogger(__name__)
@@ -68,10 +72,9 @@ class WritingStyleIntegrationService:
                 )
                 return None
 
-            # Enhance with detailed analysis
-            sample_text = sample_data.get("sample_text", "")
-            if sample_text:
-                analysis = self._analyze_sample(sample_text)
+            # Enhance with detailed analysis (stored profile, rebuilt only if stale)
+            if sample_data.get("sample_text"):
+                analysis = await self._get_analysis(sample_data)
                 sample_data["analysis"] = analysis
                 logger.info(
                     f"✅ Sample analysis: tone={analysis.get('detected_tone')}, "
@@ -85,6 +88,43 @@ class WritingStyleIntegrationService:
             logger.error(f"Error getting sample for content generation: {e}")
             return None
 
+    async def prepare_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build generation data with analysis for an already-fetched sample row.
+
+        Args:
+            sample: Writing sample dict from database
+
+        Returns:
+            Dict with sample data and analysis
+        """
+        sample_data = self.writing_style_service.build_generation_data(sample)
+        sample_data["analysis"] = await self._get_analysis(sample_data)
+        return sample_data
+
+    async def _get_analysis(self, sample_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the stored style analysis, rebuilding it only when stale.
+
+        A profile is stale when the sample text changed or the analyzer version
+        moved on; the rebuilt profile is written back so it is computed once.
+        """
+        sample_text = sample_data.get("sample_text") or ""
+        profile = sample_data.get("style_profile")
+        if is_profile_current(profile, sample_text):
+            return profile["analysis"]
+
+        profile = build_style_profile(sample_text)
+        sample_data["style_profile"] = profile
+        sample_id = sample_data.get("sample_id")
+        if sample_id is not None:
+            try:
+                await self.db.writing_style.save_style_profile(sample_id, profile)
+                logger.info(f"🔄 Rebuilt style profile for writing sample {sample_id}")
+            except Exception as e:
+                logger.warning(f"Could not store style profile for sample {sample_id}: {e}")
+        return profile["analysis"]
+
     def _analyze_sample(self, sample_text: str) -> Dict[str, Any]:
         """
         Analyze writing sample characteristics.
@@ -95,134 +135,7 @@ class WritingStyleIntegrationService:
         Returns:
             Dict with analysis results including tone, style, characteristics
         """
-        if not sample_text:
-            return {}
-
-        # Calculate basic metrics
-        words = sample_text.split()
-        sentences = re.split(r"[.!?]+", sample_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        paragraphs = [p.strip() for p in sample_text.split("\n\n") if p.strip()]
-
-        word_count = len(words)
-        sentence_count = len(sentences)
-        paragraph_count = len(paragraphs)
-
-        avg_word_length = sum(len(w) for w in words) / word_count if words else 0
-        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
-        avg_paragraph_length = word_count / paragraph_count if paragraph_count > 0 else 0
-
-        # Detect tone markers
-        formal_markers = [
-            "therefore",
-            "moreover",
-            "furthermore",
-            "consequently",
-            "however",
-            "noteworthy",
-            "significant",
-            "comprehensive",
-            "utilize",
-            "facilitate",
-        ]
-        casual_markers = [
-            "like",
-            "really",
-            "pretty",
-            "super",
-            "awesome",
-            "cool",
-            "actually",
-            "basically",
-            "literally",
-            "totally",
-            "gonna",
-            "wanna",
-        ]
-        authoritative_markers = [
-            "research shows",
-            "studies demonstrate",
-            "evidence suggests",
-            "proven",
-            "based on",
-            "according to",
-            "documented",
-            "established",
-        ]
-        conversational_markers = [
-            "you",
-            "we",
-            "let us",
-            "consider",
-            "imagine",
-            "think about",
-            "here is",
-        ]
-
-        text_lower = sample_text.lower()
-        formal_count = sum(1 for marker in formal_markers if marker in text_lower)
-        casual_count = sum(1 for marker in casual_markers if marker in text_lower)
-        authoritative_count = sum(1 for marker in authoritative_markers if marker in text_lower)
-        conversational_count = sum(1 for marker in conversational_markers if marker in text_lower)
-
-        # Determine dominant tone
-        tone_scores = {
-            "formal": formal_count,
-            "casual": casual_count,
-            "authoritative": authoritative_count,
-            "conversational": conversational_count,
-        }
-        detected_tone = (
-            max(tone_scores, key=tone_scores.get) if max(tone_scores.values()) > 0 else "neutral"
-        )
-
-        # Detect style characteristics
-        has_lists = "- " in sample_text or "* " in sample_text or "1." in sample_text
-        has_code_blocks = "```" in sample_text or "`" in sample_text
-        has_headings = sample_text.count("#") > 0
-        has_quotes = '"' in sample_text or "'" in sample_text
-        has_examples = (
-            "example" in text_lower or "for instance" in text_lower or "such as" in text_lower
-        )
-
-        # Determine style
-        style_markers = {
-            "technical": has_code_blocks or has_headings,
-            "narrative": has_examples and not has_code_blocks,
-            "listicle": has_lists,
-            "educational": has_headings and has_examples,
-            "thought-leadership": has_quotes or authoritative_count > casual_count,
-        }
-        detected_style = (
-            max(style_markers, key=style_markers.get) if any(style_markers.values()) else "general"
-        )
-
-        # Calculate vocabulary complexity
-        unique_words = len(set(words))
-        vocabulary_diversity = unique_words / word_count if word_count > 0 else 0
-
-        # Get most common word types for pattern matching
-        punctuation_marks = Counter([c for c in sample_text if c in ".,!?;:"])
-
-        return {
-            "detected_tone": detected_tone,
-            "detected_style": detected_style,
-            "tone_scores": tone_scores,
-            "word_count": word_count,
-            "sentence_count": sentence_count,
-            "paragraph_count": paragraph_count,
-            "avg_word_length": round(avg_word_length, 2),
-            "avg_sentence_length": round(avg_sentence_length, 2),
-            "avg_paragraph_length": round(avg_paragraph_length, 2),
-            "vocabulary_diversity": round(vocabulary_diversity, 2),
-            "style_characteristics": {
-                "has_lists": has_lists,
-                "has_code_blocks": has_code_blocks,
-                "has_headings": has_headings,
-                "has_quotes": has_quotes,
-                "has_examples": has_examples,
-            },
-        }
+        return analyze_writing_style(sample_text)
 
     async def generate_creative_agent_prompt_injection(
         self, writing_style_id: Optional[str], user_id: Optional[str], base_prompt: str
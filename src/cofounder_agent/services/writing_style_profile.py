@@ -0,0 +1,200 @@
+"""
+Writing Style Profile
+
+Single analyzer for writing samples (tone, style markers, vocabulary and
+sentence metrics). The analysis is computed once when a sample is uploaded or
+edited and stored on the writing_samples row under metadata["style_profile"]:
+
+    {
+        "version": STYLE_PROFILE_VERSION,
+        "content_hash": "<sha256 of the sample text>",
+        "computed_at": "<ISO timestamp>",
+        "analysis": {...analyze_writing_style() output...},
+    }
+
+Generation (WritingStyleIntegrationService), RAG scoring
+(WritingSampleRAGService) and StyleConsistencyValidator read the stored
+analysis. It is only recomputed when the sample text changes (content hash)
+or STYLE_PROFILE_VERSION is bumped after an analyzer change.
+"""
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Bump whenever analyze_writing_style() output changes so stored profiles are rebuilt
+STYLE_PROFILE_VERSION = 1
+
+FORMAL_MARKERS = [
+    "therefore",
+    "moreover",
+    "furthermore",
+    "consequently",
+    "however",
+    "noteworthy",
+    "significant",
+    "comprehensive",
+    "utilize",
+    "facilitate",
+]
+CASUAL_MARKERS = [
+    "like",
+    "really",
+    "pretty",
+    "super",
+    "awesome",
+    "cool",
+    "actually",
+    "basically",
+    "literally",
+    "totally",
+    "gonna",
+    "wanna",
+]
+AUTHORITATIVE_MARKERS = [
+    "research shows",
+    "studies demonstrate",
+    "evidence suggests",
+    "proven",
+    "based on",
+    "according to",
+    "documented",
+    "established",
+]
+CONVERSATIONAL_MARKERS = [
+    "you",
+    "we",
+    "let us",
+    "consider",
+    "imagine",
+    "think about",
+    "here is",
+]
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the sample text, used to detect edits"""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def analyze_writing_style(sample_text: str) -> Dict[str, Any]:
+    """
+    Analyze writing sample characteristics.
+
+    Args:
+        sample_text: The writing sample text
+
+    Returns:
+        Dict with analysis results including tone, style, characteristics
+    """
+    if not sample_text:
+        return {}
+
+    # Calculate basic metrics
+    words = sample_text.split()
+    sentences = re.split(r"[.!?]+", sample_text)
+    sentences = [s.strip() for s in sentences if s.strip()]
+    paragraphs = [p.strip() for p in sample_text.split("\n\n") if p.strip()]
+
+    word_count = len(words)
+    sentence_count = len(sentences)
+    paragraph_count = len(paragraphs)
+
+    avg_word_length = sum(len(w) for w in words) / word_count if words else 0
+    avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
+    avg_paragraph_length = word_count / paragraph_count if paragraph_count > 0 else 0
+
+    # Detect tone markers
+    text_lower = sample_text.lower()
+    formal_count = sum(1 for marker in FORMAL_MARKERS if marker in text_lower)
+    casual_count = sum(1 for marker in CASUAL_MARKERS if marker in text_lower)
+    authoritative_count = sum(1 for marker in AUTHORITATIVE_MARKERS if marker in text_lower)
+    conversational_count = sum(1 for marker in CONVERSATIONAL_MARKERS if marker in text_lower)
+
+    # Determine dominant tone
+    tone_scores = {
+        "formal": formal_count,
+        "casual": casual_count,
+        "authoritative": authoritative_count,
+        "conversational": conversational_count,
+    }
+    detected_tone = (
+        max(tone_scores, key=tone_scores.get) if max(tone_scores.values()) > 0 else "neutral"
+    )
+
+    # Detect style characteristics
+    has_lists = "- " in sample_text or "* " in sample_text or "1." in sample_text
+    has_code_blocks = "```" in sample_text or "`" in sample_text
+    has_headings = sample_text.count("#") > 0
+    has_quotes = '"' in sample_text or "'" in sample_text
+    has_examples = "example" in text_lower or "for instance" in text_lower or "such as" in text_lower
+
+    # Determine style
+    style_markers = {
+        "technical": has_code_blocks or has_headings,
+        "narrative": has_examples and not has_code_blocks,
+        "listicle": has_lists,
+        "educational": has_headings and has_examples,
+        "thought-leadership": has_quotes or authoritative_count > casual_count,
+    }
+    detected_style = (
+        max(style_markers, key=style_markers.get) if any(style_markers.values()) else "general"
+    )
+
+    # Calculate vocabulary complexity
+    unique_words = len(set(words))
+    vocabulary_diversity = unique_words / word_count if word_count > 0 else 0
+
+    return {
+        "detected_tone": detected_tone,
+        "detected_style": detected_style,
+        "tone_scores": tone_scores,
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "paragraph_count": paragraph_count,
+        "avg_word_length": round(avg_word_length, 2),
+        "avg_sentence_length": round(avg_sentence_length, 2),
+        "avg_paragraph_length": round(avg_paragraph_length, 2),
+        "vocabulary_diversity": round(vocabulary_diversity, 2),
+        "style_characteristics": {
+            "has_lists": has_lists,
+            "has_code_blocks": has_code_blocks,
+            "has_headings": has_headings,
+            "has_quotes": has_quotes,
+            "has_examples": has_examples,
+        },
+    }
+
+
+def build_style_profile(sample_text: str) -> Dict[str, Any]:
+    """Analyze sample_text into a versioned profile for metadata["style_profile"]"""
+    return {
+        "version": STYLE_PROFILE_VERSION,
+        "content_hash": content_hash(sample_text),
+        "computed_at": datetime.now(timezone.utc).isoformat(),
+        "analysis": analyze_writing_style(sample_text),
+    }
+
+
+def is_profile_current(profile: Optional[Dict[str, Any]], sample_text: str) -> bool:
+    """True if profile was built by this analyzer version from exactly sample_text"""
+    return (
+        isinstance(profile, dict)
+        and profile.get("version") == STYLE_PROFILE_VERSION
+        and profile.get("content_hash") == content_hash(sample_text)
+        and isinstance(profile.get("analysis"), dict)
+    )
+
+
+def stored_style_profile(sample: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The style profile stored on a writing sample row, if any"""
+    metadata = sample.get("metadata") or {}
+    return metadata.get("style_profile") if isinstance(metadata, dict) else None
+
+
+def profile_analysis(profile_or_analysis: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Accept either a stored profile or a bare analysis dict and return the analysis"""
+    if isinstance(profile_or_analysis, dict) and "content_hash" in profile_or_analysis:
+        return profile_or_analysis.get("analysis") or {}
+    return profile_or_analysis
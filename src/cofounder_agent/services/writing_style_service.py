@@ -9,6 +9,7 @@ import logging
 from typing import Any, Dict, Optional
 
 from services.database_service import DatabaseService
+from services.writing_style_profile import stored_style_profile
 
 logger = logging.getLogger(__name__)
 
@@ -67,14 +68,7 @@ class WritingStyleService:
             if not sample:
                 return None
 
-            return {
-                "sample_id": sample.get("id"),
-                "sample_title": sample.get("title"),
-                "sample_text": sample.get("content"),
-                "writing_style_guidance": self._format_sample_for_prompt(sample),
-                "word_count": sample.get("word_count"),
-                "description": sample.get("description"),
-            }
+            return self.build_generation_data(sample)
 
         except Exception as e:
             logger.error(f"Error preparing writing sample for generation: {e}")
@@ -99,19 +93,33 @@ class WritingStyleService:
                 logger.warning(f"Writing sample not found: {writing_style_id}")
                 return None
 
-            return {
-                "sample_id": sample.get("id"),
-                "sample_title": sample.get("title"),
-                "sample_text": sample.get("content"),
-                "writing_style_guidance": self._format_sample_for_prompt(sample),
-                "word_count": sample.get("word_count"),
-                "description": sample.get("description"),
-            }
+            return self.build_generation_data(sample)
 
         except Exception as e:
             logger.error(f"Error retrieving specific writing sample {writing_style_id}: {e}")
             return None
 
+    @classmethod
+    def build_generation_data(cls, sample: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Structure a writing sample row for use during content generation.
+
+        Args:
+            sample: Writing sample dict from database
+
+        Returns:
+            Dict with sample info, prompt guidance and the stored style profile
+        """
+        return {
+            "sample_id": sample.get("id"),
+            "sample_title": sample.get("title"),
+            "sample_text": sample.get("content"),
+            "writing_style_guidance": cls._format_sample_for_prompt(sample),
+            "word_count": sample.get("word_count"),
+            "description": sample.get("description"),
+            "style_profile": stored_style_profile(sample),
+        }
+
     @staticmethod
     def _format_sample_for_prompt(sample: Dict[str, Any]) -> str:
         """
@@ -40,7 +40,7 @@ class ResearchTask(PureTask):
         from src.cofounder_agent.services.model_consolidation_service import (
             get_model_consolidation_service,
         )
-        from src.cofounder_agent.services.serper_client import SerperClient
+        from services.serper_client import get_serper_client
 
         model_service = get_model_consolidation_service()
 
@@ -48,7 +48,7 @@ class ResearchTask(PureTask):
         depth = input_data.get("depth", "medium")
 
         # 1. Perform Web Search (ASYNC)
-        serper = SerperClient()
+        serper = get_serper_client()
         search_results = await serper.search(topic, num=10)
 
         # Extract organic results
@@ -75,6 +75,7 @@ class ResearchTask(PureTask):
             prompt=prompt,
             temperature=0.3,  # Factual, precise
             max_tokens=1500,
+            task_type="research",
         )
         response = response_obj.text
 
@@ -175,6 +176,7 @@ Research Context:
             prompt=prompt,
             temperature=0.7,  # Creative
             max_tokens=int(length * 1.2),  # Buffer for tokens
+            task_type="creative",
         )
         response = response_obj.text
 
@@ -249,7 +251,11 @@ class QATask(PureTask):
 
         # Query LLM
         response_obj = await model_service.generate(
-            prompt=prompt, temperature=0.2, max_tokens=1000, response_format="json"  # Analytical
+            prompt=prompt,
+            temperature=0.2,  # Analytical
+            max_tokens=1000,
+            response_format="json",
+            task_type="qa",
         )
 
         # Parse response
@@ -328,7 +334,11 @@ class ImageSelectionTask(PureTask):
         )
 
         response_obj = await model_service.generate(
-            prompt=prompt, temperature=0.5, max_tokens=300, response_format="json"
+            prompt=prompt,
+            temperature=0.5,
+            max_tokens=300,
+            response_format="json",
+            task_type="image_search_queries",
         )
 
         # Parse search queries
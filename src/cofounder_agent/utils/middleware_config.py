@@ -6,6 +6,7 @@ Configures:
 - Input validation and payload inspection
 - Rate limiting (slowapi)
 - Security headers
+- Request latency metrics (METRICS_ENABLED, default: true)
 
 All middleware can be optionally enabled/disabled and configured via environment variables.
 """
@@ -36,9 +37,10 @@ class MiddlewareConfig:
 
         Order of execution (first to last):
         1. CORS middleware (handles cross-origin requests)
-        2. Rate limiting (protects against abuse)
-        3. Input validation (sanitizes requests)
-        4. Payload inspection (logs payloads for debugging)
+        2. Request metrics (times everything below, including validation)
+        3. Rate limiting (protects against abuse)
+        4. Input validation (sanitizes requests)
+        5. Payload inspection (logs payloads for debugging)
 
         Args:
             app: FastAPI application instance
@@ -54,6 +56,7 @@ class MiddlewareConfig:
         # CORS should execute FIRST, so it's added LAST
         self._setup_input_validation(app)
         self._setup_rate_limiting(app)
+        self._setup_metrics(app)
         self._setup_cors(app)
 
         logger.info("✅ All middleware registered successfully")
@@ -82,6 +85,25 @@ class MiddlewareConfig:
         except ImportError as e:
             logger.warning(f"⚠️  Input validation middleware not available: {e}")
 
+    def _setup_metrics(self, app: FastAPI) -> None:
+        """
+        Setup request latency metrics (http_request_duration_seconds).
+
+        Exposed in Prometheus format at GET /api/metrics/prometheus.
+        Disable with METRICS_ENABLED=false.
+        """
+        if os.getenv("METRICS_ENABLED", "true").lower() != "true":
+            logger.info("Request metrics middleware disabled (METRICS_ENABLED=false)")
+            return
+
+        from middleware.metrics_middleware import MetricsMiddleware
+        from services.logger_config import register_logging_metrics
+        from services.metrics_service import get_metrics_registry
+
+        app.add_middleware(MetricsMiddleware)
+        register_logging_metrics(get_metrics_registry())
+        logger.info("✅ Request metrics middleware initialized")
+
     def _setup_cors(self, app: FastAPI) -> None:
         """
         Setup CORS (Cross-Origin Resource Sharing) middleware.
@@ -233,6 +233,17 @@ def register_all_routes(
         logger.error(f" metrics_router failed: {e}")
         status["metrics_router"] = False
 
+    try:
+        # ===== PROFILING (loop watchdog, sampling profiles) =====
+        from routes.profiling_routes import profiling_router
+
+        app.include_router(profiling_router)
+        logger.info(" profiling_router registered")
+        status["profiling_router"] = True
+    except Exception as e:
+        logger.error(f" profiling_router failed: {e}")
+        status["profiling_router"] = False
+
     try:
         # ===== ANALYTICS - KPI Dashboard =====
         from routes.analytics_routes import analytics_router
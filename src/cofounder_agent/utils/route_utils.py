@@ -199,18 +199,13 @@ def get_task_executor_dependency() -> Any:
 def get_enhanced_status_change_service() -> Any:
     """FastAPI dependency for enhanced status change service."""
     from services.enhanced_status_change_service import EnhancedStatusChangeService
-    from services.tasks_db import TasksDatabase
 
-    # Get the database pool from the generic database service
     db = _services.get_database()
     if db is None:
         raise RuntimeError("Database service not initialized")
 
-    # Create TasksDatabase with the pool
-    task_db = TasksDatabase(db.pool)
-
-    # Create and return EnhancedStatusChangeService
-    return EnhancedStatusChangeService(task_db)
+    # Use the shared tasks module so status history goes through its write-behind buffer
+    return EnhancedStatusChangeService(db.tasks)
 
 
 def get_intelligent_orchestrator_dependency() -> Any:
@@ -56,6 +56,9 @@ class StartupManager:
             logger.info("🚀 Starting Glad Labs AI Co-Founder application...")
             logger.info(f"  Environment: {os.getenv('ENVIRONMENT', 'production')}")
 
+            # Step 0: Event-loop watchdog (opt-in) so slow startup steps are caught too
+            await self._start_loop_watchdog()
+
             # Step 1: Initialize PostgreSQL database (MANDATORY)
             await self._initialize_database()
 
@@ -65,9 +68,18 @@ class StartupManager:
             # Step 3: Setup Redis cache
             await self._setup_redis_cache()
 
+            # Step 3b: Configure command queue backend
+            await self._setup_command_queue()
+
+            # Step 3c: Start progress fan-out (Redis pub/sub when available)
+            await self._setup_progress_broadcaster()
+
             # Step 4: Initialize model consolidation
             await self._initialize_model_consolidation()
 
+            # Step 4b: Initialize model router and restore its telemetry
+            await self._initialize_model_router()
+
             # Step 5: Initialize workflow history service
             await self._initialize_workflow_history()
 
@@ -89,6 +101,9 @@ class StartupManager:
             # Step 11: Initialize agent registry
             await self._initialize_agent_registry()
 
+            # Step 11b: Build pooled content agents before the first request
+            await self._warm_agent_pool()
+
             # Step 12: Initialize custom workflows service
             await self._initialize_custom_workflows_service()
 
@@ -198,6 +213,10 @@ class StartupManager:
                 logger.info(
                     "   [OK] Redis cache initialized (query performance optimization enabled)"
                 )
+                # Share Pexels/Serper/SearXNG responses across replicas
+                from services.external_api_cache import get_external_api_cache
+
+                get_external_api_cache().attach_redis(self.redis_cache)
             else:
                 logger.info(
                     "   [INFO] Redis cache not available (system will continue without caching)"
@@ -205,6 +224,26 @@ class StartupManager:
         except Exception as e:
             logger.warning(f"   [WARNING] Redis cache error: {str(e)} (continuing without cache)")
 
+    async def _setup_command_queue(self) -> None:
+        """Configure the command queue backend (COMMAND_QUEUE_BACKEND=memory|postgres)"""
+        logger.info("  [INFO] Configuring command queue...")
+        try:
+            from services.command_queue import configure_command_queue
+
+            queue = configure_command_queue(self.database_service)
+            logger.info(f"   [OK] Command queue backend: {queue.backend.name}")
+        except Exception as e:
+            logger.warning(f"   [WARNING] Command queue setup failed: {str(e)} (using in-memory queue)")
+
+    async def _setup_progress_broadcaster(self) -> None:
+        """Start WebSocket progress fan-out across replicas"""
+        try:
+            from services.progress_service import get_progress_broadcaster
+
+            await get_progress_broadcaster().start(self.redis_cache)
+        except Exception as e:
+            logger.warning(f"   [WARNING] Progress broadcaster setup failed: {str(e)}")
+
     async def _initialize_model_consolidation(self) -> None:
         """Initialize unified model consolidation service"""
         logger.info("  [INFO] Initializing unified model consolidation service...")
@@ -220,6 +259,28 @@ class StartupManager:
             logger.error(f"   {error_msg}", exc_info=True)
             # Don't fail startup - models are optional
 
+    async def _start_loop_watchdog(self) -> None:
+        """Start the event-loop stall detector when LOOP_WATCHDOG_ENABLED=true"""
+        if os.getenv("LOOP_WATCHDOG_ENABLED", "false").lower() != "true":
+            return
+        try:
+            from services.loop_monitor import start_loop_watchdog
+
+            await start_loop_watchdog()
+        except Exception as e:
+            logger.warning(f"   [WARNING] Event loop watchdog failed to start: {str(e)}")
+
+    async def _initialize_model_router(self) -> None:
+        """Initialize the global model router and restore persisted routing telemetry"""
+        try:
+            from services.model_router import initialize_model_router
+
+            router = initialize_model_router()
+            if self.database_service and await router.load_stats(self.database_service):
+                logger.info("   [OK] Model router telemetry restored")
+        except Exception as e:
+            logger.warning(f"   [WARNING] Model router initialization failed: {str(e)}")
+
     async def _initialize_workflow_history(self) -> None:
         """Initialize workflow history service (Phase 6)"""
         logger.info("  📊 Initializing workflow history service...")
@@ -354,6 +415,26 @@ class StartupManager:
             logger.warning(f"[WARNING] Agent registry initialization failed (non-critical): {type(e).__name__}: {e}")
             # Continue anyway - system can function without agent registry
 
+    async def _warm_agent_pool(self) -> None:
+        """Pre-build the content pipeline agents and their draft/refine LLM clients (AGENT_POOL_WARMUP=false to skip)"""
+        if os.getenv("AGENT_POOL_WARMUP", "true").lower() != "true":
+            return
+        try:
+            from routes.task_routes import get_model_for_phase
+            from services.unified_orchestrator import UnifiedOrchestrator
+
+            # Requests key creative_agent by their draft/refine model; warm each configured one
+            creative_models = [
+                get_model_for_phase(phase, {}, quality)
+                for quality in ("fast", "balanced", "quality")
+                for phase in ("draft", "refine")
+            ]
+            warmed = UnifiedOrchestrator().warm_agent_pool(creative_models=creative_models)
+            ready = [name for name, ok in warmed.items() if ok]
+            logger.info(f"  Agent pool warmed: {', '.join(ready) or 'none'}")
+        except Exception as e:
+            logger.warning(f"[WARNING] Agent pool warmup failed (non-critical): {type(e).__name__}: {e}")
+
     async def _initialize_custom_workflows_service(self) -> None:
         """Initialize custom workflows service for workflow builder"""
         logger.info("  🔧 Initializing custom workflows service...")
@@ -472,6 +553,48 @@ class StartupManager:
             except Exception as e:
                 logger.error(f"   Error stopping task executor: {e}", exc_info=True)
 
+            # Stop the event-loop watchdog (no-op when it was never started)
+            try:
+                from services.loop_monitor import stop_loop_watchdog
+
+                await stop_loop_watchdog()
+            except Exception as e:
+                logger.error(f"   Error stopping loop watchdog: {e}", exc_info=True)
+
+            # Close pooled agents (publishing agent holds a CMS connection pool)
+            try:
+                from services.agent_pool import get_agent_pool
+
+                await get_agent_pool().close()
+            except Exception as e:
+                logger.error(f"   Error closing agent pool: {e}", exc_info=True)
+
+            # Persist routing telemetry while the database is still open
+            try:
+                from services.model_router import get_model_router
+
+                router = get_model_router()
+                if router and self.database_service:
+                    await router.save_stats(self.database_service, force=True)
+            except Exception as e:
+                logger.error(f"   Error saving model router stats: {e}", exc_info=True)
+
+            # Close the shared Serper HTTP pool
+            try:
+                from services.serper_client import close_serper_client
+
+                await close_serper_client()
+            except Exception as e:
+                logger.error(f"   Error closing Serper client: {e}", exc_info=True)
+
+            # Stop progress fan-out before its Redis connection goes away
+            try:
+                from services.progress_service import get_progress_broadcaster
+
+                await get_progress_broadcaster().stop()
+            except Exception as e:
+                logger.error(f"   Error stopping progress broadcaster: {e}", exc_info=True)
+
             # Close Redis connection
             if self.redis_cache:
                 try:
@@ -0,0 +1,141 @@
+"""
+Tests for the per-process agent pool and its use by UnifiedOrchestrator.
+"""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+from services.agent_pool import AgentPool
+from services.unified_orchestrator import UnifiedOrchestrator
+
+
+class FakeAgent:
+    def __init__(self, llm_client=None):
+        self.llm_client = llm_client
+        self.close = AsyncMock()
+
+
+def _pool():
+    return AgentPool(llm_client_factory=lambda model: f"client:{model or 'default'}")
+
+
+class TestAgentPool:
+    """Keyed reuse, hit rates and lifecycle"""
+
+    def test_instances_are_reused_per_name_and_model(self):
+        pool = _pool()
+        built = []
+
+        def factory():
+            built.append(1)
+            return FakeAgent()
+
+        first = pool.get_agent("creative_agent", factory, "gpt-4")
+        assert pool.get_agent("creative_agent", factory, "gpt-4") is first
+        assert pool.get_agent("creative_agent", factory, None) is not first
+        assert pool.get_llm_client("gpt-4") is pool.get_llm_client("gpt-4") == "client:gpt-4"
+
+        stats = pool.get_stats()
+        assert len(built) == 2
+        assert stats["agents"] == ["creative_agent:default", "creative_agent:gpt-4"]
+        assert stats["agent_lookups"] == {"hits": 1, "misses": 2, "hit_rate": 0.3333}
+        assert stats["llm_client_lookups"]["hit_rate"] == 0.5
+
+    def test_concurrent_first_requests_build_once(self):
+        pool = _pool()
+        built = []
+        start = threading.Barrier(8)
+
+        def factory():
+            built.append(1)
+            return FakeAgent()
+
+        def worker():
+            start.wait()
+            pool.get_agent("research_agent", factory)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+
+    def test_failed_construction_is_not_cached(self):
+        pool = _pool()
+
+        def broken():
+            raise ValueError("SERPER_API_KEY is not set")
+
+        assert pool.warm([("research_agent", broken, None), ("qa_agent", FakeAgent, None)]) == {
+            "research_agent": False,
+            "qa_agent": True,
+        }
+        assert pool.get_stats()["agents"] == ["qa_agent:default"]
+
+    async def test_hooks_and_close(self):
+        created, closed = [], []
+        pool = AgentPool(
+            llm_client_factory=lambda model: "client",
+            on_create=lambda key, instance: created.append(key),
+        )
+        agent = pool.get_agent("publishing_agent", FakeAgent)
+        pool.get_llm_client()
+
+        await pool.close()
+
+        assert created == [("publishing_agent", None), ("llm_client", None)]
+        agent.close.assert_awaited_once()
+        assert pool.get_stats()["agents"] == []
+
+        pool.on_close = lambda key, instance: closed.append(key)
+        pool.get_agent("qa_agent", FakeAgent)
+        pool.evict("qa_agent")
+        assert closed == [("qa_agent", None)]
+
+
+class TestOrchestratorPooling:
+    """UnifiedOrchestrator hands out pooled agents"""
+
+    def test_agents_and_llm_clients_come_from_the_pool(self):
+        pool = _pool()
+        orchestrator = UnifiedOrchestrator(agent_pool=pool)
+        orchestrator._create_agent_instance = MagicMock(side_effect=lambda name, **kw: FakeAgent(**kw))
+
+        draft = orchestrator._get_agent_instance("creative_agent", "gpt-4")
+        again = UnifiedOrchestrator(agent_pool=pool)._get_agent_instance("creative_agent", "gpt-4")
+        research = orchestrator._get_agent_instance("research_agent")
+
+        assert again is draft
+        assert draft.llm_client == "client:gpt-4"
+        assert research.llm_client is None
+        assert orchestrator._create_agent_instance.call_count == 2
+        assert orchestrator._get_system_info()["agent_pool"]["agent_lookups"]["hits"] == 1
+
+    def test_warmup_covers_the_draft_and_refine_models(self):
+        pool = _pool()
+        orchestrator = UnifiedOrchestrator(agent_pool=pool)
+        orchestrator._create_agent_instance = MagicMock(side_effect=lambda name, **kw: FakeAgent(**kw))
+
+        warmed = orchestrator.warm_agent_pool(
+            creative_models=["ollama/mistral", "gpt-4", "ollama/mistral"]
+        )
+        misses = pool.get_stats()["agent_lookups"]["misses"]
+        drafter = orchestrator._get_agent_instance("creative_agent", "ollama/mistral")
+        refiner = orchestrator._get_agent_instance("creative_agent", "gpt-4")
+
+        assert warmed["creative_agent:gpt-4"] and warmed["creative_agent:ollama/mistral"]
+        assert pool.get_stats()["agent_lookups"]["misses"] == misses
+        assert drafter.llm_client == "client:ollama/mistral"
+        assert refiner.llm_client == "client:gpt-4"
+
+    def test_explicit_kwargs_bypass_the_pool(self):
+        pool = _pool()
+        orchestrator = UnifiedOrchestrator(agent_pool=pool)
+        orchestrator._create_agent_instance = MagicMock(side_effect=lambda name, **kw: FakeAgent(**kw))
+
+        agent = orchestrator._get_agent_instance("creative_agent", llm_client="custom")
+
+        assert agent.llm_client == "custom"
+        assert pool.get_stats()["agents"] == []
@@ -0,0 +1,157 @@
+"""
+Tests for the write-behind BatchWriter used for cost_logs and
+task_status_history inserts.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.batch_writer import BatchWriter
+
+
+def _pool():
+    conn = AsyncMock()
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pool, conn
+
+
+def _copied_rows(conn):
+    rows = []
+    for call in conn.copy_records_to_table.await_args_list:
+        rows.extend(call.kwargs["records"])
+    return rows
+
+
+class TestBatchWriterFlushing:
+    """Size, time and shutdown flush triggers"""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self):
+        pool, conn = _pool()
+        writer = BatchWriter(pool, "cost_logs", ["a", "b"], max_batch=3, flush_interval=60)
+        await writer.start()
+
+        for i in range(3):
+            await writer.submit((i, "x"))
+        await asyncio.sleep(0.05)
+
+        assert _copied_rows(conn) == [(0, "x"), (1, "x"), (2, "x")]
+        call = conn.copy_records_to_table.await_args
+        assert call.args == ("cost_logs",)
+        assert call.kwargs["columns"] == ["a", "b"]
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_interval(self):
+        pool, conn = _pool()
+        writer = BatchWriter(pool, "t", ["a"], max_batch=100, flush_interval=0.05)
+        await writer.start()
+
+        await writer.submit((1,))
+        assert conn.copy_records_to_table.await_count == 0
+        await asyncio.sleep(0.15)
+
+        assert _copied_rows(conn) == [(1,)]
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_rows(self):
+        pool, conn = _pool()
+        writer = BatchWriter(pool, "t", ["a"], max_batch=100, flush_interval=60)
+        await writer.start()
+        for i in range(5):
+            await writer.submit((i,))
+
+        await writer.stop()
+
+        assert len(_copied_rows(conn)) == 5
+        assert writer.pending == 0
+        assert writer.running is False
+        assert writer.get_stats()["written"] == 5
+
+
+class TestBatchWriterFailures:
+    """COPY fallback and backpressure"""
+
+    @pytest.mark.asyncio
+    async def test_copy_failure_falls_back_to_row_inserts(self):
+        pool, conn = _pool()
+        conn.copy_records_to_table.side_effect = Exception("fk violation")
+        conn.execute.side_effect = [None, Exception("bad row"), None]
+        writer = BatchWriter(pool, "t", ["a", "b"], max_batch=10)
+
+        for i in range(3):
+            await writer.submit((i, i))
+        written = await writer.flush()
+
+        assert written == 2
+        stats = writer.get_stats()
+        assert stats["copy_fallbacks"] == 1
+        assert stats["failed"] == 1
+        assert conn.execute.await_args_list[0].args == ("INSERT INTO t (a, b) VALUES ($1, $2)", 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_rows_are_kept_when_no_connection(self):
+        pool, _ = _pool()
+        pool.acquire.return_value.__aenter__.side_effect = ConnectionError("pool closed")
+        writer = BatchWriter(pool, "t", ["a"])
+        await writer.submit((1,))
+
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+        assert writer.pending == 1
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_applies_backpressure(self):
+        pool, conn = _pool()
+        writer = BatchWriter(pool, "t", ["a"], max_batch=100, max_pending=2)
+
+        for i in range(3):
+            await writer.submit((i,))
+
+        stats = writer.get_stats()
+        assert stats["backpressure_waits"] == 1
+        assert stats["written"] == 2
+        assert writer.pending == 1
+        assert stats["max_pending_seen"] == 2
+
+
+class TestStatusHistoryWriteBehind:
+    """TasksDatabase.log_status_change through the buffer"""
+
+    @pytest.mark.asyncio
+    async def test_buffered_and_flushed_before_read(self):
+        from services.tasks_db import TasksDatabase
+
+        pool, conn = _pool()
+        conn.fetch.return_value = []
+        db = TasksDatabase(pool)
+        await db.create_status_history_writer(max_batch=100, flush_interval=60).start()
+
+        result = await db.log_status_change(
+            "task-1", "pending", "in_progress", reason="start", changed_by="alice"
+        )
+
+        assert result is True
+        conn.execute.assert_not_called()
+        await db.get_status_history("task-1")
+        row = _copied_rows(conn)[0]
+        assert row[:4] == ("task-1", "pending", "in_progress", "start")
+        assert '"changed_by": "alice"' in row[4]
+        await db.status_history_writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_inserts_immediately(self):
+        from services.tasks_db import TasksDatabase
+
+        pool, conn = _pool()
+        db = TasksDatabase(pool)
+        await db.create_status_history_writer().start()
+
+        assert await db.log_status_change("task-1", "pending", "failed", wait=True) is True
+        conn.execute.assert_awaited_once()
+        await db.status_history_writer.stop()
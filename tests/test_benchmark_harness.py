@@ -0,0 +1,94 @@
+"""
+Tests for the benchmark harness: percentiles, load generation and
+baseline comparison.
+"""
+
+import pytest
+
+from benchmarks.harness import Thresholds, compare_results, percentile, run_load
+
+
+def _doc(**overrides):
+    record = {
+        "scenario": "cms_list_posts",
+        "concurrency": 16,
+        "throughput_rps": 500.0,
+        "p50_ms": 20.0,
+        "p95_ms": 40.0,
+        "p99_ms": 60.0,
+        "rss_peak_mb": 200.0,
+        "errors": 0,
+    }
+    record.update(overrides)
+    return {"results": [record]}
+
+
+class TestPercentile:
+    """Interpolated percentiles"""
+
+    def test_empty(self):
+        assert percentile([], 95) == 0.0
+
+    def test_interpolates(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 50) == pytest.approx(50.5)
+        assert percentile(samples, 99) == pytest.approx(99.01)
+        assert percentile(samples, 100) == 100
+
+
+class TestRunLoad:
+    """Load generation"""
+
+    @pytest.mark.asyncio
+    async def test_counts_requests_and_errors(self):
+        calls = []
+
+        async def operation(i):
+            calls.append(i)
+            if i == 3:
+                raise ValueError("boom")
+
+        result = await run_load("demo", operation, concurrency=4, requests=10)
+
+        assert sorted(calls) == list(range(10))
+        assert result.errors == 1
+        assert result.error_samples == ["ValueError: boom"]
+        assert result.key == "demo@4"
+        assert result.p50_ms <= result.p95_ms <= result.p99_ms
+
+    @pytest.mark.asyncio
+    async def test_warmup_calls_are_not_measured(self):
+        calls = []
+
+        async def operation(i):
+            calls.append(i)
+
+        result = await run_load("demo", operation, concurrency=1, requests=3, warmup=2)
+
+        assert calls[:2] == [-1, -2]
+        assert result.requests == 3
+
+
+class TestCompareResults:
+    """Regression detection against a baseline"""
+
+    def test_no_change_no_regressions(self):
+        assert compare_results(_doc(), _doc(), Thresholds()) == []
+
+    def test_latency_regression(self):
+        regressions = compare_results(_doc(), _doc(p95_ms=60.0), Thresholds())
+        assert [(r["metric"], r["change"]) for r in regressions] == [("p95_ms", 0.5)]
+
+    def test_small_absolute_latency_change_ignored(self):
+        base = _doc(p50_ms=1.0, p95_ms=2.0, p99_ms=3.0)
+        current = _doc(p50_ms=2.0, p95_ms=3.5, p99_ms=4.5)
+        assert compare_results(base, current, Thresholds()) == []
+
+    def test_throughput_rss_and_errors(self):
+        current = _doc(throughput_rps=300.0, rss_peak_mb=300.0, errors=2)
+        metrics = {r["metric"] for r in compare_results(_doc(), current, Thresholds())}
+        assert metrics == {"throughput_rps", "rss_peak_mb", "errors"}
+
+    def test_unmatched_records_are_skipped(self):
+        current = _doc(concurrency=64, p95_ms=1000.0)
+        assert compare_results(_doc(), current, Thresholds()) == []
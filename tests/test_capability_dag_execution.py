@@ -0,0 +1,163 @@
+"""Unit tests for dependency-graph scheduling in CapabilityTaskExecutor."""
+
+import asyncio
+
+import pytest
+
+from services.capability_registry import CapabilityRegistry, InputSchema, OutputSchema
+from services.capability_task_executor import (
+    CapabilityStep,
+    CapabilityTaskDefinition,
+    CapabilityTaskExecutor,
+)
+
+
+def _register(registry, name, delay=0.05, cost_tier="cheap", fail=False, tracker=None):
+    async def capability(**inputs):
+        if tracker is not None:
+            tracker["running"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["running"])
+        try:
+            await asyncio.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{name} exploded")
+            return {"from": name, "inputs": inputs}
+        finally:
+            if tracker is not None:
+                tracker["running"] -= 1
+
+    registry.register_function(
+        func=capability,
+        name=name,
+        description=name,
+        input_schema=InputSchema(),
+        output_schema=OutputSchema(),
+        cost_tier=cost_tier,
+    )
+
+
+def _diamond_task():
+    return CapabilityTaskDefinition(
+        name="diamond",
+        steps=[
+            CapabilityStep("research", {"topic": "AI"}, "research_data", order=0),
+            CapabilityStep("draft", {"research": "$research_data"}, "draft", order=1),
+            CapabilityStep("images", {"research": "$research_data"}, "images", order=2),
+            CapabilityStep(
+                "publish", {"content": "$draft", "images": "$images"}, "post", order=3
+            ),
+        ],
+    )
+
+
+class TestDependencyGraph:
+    """Tests for dependency inference."""
+
+    def test_references_become_edges(self):
+        executor = CapabilityTaskExecutor(registry=CapabilityRegistry())
+        steps = _diamond_task().steps
+        assert executor.build_dependency_graph(steps) == {0: set(), 1: {0}, 2: {0}, 3: {1, 2}}
+
+    def test_rewrite_of_a_key_waits_for_its_readers(self):
+        executor = CapabilityTaskExecutor(registry=CapabilityRegistry())
+        steps = [
+            CapabilityStep("draft", {}, "text", order=0),
+            CapabilityStep("summarize", {"text": "$text"}, "summary", order=1),
+            CapabilityStep("polish", {}, "text", order=2),
+            CapabilityStep("publish", {"text": "$text"}, "post", order=3),
+        ]
+        assert executor.build_dependency_graph(steps) == {0: set(), 1: {0}, 2: {0, 1}, 3: {2}}
+
+    def test_unknown_reference_is_literal(self):
+        executor = CapabilityTaskExecutor(registry=CapabilityRegistry())
+        steps = [CapabilityStep("a", {"price": "$5 off"}, "a_out")]
+        assert executor.build_dependency_graph(steps) == {0: set()}
+
+
+class TestDagExecution:
+    """Tests for execute_parallel_steps without explicit groups."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        registry = CapabilityRegistry()
+        for name in ("research", "draft", "images", "publish"):
+            _register(registry, name, delay=0.1)
+        executor = CapabilityTaskExecutor(registry=registry)
+
+        result = await executor.execute_parallel_steps(_diamond_task())
+
+        assert result.status == "completed"
+        assert result.final_outputs["post"]["inputs"]["images"]["from"] == "images"
+        # Three levels of 100ms each, not four serial steps
+        assert result.total_duration_ms < 380
+        assert result.critical_path[0] == 0 and result.critical_path[-1] == 3
+        assert len(result.critical_path) == 3
+
+    @pytest.mark.asyncio
+    async def test_cost_tier_limit_is_respected(self):
+        registry = CapabilityRegistry()
+        tracker = {"running": 0, "peak": 0}
+        for name in ("a", "b", "c"):
+            _register(registry, name, cost_tier="premium", tracker=tracker)
+        executor = CapabilityTaskExecutor(registry=registry, cost_tier_limits={"premium": 1})
+        task = CapabilityTaskDefinition(
+            steps=[CapabilityStep(name, {}, f"{name}_out", order=i) for i, name in enumerate("abc")]
+        )
+
+        result = await executor.execute_parallel_steps(task)
+
+        assert result.status == "completed"
+        assert tracker["peak"] == 1
+
+    @pytest.mark.asyncio
+    async def test_step_waiting_on_its_tier_does_not_hold_a_global_slot(self):
+        registry = CapabilityRegistry()
+        finished = []
+
+        def register(name, delay, cost_tier):
+            async def capability(**inputs):
+                await asyncio.sleep(delay)
+                finished.append(name)
+                return {}
+
+            registry.register_function(
+                func=capability,
+                name=name,
+                description=name,
+                input_schema=InputSchema(),
+                output_schema=OutputSchema(),
+                cost_tier=cost_tier,
+            )
+
+        register("premium_a", 0.1, "premium")
+        register("premium_b", 0.1, "premium")
+        register("cheap", 0.01, "cheap")
+        executor = CapabilityTaskExecutor(
+            registry=registry, max_concurrency=2, cost_tier_limits={"premium": 1}
+        )
+        task = CapabilityTaskDefinition(
+            steps=[
+                CapabilityStep(name, {}, f"{name}_out", order=i)
+                for i, name in enumerate(["premium_a", "premium_b", "cheap"])
+            ]
+        )
+
+        result = await executor.execute_parallel_steps(task)
+
+        assert result.status == "completed"
+        # premium_b queues on its tier without taking the second global slot
+        assert finished == ["cheap", "premium_a", "premium_b"]
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_dependent_steps(self):
+        registry = CapabilityRegistry()
+        _register(registry, "research", fail=True)
+        for name in ("draft", "images", "publish"):
+            _register(registry, name)
+        executor = CapabilityTaskExecutor(registry=registry)
+
+        result = await executor.execute_parallel_steps(_diamond_task())
+
+        assert result.status == "failed"
+        assert "research exploded" in result.error
+        assert [r.step_index for r in result.step_results] == [0]
@@ -0,0 +1,188 @@
+"""Unit tests for the capability composer plan cache."""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from services.capability_registry import CapabilityRegistry, InputSchema, OutputSchema
+from services.capability_natural_language_composer import (
+    CapabilityNaturalLanguageComposer,
+    CompositionPlanCache,
+)
+
+
+PLAN = {
+    "name": "Blog pipeline",
+    "description": "Research and write",
+    "steps": [
+        {"capability_name": "research", "inputs": {"topic": "AI"}, "output_key": "research_data"},
+        {
+            "capability_name": "generate_content",
+            "inputs": {"research": "$research_data"},
+            "output_key": "blog_content",
+        },
+    ],
+}
+
+
+def _registry() -> CapabilityRegistry:
+    registry = CapabilityRegistry()
+    for name in ("research", "generate_content"):
+        registry.register_function(
+            func=lambda **kwargs: kwargs,
+            name=name,
+            description=f"{name} capability",
+            input_schema=InputSchema(),
+            output_schema=OutputSchema(),
+        )
+    return registry
+
+
+@pytest.fixture
+def composer():
+    composer = CapabilityNaturalLanguageComposer(model_router=object())
+    composer.registry = _registry()
+    composer._call_llm = AsyncMock(return_value=json.dumps(PLAN))
+    return composer
+
+
+LONG_REQUEST = (
+    "Research and write a detailed blog post about the latest AI trends "
+    "in healthcare with images for {}"
+)
+
+
+class TestCompositionPlanCache:
+    """Tests for CompositionPlanCache lookups and invalidation."""
+
+    def test_normalize_ignores_case_and_punctuation(self):
+        assert CompositionPlanCache.normalize("  Write a Blog-Post!! ") == "write a blog post"
+
+    def test_normalize_keeps_language_names_distinct(self):
+        keys = {
+            CompositionPlanCache.normalize(f"Write a {lang} tutorial.")
+            for lang in ("C++", "C#", "C")
+        }
+        assert keys == {"write a c++ tutorial", "write a c# tutorial", "write a c tutorial"}
+
+    def test_language_swap_rebinds_instead_of_exact_hit(self):
+        cache = CompositionPlanCache()
+        plan = {
+            "name": "C++ tutorial",
+            "steps": [
+                {
+                    "capability_name": "generate_content",
+                    "inputs": {"topic": "Memory management in C++"},
+                    "output_key": "tutorial",
+                }
+            ],
+        }
+        cache.put(LONG_REQUEST.format("C++ developers"), 1, plan, 0.9)
+
+        hit = cache.get(LONG_REQUEST.format("C# developers"), 1)
+
+        assert hit is not None and hit[1] < 1.0
+        assert hit[0].task_dict["name"] == "C# tutorial"
+        assert hit[0].task_dict["steps"][0]["inputs"]["topic"] == "Memory management in C#"
+
+    def test_exact_and_near_duplicate_hits(self):
+        cache = CompositionPlanCache()
+        cache.put("Write a blog post about AI trends in 2025", 1, PLAN, 0.9)
+
+        assert cache.get("write a blog post about AI trends in 2025.", 1)[1] == 1.0
+        near = cache.get("Please write a blog post about AI trends in 2025", 1)
+        assert near is not None and near[1] >= cache.similarity_threshold
+        assert cache.get("Write a blog post about cats", 1) is None
+
+    def test_near_duplicate_rebinds_literal_inputs(self):
+        cache = CompositionPlanCache()
+        plan = {
+            "name": "Blog for doctors",
+            "description": "Research and write",
+            "steps": [
+                {
+                    "capability_name": "research",
+                    "inputs": {"topic": "AI trends in healthcare for Doctors"},
+                    "output_key": "research_data",
+                },
+                {
+                    "capability_name": "generate_content",
+                    "inputs": {"research": "$research_data", "audience": "doctors"},
+                    "output_key": "blog_content",
+                },
+            ],
+        }
+        cache.put(LONG_REQUEST.format("doctors"), 1, plan, 0.9)
+
+        hit = cache.get(LONG_REQUEST.format("nurses"), 1)
+
+        assert hit is not None and hit[1] < 1.0
+        task_dict = hit[0].task_dict
+        assert "doctor" not in json.dumps(task_dict).lower()
+        assert task_dict["name"] == "Blog for nurses"
+        assert task_dict["steps"][0]["inputs"]["topic"] == "AI trends in healthcare for Nurses"
+        assert task_dict["steps"][1]["inputs"] == {"research": "$research_data", "audience": "nurses"}
+        # The cached template itself is untouched
+        assert cache.get(LONG_REQUEST.format("doctors"), 1)[0].task_dict == plan
+
+    def test_near_duplicate_with_unbindable_topic_misses(self):
+        cache = CompositionPlanCache()
+        # The plan paraphrases the audience, so "doctors" cannot be re-bound
+        plan = {
+            "name": "Clinical blog",
+            "steps": [
+                {
+                    "capability_name": "research",
+                    "inputs": {"topic": "AI trends for physicians"},
+                    "output_key": "research_data",
+                }
+            ],
+        }
+        cache.put(LONG_REQUEST.format("doctors"), 1, plan, 0.9)
+
+        assert cache.get(LONG_REQUEST.format("nurses"), 1) is None
+        assert cache.get(LONG_REQUEST.format("doctors").replace("in healthcare", "in modern healthcare"), 1) is None
+        assert cache.metrics["rebind_failures"] == 2
+
+    def test_registry_version_change_invalidates(self):
+        cache = CompositionPlanCache()
+        cache.put("Write a blog post", 1, PLAN, 0.9)
+        assert cache.get("Write a blog post", 2) is None
+
+    def test_lru_eviction(self):
+        cache = CompositionPlanCache(max_entries=2)
+        cache.put("first request", 1, PLAN, 0.9)
+        cache.put("second request", 1, PLAN, 0.9)
+        cache.put("third request", 1, PLAN, 0.9)
+        assert cache.get_metrics()["entries"] == 2
+        assert cache.metrics["evictions"] == 1
+
+
+class TestComposerCaching:
+    """Tests for plan reuse and registry-context memoization in the composer."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_skips_llm(self, composer):
+        first = await composer.compose_from_request("Write a blog post about AI")
+        second = await composer.compose_from_request("write a blog post about AI!")
+
+        assert first.success and not first.cache_hit
+        assert second.success and second.cache_hit
+        assert composer._call_llm.await_count == 1
+        # Each composition gets its own task definition
+        assert first.task_definition.id != second.task_definition.id
+
+    def test_registry_context_memoized_until_register(self, composer):
+        first = composer._get_registry_context()
+        assert composer._get_registry_context() is first
+
+        composer.registry.register_function(
+            func=lambda **kwargs: kwargs,
+            name="publish",
+            description="publish capability",
+            input_schema=InputSchema(),
+            output_schema=OutputSchema(),
+        )
+        refreshed = composer._get_registry_context()
+        assert "## publish" in refreshed
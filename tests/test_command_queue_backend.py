@@ -0,0 +1,282 @@
+"""
+Tests for CommandQueue delivery semantics on the in-memory backend:
+leases/visibility timeouts, batch dequeue, consumer groups, dead-lettering,
+replay and stats.
+"""
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.command_queue import (
+    Command,
+    CommandQueue,
+    CommandStatus,
+    InMemoryCommandBackend,
+    PostgresCommandBackend,
+    StaleCommandError,
+    _parse_ts,
+)
+
+
+def _expire_lease(command: Command) -> None:
+    command.visible_at = (datetime.utcnow() - timedelta(seconds=1)).isoformat()
+
+
+class TestDequeue:
+    """Leasing commands to consumers"""
+
+    @pytest.mark.asyncio
+    async def test_dequeue_leases_command(self):
+        queue = CommandQueue(visibility_timeout=30)
+        await queue.enqueue(Command(agent_type="content", action="generate"))
+
+        cmd = await queue.dequeue(timeout=0, consumer="worker-1")
+
+        assert cmd.status == CommandStatus.PROCESSING
+        assert cmd.claimed_by == "worker-1"
+        assert datetime.fromisoformat(cmd.visible_at) > datetime.utcnow()
+        assert await queue.dequeue(timeout=0) is None
+
+    @pytest.mark.asyncio
+    async def test_dequeue_timeout_returns_none(self):
+        queue = CommandQueue(poll_interval=0.01)
+        assert await queue.dequeue(timeout=0.05) is None
+
+    @pytest.mark.asyncio
+    async def test_dequeue_wakes_on_enqueue(self):
+        queue = CommandQueue(poll_interval=10)
+        waiter = asyncio.create_task(queue.dequeue(timeout=5))
+        await asyncio.sleep(0)
+        await queue.enqueue(Command(agent_type="content", action="generate"))
+
+        cmd = await asyncio.wait_for(waiter, timeout=1)
+        assert cmd is not None
+
+    @pytest.mark.asyncio
+    async def test_batch_dequeue_is_fifo_and_bounded(self):
+        queue = CommandQueue()
+        ids = [await queue.enqueue(Command(agent_type="content", action=str(i))) for i in range(5)]
+
+        batch = await queue.dequeue_batch(max_count=3, timeout=0)
+
+        assert [c.id for c in batch] == ids[:3]
+        assert len(await queue.dequeue_batch(max_count=10, timeout=0)) == 2
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_filters_agent_type(self):
+        queue = CommandQueue()
+        await queue.enqueue(Command(agent_type="content", action="a"))
+        financial_id = await queue.enqueue(Command(agent_type="financial", action="b"))
+
+        batch = await queue.dequeue_batch(timeout=0, agent_types=["financial"])
+
+        assert [c.id for c in batch] == [financial_id]
+        # The skipped content command is still deliverable
+        remaining = await queue.dequeue_batch(timeout=0)
+        assert [c.agent_type for c in remaining] == ["content"]
+
+
+class TestVisibilityTimeout:
+    """Redelivery and dead-lettering of expired leases"""
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_redelivered(self):
+        queue = CommandQueue()
+        await queue.enqueue(Command(agent_type="content", action="generate"))
+        first = await queue.dequeue(timeout=0, consumer="worker-1")
+        _expire_lease(first)
+
+        second = await queue.dequeue(timeout=0, consumer="worker-2")
+
+        assert second.id == first.id
+        assert second.claimed_by == "worker-2"
+        assert second.retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lease_expiry_dead_letters_after_max_retries(self):
+        queue = CommandQueue()
+        await queue.enqueue(Command(agent_type="content", action="generate", max_retries=1))
+
+        cmd = await queue.dequeue(timeout=0)
+        _expire_lease(cmd)
+        cmd = await queue.dequeue(timeout=0)
+        _expire_lease(cmd)
+
+        assert await queue.dequeue(timeout=0) is None
+        assert (await queue.get_command(cmd.id)).status == CommandStatus.DEAD_LETTER
+
+
+class TestFailureHandling:
+    """Retries, dead-lettering and replay"""
+
+    @pytest.mark.asyncio
+    async def test_fail_retries_then_dead_letters(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x", max_retries=1))
+
+        await queue.dequeue(timeout=0)
+        cmd = await queue.fail_command(cmd_id, "boom")
+        assert cmd.status == CommandStatus.PENDING
+
+        await queue.dequeue(timeout=0)
+        cmd = await queue.fail_command(cmd_id, "boom again")
+        assert cmd.status == CommandStatus.DEAD_LETTER
+
+    @pytest.mark.asyncio
+    async def test_fail_without_retry_marks_failed(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x"))
+
+        cmd = await queue.fail_command(cmd_id, "bad input", retry=False)
+
+        assert cmd.status == CommandStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_hides_command(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x"))
+        await queue.dequeue(timeout=0)
+
+        await queue.fail_command(cmd_id, "transient", retry_delay=60)
+
+        assert await queue.dequeue(timeout=0) is None
+
+    @pytest.mark.asyncio
+    async def test_replay_dead_letter(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x", max_retries=0))
+        await queue.dequeue(timeout=0)
+        await queue.fail_command(cmd_id, "boom")
+
+        cmd = await queue.replay_command(cmd_id)
+
+        assert cmd.status == CommandStatus.PENDING
+        assert cmd.retry_count == 0
+        assert (await queue.dequeue(timeout=0)).id == cmd_id
+
+    @pytest.mark.asyncio
+    async def test_replay_ignores_active_command(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x"))
+
+        cmd = await queue.replay_command(cmd_id)
+
+        assert cmd.status == CommandStatus.PENDING
+        assert await queue.replay_command("missing") is None
+
+
+class TestLeaseFencing:
+    """Only the current lease holder can finish a command"""
+
+    @pytest.mark.asyncio
+    async def test_expired_claimer_cannot_complete_after_redelivery(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x"))
+        stale = await queue.dequeue(timeout=0, consumer="worker-1")
+        _expire_lease(stale)
+        await queue.dequeue(timeout=0, consumer="worker-2")
+
+        with pytest.raises(StaleCommandError):
+            await queue.complete_command(cmd_id, {"by": "worker-1"}, consumer="worker-1")
+        with pytest.raises(StaleCommandError):
+            await queue.fail_command(cmd_id, "late", consumer="worker-1")
+
+        cmd = await queue.get_command(cmd_id)
+        assert cmd.status == CommandStatus.PROCESSING and cmd.claimed_by == "worker-2"
+        done = await queue.complete_command(cmd_id, {"by": "worker-2"}, consumer="worker-2")
+        assert done.status == CommandStatus.COMPLETED and done.result == {"by": "worker-2"}
+
+    @pytest.mark.asyncio
+    async def test_write_is_rejected_if_command_changed_after_read(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x"))
+        await queue.dequeue(timeout=0, consumer="worker-1")
+        read = queue.backend.get
+
+        async def get_then_redeliver(command_id):
+            # The lease expires and is reclaimed between the read and the write
+            command = await read(command_id)
+            _expire_lease(queue.backend.commands[command_id])
+            await queue.backend.claim(1, "worker-2", 30)
+            return command
+
+        queue.backend.get = get_then_redeliver
+        with pytest.raises(StaleCommandError):
+            await queue.complete_command(cmd_id, {"by": "worker-1"}, consumer="worker-1")
+
+        assert queue.backend.commands[cmd_id].claimed_by == "worker-2"
+        assert queue.backend.commands[cmd_id].result is None
+
+    @pytest.mark.asyncio
+    async def test_finished_commands_cannot_be_completed_or_failed_again(self):
+        queue = CommandQueue()
+        cmd_id = await queue.enqueue(Command(agent_type="content", action="x"))
+        await queue.dequeue(timeout=0)
+        await queue.complete_command(cmd_id, {"ok": True})
+
+        with pytest.raises(StaleCommandError):
+            await queue.complete_command(cmd_id, {"ok": False})
+        with pytest.raises(StaleCommandError):
+            await queue.fail_command(cmd_id, "late")
+        assert (await queue.get_command(cmd_id)).result == {"ok": True}
+
+
+    @pytest.mark.asyncio
+    async def test_postgres_update_is_conditional_on_the_observed_lease(self):
+        pool = MagicMock()
+        pool.fetchval = AsyncMock(return_value=None)
+        backend = PostgresCommandBackend(pool)
+        expected = Command(
+            status=CommandStatus.PROCESSING,
+            claimed_by="worker-1",
+            started_at=datetime.utcnow().isoformat(),
+        )
+
+        applied = await backend.update(replace(expected, status=CommandStatus.COMPLETED), expected)
+
+        query, *args = pool.fetchval.await_args.args
+        assert not applied
+        assert "claimed_by IS NOT DISTINCT FROM $13" in query and "RETURNING id" in query
+        assert args[10:] == [True, "processing", "worker-1", _parse_ts(expected.started_at)]
+
+
+class TestStats:
+    """Backlog and throughput metrics"""
+
+    @pytest.mark.asyncio
+    async def test_stats_report_backlog_and_throughput(self):
+        queue = CommandQueue(backend=InMemoryCommandBackend())
+        for i in range(3):
+            await queue.enqueue(Command(agent_type="content", action=str(i)))
+        cmd = await queue.dequeue(timeout=0)
+        await queue.complete_command(cmd.id, {"ok": True})
+        await queue.dequeue(timeout=0)
+
+        stats = await queue.get_stats()
+
+        assert stats["backend"] == "memory"
+        assert stats["total_commands"] == 3
+        assert stats["pending_commands"] == 1
+        assert stats["in_flight_commands"] == 1
+        assert stats["dead_letter_commands"] == 0
+        assert stats["oldest_pending_age_seconds"] >= 0
+        assert stats["throughput_per_minute"]["enqueued"] == 3
+        assert stats["throughput_per_minute"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_and_clear_old_commands(self):
+        queue = CommandQueue()
+        for i in range(4):
+            await queue.enqueue(Command(agent_type="content", action=str(i)))
+        cmd = await queue.dequeue(timeout=0)
+        await queue.complete_command(cmd.id, {})
+        cmd.updated_at = (datetime.utcnow() - timedelta(hours=48)).isoformat()
+
+        assert len(await queue.list_commands(limit=2)) == 2
+        assert await queue.count_commands(CommandStatus.PENDING) == 3
+        assert await queue.clear_old_commands(max_age_hours=24) == 1
+        assert await queue.count_commands() == 3
@@ -0,0 +1,380 @@
+"""
+Tests for bulk newsletter delivery in EmailPublisher: pooled SMTP
+connections, rate limiting, retries, resume checkpoints and an end-to-end
+run against an aiosmtpd sink.
+"""
+
+import os
+import socket
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+import pytest
+
+from services.email_publisher import (
+    CampaignCheckpoint,
+    CampaignMessage,
+    EmailPublisher,
+    SendRateLimiter,
+    rate_limit_for_host,
+)
+
+SMTP_ENV = {
+    "SMTP_HOST": "smtp.example.com",
+    "SMTP_PORT": "587",
+    "SMTP_USER": "news@example.com",
+    "SMTP_PASSWORD": "secret",
+    "EMAIL_FROM": "news@example.com",
+    "SMTP_RATE_LIMIT": "0",  # Unlimited unless a test says otherwise
+    "SMTP_POOL_SIZE": "2",
+}
+
+
+class FakeSMTP:
+    """In-memory aiosmtplib.SMTP stand-in; behaviour is scripted per recipient"""
+
+    instances = []
+    failures = {}  # email -> list of exceptions raised on successive attempts
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_connected = False
+        self.logins = 0
+        self.sent = []
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def login(self, user, password):
+        self.logins += 1
+
+    async def noop(self):
+        return None
+
+    async def quit(self):
+        self.is_connected = False
+
+    async def sendmail(self, sender, recipients, message):
+        scripted = FakeSMTP.failures.get(recipients[0])
+        if scripted:
+            raise scripted.pop(0)
+        self.sent.append((sender, recipients, message))
+
+    async def send_message(self, message, sender=None, recipients=None):
+        self.sent.append((sender, recipients, message))
+
+
+def _publisher(**env):
+    FakeSMTP.instances = []
+    FakeSMTP.failures = {}
+    with patch.dict(os.environ, {**SMTP_ENV, **env}):
+        return EmailPublisher(smtp_factory=FakeSMTP)
+
+
+def _message():
+    return CampaignMessage(
+        subject="Weekly digest",
+        text="Hello readers",
+        html="<html><body><p>Hello readers</p></body></html>",
+        from_address="news@example.com",
+        from_name="Glad Labs",
+        preview_text="This week in AI",
+        list_id="weekly.example.com",
+        unsubscribe_url="https://example.com/unsubscribe",
+    )
+
+
+async def _recipients(count, start=1):
+    for i in range(start, start + count):
+        yield i, f"reader{i}@example.org"
+
+
+def _sent_messages():
+    return [m for smtp in FakeSMTP.instances for m in smtp.sent]
+
+
+class TestCampaignMessage:
+    """Render once, personalize headers per recipient"""
+
+    def test_per_recipient_headers(self):
+        payload = _message().for_recipient("a+b@example.org").decode()
+
+        assert payload.startswith("To: a+b@example.org\r\n")
+        assert "List-Unsubscribe: <https://example.com/unsubscribe?email=a%2Bb%40example.org>" in payload
+        assert "List-Unsubscribe-Post: List-Unsubscribe=One-Click" in payload
+        assert "List-Id: <weekly.example.com>" in payload
+        assert "This week in AI" in payload
+        assert payload.count("Message-ID:") == 1
+
+    def test_message_ids_are_unique(self):
+        message = _message()
+        first = message.for_recipient("a@example.org")
+        second = message.for_recipient("b@example.org")
+
+        assert first.split(b"\r\n")[1] != second.split(b"\r\n")[1]
+
+    def test_header_injection_is_rejected(self):
+        with pytest.raises(ValueError):
+            _message().for_recipient("a@example.org\r\nBcc: victim@example.org")
+
+
+class TestRateLimiting:
+    """Per-provider token bucket"""
+
+    def test_provider_defaults_and_override(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert rate_limit_for_host("smtp.office365.com") == 0.5
+            assert rate_limit_for_host("email-smtp.us-east-1.amazonaws.com") == 14.0
+            assert rate_limit_for_host("mail.internal") == 50.0
+        with patch.dict(os.environ, {"SMTP_RATE_LIMIT": "7"}):
+            assert rate_limit_for_host("smtp.gmail.com") == 7.0
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_spaces_sends(self):
+        limiter = SendRateLimiter(rate=50, burst=1)
+        started = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+
+        assert time.monotonic() - started >= 0.09
+        assert limiter.waited_seconds > 0
+
+
+class TestCampaignCheckpoint:
+    """Watermark only advances past contiguous completions"""
+
+    def test_out_of_order_completion(self):
+        checkpoint = CampaignCheckpoint(start_after=10)
+        for subscriber_id in (11, 12, 15, 20):
+            checkpoint.dispatched(subscriber_id)
+
+        checkpoint.done(12)
+        checkpoint.done(15)
+        assert checkpoint.watermark == 10
+
+        checkpoint.done(11)
+        assert checkpoint.watermark == 15
+
+        checkpoint.done(20)
+        assert checkpoint.watermark == 20
+
+
+class TestPooledDelivery:
+    """Connection reuse, retries and permanent failures"""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self):
+        publisher = _publisher()
+
+        counts = await publisher.deliver(_message(), _recipients(40))
+
+        assert counts == {"sent": 40, "failed": 0, "bounced": 0}
+        assert len(FakeSMTP.instances) <= 2
+        assert sum(smtp.logins for smtp in FakeSMTP.instances) == len(FakeSMTP.instances)
+        assert FakeSMTP.instances[0].kwargs["start_tls"] is True
+        assert publisher.pool.stats["reuses"] >= 38
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_recycle_after_max_messages(self):
+        publisher = _publisher(SMTP_POOL_SIZE="1")
+        publisher.pool.max_messages = 5
+
+        await publisher.deliver(_message(), _recipients(12))
+
+        assert len(FakeSMTP.instances) == 3
+        assert publisher.pool.stats["recycled"] == 2
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried_on_new_connection(self):
+        publisher = _publisher()
+        FakeSMTP.failures["reader2@example.org"] = [
+            aiosmtplib.SMTPServerDisconnected("connection lost"),
+            aiosmtplib.SMTPResponseException(421, "try again later"),
+        ]
+        results = []
+
+        with patch("services.email_publisher.asyncio.sleep", new=AsyncMock()):
+            counts = await publisher.deliver(
+                _message(), _recipients(3), on_result=AsyncMock(side_effect=results.append)
+            )
+
+        assert counts["sent"] == 3
+        retried = next(r for r in results if r.subscriber_id == 2)
+        assert retried.attempts == 3
+        assert publisher.pool.stats["discarded"] == 2
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_permanent_failure_is_not_retried(self):
+        publisher = _publisher()
+        FakeSMTP.failures["reader1@example.org"] = [
+            aiosmtplib.SMTPResponseException(550, "mailbox unavailable")
+        ]
+        results = []
+
+        counts = await publisher.deliver(
+            _message(), _recipients(1), on_result=AsyncMock(side_effect=results.append)
+        )
+
+        assert counts["bounced"] == 1
+        assert results[0].attempts == 1
+        assert "550" in results[0].error
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_failing_result_callback_aborts_delivery(self):
+        publisher = _publisher()
+        consumed = []
+
+        async def recipients():
+            async for item in _recipients(500):
+                consumed.append(item[0])
+                yield item
+
+        on_result = AsyncMock(side_effect=RuntimeError("checkpoint write failed"))
+
+        with pytest.raises(RuntimeError, match="checkpoint write failed"):
+            await publisher.deliver(_message(), recipients(), on_result=on_result, concurrency=2)
+
+        # The producer was cancelled instead of blocking on the full queue
+        assert len(consumed) < 500
+        await publisher.close()
+
+
+class TestSendNewsletter:
+    """Campaign bookkeeping around delivery"""
+
+    def _database(self, campaign):
+        db = MagicMock()
+        db.pool.fetchrow = AsyncMock(return_value=campaign)
+        db.pool.execute = AsyncMock()
+        conn = AsyncMock()
+        db.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+        db.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+        return db, conn
+
+    @pytest.mark.asyncio
+    async def test_resume_starts_after_checkpoint(self):
+        campaign = {
+            "id": 7,
+            "campaign_name": "weekly",
+            "subject": "Weekly digest",
+            "content": '{"text": "Hello readers"}',
+            "status": "paused",
+            "last_subscriber_id": 100,
+            "sent_count": 100,
+            "failed_count": 0,
+        }
+        db, conn = self._database(campaign)
+        publisher = _publisher()
+        publisher.database_service = db
+        streamed_after = []
+
+        async def stream(campaign_id, after_id):
+            streamed_after.append(after_id)
+            async for item in _recipients(5, start=101):
+                yield item
+
+        publisher._stream_subscribers = stream
+        result = await publisher.send_newsletter("", "", "", campaign_id=7, checkpoint_every=2)
+
+        assert result["success"] is True
+        assert result["sent"] == 5
+        assert result["resumed_from"] == 100
+        assert streamed_after == [100]
+        logged = [r for call in conn.copy_records_to_table.await_args_list for r in call.kwargs["records"]]
+        assert [row[0] for row in logged] == [101, 102, 103, 104, 105]
+        final = db.pool.execute.await_args_list[-1].args
+        assert final[1:4] == (7, "completed", 105)
+        assert sum(call.args[4] for call in db.pool.execute.await_args_list) == 5
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_failure_pauses_campaign(self):
+        campaign = {
+            "id": 9,
+            "campaign_name": "weekly",
+            "subject": "Weekly digest",
+            "content": '{"text": "Hello readers"}',
+            "status": "pending",
+            "last_subscriber_id": 0,
+            "sent_count": 0,
+            "failed_count": 0,
+        }
+        db, _ = self._database(campaign)
+        publisher = _publisher()
+        publisher.database_service = db
+        publisher._stream_subscribers = lambda campaign_id, after_id: _recipients(500)
+        save_checkpoint = publisher._save_checkpoint
+        statuses = []
+
+        async def flaky_save(campaign_id, status, checkpoint, sent, failed, error=None):
+            statuses.append(status)
+            if status == "sending" and sent + failed:
+                raise ConnectionError("database went away")
+            await save_checkpoint(campaign_id, status, checkpoint, sent, failed, error)
+
+        publisher._save_checkpoint = flaky_save
+        result = await publisher.send_newsletter("", "", "", campaign_id=9, checkpoint_every=10)
+
+        assert result["success"] is False
+        assert "database went away" in result["error"]
+        assert statuses[-1] == "paused"
+        paused = db.pool.execute.await_args_list[-1].args
+        assert paused[2] == "paused"
+        # Counts from the failed "sending" save are carried into the pause
+        assert paused[4] >= 10
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_requires_database(self):
+        publisher = _publisher()
+
+        result = await publisher.send_newsletter("Subject", "Body", "weekly")
+
+        assert result["success"] is False
+        assert "database" in result["error"]
+
+
+class TestSMTPSink:
+    """End-to-end against a real SMTP server (aiosmtpd)"""
+
+    @pytest.mark.asyncio
+    async def test_delivers_to_aiosmtpd_sink(self):
+        pytest.importorskip("aiosmtpd")
+        from aiosmtpd.controller import Controller
+
+        received = []
+
+        class Sink:
+            async def handle_DATA(self, server, session, envelope):
+                received.append(envelope)
+                return "250 OK"
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        controller = Controller(Sink(), hostname="127.0.0.1", port=port)
+        controller.start()
+        try:
+            env = {**SMTP_ENV, "SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(port), "SMTP_USE_TLS": "false"}
+            with patch.dict(os.environ, env):
+                publisher = EmailPublisher()
+            publisher.smtp_user = publisher.smtp_password = None  # Sink has no AUTH
+
+            started = time.perf_counter()
+            counts = await publisher.deliver(_message(), _recipients(200))
+            elapsed = time.perf_counter() - started
+            await publisher.close()
+        finally:
+            controller.stop()
+
+        assert counts["sent"] == 200
+        assert len(received) == 200
+        assert received[0].rcpt_tos == ["reader1@example.org"]
+        assert publisher.pool.stats["connects"] <= 2
+        assert 200 / elapsed * 60 > 1000  # Thousands of messages per minute
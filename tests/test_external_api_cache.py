@@ -0,0 +1,191 @@
+"""
+Tests for the shared external API cache and token-bucket quota governor.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services import serper_client
+from services.external_api_cache import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    ExternalAPICache,
+    QuotaExceededError,
+    QuotaGovernor,
+    TokenBucket,
+    make_cache_key,
+)
+
+
+def _cache(**kwargs):
+    return ExternalAPICache(governor=QuotaGovernor(limits={}), **kwargs)
+
+
+class TestExternalAPICache:
+    """Normalized keys, TTLs, bounds and coalescing"""
+
+    async def test_normalized_queries_share_an_entry(self):
+        cache = _cache()
+        fetch = AsyncMock(return_value={"organic": [1, 2]})
+
+        first = await cache.get_or_fetch("serper.search", "AI  Trends ", fetch, {"num": 3})
+        first["organic"].append(3)  # Callers get copies
+        second = await cache.get_or_fetch("serper.search", "ai trends", fetch, {"num": 3})
+        await cache.get_or_fetch("serper.search", "ai trends", fetch, {"num": 5})
+
+        assert second == {"organic": [1, 2]}
+        assert fetch.await_count == 2
+        assert cache.get_stats()["endpoints"]["serper.search"]["hit"] == 1
+
+    async def test_empty_and_failed_responses_are_not_cached(self):
+        cache = _cache()
+        fetch = AsyncMock(side_effect=[[], RuntimeError("503"), [{"id": 1}]])
+
+        assert await cache.get_or_fetch("pexels.search", "sky", fetch) == []
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("pexels.search", "sky", fetch)
+        assert await cache.get_or_fetch("pexels.search", "sky", fetch) == [{"id": 1}]
+        assert await cache.get_or_fetch("pexels.search", "sky", fetch) == [{"id": 1}]
+        assert fetch.await_count == 3
+
+    async def test_ttl_and_lru_bound(self):
+        cache = _cache(max_entries=2, ttls={"serper.news": 0})
+        fetch = AsyncMock(return_value=["x"])
+
+        await cache.get_or_fetch("serper.news", "a", fetch)
+        await cache.get_or_fetch("serper.news", "a", fetch)
+        assert fetch.await_count == 2  # Expired immediately
+
+        for query in ("a", "b", "c"):
+            await cache.get_or_fetch("serper.search", query, fetch)
+        assert cache.get_stats()["entries"] == 2
+        await cache.get_or_fetch("serper.search", "a", fetch)
+        assert fetch.await_count == 6  # "a" was evicted
+
+    async def test_concurrent_misses_share_one_upstream_call(self):
+        cache = _cache()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return ["result"]
+
+        fetch_mock = AsyncMock(side_effect=fetch)
+        waiters = [
+            asyncio.create_task(cache.get_or_fetch("searxng.general", "q", fetch_mock))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [["result"]] * 5
+        assert fetch_mock.await_count == 1
+        assert cache.get_stats()["endpoints"]["searxng.general"]["coalesced"] == 4
+
+    async def test_caller_after_last_waiter_cancels_starts_fresh_fetch(self):
+        cache = _cache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0.05)  # Slow cleanup keeps the task alive
+                    raise
+            return ["fresh"]
+
+        first = asyncio.create_task(cache.get_or_fetch("serper.search", "q", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        # The cancelled fetch is still unwinding; a new caller must not join it
+        assert await cache.get_or_fetch("serper.search", "q", fetch) == ["fresh"]
+        assert calls == 2
+
+    async def test_redis_tier_is_read_and_written(self):
+        redis = MagicMock()
+        redis.is_available = AsyncMock(return_value=True)
+        redis.get = AsyncMock(side_effect=[None, {"organic": ["shared"]}])
+        redis.set = AsyncMock(return_value=True)
+        cache = _cache(redis_cache=redis)
+        fetch = AsyncMock(return_value={"organic": ["fresh"]})
+
+        await cache.get_or_fetch("serper.news", "q1", fetch)
+        key, value, ttl = redis.set.call_args.args
+        assert key == make_cache_key("serper.news", "Q1")
+        assert (value, ttl) == ({"organic": ["fresh"]}, 3600)
+
+        assert await cache.get_or_fetch("serper.news", "q2", fetch) == {"organic": ["shared"]}
+        assert fetch.await_count == 1
+
+
+class TestQuotaGovernor:
+    """Token buckets queue by priority and reject after max wait"""
+
+    async def test_burst_then_priority_order(self):
+        bucket = TokenBucket(rate_per_minute=600, capacity=2)  # One token per 0.1s
+        order = []
+
+        async def request(name, priority):
+            await bucket.acquire(priority, timeout=5)
+            order.append(name)
+
+        await asyncio.gather(request("a", PRIORITY_LOW), request("b", PRIORITY_LOW))
+        await asyncio.gather(
+            request("background", PRIORITY_LOW), request("interactive", PRIORITY_HIGH)
+        )
+
+        assert order == ["a", "b", "interactive", "background"]
+        assert bucket.to_dict()["queued"] == 2
+
+    async def test_wait_beyond_limit_raises(self):
+        cache = ExternalAPICache(governor=QuotaGovernor(limits={"pexels": (0.001, 1)}), max_wait=0.05)
+        fetch = AsyncMock(return_value=["x"])
+
+        await cache.get_or_fetch("pexels.search", "one", fetch)
+        with pytest.raises(QuotaExceededError):
+            await cache.get_or_fetch("pexels.search", "two", fetch)
+        await cache.get_or_fetch("pexels.search", "one", fetch)  # Cached hits need no token
+
+        assert fetch.await_count == 1
+        assert cache.get_stats()["quota"]["pexels"]["rejected"] == 1
+
+
+class TestSerperBatching:
+    """fact_check_claims runs every claim through the shared cache"""
+
+    async def test_fact_checks_are_concurrent_and_uncapped(self, monkeypatch):
+        cache = _cache()
+        monkeypatch.setattr(serper_client, "get_external_api_cache", lambda: cache)
+        calls = []
+
+        class FakeAsyncClient:
+            is_closed = False
+
+            def __init__(self, **kwargs):
+                pass
+
+            async def post(self, url, json, headers):
+                calls.append(json["q"])
+                response = MagicMock()
+                response.json.return_value = {"organic": [{"title": json["q"], "link": "u"}]}
+                return response
+
+        monkeypatch.setattr(serper_client.httpx, "AsyncClient", FakeAsyncClient)
+        client = serper_client.SerperClient(api_key="key")
+        claims = ["claim one", "claim two", "claim three", "claim four", "claim one"]
+
+        results = await client.fact_check_claims(claims)
+        await client.fact_check_claims(["Claim  One"])
+
+        assert set(results) == {"claim one", "claim two", "claim three", "claim four"}
+        assert results["claim four"]["sources_found"] == 1
+        assert len(calls) == 4
+        assert client.monthly_usage == 4
@@ -0,0 +1,138 @@
+"""
+Tests for streaming generation with early quality abort.
+"""
+
+from unittest.mock import MagicMock
+
+from services import ai_content_generator
+from services.ai_content_generator import AIContentGenerator
+from services.generation_guard import StreamGuard, run_guarded_stream, topic_keywords
+from services.progress_service import ProgressService
+
+ON_TOPIC = (
+    "Solar panels convert sunlight into electricity for homes. Installers size each array "
+    "by roof area, orientation and local weather, then connect inverters to the grid. "
+)
+
+
+class FakeStream:
+    """Async generator stand-in that records how far it was consumed"""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed >= len(self.chunks):
+            raise StopAsyncIteration
+        self.consumed += 1
+        return self.chunks[self.consumed - 1]
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _varied_words(count, start=0):
+    return " ".join(f"solar{i}" for i in range(start, start + count)) + " "
+
+
+class TestStreamGuard:
+    """Each check aborts with its reason"""
+
+    async def test_clean_stream_completes(self):
+        stream = FakeStream([ON_TOPIC] + [_varied_words(60, start) for start in (0, 60, 120)])
+        partials = []
+
+        outcome = await run_guarded_stream(
+            stream, StreamGuard("Solar panels", target_words=400), lambda t, w: partials.append(w)
+        )
+
+        assert not outcome.aborted
+        assert outcome.text.startswith("Solar panels")
+        assert stream.consumed == len(stream.chunks)
+        assert partials and partials == sorted(partials)
+
+    async def test_repetition_loop_aborts_and_closes_stream(self):
+        loop = "The sun is bright and the panels are very efficient today. "
+        stream = FakeStream([ON_TOPIC] + [loop] * 200)
+
+        outcome = await run_guarded_stream(stream, StreamGuard("Solar panels", target_words=1500))
+
+        assert outcome.abort_reason == "repetition"
+        assert stream.consumed < 40
+        assert stream.closed
+
+    async def test_refusal_aborts_immediately(self):
+        stream = FakeStream(["I'm sorry, but I can't write an article about that topic. "] * 50)
+
+        outcome = await run_guarded_stream(
+            stream, StreamGuard("Solar panels", check_every_chars=50)
+        )
+
+        assert outcome.abort_reason == "refusal"
+        assert stream.consumed == 1
+
+    async def test_off_topic_after_grace(self):
+        filler = " ".join(f"recipe{i} pasta tomato basil" for i in range(60))
+
+        outcome = await run_guarded_stream(
+            FakeStream([filler]), StreamGuard("Solar panels", target_words=1000)
+        )
+
+        assert outcome.abort_reason == "off_topic"
+
+    def test_runaway_length_and_slow_rate(self):
+        guard = StreamGuard("Solar", target_words=100, max_seconds=60)
+        text = ON_TOPIC + _varied_words(300)
+
+        assert guard.check(text, 301, elapsed=1) == "runaway_length"
+        # 20 words in 30s projects 150s for 100 words, past the 60s budget
+        assert guard.check(ON_TOPIC, 20, elapsed=30) == "too_slow"
+        assert guard.check(ON_TOPIC, 80, elapsed=30) is None
+
+    def test_topic_keywords_skip_stopwords(self):
+        assert topic_keywords("How to Install Solar Panels", ["renewables"]) == [
+            "insta",
+            "solar",
+            "panel",
+            "renew",
+        ]
+
+
+class TestGeneratorStreaming:
+    """AIContentGenerator moves on to the next model after an abort"""
+
+    async def test_aborted_model_falls_through_and_partials_reach_progress(self, monkeypatch):
+        loop = "The sun is bright and the panels are very efficient today. "
+        good = ON_TOPIC + _varied_words(700)
+        streams = {"neural-chat:latest": [ON_TOPIC] + [loop] * 200, "llama2:latest": [good]}
+
+        class FakeOllama:
+            def stream_generate(self, prompt, model, system, max_tokens):
+                return FakeStream(streams[model])
+
+        progress = ProgressService()
+        monkeypatch.setattr("services.ollama_client.OllamaClient", FakeOllama)
+        monkeypatch.setattr("services.progress_service.get_progress_service", lambda: progress)
+        monkeypatch.setattr(ai_content_generator.ProviderChecker, "is_gemini_available", lambda: False)
+        monkeypatch.setattr(
+            ai_content_generator.ProviderChecker, "is_huggingface_available", lambda: False
+        )
+        prompts = MagicMock(get_prompt=lambda name, **kwargs: name)
+        monkeypatch.setattr(ai_content_generator, "get_prompt_manager", lambda: prompts)
+
+        generator = AIContentGenerator(quality_threshold=0, streaming=True)
+        generator.ollama_checked = generator.ollama_available = True
+
+        content, model, metrics = await generator.generate_blog_post(
+            "Solar panels", "technical", "professional", 700, ["solar"], progress_task_id="t1"
+        )
+
+        assert content == good
+        assert model == "Ollama - llama2:latest"
+        assert [abort["abort_reason"] for abort in metrics["stream_aborts"]] == ["repetition"]
+        assert progress.get_progress("t1").partial_content == good
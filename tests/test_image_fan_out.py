@@ -0,0 +1,110 @@
+"""
+Tests for concurrent featured-image query fan-out.
+"""
+
+import asyncio
+
+from services.image_service import FeaturedImageMetadata, ImageService
+from services.pexels_client import PexelsClient, fan_out_search
+
+
+def _slow_search(delays, results, started, cancelled):
+    async def search(query):
+        started.append(query)
+        try:
+            await asyncio.sleep(delays[query])
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+        return results.get(query, [])
+
+    return search
+
+
+class TestFanOutSearch:
+    """Priority order, early return and cancellation"""
+
+    async def test_highest_priority_result_wins_and_rest_are_cancelled(self):
+        started, cancelled = [], []
+        search = _slow_search(
+            {"topic": 0.05, "keyword": 0.01, "backup": 0.2, "late": 0.2},
+            {"topic": [], "keyword": ["kw-image"], "backup": ["backup-image"]},
+            started,
+            cancelled,
+        )
+
+        loop = asyncio.get_running_loop()
+        began = loop.time()
+        found = await fan_out_search(["topic", "keyword", "backup", "late"], search, max_concurrency=3)
+
+        assert found == [("keyword", ["kw-image"])]
+        assert loop.time() - began < 0.15  # One round trip, not the sum
+        assert started == ["topic", "keyword", "backup", "late"]  # "late" took keyword's slot
+        assert sorted(cancelled) == ["backup", "late"]
+
+    async def test_slower_higher_priority_query_is_awaited(self):
+        search = _slow_search(
+            {"topic": 0.05, "keyword": 0.0},
+            {"topic": ["topic-image"], "keyword": ["kw-image"]},
+            [],
+            [],
+        )
+
+        assert await fan_out_search(["topic", "keyword"], search) == [("topic", ["topic-image"])]
+
+    async def test_concurrency_is_limited(self):
+        started, cancelled = [], []
+        search = _slow_search(dict.fromkeys("abcde", 0.05), {"e": ["image"]}, started, cancelled)
+
+        task = asyncio.create_task(fan_out_search(list("abcde"), search, max_concurrency=2))
+        await asyncio.sleep(0.01)
+        assert started == ["a", "b"]
+
+        assert await task == [("e", ["image"])]
+        assert cancelled == []
+
+    async def test_merges_until_enough_and_survives_errors(self):
+        async def search(query):
+            if query == "broken":
+                raise RuntimeError("timeout")
+            return [f"{query}-{i}" for i in range(2)]
+
+        found = await fan_out_search(["a", "broken", "b", "c"], search, needed=3)
+
+        assert found == [("a", ["a-0", "a-1"]), ("b", ["b-0", "b-1"])]
+
+
+class TestFeaturedImageFanOut:
+    """ImageService and PexelsClient use the fan-out"""
+
+    async def test_image_service_skips_filtered_results(self, monkeypatch):
+        service = ImageService()
+        service.pexels_api_key = "key"
+
+        async def pexels_search(query, **kwargs):
+            if query == "cloud computing":
+                return [FeaturedImageMetadata(url="x", alt_text="Sexy server rack")]
+            if query == "servers":
+                return [FeaturedImageMetadata(url="ok", alt_text="Rows of servers")]
+            return []
+
+        monkeypatch.setattr(service, "_pexels_search", pexels_search)
+
+        image = await service.search_featured_image("cloud computing", keywords=["servers"])
+
+        assert image.url == "ok"
+
+    async def test_pexels_client_gallery_uses_page_argument(self, monkeypatch):
+        client = PexelsClient(api_key="key")
+        calls = []
+
+        async def search_images(query, per_page=5, page=1, **kwargs):
+            calls.append((query, per_page, page))
+            return [{"url": f"{query}-{i}"} for i in range(per_page)]
+
+        monkeypatch.setattr(client, "search_images", search_images)
+
+        images = await client.get_images_for_gallery("ocean", count=2, keywords=["waves"])
+
+        assert [image["url"] for image in images] == ["ocean-0", "ocean-1"]
+        assert calls[0] == ("ocean", 2, 1)
@@ -0,0 +1,149 @@
+"""
+Tests for non-blocking logging in services.logger_config: deferred
+formatting on the listener thread, per-logger sampling, drop-on-full and the
+per-request handler time bound.
+"""
+
+import json
+import logging
+import queue
+import threading
+from logging.handlers import QueueListener
+
+import pytest
+
+from services import logger_config
+from services.logger_config import (
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    parse_sample_rates,
+    start_request_log_timer,
+)
+
+
+def _record(name="svc", level=logging.INFO, msg="hello %s", args=("world",), exc_info=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, exc_info)
+
+
+class TestSamplingFilter:
+    """Deterministic per-logger sampling"""
+
+    def test_keeps_one_in_n_below_warning(self):
+        sampler = SamplingFilter({"services.task_executor.loop": 0.1})
+
+        kept = [sampler.filter(_record("services.task_executor.loop")) for _ in range(30)]
+
+        assert kept.count(True) == 3
+        assert sampler.sampled_out == 27
+        assert sampler.filter(_record("services.task_executor.loop", logging.WARNING))
+        assert all(sampler.filter(_record("services.task_executor")) for _ in range(5))
+
+    def test_longest_prefix_wins_and_children_inherit(self):
+        sampler = SamplingFilter({"routes": 0.5, "routes.task_routes": 0.0})
+
+        assert not sampler.filter(_record("routes.task_routes.sub"))
+        assert [sampler.filter(_record("routes.cms_routes")) for _ in range(4)] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+
+    def test_parse_sample_rates(self):
+        assert parse_sample_rates("a=0.1, b.c=2,bad,d=x") == {"a": 0.1, "b.c": 1.0}
+        assert parse_sample_rates(None) == {}
+
+
+class TestNonBlockingQueueHandler:
+    """Enqueue without formatting, never block"""
+
+    def test_record_is_enqueued_unformatted(self):
+        handler = NonBlockingQueueHandler(queue.Queue())
+        record = _record(args=(["mutable", "list"],))
+
+        handler.handle(record)
+
+        queued = handler.queue.get_nowait()
+        assert queued is record
+        assert queued.msg == "hello %s"
+        assert queued.args == (["mutable", "list"],)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+
+        for _ in range(5):
+            handler.handle(_record())
+
+        assert handler.enqueued == 2
+        assert handler.dropped == 3
+
+    def test_formatting_happens_on_listener_thread(self):
+        threads = []
+
+        class RecordingFormatter(logging.Formatter):
+            def format(self, record):
+                threads.append(threading.current_thread())
+                return super().format(record)
+
+        sink = logging.StreamHandler(open("/dev/null", "w"))
+        sink.setFormatter(RecordingFormatter("%(message)s"))
+        handler = NonBlockingQueueHandler(queue.Queue())
+        listener = QueueListener(handler.queue, sink)
+        listener.start()
+        try:
+            handler.handle(_record())
+        finally:
+            listener.stop()
+            sink.stream.close()
+
+        assert threads and threads[0] is not threading.current_thread()
+
+    def test_request_timer_bounds_handler_time(self):
+        handler = NonBlockingQueueHandler(queue.Queue())
+        handler.addFilter(SamplingFilter({}))
+        log_time = start_request_log_timer()
+
+        for i in range(2000):
+            handler.handle(_record(msg="📝 [TASK_SINGLE] step %d for task %s", args=(i, "task-1")))
+
+        assert log_time[0] == pytest.approx(handler.handle_seconds)
+        # Per-record cost on the loop: filter + queue put, no formatting or I/O
+        assert log_time[0] / 2000 < 50e-6
+
+
+class TestStructlogRendering:
+    """structlog events are rendered by the ProcessorFormatter"""
+
+    def test_json_render_with_exception_captured_on_caller_thread(self, monkeypatch):
+        structlog = pytest.importorskip("structlog")
+        monkeypatch.setattr(logger_config, "LOG_FORMAT", "json")
+        formatter = logger_config._structlog_formatter()
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            event = logger_config._capture_exc_info(None, "error", {"event": "failed", "exc_info": True})
+
+        record = _record(name="svc", level=logging.ERROR, msg=event, args=())
+        record._logger = structlog.get_logger("svc")
+        record._name = "svc"
+
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(out=formatter.format(record)))
+        worker.start()
+        worker.join()
+
+        rendered = json.loads(result["out"])
+        assert rendered["event"] == "failed"
+        assert "RuntimeError: boom" in rendered["exception"]
+
+    def test_foreign_records_use_lazy_args(self, monkeypatch):
+        pytest.importorskip("structlog")
+        monkeypatch.setattr(logger_config, "LOG_FORMAT", "json")
+        formatter = logger_config._structlog_formatter()
+
+        rendered = json.loads(formatter.format(_record(name="services.x", msg="took %.1fms", args=(1.25,))))
+
+        assert rendered["event"] == "took 1.2ms"
+        assert rendered["logger"] == "services.x"
+        assert rendered["level"] == "info"
@@ -0,0 +1,113 @@
+"""
+Tests for services.loop_monitor: event-loop stall detection with the
+blocking stack, lag measurement and the folded-stack sampling profiler.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+from services.loop_monitor import (
+    LOOP_LAG,
+    EventLoopWatchdog,
+    SamplingProfiler,
+    find_offender,
+    format_stack,
+)
+
+
+def _blocking_parse():
+    # Stands in for a sync HTTP call or a big BeautifulSoup parse
+    time.sleep(0.25)
+
+
+async def _handler_that_blocks():
+    _blocking_parse()
+
+
+def _busy_scoring(seconds):
+    deadline = time.monotonic() + seconds
+    total = 0
+    while time.monotonic() < deadline:
+        total += sum(i * i for i in range(200))
+    return total
+
+
+class TestEventLoopWatchdog:
+    """Stall detection on a running loop"""
+
+    async def test_blocking_call_is_reported_with_stack(self):
+        watchdog = EventLoopWatchdog(threshold_ms=50, interval_ms=10)
+        await watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            await _handler_that_blocks()
+            await asyncio.sleep(0.05)
+        finally:
+            await watchdog.stop()
+
+        assert len(watchdog.stalls) == 1
+        stall = watchdog.stalls[0]
+        assert "_blocking_parse" in stall.offender
+        assert any("_handler_that_blocks" in line for line in stall.stack)
+        assert stall.blocked_ms >= 50
+        # Filled in by the heartbeat once the loop resumed
+        assert stall.duration_ms is not None and stall.duration_ms >= 200
+
+        status = watchdog.get_status()
+        assert status["stall_count"] == 1
+        assert status["top_offenders"][0]["offender"] == stall.offender
+        assert status["max_lag_ms"] >= 200
+
+    async def test_idle_loop_records_lag_without_stalls(self):
+        before = LOOP_LAG.labels().count
+        watchdog = EventLoopWatchdog(threshold_ms=200, interval_ms=5)
+        await watchdog.start()
+        try:
+            assert watchdog.running
+            await asyncio.sleep(0.1)
+        finally:
+            await watchdog.stop()
+
+        assert not watchdog.running
+        assert LOOP_LAG.labels().count > before
+        assert not watchdog.stalls
+
+
+class TestFrameHelpers:
+    """Offender and stack formatting"""
+
+    def test_falls_back_to_innermost_frame_outside_app(self):
+        frame = sys._getframe()
+
+        assert find_offender(frame).endswith("in test_falls_back_to_innermost_frame_outside_app")
+        assert format_stack(frame)[-1] == find_offender(frame)
+        assert len(format_stack(frame, limit=2)) == 2
+
+
+class TestSamplingProfiler:
+    """Folded-stack sampling"""
+
+    def test_busy_function_appears_in_folded_output(self):
+        profiler = SamplingProfiler(thread_id=threading.get_ident(), interval_ms=1)
+        profiler.start()
+        _busy_scoring(0.2)
+        summary = profiler.stop()
+
+        assert summary["samples"] > 10
+        assert not summary["running"]
+        folded = profiler.to_folded().splitlines()
+        assert folded
+        stack, count = folded[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert any("_busy_scoring" in line for line in folded)
+        assert "_busy_scoring" in stack
+
+    def test_max_seconds_stops_sampling(self):
+        profiler = SamplingProfiler(thread_id=None, interval_ms=1, max_seconds=0.05)
+        profiler.start()
+        time.sleep(0.2)
+
+        assert not profiler.running
+        assert profiler.get_summary()["duration_s"] < 0.2
@@ -0,0 +1,203 @@
+"""
+Tests for incremental knowledge clustering and learning-pattern discovery.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+import memory_system
+from memory_system import AIMemorySystem, CentroidIndex, MemoryType, learning_pattern_id
+
+# Word -> direction; texts embed to the normalized sum of their words
+AXES = {"pricing": 0, "revenue": 0, "hiring": 1, "team": 1, "latency": 2, "cache": 2}
+
+
+class FakeEmbeddingModel:
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts):
+        self.calls += 1
+        vectors = []
+        for text in texts:
+            vector = np.zeros(4, dtype=np.float32)
+            for word in text.lower().split():
+                vector[AXES.get(word, 3)] += 1
+            vectors.append(vector / np.linalg.norm(vector))
+        return np.array(vectors)
+
+
+def _system(monkeypatch, **kwargs):
+    monkeypatch.setattr(memory_system, "SENTENCE_TRANSFORMERS_AVAILABLE", False)
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.executemany = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.fetchrow = AsyncMock(return_value=None)
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = acquire
+    system = AIMemorySystem(pool, **kwargs)
+    system.embedding_model = FakeEmbeddingModel()
+    return system, conn
+
+
+def _queries(conn):
+    return [call.args[0] for call in conn.execute.await_args_list]
+
+
+class TestCentroidIndex:
+    """Nearest lookup, running-mean updates and a fixed k"""
+
+    def test_nearest_update_and_remove(self):
+        index = CentroidIndex(max_clusters=2)
+        index.add("a", [1, 0])
+        index.add("b", [0, 1])
+        index.add("c", [1, 1])  # Full: ignored
+
+        assert len(index) == 2 and index.full and "c" not in index
+        assert index.nearest([0.9, 0.1])[0][0] == "a"
+        assert [cid for cid, _ in index.nearest([0.1, 0.9], n=2)] == ["b", "a"]
+
+        assert list(index.update("a", [0, 1])) == [0.5, 0.5]  # Mean of two members
+        assert np.allclose(index.update("a", [0, 1]), [1 / 3, 2 / 3])
+
+        index.remove("a")
+        assert len(index) == 1 and index.nearest([1, 0])[0][0] == "b"
+        assert index.nearest([1, 0, 0]) == []  # Wrong dimension
+
+
+class TestIncrementalClustering:
+    """Each new memory costs one centroid lookup and one appending UPDATE"""
+
+    async def test_similar_memories_share_a_cluster(self, monkeypatch):
+        system, conn = _system(monkeypatch)
+
+        await system.store_memory("pricing revenue", MemoryType.BUSINESS_FACT, tags=["money"])
+        await system.store_memory("pricing pricing revenue", MemoryType.BUSINESS_FACT)
+        await system.store_memory("hiring team", MemoryType.BUSINESS_FACT, tags=["people"])
+
+        assert len(system.centroid_index) == 2
+        pricing = system.knowledge_clusters[system.centroid_index.nearest([1, 0, 0, 0])[0][0]]
+        assert pricing.member_count == 2 and len(pricing.memories) == 2
+        assert pricing.topics == ["money"]
+
+        cluster_writes = [q for q in _queries(conn) if "knowledge_clusters" in q]
+        assert ["INSERT" in q for q in cluster_writes] == [True, False, True]
+        assert "array_append" in cluster_writes[1]
+
+    async def test_full_index_assigns_to_nearest(self, monkeypatch):
+        system, _ = _system(monkeypatch)
+        system.centroid_index = CentroidIndex(max_clusters=1)
+
+        await system.store_memory("pricing", MemoryType.BUSINESS_FACT)
+        await system.store_memory("latency cache", MemoryType.TECHNICAL_KNOWLEDGE)
+
+        (cluster,) = system.knowledge_clusters.values()
+        assert cluster.member_count == 2 and len(system.centroid_index) == 1
+
+    async def test_evicted_cluster_is_paged_in_by_id(self, monkeypatch):
+        system, conn = _system(monkeypatch, max_knowledge_clusters=1)
+        await system.store_memory("pricing", MemoryType.BUSINESS_FACT)
+        await system.store_memory("hiring", MemoryType.BUSINESS_FACT)
+        pricing_id = system.centroid_index.nearest([1, 0, 0, 0])[0][0]
+        assert pricing_id not in system.knowledge_clusters
+
+        conn.fetchrow = AsyncMock(
+            return_value={
+                "id": pricing_id,
+                "name": "Business Fact Knowledge",
+                "description": "Knowledge cluster for business_fact",
+                "memories": ["0" * 32],
+                "confidence": 1.0,
+                "last_updated": None,
+                "importance_score": 3.0,
+                "topics": None,
+                "centroid": np.array([1, 0, 0, 0], dtype=np.float32).tobytes(),
+                "member_count": 1,
+            }
+        )
+        monkeypatch.setattr(system, "_calculate_cluster_importance", lambda cluster: 1.0)
+        await system.store_memory("pricing revenue", MemoryType.BUSINESS_FACT)
+
+        query, cluster_id = conn.fetchrow.await_args.args
+        assert "id = $1::uuid" in query and cluster_id == pricing_id
+        assert system.knowledge_clusters[pricing_id].member_count == 2
+
+
+class TestLearningPatterns:
+    """Running counts, scheduled discovery and persisted results"""
+
+    async def test_counts_follow_the_conversation_window(self, monkeypatch):
+        system, conn = _system(monkeypatch)
+        for _ in range(3):
+            await system.store_conversation_turn("user", "Should pricing change?")
+            await system.store_conversation_turn("user", "pricing works")
+        await system.store_conversation_turn("assistant", "pricing answer")
+
+        patterns = await system.identify_learning_patterns()
+
+        assert [p.pattern_id for p in patterns] == [
+            learning_pattern_id("common_topics"),
+            learning_pattern_id("question_pattern"),
+        ]
+        topics = "User frequently discusses: pricing, should, change, works"
+        assert patterns[0].description == topics
+        assert patterns[1].frequency == 3
+        assert patterns[1].examples == ["Should pricing change?"] * 3
+        stored = [c.args for c in conn.execute.await_args_list if "learning_patterns" in c.args[0]]
+        assert [args[1] for args in stored] == [p.pattern_id for p in patterns]
+
+        for n in range(50):
+            await system.store_conversation_turn("user", f"hello {n}")
+        assert "pricing" not in system._word_counts and system._user_questions == 0
+        assert system._user_turns == 50
+
+    async def test_background_job_refreshes_only_after_new_turns(self, monkeypatch):
+        system, _ = _system(monkeypatch)
+        monkeypatch.setattr(memory_system, "MEMORY_PATTERN_INTERVAL_SECONDS", 0.01)
+        monkeypatch.setattr(memory_system, "MEMORY_FORGET_INTERVAL_SECONDS", 0)
+        identify = AsyncMock(side_effect=lambda: setattr(system, "_patterns_stale", False))
+        monkeypatch.setattr(system, "identify_learning_patterns", identify)
+
+        await system.start_background_pruning(interval=0.01)
+        await asyncio.sleep(0.05)
+        assert identify.await_count == 0
+
+        await system.store_conversation_turn("user", "pricing")
+        for _ in range(50):
+            if identify.await_count:
+                break
+            await asyncio.sleep(0.01)
+        await system.stop_background_pruning()
+
+        assert identify.await_count == 1
+
+
+class TestContextualKnowledge:
+    """Context is assembled from indexes and cached results"""
+
+    async def test_lookup_encodes_once_and_batches_access_updates(self, monkeypatch):
+        system, conn = _system(monkeypatch)
+        await system.store_memory("pricing revenue", MemoryType.BUSINESS_FACT)
+        await system.store_memory("pricing", MemoryType.BUSINESS_FACT)
+        await system.store_memory("latency cache", MemoryType.TECHNICAL_KNOWLEDGE)
+        for _ in range(5):
+            await system.store_conversation_turn("user", "pricing pricing")
+        await system.refresh_learning_patterns()
+        encodes = system.embedding_model.calls
+
+        context = await system.get_contextual_knowledge("pricing revenue")
+
+        assert system.embedding_model.calls == encodes + 1
+        assert [c["member_count"] for c in context["knowledge_clusters"]] == [2]
+        assert "centroid" not in context["knowledge_clusters"][0]
+        assert len(context["relevant_memories"]) == 2
+        assert conn.executemany.await_count == 1
+        assert [p["pattern_id"] for p in context["learning_patterns"]] == [
+            learning_pattern_id("common_topics")
+        ]
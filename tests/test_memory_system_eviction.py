@@ -0,0 +1,169 @@
+"""
+Tests for the bounded in-process memory hot set and on-demand page-in.
+"""
+
+import asyncio
+import pickle
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import memory_system
+from memory_system import (
+    AIMemorySystem,
+    HotMemorySet,
+    ImportanceLevel,
+    Memory,
+    MemoryType,
+    memory_key,
+)
+
+
+def _memory(n, importance=ImportanceLevel.MEDIUM, content=None, embedding=None):
+    now = datetime.now()
+    return Memory(
+        id=f"{n:032x}",
+        content=content or f"memory number {n}",
+        memory_type=MemoryType.BUSINESS_FACT,
+        importance=importance,
+        confidence=1.0,
+        created_at=now,
+        last_accessed=now,
+        embedding=embedding,
+    )
+
+
+def _row(memory):
+    return {
+        "id": memory.id,
+        "content": memory.content,
+        "memory_type": memory.memory_type.value,
+        "importance": memory.importance.value,
+        "confidence": memory.confidence,
+        "created_at": memory.created_at,
+        "last_accessed": memory.last_accessed,
+        "access_count": memory.access_count,
+        "tags": memory.tags,
+        "related_memories": None,
+        "metadata": None,
+        "embedding": pickle.dumps([0.5, 0.25]),
+    }
+
+
+def _system(monkeypatch, **kwargs):
+    monkeypatch.setattr(memory_system, "SENTENCE_TRANSFORMERS_AVAILABLE", False)
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.executemany = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.fetchrow = AsyncMock(return_value=None)
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = acquire
+    return AIMemorySystem(pool, **kwargs), conn
+
+
+class TestMemoryRecord:
+    """Slotted records with float32 embeddings"""
+
+    def test_record_is_slotted_and_embedding_compact(self):
+        memory = _memory(1, embedding=[0.5] * 384)
+
+        assert not hasattr(memory, "__dict__")
+        assert memory.embedding.itemsize == 4 and len(memory.embedding) == 384
+        assert memory.to_dict()["embedding"] == [0.5] * 384
+
+
+class TestHotMemorySet:
+    """Entry, byte and idle bounds with importance-weighted eviction"""
+
+    def test_capacity_evicts_least_important_of_oldest(self):
+        hot = HotMemorySet(max_entries=3, max_bytes=10**9, max_idle_seconds=0)
+        hot.put(_memory(1, ImportanceLevel.HIGH))
+        hot.put(_memory(2, ImportanceLevel.LOW))
+        hot.put(_memory(3, ImportanceLevel.MEDIUM))
+
+        evicted = hot.put(_memory(4))
+
+        assert evicted == [memory_key(_memory(2).id)]
+        assert len(hot) == 3 and _memory(1).id in hot
+        assert hot.stats["evictions"] == 1
+
+    def test_byte_cap_and_idle_expiry(self):
+        hot = HotMemorySet(max_entries=100, max_bytes=5_000, max_idle_seconds=60)
+        for n in range(20):
+            hot.put(_memory(n, content="x" * 500))
+        assert hot.bytes <= 5_000 and len(hot) < 20
+
+        hot = HotMemorySet(max_entries=100, max_bytes=10**9, max_idle_seconds=60)
+        hot.put(_memory(1, ImportanceLevel.LOW))
+        hot.put(_memory(2, ImportanceLevel.HIGH))
+        now = hot._entries[memory_key(_memory(2).id)][2]
+
+        assert hot.expire(now + 90) == 1  # Important memories get twice as long
+        assert [m.id for m in hot.values()] == [_memory(2).id]
+        assert hot.expire(now + 150) == 1 and hot.bytes == 0
+
+
+class TestAIMemorySystem:
+    """Bounded caches backed by PostgreSQL page-in"""
+
+    async def test_store_stays_bounded_and_evicted_memory_pages_back_in(self, monkeypatch):
+        system, conn = _system(monkeypatch, hot_set_size=5)
+        for n in range(12):
+            await system.store_memory(f"fact {n}", MemoryType.BUSINESS_FACT)
+            await system.store_conversation_turn("user", "hi")
+        assert len(system.hot_memories) == 5
+        assert system.get_memory_stats()["evictions"] == 7
+
+        evicted = _memory(99, content="evicted fact")
+        conn.fetchrow = AsyncMock(return_value=_row(evicted))
+        paged = await system.get_memory(evicted.id)
+
+        assert paged.content == "evicted fact" and evicted.id in system.hot_memories
+        assert list(paged.embedding) == [0.5, 0.25]
+        assert system.hot_memories.stats["page_ins"] == 1
+        assert await system.get_memory(evicted.id) is paged  # Now served from process
+
+    async def test_recall_falls_back_to_database_candidates(self, monkeypatch):
+        system, conn = _system(monkeypatch)
+        system.hot_memories.put(_memory(1, content="growth strategy for agencies"))
+        stored = _memory(2, content="pricing tiers for small businesses")
+        conn.fetch = AsyncMock(return_value=[_row(stored)])
+
+        recalled = await system.recall_memories("pricing tiers", limit=5)
+
+        assert [m.id for m in recalled] == [stored.id]
+        query, hot_ids, types, patterns, words, _ = conn.fetch.await_args.args
+        assert "ILIKE ANY" in query and hot_ids == [_memory(1).id]
+        assert (types, patterns, words) == (None, ["%pricing%", "%tiers%"], ["pricing", "tiers"])
+        assert stored.id in system.hot_memories and recalled[0].access_count == 1
+
+    async def test_conversation_context_and_clusters_are_capped(self, monkeypatch):
+        system, _ = _system(monkeypatch, max_knowledge_clusters=2)
+        for n in range(60):
+            await system.store_conversation_turn("user", f"turn {n}")
+        for tag in ("a", "b", "c"):
+            await system.store_memory("fact", MemoryType.BUSINESS_FACT, tags=[tag])
+
+        assert len(system.conversation_context) == 50
+        assert (await system.get_conversation_context(2))[-1]["content"] == "turn 59"
+        assert list(system.knowledge_clusters) == ["business_fact_b", "business_fact_c"]
+
+    async def test_background_pruning_expires_idle_memories(self, monkeypatch):
+        system, _ = _system(monkeypatch, max_idle_seconds=0.01)
+        monkeypatch.setattr(memory_system, "MEMORY_FORGET_INTERVAL_SECONDS", 0)
+        system.hot_memories.put(_memory(1))
+
+        await system.start_background_pruning(interval=0.02)
+        assert system.get_memory_stats()["background_pruning"]
+        for _ in range(50):
+            if not len(system.hot_memories):
+                break
+            await asyncio.sleep(0.02)
+        await system.stop_background_pruning()
+
+        assert len(system.hot_memories) == 0
+        assert system.get_memory_stats()["expired"] == 1
+        assert not system.get_memory_stats()["background_pruning"]
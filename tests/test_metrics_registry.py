@@ -0,0 +1,162 @@
+"""
+Tests for the in-process metrics registry: histogram buckets, Prometheus
+rendering, the asyncpg query hook and the request-timing middleware.
+"""
+
+import timeit
+from collections import namedtuple
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from middleware.metrics_middleware import MetricsMiddleware
+from services.metrics_service import (
+    DB_QUERY_DURATION,
+    DB_QUERY_ERRORS,
+    HTTP_REQUEST_DURATION,
+    MetricsRegistry,
+    record_db_query,
+)
+
+LoggedQuery = namedtuple("LoggedQuery", "query args timeout elapsed exception conn_addr conn_params")
+
+
+class TestHistogram:
+    """Fixed buckets and percentile estimates"""
+
+    def test_bucket_boundaries_are_inclusive(self):
+        histogram = MetricsRegistry().histogram("t_seconds", "test", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 1.0, 5.0):
+            histogram.observe(value)
+
+        child = histogram.labels()
+        assert child.counts == [2, 2, 1]
+        assert child.count == 5
+        assert child.sum == pytest.approx(6.65)
+
+    def test_percentile_interpolates_within_bucket(self):
+        histogram = MetricsRegistry().histogram("t_seconds", "test", buckets=(1.0, 2.0))
+        for _ in range(50):
+            histogram.observe(0.5)
+        for _ in range(50):
+            histogram.observe(1.5)
+
+        child = histogram.labels()
+        assert child.percentile(50) == pytest.approx(1.0)
+        assert child.percentile(95) == pytest.approx(1.9)
+        assert MetricsRegistry().histogram("e_seconds", "test").labels().percentile(50) is None
+
+    def test_label_children_are_cached(self):
+        histogram = MetricsRegistry().histogram("t_seconds", "test", ("route",))
+
+        assert histogram.labels("/a") is histogram.labels("/a")
+        with pytest.raises(ValueError):
+            histogram.labels("/a", "extra")
+
+
+class TestRegistry:
+    """Registration and exposition"""
+
+    def test_get_or_create_and_conflicts(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("kind",))
+
+        assert registry.counter("jobs_total", "Jobs", ("kind",)) is counter
+        with pytest.raises(ValueError):
+            registry.histogram("jobs_total", "Jobs", ("kind",))
+        with pytest.raises(ValueError):
+            registry.counter("bad-name", "Invalid")
+
+    def test_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs run", ("kind",)).labels('a"b').inc(3)
+        registry.gauge("queue_depth", "Queued jobs").set_function(lambda: 7)
+        histogram = registry.histogram("job_seconds", "Job latency", ("kind",), buckets=(0.5, 1))
+        histogram.labels("x").observe(0.25)
+        histogram.labels("x").observe(2)
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a\\"b"} 3' in text
+        assert "queue_depth 7" in text
+        assert 'job_seconds_bucket{kind="x",le="0.5"} 1' in text
+        assert 'job_seconds_bucket{kind="x",le="1"} 1' in text
+        assert 'job_seconds_bucket{kind="x",le="+Inf"} 2' in text
+        assert 'job_seconds_sum{kind="x"} 2.25' in text
+        assert 'job_seconds_count{kind="x"} 2' in text
+        assert text.endswith("\n")
+
+    def test_observation_overhead(self):
+        # Relative to a trivial Python call so CI load and coverage scale both
+        # sides; absolute numbers come from benchmarks/micro_metrics.py
+        child = MetricsRegistry().histogram("t_seconds", "test", ("route",)).labels("/a")
+        latest = {}
+
+        def store(value):
+            latest["value"] = value
+
+        iterations = 20_000
+        observe = min(timeit.repeat(lambda: child.observe(0.02), number=iterations, repeat=5))
+        baseline = min(timeit.repeat(lambda: store(0.02), number=iterations, repeat=5))
+
+        assert observe < baseline * 25
+
+
+class TestQueryHook:
+    """asyncpg query logger"""
+
+    def test_records_operation_and_table(self):
+        DB_QUERY_DURATION.clear()
+        DB_QUERY_ERRORS.clear()
+        query = "\n  -- fetch one task\n  SELECT * FROM content_tasks WHERE task_id = $1"
+
+        record_db_query(LoggedQuery(query, (), None, 0.004, None, None, None))
+        record_db_query(
+            LoggedQuery("INSERT INTO cost_logs (a) VALUES ($1)", (), None, 0.1, Exception("x"), None, None)
+        )
+
+        assert DB_QUERY_DURATION.labels("SELECT", "content_tasks").count == 1
+        assert DB_QUERY_DURATION.labels("INSERT", "cost_logs").sum == pytest.approx(0.1)
+        assert DB_QUERY_ERRORS.labels("INSERT", "cost_logs").value == 1
+
+
+class TestMetricsMiddleware:
+    """Per-route request timing"""
+
+    def test_labels_by_route_template(self):
+        HTTP_REQUEST_DURATION.clear()
+        app = FastAPI()
+
+        @app.get("/api/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        app.add_middleware(MetricsMiddleware)
+        client = TestClient(app)
+
+        client.get("/api/items/1")
+        client.get("/api/items/2")
+        client.get("/nope")
+
+        assert HTTP_REQUEST_DURATION.labels("GET", "/api/items/{item_id}", "200").count == 2
+        assert HTTP_REQUEST_DURATION.labels("GET", "unmatched", "404").count == 1
+
+    def test_unknown_methods_share_one_label(self):
+        HTTP_REQUEST_DURATION.clear()
+        app = FastAPI()
+
+        @app.get("/api/items")
+        async def list_items():
+            return []
+
+        app.add_middleware(MetricsMiddleware)
+        client = TestClient(app)
+
+        for n in range(50):
+            client.request(f"FUZZ{n}", "/api/items")
+
+        # One cached label combination, however many methods clients invent
+        assert list(HTTP_REQUEST_DURATION._lookup) == [("OTHER", "/api/items", 405)]
+        assert HTTP_REQUEST_DURATION.labels("OTHER", "/api/items", "405").count == 50
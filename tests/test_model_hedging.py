@@ -0,0 +1,312 @@
+"""
+Tests for hedged provider racing in ModelConsolidationService: p95-derived
+budgets, first-success-wins, loser cancellation and cost accounting.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.model_consolidation_service import (
+    AnthropicAdapter,
+    LatencyHistogram,
+    ModelConsolidationService,
+    ModelResponse,
+    OpenAIAdapter,
+    ProviderType,
+)
+
+
+class _FakeAdapter:
+    """Provider that answers after a fixed delay (or raises)"""
+
+    def __init__(self, provider_type, delay, cost=0.0, error=None):
+        self.provider_type = provider_type
+        self.delay = delay
+        self.cost = cost
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def is_available(self):
+        return True
+
+    async def generate(self, prompt, model=None, max_tokens=2000, temperature=0.7, **kwargs):
+        self.calls += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return ModelResponse(
+            text=f"from {self.provider_type.value}",
+            provider=self.provider_type,
+            model=model or "fake",
+            tokens_used=10,
+            cost=self.cost,
+            response_time_ms=(time.perf_counter() - start) * 1000,
+        )
+
+
+def _service(*adapters, **kwargs):
+    with patch.object(ModelConsolidationService, "_initialize_adapters"):
+        service = ModelConsolidationService(**kwargs)
+    service.adapters = {a.provider_type: a for a in adapters}
+    service.FALLBACK_CHAIN = [a.provider_type for a in adapters]
+    return service
+
+
+def _train(service, provider_type, latency_ms, count=20):
+    histogram = service.latency.setdefault(provider_type, LatencyHistogram())
+    for _ in range(count):
+        histogram.record(latency_ms)
+
+
+class TestLatencyHistogram:
+    """Bucketed percentile estimates"""
+
+    def test_percentiles_follow_distribution(self):
+        histogram = LatencyHistogram()
+        for _ in range(95):
+            histogram.record(100)
+        for _ in range(5):
+            histogram.record(5000)
+
+        assert histogram.percentile(50) < 150
+        assert histogram.percentile(99) > 3000
+
+    def test_empty_histogram_has_no_percentile(self):
+        assert LatencyHistogram().percentile(95) is None
+
+    def test_decay_keeps_recent_behaviour(self):
+        histogram = LatencyHistogram(max_weight=100)
+        for _ in range(200):
+            histogram.record(5000)
+        for _ in range(400):
+            histogram.record(100)
+
+        assert histogram.total < 100
+        assert histogram.percentile(50) < 150
+
+    def test_censored_samples_raise_the_tail(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(100)
+        for _ in range(10):
+            histogram.record(5000)
+        before = histogram.percentile(95)
+
+        # Attempts cancelled after 1s: their weight goes to the slow bucket above
+        for _ in range(20):
+            histogram.record_censored(1000)
+
+        assert histogram.total == pytest.approx(120)
+        assert histogram.percentile(95) > before
+        assert histogram.percentile(85) > 3000
+
+    def test_censored_sample_without_slower_data_is_a_lower_bound(self):
+        histogram = LatencyHistogram()
+        histogram.record(100)
+        histogram.record_censored(2000)
+
+        assert histogram.percentile(100) >= 2000
+
+
+class TestHedgeBudget:
+    """Budgets derived from observed p95"""
+
+    def test_default_budget_until_enough_samples(self):
+        service = _service(_FakeAdapter(ProviderType.OLLAMA, 0))
+        _train(service, ProviderType.OLLAMA, 100, count=2)
+
+        assert service.hedge_budget_ms(ProviderType.OLLAMA) == service.HEDGE_DEFAULT_BUDGET_MS
+
+    def test_budget_scales_with_p95_and_is_clamped(self):
+        service = _service(_FakeAdapter(ProviderType.OLLAMA, 0))
+        _train(service, ProviderType.OLLAMA, 2000)
+        budget = service.hedge_budget_ms(ProviderType.OLLAMA)
+        assert 2000 <= budget <= 2000 * 1.5 * service.HEDGE_P95_MULTIPLIER
+
+        _train(service, ProviderType.GOOGLE, 10)
+        assert service.hedge_budget_ms(ProviderType.GOOGLE) == service.HEDGE_MIN_BUDGET_MS
+
+
+class TestHedgedGenerate:
+    """Racing providers"""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_hedge(self):
+        primary = _FakeAdapter(ProviderType.OLLAMA, 0.01)
+        backup = _FakeAdapter(ProviderType.ANTHROPIC, 0.01, cost=0.01)
+        service = _service(primary, backup, hedging_enabled=True)
+
+        response = await service.generate("hello")
+
+        assert response.provider == ProviderType.OLLAMA
+        assert response.hedged is False
+        assert backup.calls == 0
+        assert service.metrics["hedging"]["hedged_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_raced_and_cancelled(self):
+        primary = _FakeAdapter(ProviderType.OLLAMA, 5.0, cost=0.0)
+        backup = _FakeAdapter(ProviderType.ANTHROPIC, 0.01, cost=0.01)
+        service = _service(primary, backup, hedging_enabled=True)
+        service.HEDGE_MIN_BUDGET_MS = 10.0
+        _train(service, ProviderType.OLLAMA, 20)
+
+        start = time.perf_counter()
+        response = await service.generate("hello")
+
+        assert time.perf_counter() - start < 1.0
+        assert response.provider == ProviderType.ANTHROPIC
+        assert response.hedged is True
+        assert primary.cancelled is True
+        hedging = service.metrics["hedging"]
+        assert hedging["hedged_requests"] == 1
+        assert hedging["hedge_wins"] == 1
+        assert hedging["cancelled_attempts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_paid_attempt_is_charged(self):
+        primary = _FakeAdapter(ProviderType.ANTHROPIC, 5.0, cost=0.02)
+        backup = _FakeAdapter(ProviderType.OPENAI, 0.01, cost=0.03)
+        service = _service(primary, backup, hedging_enabled=True)
+        service.HEDGE_MIN_BUDGET_MS = 10.0
+        _train(service, ProviderType.ANTHROPIC, 20)
+        service.metrics["by_provider"]["anthropic"] = {"requests": 2, "cost": 0.04}
+
+        response = await service.generate("hello")
+
+        assert response.provider == ProviderType.OPENAI
+        assert response.hedge_cost == pytest.approx(0.02)
+        assert service.metrics["hedging"]["hedge_cost"] == pytest.approx(0.02)
+        # Both attempts are in the total: 0.03 winner + 0.02 cancelled loser
+        assert service.metrics["total_cost"] == pytest.approx(0.05)
+        assert service.metrics["by_provider"]["openai"]["cost"] == pytest.approx(0.03)
+
+    @pytest.mark.asyncio
+    async def test_same_tick_loser_cost_counted_once(self):
+        gate = asyncio.Event()
+
+        class _GatedAdapter(_FakeAdapter):
+            """Both attempts return in the same event-loop tick once the backup starts"""
+
+            async def generate(self, prompt, **kwargs):
+                if self.provider_type == ProviderType.OPENAI:
+                    gate.set()
+                await gate.wait()
+                return await super().generate(prompt, **kwargs)
+
+        primary = _GatedAdapter(ProviderType.ANTHROPIC, 0.0, cost=0.02)
+        backup = _GatedAdapter(ProviderType.OPENAI, 0.0, cost=0.03)
+        service = _service(primary, backup, hedging_enabled=True)
+        service.HEDGE_MIN_BUDGET_MS = 10.0
+        _train(service, ProviderType.ANTHROPIC, 20)
+
+        response = await service.generate("hello")
+
+        assert primary.calls == backup.calls == 1
+        assert service.metrics["hedging"]["cancelled_attempts"] == 0
+        assert response.hedge_cost == pytest.approx(0.02 if response.provider == ProviderType.OPENAI else 0.03)
+        # Winner plus same-tick loser, each counted exactly once
+        assert service.metrics["total_cost"] == pytest.approx(0.05)
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_over_without_waiting_for_budget(self):
+        primary = _FakeAdapter(ProviderType.OLLAMA, 0.0, error=RuntimeError("boom"))
+        backup = _FakeAdapter(ProviderType.GOOGLE, 0.01)
+        service = _service(primary, backup, hedging_enabled=True)
+
+        start = time.perf_counter()
+        response = await service.generate("hello")
+
+        assert time.perf_counter() - start < 1.0
+        assert response.provider == ProviderType.GOOGLE
+        assert service.metrics["successful_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_providers_failing_raises(self):
+        service = _service(
+            _FakeAdapter(ProviderType.OLLAMA, 0.0, error=RuntimeError("a")),
+            _FakeAdapter(ProviderType.GOOGLE, 0.0, error=RuntimeError("b")),
+            hedging_enabled=True,
+        )
+
+        with pytest.raises(Exception, match="All model providers failed"):
+            await service.generate("hello")
+        assert service.metrics["failed_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_records_latency(self):
+        service = _service(_FakeAdapter(ProviderType.OLLAMA, 0.01), hedging_enabled=False)
+
+        await service.generate("hello")
+
+        assert service.latency[ProviderType.OLLAMA].total == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_attempt_is_recorded_as_censored_latency(self):
+        primary = _FakeAdapter(ProviderType.OLLAMA, 5.0)
+        backup = _FakeAdapter(ProviderType.GOOGLE, 0.2)
+        service = _service(primary, backup, hedging_enabled=True)
+        service.HEDGE_MIN_BUDGET_MS = 10.0
+        _train(service, ProviderType.OLLAMA, 20)
+
+        await service.generate("hello")
+
+        histogram = service.latency[ProviderType.OLLAMA]
+        assert primary.cancelled is True
+        assert histogram.total == pytest.approx(21)
+        # Cancelled after ~200ms, well past the 20ms the fast samples suggest
+        assert histogram.percentile(100) >= 150
+
+
+class TestPaidAdaptersCancel:
+    """Paid adapters await the async SDK clients, so cancelling stops the call"""
+
+    @staticmethod
+    async def _assert_cancel_reaches_client(adapter, create_path):
+        started = asyncio.Event()
+        cancelled = []
+
+        async def create(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["model"])
+                raise
+
+        client = SimpleNamespace()
+        target = client
+        for name in create_path[:-1]:
+            setattr(target, name, SimpleNamespace())
+            target = getattr(target, name)
+        setattr(target, create_path[-1], create)
+        adapter.client = client
+
+        task = asyncio.create_task(adapter.generate("hello", model="m"))
+        await asyncio.wait_for(started.wait(), 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled == ["m"]
+
+    @pytest.mark.asyncio
+    async def test_anthropic_call_is_cancelled(self):
+        adapter = AnthropicAdapter.__new__(AnthropicAdapter)
+        adapter.provider_type = ProviderType.ANTHROPIC
+        await self._assert_cancel_reaches_client(adapter, ["messages", "create"])
+
+    @pytest.mark.asyncio
+    async def test_openai_call_is_cancelled(self):
+        adapter = OpenAIAdapter.__new__(OpenAIAdapter)
+        adapter.provider_type = ProviderType.OPENAI
+        await self._assert_cancel_reaches_client(adapter, ["chat", "completions", "create"])
@@ -0,0 +1,308 @@
+"""
+Tests for telemetry-driven routing in ModelRouter: SLO/quality filtering,
+exploration, the decision log and persistence through the settings table.
+"""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.model_consolidation_service import (
+    ModelConsolidationService,
+    ModelResponse,
+    ProviderType,
+    resolve_router_model,
+    router_model_name,
+)
+from services.model_router import ModelRouter, ModelStats, TaskComplexity
+
+
+def _router(**kwargs):
+    kwargs.setdefault("use_ollama", False)
+    kwargs.setdefault("adaptive", True)
+    kwargs.setdefault("latency_slo_ms", 5000)
+    kwargs.setdefault("quality_floor", 70)
+    kwargs.setdefault("exploration_rate", 0.0)
+    return ModelRouter(**kwargs)
+
+
+def _observe(router, task_type, model, latency_ms, count=10, success=True, quality=None):
+    for _ in range(count):
+        router.record_outcome(task_type, model, latency_ms, tokens=500, success=success, quality_score=quality)
+
+
+class TestModelStats:
+    """Rolling statistics"""
+
+    def test_ewma_and_p95(self):
+        stats = ModelStats()
+        for latency in [100] * 19 + [2000]:
+            stats.record(latency, tokens=100, success=True)
+
+        assert stats.samples == 20
+        assert stats.p95_latency_ms == 2000
+        assert 100 < stats.latency_ms < 2000
+        assert stats.tokens_per_sec > 0
+        assert stats.failure_rate == 0.0
+
+    def test_round_trip(self):
+        stats = ModelStats()
+        stats.record(250, tokens=50, success=False)
+        stats.record_quality(82)
+
+        restored = ModelStats.from_dict(stats.to_dict())
+
+        assert restored.samples == 1
+        assert restored.failure_rate == 1.0
+        assert restored.quality_score == 82
+
+
+class TestAdaptiveRouting:
+    """Cheapest model meeting SLO and quality floor"""
+
+    def test_static_without_telemetry(self):
+        router = _router()
+
+        model, _, complexity = router.route_request("analyze")
+
+        assert complexity == TaskComplexity.MEDIUM
+        assert model == "claude-haiku-3"
+        assert router.get_routing_decisions()[0]["strategy"] == "static"
+
+    def test_cheaper_model_with_proven_quality_wins(self):
+        router = _router()
+        _observe(router, "create", "claude-sonnet-3", 1500, quality=85)
+        _observe(router, "create", "gpt-3.5-turbo", 800, quality=78)
+
+        model, cost, _ = router.route_request("create", estimated_tokens=1000)
+
+        assert model == "gpt-3.5-turbo"
+        assert cost == pytest.approx(0.00175)
+        decision = router.get_routing_decisions()[0]
+        assert decision["strategy"] == "adaptive"
+        assert "cheapest eligible" in decision["reason"]
+
+    def test_quality_floor_and_slo_reject_models(self):
+        router = _router()
+        _observe(router, "create", "gpt-3.5-turbo", 800, quality=50)  # Below floor
+        _observe(router, "create", "claude-haiku-3", 9000, quality=90)  # Too slow
+        _observe(router, "create", "claude-sonnet-3", 1500, quality=85)
+
+        model, _, _ = router.route_request("create")
+
+        assert model == "claude-sonnet-3"
+        rejected = {c["model"]: c.get("rejected") for c in router.get_routing_decisions()[0]["candidates"]}
+        assert "quality" in rejected["gpt-3.5-turbo"]
+        assert "SLO" in rejected["claude-haiku-3"]
+
+    def test_unreliable_model_is_skipped(self):
+        router = _router()
+        _observe(router, "analyze", "claude-haiku-3", 500, count=10, success=False)
+        _observe(router, "analyze", "gpt-3.5-turbo", 500, quality=80)
+
+        model, _, _ = router.route_request("analyze")
+
+        assert model == "gpt-3.5-turbo"
+
+    def test_lower_tier_without_quality_data_is_not_trusted(self):
+        router = _router()
+        _observe(router, "create", "gpt-3.5-turbo", 300)  # No quality scores
+
+        model, _, _ = router.route_request("create")
+
+        assert model == "claude-sonnet-3"
+        assert router.get_routing_decisions()[0]["strategy"] == "static"
+
+    def test_exploration_picks_least_sampled_model(self):
+        router = _router(exploration_rate=1.0, rng=random.Random(1))
+        _observe(router, "create", "claude-sonnet-3", 1500, quality=85)
+        _observe(router, "create", "gpt-4", 1500, quality=85)
+        _observe(router, "create", "claude-haiku-3", 1500, quality=85)
+
+        model, _, _ = router.route_request("create")
+
+        assert model == "gpt-3.5-turbo"
+        assert router.get_routing_decisions()[0]["strategy"] == "explore"
+
+    def test_prefer_fallback_keeps_static_choice(self):
+        router = _router()
+        _observe(router, "analyze", "gpt-3.5-turbo", 500, quality=80)
+
+        model, _, _ = router.route_request("analyze", {"prefer_fallback": True})
+
+        assert model == "gpt-3.5-turbo"
+        assert router.get_routing_decisions()[0]["strategy"] == "static"
+
+
+class TestStatsPersistence:
+    """Telemetry survives restarts via the settings table"""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self):
+        router = _router()
+        _observe(router, "create", "gpt-3.5-turbo", 800, quality=78)
+        db = AsyncMock()
+        db.set_setting.return_value = True
+
+        assert await router.save_stats(db, force=True) is True
+        saved = db.set_setting.call_args.args[1]
+
+        restored = _router()
+        db.get_setting_value.return_value = saved
+        assert await restored.load_stats(db) is True
+        assert restored.get_model_stats("create")["create"]["gpt-3.5-turbo"]["samples"] == 10
+        assert restored.route_request("create")[0] == "gpt-3.5-turbo"
+
+    @pytest.mark.asyncio
+    async def test_save_is_throttled(self):
+        router = _router()
+        db = AsyncMock()
+        db.set_setting.return_value = True
+        _observe(router, "create", "gpt-4", 800, count=1)
+        await router.save_stats(db, force=True)
+
+        _observe(router, "create", "gpt-4", 800, count=1)
+        assert await router.save_stats(db) is False
+        assert db.set_setting.await_count == 1
+
+
+class _RecordingAdapter:
+    """Provider adapter that remembers the model it was asked for"""
+
+    def __init__(self, provider_type, error=None):
+        self.provider_type = provider_type
+        self.error = error
+        self.models = []
+
+    async def is_available(self):
+        return True
+
+    async def generate(self, prompt, model=None, max_tokens=2000, temperature=0.7, **kwargs):
+        self.models.append(model)
+        if self.error:
+            raise self.error
+        return ModelResponse(
+            text="ok",
+            provider=self.provider_type,
+            model=model or "mistral:latest",
+            tokens_used=20,
+            cost=0.0,
+            response_time_ms=40.0,
+        )
+
+
+class TestConsolidationRouting:
+    """ModelConsolidationService routes tagged calls and reports each attempt"""
+
+    @staticmethod
+    def _service(router, *adapters):
+        with patch.object(ModelConsolidationService, "_initialize_adapters"):
+            service = ModelConsolidationService(hedging_enabled=False)
+        service.adapters = {a.provider_type: a for a in adapters}
+        service.FALLBACK_CHAIN = [a.provider_type for a in adapters]
+        return service
+
+    @pytest.mark.asyncio
+    async def test_routed_model_goes_first_and_is_recorded(self):
+        router = _router()
+        ollama = _RecordingAdapter(ProviderType.OLLAMA)
+        openai = _RecordingAdapter(ProviderType.OPENAI)
+        service = self._service(router, ollama, openai)
+
+        with patch("services.model_consolidation_service.get_model_router", return_value=router):
+            response = await service.generate("hi", task_type="summarize")
+
+        assert response.provider == ProviderType.OPENAI
+        assert openai.models == ["gpt-3.5-turbo"] and ollama.models == []
+        stats = router.get_model_stats("summarize")["summarize"]["gpt-3.5-turbo"]
+        assert stats["samples"] == 1 and stats["failure_rate"] == 0.0
+        assert router.get_routing_decisions()[0]["model"] == "gpt-3.5-turbo"
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_recorded_under_real_model(self):
+        router = _router()
+        ollama = _RecordingAdapter(ProviderType.OLLAMA)
+        openai = _RecordingAdapter(ProviderType.OPENAI, error=RuntimeError("quota"))
+        service = self._service(router, ollama, openai)
+
+        with patch("services.model_consolidation_service.get_model_router", return_value=router):
+            response = await service.generate("hi", task_type="summarize")
+
+        assert response.provider == ProviderType.OLLAMA
+        assert ollama.models == [None]  # The routed model is not forced on other providers
+        stats = router.get_model_stats("summarize")["summarize"]
+        assert stats["gpt-3.5-turbo"]["failure_rate"] == 1.0
+        assert stats["ollama/mistral"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_untagged_calls_bypass_router(self):
+        router = _router()
+        ollama = _RecordingAdapter(ProviderType.OLLAMA)
+        service = self._service(router, ollama)
+
+        with patch("services.model_consolidation_service.get_model_router", return_value=router):
+            await service.generate("hi")
+
+        assert router.get_model_stats() == {}
+        assert router.metrics["total_requests"] == 0
+
+    def test_router_names_round_trip(self):
+        for name in ("ollama/mistral", "ollama/llama2:70b", "claude-haiku-3", "gpt-4"):
+            provider, model = resolve_router_model(name)
+            assert router_model_name(provider, model) == name
+
+
+class TestQualityFeedback:
+    """QA scores from the task pipeline reach the router's quality floor"""
+
+    @pytest.mark.asyncio
+    async def test_draft_critique_feeds_the_drafting_model(self):
+        from services.task_executor import TaskExecutor
+
+        article = "# Shipping small\n\n" + "Small releases are easier to review and roll back. " * 30
+
+        class Orchestrator:
+            async def process_request(self, user_input, context):
+                return {"final_formatting": article}
+
+        router = _router()
+        executor = TaskExecutor(database_service=None, orchestrator=Orchestrator())
+        scores = []
+        evaluate = executor.quality_service.evaluate
+
+        async def recording_evaluate(content, context=None, **kwargs):
+            assessment = await evaluate(content, context=context, **kwargs)
+            scores.append(assessment.overall_score)
+            return assessment
+
+        executor.quality_service.evaluate = recording_evaluate
+
+        with patch("services.quality_service.get_model_router", return_value=router):
+            await executor._execute_task(
+                {"id": "t1", "topic": "Shipping small", "model_selections": {"draft": "gpt-4"}}
+            )
+
+        stats = router.get_model_stats("creative")["creative"]
+        assert list(stats) == ["gpt-4"]
+        assert stats["gpt-4"]["quality_samples"] == 1
+        assert stats["gpt-4"]["quality_score"] == round(scores[0], 2)
+
+    @pytest.mark.asyncio
+    async def test_fallback_content_is_not_credited_to_the_draft_model(self):
+        from services.task_executor import TaskExecutor
+
+        class Orchestrator:
+            async def process_request(self, user_input, context):
+                return {"final_formatting": ""}
+
+        router = _router()
+        executor = TaskExecutor(database_service=None, orchestrator=Orchestrator())
+        executor._fallback_generate_content = AsyncMock(return_value="Fallback article. " * 40)
+
+        with patch("services.quality_service.get_model_router", return_value=router):
+            await executor._execute_task(
+                {"id": "t2", "topic": "Shipping small", "model_selections": {"draft": "gpt-4"}}
+            )
+
+        assert router.get_model_stats() == {}
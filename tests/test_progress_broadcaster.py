@@ -0,0 +1,190 @@
+"""
+Tests for ProgressBroadcaster: per-task coalescing, thread-safe submission
+and Redis pub/sub fan-out.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.progress_service import ProgressBroadcaster, ProgressService
+
+
+class _Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, task_id, message):
+        self.messages.append((task_id, message))
+
+
+class TestCoalescing:
+    """Throttling updates for the same task"""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_to_latest(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=0.05)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start()
+
+        for step in range(50):
+            broadcaster.submit("task-1", {"current_step": step})
+        await asyncio.sleep(0.1)
+
+        assert len(recorder.messages) == 1
+        assert recorder.messages[0] == ("task-1", {"current_step": 49})
+        assert broadcaster.get_stats()["coalesced"] == 49
+
+    @pytest.mark.asyncio
+    async def test_throttle_is_per_task(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=0.05)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start()
+
+        broadcaster.submit("a", {"n": 1})
+        broadcaster.submit("b", {"n": 1})
+        await asyncio.sleep(0.02)
+
+        assert sorted(task for task, _ in recorder.messages) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_immediate_bypasses_throttle(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=10)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start()
+
+        broadcaster.submit("task-1", {"status": "generating"})
+        await asyncio.sleep(0.01)
+        broadcaster.submit("task-1", {"status": "completed"}, immediate=True)
+        await asyncio.sleep(0.01)
+
+        assert [m["status"] for _, m in recorder.messages] == ["generating", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_submit_from_worker_thread(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=0.01)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start()
+
+        thread = threading.Thread(target=broadcaster.submit, args=("task-1", {"step": 3}))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.05)
+
+        assert recorder.messages == [("task-1", {"step": 3})]
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=10)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start()
+        broadcaster.submit("task-1", {"n": 1})
+        await asyncio.sleep(0.01)
+        broadcaster.submit("task-1", {"n": 2})
+
+        await broadcaster.stop()
+
+        assert recorder.messages[-1] == ("task-1", {"n": 2})
+
+
+class TestRedisFanOut:
+    """Publishing through Redis instead of delivering locally"""
+
+    def _redis(self, subscribers=1):
+        redis = MagicMock()
+        redis.is_available = AsyncMock(return_value=True)
+        redis.publish = AsyncMock(return_value=subscribers)
+        redis.set = AsyncMock(return_value=True)
+        redis.get = AsyncMock(return_value={"status": "generating"})
+        redis.pubsub = MagicMock(return_value=None)  # listener exits immediately
+        return redis
+
+    @pytest.mark.asyncio
+    async def test_publishes_and_stores_snapshot(self):
+        recorder = _Recorder()
+        redis = self._redis()
+        broadcaster = ProgressBroadcaster(min_interval=0)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start(redis)
+
+        broadcaster.submit("task-1", {"status": "generating"}, immediate=True)
+        await asyncio.sleep(0.01)
+
+        redis.publish.assert_awaited_once_with(
+            ProgressBroadcaster.CHANNEL,
+            {"task_id": "task-1", "message": {"status": "generating"}},
+        )
+        redis.set.assert_awaited_once()
+        # Local sockets are served by the subscription, not directly
+        assert recorder.messages == []
+        assert await broadcaster.get_snapshot("task-1") == {"status": "generating"}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_without_subscribers(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=0)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start(self._redis(subscribers=0))
+
+        broadcaster.submit("task-1", {"n": 1}, immediate=True)
+        await asyncio.sleep(0.01)
+
+        assert recorder.messages == [("task-1", {"n": 1})]
+
+    @pytest.mark.asyncio
+    async def test_listener_delivers_channel_messages(self):
+        recorder = _Recorder()
+        envelope = {"task_id": "remote", "message": {"n": 7}}
+
+        async def listen():
+            yield {"type": "subscribe", "data": 1}
+            yield {"type": "message", "data": json.dumps(envelope)}
+            await asyncio.sleep(3600)
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.close = AsyncMock()
+        pubsub.listen = listen
+        redis = self._redis()
+        redis.pubsub = MagicMock(return_value=pubsub)
+
+        broadcaster = ProgressBroadcaster()
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start(redis)
+        await asyncio.sleep(0.01)
+        await broadcaster.stop()
+
+        assert recorder.messages == [("remote", {"n": 7})]
+        pubsub.close.assert_awaited()
+
+
+class TestProgressServiceIntegration:
+    """ProgressService publishes through an attached broadcaster"""
+
+    @pytest.mark.asyncio
+    async def test_updates_are_broadcast(self):
+        recorder = _Recorder()
+        broadcaster = ProgressBroadcaster(min_interval=0.05)
+        broadcaster.set_local_delivery(recorder)
+        await broadcaster.start()
+        service = ProgressService()
+        service.attach_broadcaster(broadcaster)
+
+        service.create_progress("task-1", total_steps=10)
+        for step in range(1, 10):
+            service.update_progress("task-1", step)
+        service.mark_complete("task-1")
+        await asyncio.sleep(0.01)
+
+        statuses = [m["status"] for _, m in recorder.messages]
+        assert statuses[-1] == "completed"
+        assert len(recorder.messages) <= 2
+        assert (await service.fetch_progress("task-1"))["percentage"] == 100.0
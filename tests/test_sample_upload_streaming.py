@@ -0,0 +1,273 @@
+"""
+Tests for streaming, size-bounded writing-sample upload parsing.
+"""
+
+import io
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from services import sample_upload_service
+from services.sample_upload_service import SampleUploadService, UploadTooLargeError
+from services.writing_style_db import WritingStyleDatabase
+
+ARTICLE = "Caching keeps hot data close to the code that needs it. " * 3
+
+
+class CountingFile(io.BytesIO):
+    """BytesIO that records how much was read and from which threads"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.read_threads = set()
+
+    def read(self, size=-1):
+        self.read_threads.add(threading.get_ident())
+        return super().read(size)
+
+
+def _upload(data: bytes, content_type: str = "text/plain") -> UploadFile:
+    headers = {"content-type": content_type}
+    return UploadFile(file=CountingFile(data), filename="corpus", headers=headers)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(sample_upload_service, "UPLOAD_CHUNK_SIZE", 7)
+
+
+class TestParseFile:
+    """Same results as before, produced from a stream"""
+
+    async def test_formats_parse_off_the_event_loop(self, small_chunks):
+        service = SampleUploadService()
+        rows = "content,title\n" + "".join(f'"{ARTICLE}{i}",t{i}\n' for i in range(2))
+        items = [{"content": f"{ARTICLE}{i}"} for i in range(2)]
+
+        csv_upload = _upload(rows.encode(), "text/csv")
+        assert await service.parse_file(csv_upload, "text/csv") == f"{ARTICLE}0\n{ARTICLE}1"
+        assert threading.get_ident() not in csv_upload.file.read_threads
+
+        json_text = await service.parse_file(_upload(json.dumps(items).encode()), "application/json")
+        assert json_text == f"{ARTICLE}0\n{ARTICLE}1"
+        obj_text = await service.parse_file(
+            _upload(json.dumps(items[0]).encode()), "application/json"
+        )
+        assert obj_text == f"{ARTICLE}0"
+        text = "Grüße aus Köln. " + ARTICLE  # Multi-byte characters across chunk edges
+        assert await service.parse_file(_upload(text.encode()), "text/plain") == text.strip()
+
+    async def test_byte_cap_stops_reading_early(self):
+        service = SampleUploadService()
+        service.MAX_FILE_SIZE = 200_000
+        service.MAX_CONTENT_LENGTH = 10_000_000
+        upload = _upload(b"x" * 5_000_000)
+
+        with pytest.raises(ValueError, match="File too large"):
+            await service.parse_file(upload, "text/plain")
+
+        assert upload.file.tell() < 400_000
+
+    async def test_character_cap_and_bad_input(self):
+        service = SampleUploadService()
+        service.MAX_CONTENT_LENGTH = 500
+
+        with pytest.raises(ValueError, match="Content too long"):
+            await service.parse_file(_upload((ARTICLE * 10).encode()), "text/plain")
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            await service.parse_file(_upload(b'[{"content": "abc"'), "application/json")
+        with pytest.raises(ValueError, match="'content' column"):
+            await service.parse_file(_upload(b"body\nhello\n"), "text/csv")
+
+    async def test_read_text_enforces_cap(self):
+        service = SampleUploadService()
+
+        assert await service.read_text(_upload(ARTICLE.encode())) == ARTICLE
+        with pytest.raises(UploadTooLargeError):
+            await service.read_text(_upload(b"x" * 2_000), max_bytes=1_000)
+
+
+class TestJsonStreaming:
+    """Values are decoded one at a time across chunk boundaries"""
+
+    def test_array_items_json_lines_and_edge_numbers(self, small_chunks):
+        stream = io.StringIO('[ {"a": [1, {"b": "]"}]}, 12345 ,"x" ]')
+        assert list(sample_upload_service._iter_json_values(stream)) == [
+            {"a": [1, {"b": "]"}]},
+            12345,
+            "x",
+        ]
+
+        lines = io.StringIO('{"content": "one"}\n{"content": "two"}\n')
+        assert list(sample_upload_service._iter_json_values(lines)) == [
+            {"content": "one"},
+            {"content": "two"},
+        ]
+
+
+class TestCorpusBatches:
+    """Many samples, bounded batches, bounded read-ahead"""
+
+    async def test_text_corpus_splits_and_skips_short_sections(self):
+        service = SampleUploadService()
+        corpus = "\n---\n".join([ARTICLE + "a", "too short", ARTICLE + "b", ARTICLE + "c"])
+
+        batches = [
+            batch
+            async for batch in service.iter_sample_batches(
+                _upload(corpus.encode()), "text/plain", batch_size=2
+            )
+        ]
+
+        assert batches == [[ARTICLE + "a", ARTICLE + "b"], [ARTICLE + "c"]]
+
+    async def test_worker_stays_bounded_ahead_and_stops_with_consumer(self):
+        service = SampleUploadService()
+        lines = "".join(json.dumps({"content": f"{ARTICLE}{i}"}) + "\n" for i in range(5_000))
+        upload = _upload(lines.encode(), "application/json")
+
+        batches = service.iter_sample_batches(upload, "application/json", batch_size=10)
+        first = await anext(batches)
+        await batches.aclose()
+
+        assert len(first) == 10
+        # Worker parsed at most a few batches plus read-ahead, not the whole file
+        assert upload.file.tell() < len(lines) / 10
+
+    async def test_profiles_are_built_with_the_batches(self, monkeypatch):
+        service = SampleUploadService()
+        threads = set()
+        build_style_profile = sample_upload_service.build_style_profile
+
+        def profile(text):
+            threads.add(threading.get_ident())
+            return build_style_profile(text)
+
+        monkeypatch.setattr(sample_upload_service, "build_style_profile", profile)
+        batches = [
+            batch
+            async for batch in service.iter_sample_batches(
+                _upload(ARTICLE.encode()), "text/plain", with_profiles=True
+            )
+        ]
+
+        [[sample]] = batches
+        assert sample["content"] == ARTICLE.strip() and "style_profile" in sample
+        assert threads and threading.get_ident() not in threads
+
+    async def test_parse_errors_surface_to_consumer(self):
+        service = SampleUploadService()
+
+        with pytest.raises(UploadTooLargeError):
+            async for _ in service.iter_sample_batches(
+                _upload(b"x" * 10_000), "text/plain", max_bytes=1_000
+            ):
+                pass
+
+
+class TestBulkInsert:
+    """Corpus batches are inserted with a single statement"""
+
+    async def test_create_writing_samples_uses_one_unnest_insert(self):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(
+            return_value=[
+                {"id": n, "user_id": "u", "title": f"t{n}", "content": "c"} for n in (1, 2)
+            ]
+        )
+        acquire = MagicMock()
+        acquire.__aenter__ = AsyncMock(return_value=conn)
+        acquire.__aexit__ = AsyncMock(return_value=False)
+        pool = MagicMock()
+        pool.acquire.return_value = acquire
+
+        created = await WritingStyleDatabase(pool).create_writing_samples(
+            "u", [{"title": "t1", "content": "a b"}, {"title": "t2", "content": "c d e"}]
+        )
+
+        query, user_id, titles, descriptions, contents, words, chars, metadata = (
+            conn.fetch.await_args.args
+        )
+        assert "unnest(" in query and conn.fetch.await_count == 1
+        assert (titles, descriptions, words, chars) == (["t1", "t2"], ["", ""], [2, 3], [3, 5])
+        assert all("style_profile" in json.loads(item) for item in metadata)
+        assert [sample["id"] for sample in created] == ["1", "2"]
+
+
+class TestCorpusUploadRoute:
+    """A corpus upload commits all of its batches or none of them"""
+
+    @staticmethod
+    def _database():
+        conn = MagicMock()
+        conn.fetch = AsyncMock(
+            side_effect=lambda *args: [
+                {"id": f"{title}", "user_id": "u", "title": title, "content": "c"}
+                for title in args[2]
+            ]
+        )
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock()
+        transaction.__aexit__ = AsyncMock(return_value=False)
+        conn.transaction.return_value = transaction
+        acquire = MagicMock()
+        acquire.__aenter__ = AsyncMock(return_value=conn)
+        acquire.__aexit__ = AsyncMock(return_value=False)
+        pool = MagicMock()
+        pool.acquire.return_value = acquire
+        return MagicMock(writing_style=WritingStyleDatabase(pool)), pool, conn, transaction
+
+    async def test_failure_after_first_batch_rolls_back_all_inserts(
+        self, monkeypatch, small_chunks
+    ):
+        from routes.writing_style_routes import upload_writing_corpus
+
+        monkeypatch.setattr(SampleUploadService, "BULK_BATCH_SIZE", 1)
+        db_service, pool, conn, transaction = self._database()
+        corpus = f"{ARTICLE}a\n---\n{ARTICLE}b\n---\n".encode() + b"\xff\xfe" * 10
+        upload = UploadFile(
+            file=io.BytesIO(corpus),
+            filename="corpus.txt",
+            headers={"content-type": "text/plain"},
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_writing_corpus(
+                current_user={"id": "u"},
+                db_service=db_service,
+                title="Corpus",
+                description=None,
+                file=upload,
+            )
+
+        assert exc_info.value.status_code == 422
+        # Every batch went through the one transactional connection...
+        assert pool.acquire.call_count == 1 and conn.fetch.await_count >= 1
+        # ...and the transaction saw the error, so asyncpg rolls it back
+        exc_type = transaction.__aexit__.await_args.args[0]
+        assert exc_type is UnicodeDecodeError
+
+    async def test_successful_upload_commits_once(self):
+        from routes.writing_style_routes import upload_writing_corpus
+
+        db_service, pool, conn, transaction = self._database()
+        corpus = f"{ARTICLE}a\n---\n{ARTICLE}b".encode()
+        upload = UploadFile(
+            file=io.BytesIO(corpus),
+            filename="corpus.txt",
+            headers={"content-type": "text/plain"},
+        )
+
+        response = await upload_writing_corpus(
+            current_user={"id": "u"},
+            db_service=db_service,
+            title="Corpus",
+            description=None,
+            file=upload,
+        )
+
+        assert response.sample_ids == ["Corpus (1)", "Corpus (2)"]
+        assert transaction.__aexit__.await_args.args[0] is None
@@ -0,0 +1,148 @@
+"""
+Tests for section-level refinement: lossless Markdown sectioning, rewriting
+only sections below threshold, splicing and incremental re-scoring.
+"""
+
+import pytest
+
+from services.quality_service import UnifiedQualityService
+from services.section_refinement import SectionRefiner, join_sections, split_sections
+
+GOOD = (
+    "The team ships one small change at a time, and each one is easy for a peer to read and test. "
+    "When a bug does slip in, we find it within the hour and the fix is just as small as the change. "
+    "Our users see a calm stream of good updates, and nobody on the team has to stay up late on a Friday.\n\n"
+)
+BAD = (
+    "Notwithstanding the aforementioned organizational considerations, institutionalized "
+    "interdepartmental communication methodologies necessitate comprehensive "
+    "reconceptualization, particularly regarding asynchronous documentation infrastructure, "
+    "collaborative prioritization frameworks, and multidimensional accountability "
+    "architectures that characteristically undermine operational effectiveness.\n\n"
+)
+
+ARTICLE = (
+    "# Shipping Small\n\n" + GOOD
+    + "## Why Big Releases Hurt\n\n" + BAD
+    + "## A Calmer Process\n\n" + GOOD
+    + "```python\n# not a heading\nprint('hi')\n```\n"
+)
+
+
+class TestSplitSections:
+    """Heading-delimited, lossless sectioning"""
+
+    def test_round_trip_and_fenced_code(self):
+        sections = split_sections("Preface line.\n\n" + ARTICLE)
+
+        assert join_sections(sections) == "Preface line.\n\n" + ARTICLE
+        assert [s.title for s in sections] == ["", "Shipping Small", "Why Big Releases Hurt", "A Calmer Process"]
+        assert [s.level for s in sections] == [0, 1, 2, 2]
+        assert "# not a heading" in sections[-1].body
+
+    def test_text_without_headings_is_one_section(self):
+        assert len(split_sections(GOOD)) == 1
+        assert split_sections("") == []
+
+
+class TestSectionRefiner:
+    """Rewrite only weak sections and splice the rest back"""
+
+    async def test_rewrites_only_the_weak_section(self):
+        calls = []
+
+        async def rewrite(section, context, critique):
+            calls.append((section.title, critique, context["section_word_target"]))
+            return "## Why Big Releases Hurt\n\n" + GOOD.strip()
+
+        refiner = SectionRefiner(rewrite, UnifiedQualityService())
+        outcome = await refiner.refine_pass(ARTICLE, {"target_length": 150}, "Too dense")
+
+        assert [c[0] for c in calls] == ["Why Big Releases Hurt"]
+        assert calls[0][1].startswith("Too dense\n- Use plainer words")
+        assert calls[0][2] == 50
+        assert outcome.rewritten == ["Why Big Releases Hurt"]
+        assert not outcome.needs_full_rewrite
+        assert outcome.rewritten_chars < outcome.article_chars / 2
+        assert outcome.content == ARTICLE.replace(BAD, GOOD)
+
+        # Second pass: nothing weak left, and only the new text needed scoring
+        scored = refiner.sections_scored
+        again = await refiner.refine_pass(outcome.content, {"target_length": 150})
+        assert again.needs_full_rewrite
+        assert refiner.sections_scored == scored
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("rewritten", [BAD.strip(), "Too short to keep.", ""])
+    async def test_unimproved_or_short_rewrites_are_discarded(self, rewritten):
+        async def rewrite(section, context, critique):
+            return rewritten
+
+        outcome = await SectionRefiner(rewrite).refine_pass(ARTICLE)
+
+        assert outcome.rewritten == []
+        assert outcome.rejected == ["Why Big Releases Hurt"]
+        assert outcome.content == ARTICLE
+
+    async def test_rewrite_errors_keep_the_original(self):
+        async def rewrite(section, context, critique):
+            raise RuntimeError("model offline")
+
+        outcome = await SectionRefiner(rewrite).refine_pass(ARTICLE)
+
+        assert outcome.rejected == ["Why Big Releases Hurt"]
+        assert outcome.content == ARTICLE
+
+    async def test_single_block_needs_full_rewrite(self):
+        async def rewrite(section, context, critique):
+            pytest.fail("should not be called")
+
+        outcome = await SectionRefiner(rewrite).refine_pass(BAD)
+
+        assert outcome.needs_full_rewrite
+        assert outcome.content == BAD
+
+
+class TestRejectedRewritesFallBack:
+    """With every section rewrite rejected, the whole-article rewrite still runs"""
+
+    async def test_task_executor_falls_back_to_full_rewrite(self, monkeypatch):
+        from services.task_executor import TaskExecutor
+
+        requests = []
+
+        class Orchestrator:
+            async def process_request(self, user_input, context):
+                requests.append(context)
+                if "original_content" in context:
+                    return {"content": ARTICLE.replace(BAD, GOOD)}
+                return {"final_formatting": ARTICLE}
+
+            async def refine_content(self, content, context=None, feedback=""):
+                return {
+                    "content": content,
+                    "needs_full_rewrite": False,
+                    "rewritten": [],
+                    "rejected": ["Why Big Releases Hurt"],
+                }
+
+        verdicts = iter([False, True])
+
+        async def critique(content, context):
+            passing = next(verdicts)
+            return {
+                "quality_score": 90 if passing else 55,
+                "approved": passing,
+                "feedback": "Too dense",
+                "suggestions": [],
+                "needs_refinement": not passing,
+            }
+
+        executor = TaskExecutor(database_service=None, orchestrator=Orchestrator())
+        monkeypatch.setattr(executor, "_critique", critique)
+
+        result = await executor._execute_task({"id": "t1", "topic": "Shipping small"})
+
+        assert len(requests) == 2 and requests[1]["original_content"] == ARTICLE
+        assert BAD not in result["content"]
+        assert result["content_approved"] is True
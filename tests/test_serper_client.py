@@ -0,0 +1,131 @@
+"""
+Tests for SerperClient batched search over one pooled HTTP client.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from services import serper_client
+from services.external_api_cache import ExternalAPICache, QuotaGovernor
+
+
+class FakeAsyncClient:
+    """Stands in for httpx.AsyncClient; behaviour keyed by query text"""
+
+    instances = 0
+    delays = {}
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, **kwargs):
+        FakeAsyncClient.instances += 1
+        self.is_closed = False
+
+    async def post(self, url, json, headers):
+        cls = FakeAsyncClient
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(cls.delays.get(json["q"], 0.01))
+            if "boom" in json["q"]:
+                raise RuntimeError("upstream 500")
+            response = MagicMock()
+            response.json.return_value = {"organic": [{"title": json["q"], "link": "u"}]}
+            return response
+        finally:
+            cls.in_flight -= 1
+
+    async def aclose(self):
+        self.is_closed = True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    FakeAsyncClient.instances = FakeAsyncClient.max_in_flight = 0
+    FakeAsyncClient.delays = {}
+    cache = ExternalAPICache(governor=QuotaGovernor(limits={}))
+    monkeypatch.setattr(serper_client, "get_external_api_cache", lambda: cache)
+    monkeypatch.setattr(serper_client.httpx, "AsyncClient", FakeAsyncClient)
+    return serper_client.SerperClient(api_key="key")
+
+
+class TestSearchMany:
+    """Bounded, pooled, partial-result batches"""
+
+    async def test_batch_shares_one_pooled_client_with_bounded_parallelism(self, client):
+        queries = [f"query {i}" for i in range(12)]
+
+        results = await client.search_many(queries, max_concurrency=4)
+        await client.search("another query")
+
+        assert list(results) == queries
+        assert all(result["organic"] for result in results.values())
+        assert FakeAsyncClient.instances == 1
+        assert FakeAsyncClient.max_in_flight == 4
+
+        await client.aclose()
+        await client.search("after close")
+        assert FakeAsyncClient.instances == 2
+
+    async def test_slow_and_failing_queries_do_not_sink_the_batch(self, client):
+        FakeAsyncClient.delays = {"slow": 1.0}
+
+        results = await client.search_many(["fast", "slow", "boom", "fast"], timeout=0.1)
+
+        assert list(results) == ["fast", "slow", "boom"]
+        assert results["fast"]["organic"][0]["title"] == "fast"
+        assert results["slow"] == {"error": "timed out after 0.1s"}
+        assert results["boom"] == {"error": "upstream 500"}
+
+    async def test_fact_check_reports_failed_claims_individually(self, client):
+        results = await client.fact_check_claims(["sky is blue", "boom claim"])
+
+        assert results["sky is blue"]["sources_found"] == 1
+        assert results["boom claim"] == {"error": "upstream 500"}
+
+    async def test_research_topic_searches_aspects_concurrently(self, client):
+        FakeAsyncClient.delays = {"solar": 0.05, "solar overview": 0.05, "solar current trends": 0.05}
+
+        loop = asyncio.get_running_loop()
+        began = loop.time()
+        research = await client.research_topic("solar")
+
+        assert loop.time() - began < 0.12
+        assert set(research["aspects"]) == {"overview", "current trends"}
+        assert research["main_sources"][0]["title"] == "solar"
+
+
+class TestSharedClient:
+    """One pooled client per process, closed on shutdown"""
+
+    async def test_shared_client_is_reused_and_closed(self, client, monkeypatch):
+        monkeypatch.setenv("SERPER_API_KEY", "key")
+        monkeypatch.setattr(serper_client, "_serper_client", None)
+
+        shared = serper_client.get_serper_client()
+        await shared.search("first")
+        await serper_client.get_serper_client().search("second")
+        http_client = shared._client
+
+        assert serper_client.get_serper_client() is shared
+        assert FakeAsyncClient.instances == 1
+
+        await serper_client.close_serper_client()
+
+        assert http_client.is_closed and serper_client._serper_client is None
+
+    async def test_api_key_change_closes_the_replaced_client(self, client, monkeypatch):
+        monkeypatch.setenv("SERPER_API_KEY", "old")
+        monkeypatch.setattr(serper_client, "_serper_client", None)
+        old = serper_client.get_serper_client()
+        await old.search("first")
+        http_client = old._client
+
+        monkeypatch.setenv("SERPER_API_KEY", "new")
+        assert serper_client.get_serper_client() is not old
+        await asyncio.sleep(0)
+
+        assert http_client.is_closed and old._client is None
+        await serper_client.close_serper_client()
@@ -0,0 +1,177 @@
+"""Unit tests for TasksDatabase keyset pagination and cached task counts."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncpg import UndefinedTableError
+
+from services.tasks_db import (
+    TASK_COUNT_ESTIMATE_THRESHOLD,
+    TasksDatabase,
+    decode_task_cursor,
+    encode_task_cursor,
+)
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _rows(count, start_id=100):
+    return [
+        {
+            "id": start_id - i,
+            "task_id": f"task-{start_id - i}",
+            "status": "completed",
+            "created_at": BASE_TIME - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+STATUS_COUNTS = [{"status": "completed", "count": 40}, {"status": "pending", "count": 2}]
+
+
+@pytest.fixture
+def conn():
+    conn = AsyncMock()
+    conn.fetchval = AsyncMock(return_value=42)
+    return conn
+
+
+def _fetch(page_rows, status_counts=STATUS_COUNTS):
+    """conn.fetch returning the page rows, then the task_status_counts rows"""
+
+    async def fetch(sql, *args):
+        if "task_status_counts" in sql:
+            if isinstance(status_counts, Exception):
+                raise status_counts
+            return status_counts
+        return page_rows
+
+    return AsyncMock(side_effect=fetch)
+
+
+@pytest.fixture
+def db(conn):
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return TasksDatabase(pool)
+
+
+class TestTaskCursor:
+    """Opaque (created_at, id) cursors"""
+
+    def test_round_trip(self):
+        cursor = encode_task_cursor(BASE_TIME, 57)
+
+        assert "=" not in cursor
+        assert decode_task_cursor(cursor) == (BASE_TIME, 57)
+
+    def test_malformed_cursor_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_task_cursor("not-a-cursor")
+
+
+class TestGetTasksPage:
+    """Keyset pages with a slim projection"""
+
+    async def test_first_page_returns_next_cursor(self, db, conn):
+        conn.fetch = _fetch(_rows(3))
+
+        page = await db.get_tasks_page(limit=2, status="completed")
+
+        sql, *params = conn.fetch.call_args_list[0].args
+        assert sql.startswith("SELECT id, task_id, task_type")
+        assert "content," not in sql and "result" not in sql
+        assert "ORDER BY created_at DESC, id DESC LIMIT $2" in sql
+        assert "OFFSET" not in sql
+        assert params == ["completed", 3]
+
+        assert [task["id"] for task in page["tasks"]] == [100, 99]
+        assert page["tasks"][0]["created_at"] == BASE_TIME.isoformat()
+        assert decode_task_cursor(page["next_cursor"]) == (BASE_TIME - timedelta(minutes=1), 99)
+        assert page["total"] == 40
+
+    async def test_cursor_page_seeks_past_last_row(self, db, conn):
+        conn.fetch = _fetch(_rows(1, start_id=98))
+        cursor = encode_task_cursor(BASE_TIME - timedelta(minutes=1), 99)
+
+        page = await db.get_tasks_page(limit=2, category="tech", cursor=cursor, offset=40)
+
+        sql, *params = conn.fetch.call_args_list[0].args
+        assert "WHERE category = $1 AND (created_at, id) < ($2, $3)" in sql
+        assert "OFFSET" not in sql
+        assert params == ["tech", BASE_TIME - timedelta(minutes=1), 99, 3]
+        assert page["next_cursor"] is None
+
+    async def test_full_projection_and_legacy_offset(self, db, conn):
+        conn.fetch = AsyncMock(return_value=[])
+
+        await db.get_tasks_page(limit=10, offset=20, summary=False)
+
+        sql, *params = conn.fetch.call_args_list[0].args
+        assert sql.startswith("SELECT * FROM content_tasks ORDER BY")
+        assert sql.endswith("LIMIT $1 OFFSET $2")
+        assert params == [11, 20]
+
+
+class TestTaskCounts:
+    """Summary-table, cached and estimated totals"""
+
+    async def test_totals_come_from_status_counts_table(self, db, conn):
+        conn.fetch = _fetch([])
+
+        assert (await db.get_tasks_page())["total"] == 42
+        assert (await db.get_tasks_page(status="pending"))["total"] == 2
+        assert (await db.get_tasks_page(status="failed"))["total"] == 0
+        conn.fetchval.assert_not_awaited()
+
+        counts = await db.get_task_counts()
+        assert (counts.total, counts.pending, counts.completed) == (42, 2, 40)
+
+    async def test_missing_summary_table_falls_back_to_group_by(self, db, conn):
+        fetch = _fetch([], status_counts=UndefinedTableError("missing"))
+        conn.fetch = fetch
+
+        await db.get_tasks_page(status="pending")
+        assert db._status_counts_available is False
+
+        conn.fetch = AsyncMock(return_value=[{"status": "failed", "count": 3}])
+        counts = await db.get_task_counts()
+        assert (counts.total, counts.failed) == (3, 3)
+        assert "GROUP BY status" in conn.fetch.call_args.args[0]
+
+    async def test_category_count_is_cached_until_invalidated(self, db, conn):
+        conn.fetch = _fetch([])
+        conn.fetchval = AsyncMock(side_effect=[7, 9])
+
+        first = await db.get_tasks_page(category="tech")
+        second = await db.get_tasks_page(category="tech")
+
+        assert first["total"] == second["total"] == 7
+        assert conn.fetchval.await_count == 1
+
+        db._count_cache.clear()
+        assert (await db.get_tasks_page(category="tech"))["total"] == 9
+
+    async def test_large_table_total_is_estimated(self, db, conn):
+        db._status_counts_available = False
+        conn.fetch = AsyncMock(return_value=[])
+        conn.fetchval = AsyncMock(return_value=TASK_COUNT_ESTIMATE_THRESHOLD * 3)
+
+        page = await db.get_tasks_page()
+
+        assert page["total"] == TASK_COUNT_ESTIMATE_THRESHOLD * 3
+        assert page["total_is_estimate"] is True
+        assert "reltuples" in conn.fetchval.call_args.args[0]
+
+    async def test_small_table_total_is_exact(self, db, conn):
+        db._status_counts_available = False
+        conn.fetch = AsyncMock(return_value=[])
+        conn.fetchval = AsyncMock(side_effect=[120, 118])
+
+        page = await db.get_tasks_page()
+
+        assert page["total"] == 118
+        assert page["total_is_estimate"] is False
+        assert "COUNT(*)" in conn.fetchval.call_args.args[0]
@@ -0,0 +1,273 @@
+"""Unit tests for dependency-aware phase scheduling in WorkflowEngine."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.custom_workflows_service import CustomWorkflowsService
+from services.workflow_execution_adapter import execute_custom_workflow
+from services.workflow_engine import (
+    PhaseStatus,
+    WorkflowContext,
+    WorkflowEngine,
+    WorkflowPhase,
+    WorkflowStatus,
+)
+
+
+def _phase(name, calls, delay=0.05, inputs=None, outputs=None, fail=False, **kwargs):
+    async def handler(context):
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        return {"phase": name, "input": context.get_phase_input(inputs)}
+
+    return WorkflowPhase(
+        name=name, handler=handler, inputs=inputs, outputs=outputs or [], max_retries=0, **kwargs
+    )
+
+
+def _context():
+    return WorkflowContext(workflow_id="wf-1", request_id="req-1", initial_input={"topic": "AI"})
+
+
+class TestPhaseDependencies:
+    """Tests for dependency graph construction."""
+
+    def test_legacy_phases_stay_sequential(self):
+        phases = [_phase("a", []), _phase("b", []), _phase("c", [])]
+        assert WorkflowEngine.build_phase_dependencies(phases) == {
+            "a": set(),
+            "b": {"a"},
+            "c": {"b"},
+        }
+
+    def test_declared_inputs_and_outputs(self):
+        phases = [
+            _phase("research", [], inputs=[]),
+            _phase("draft", [], inputs=["research"], outputs=["article"]),
+            _phase("image", [], inputs=["research"]),
+            _phase("publish", [], inputs=["article", "image"]),
+        ]
+        deps = WorkflowEngine.build_phase_dependencies(phases)
+        assert deps["image"] == {"research"}
+        assert deps["publish"] == {"draft", "image"}
+
+    def test_unknown_input_rejected(self):
+        with pytest.raises(ValueError):
+            WorkflowEngine.build_phase_dependencies([_phase("a", [], inputs=["missing"])])
+
+
+class TestParallelExecution:
+    """Tests for concurrent phases, checkpointing and resume."""
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_run_concurrently(self):
+        calls = []
+        phases = [
+            _phase("research", calls, inputs=[]),
+            _phase("draft", calls, delay=0.2, inputs=["research"]),
+            _phase("image", calls, delay=0.2, inputs=["research"]),
+            _phase("publish", calls, inputs=["draft", "image"]),
+        ]
+        engine = WorkflowEngine()
+
+        context = await engine.execute_workflow(phases, _context())
+
+        assert context.status == WorkflowStatus.COMPLETED
+        assert context.phase_timings["publish"]["duration_ms"] > 0
+        total = sum(t["duration_ms"] for t in context.phase_timings.values())
+        wall = (context.results["publish"].completed_at - context.started_at).total_seconds()
+        assert wall * 1000 < total
+        assert set(context.get_phase_output("publish")["input"]) == {"draft", "image"}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_and_resume_skip_completed_phases(self):
+        checkpoints = []
+
+        async def checkpoint_handler(ctx):
+            checkpoints.append(ctx.to_dict())
+
+        calls = []
+        phases = [
+            _phase("research", calls, inputs=[]),
+            _phase("draft", calls, inputs=["research"], fail=True),
+        ]
+        engine = WorkflowEngine(checkpoint_handler=checkpoint_handler)
+        first = await engine.execute_workflow(phases, _context())
+        assert first.status == WorkflowStatus.FAILED
+        assert len(checkpoints) == 2
+
+        resumed = WorkflowContext.from_dict(checkpoints[-1], initial_input={"topic": "AI"})
+        calls.clear()
+        phases[1] = _phase("draft", calls, inputs=["research"])
+        second = await WorkflowEngine().execute_workflow(phases, resumed)
+
+        assert calls == ["draft"]
+        assert second.status == WorkflowStatus.COMPLETED
+        assert second.results["research"].status == PhaseStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_skip_on_error_after_optional_failure(self):
+        calls = []
+        phases = [
+            _phase("research", calls, inputs=[]),
+            _phase("image", calls, inputs=["research"], fail=True, required=False),
+            _phase("caption", calls, inputs=["image"], skip_on_error=True, required=False),
+        ]
+
+        context = await WorkflowEngine().execute_workflow(phases, _context())
+
+        assert "caption" not in calls
+        assert context.results["caption"].status == PhaseStatus.SKIPPED
+
+    @pytest.mark.asyncio
+    async def test_resume_feeds_previous_output_to_legacy_phase(self):
+        checkpoints = []
+
+        async def checkpoint_handler(ctx):
+            # Round-trip through JSON like the workflow_executions metadata column
+            checkpoints.append(json.loads(json.dumps(ctx.to_dict(), default=str)))
+
+        calls = []
+        phases = [_phase("research", calls), _phase("draft", calls, fail=True)]
+        await WorkflowEngine(checkpoint_handler=checkpoint_handler).execute_workflow(
+            phases, _context()
+        )
+
+        resumed = WorkflowContext.from_dict(checkpoints[-1], initial_input={"topic": "AI"})
+        assert resumed.accumulated_output == {"phase": "research", "input": {"topic": "AI"}}
+
+        phases[1] = _phase("draft", calls)
+        second = await WorkflowEngine().execute_workflow(phases, resumed)
+
+        assert second.get_phase_output("draft")["input"] == {
+            "phase": "research",
+            "input": {"topic": "AI"},
+        }
+
+
+class TestResumeOwnership:
+    """Tests for owner-checked checkpoint loading on resume."""
+
+    @staticmethod
+    def _database(row=None):
+        database = MagicMock()
+        database.pool.fetchrow = AsyncMock(return_value=row)
+        return database
+
+    @pytest.mark.asyncio
+    async def test_resume_of_another_owners_execution_is_rejected(self):
+        database = self._database(row=None)
+        workflow = SimpleNamespace(id="wf-1", owner_id="alice", tags=[], phases=[])
+
+        with pytest.raises(ValueError):
+            await execute_custom_workflow(
+                workflow, {}, database, queue_async=False, resume_execution_id="exec-1"
+            )
+
+        query, *args = database.pool.fetchrow.await_args.args
+        assert "owner_id = $2" in query
+        assert args == ["exec-1", "alice"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_from_another_workflow_is_not_loaded(self):
+        service = CustomWorkflowsService(self._database())
+        service.get_workflow_execution = AsyncMock(
+            return_value={"workflow_id": "wf-2", "metadata": {"checkpoint": {"workflow_id": "wf-2"}}}
+        )
+
+        assert await service.load_execution_checkpoint("exec-1", "alice", "wf-1") is None
+        assert await service.load_execution_checkpoint("exec-1", "alice", "wf-2") == {
+            "workflow_id": "wf-2"
+        }
+        assert await service.load_execution_checkpoint("exec-1", "") is None
+
+
+class TestDeterministicMerge:
+    """Concurrent phases merge into the shared context the same way regardless of timing."""
+
+    @staticmethod
+    def _phases(calls, a_delay, b_delay):
+        return [
+            _phase("research", calls, delay=0, inputs=[]),
+            _phase("a", calls, delay=a_delay, inputs=["research"]),
+            _phase("b", calls, delay=b_delay, inputs=["research"]),
+            _phase("summary", calls, delay=0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_merge_does_not_depend_on_finish_order(self):
+        outcomes = []
+        for a_delay, b_delay in ((0.01, 0.1), (0.1, 0.01)):
+            context = await WorkflowEngine().execute_workflow(
+                self._phases([], a_delay, b_delay), _context()
+            )
+            outcomes.append(
+                (
+                    context.phases_executed,
+                    context.accumulated_output,
+                    context.get_phase_output("summary")["input"]["phase"],
+                    context.current_phase,
+                )
+            )
+
+        assert outcomes[0] == outcomes[1]
+        assert outcomes[0][0] == ["research", "a", "b", "summary"]
+        # The legacy phase reads the phase declared before it, not the last to finish
+        assert outcomes[0][2] == "b"
+        assert outcomes[0][3] is None
+
+    @pytest.mark.asyncio
+    async def test_current_phase_is_earliest_running_phase(self):
+        seen = []
+
+        async def watch(context):
+            await asyncio.sleep(0.02)
+            seen.append(context.current_phase)
+
+        phases = [
+            _phase("research", [], delay=0, inputs=[]),
+            WorkflowPhase(name="a", handler=watch, inputs=["research"], max_retries=0),
+            _phase("b", [], delay=0.1, inputs=["research"]),
+        ]
+
+        await WorkflowEngine().execute_workflow(phases, _context())
+
+        assert seen == ["a"]
+
+
+class TestActiveDuration:
+    """Resumed workflows report execution time, not time since the first start."""
+
+    @pytest.mark.asyncio
+    async def test_resume_excludes_downtime(self):
+        checkpoints = []
+
+        async def checkpoint_handler(ctx):
+            checkpoints.append(json.loads(json.dumps(ctx.to_dict(), default=str)))
+
+        calls = []
+        phases = [_phase("research", calls), _phase("draft", calls, fail=True)]
+        first = await WorkflowEngine(checkpoint_handler=checkpoint_handler).execute_workflow(
+            phases, _context()
+        )
+        assert first.active_ms > 0
+
+        checkpoint = checkpoints[-1]
+        assert 0 < checkpoint["active_ms"] <= first.active_ms
+        # The worker was down for a day before the workflow was resumed
+        started = datetime.fromisoformat(checkpoint["started_at"]) - timedelta(days=1)
+        checkpoint["started_at"] = started.isoformat()
+
+        resumed = WorkflowContext.from_dict(checkpoint, initial_input={"topic": "AI"})
+        phases[1] = _phase("draft", calls)
+        second = await WorkflowEngine().execute_workflow(phases, resumed)
+
+        assert second.status == WorkflowStatus.COMPLETED
+        assert first.active_ms < second.active_ms < 5000
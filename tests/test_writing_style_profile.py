@@ -0,0 +1,136 @@
+"""
+Tests for the stored, versioned writing style profile.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from services import writing_style_integration, writing_style_profile
+from services.qa_style_evaluator import StyleConsistencyValidator
+from services.writing_sample_rag import WritingSampleRAGService
+from services.writing_style_db import WritingStyleDatabase
+from services.writing_style_integration import WritingStyleIntegrationService
+from services.writing_style_profile import build_style_profile, is_profile_current
+
+SAMPLE = (
+    "Research shows that caching is essential. Moreover, according to the benchmarks, "
+    "it is significant.\n\nFor example, a warm cache halves latency."
+)
+
+
+def _db(samples):
+    db = MagicMock()
+    db.writing_style.get_user_writing_samples = AsyncMock(return_value=samples)
+    db.writing_style.get_writing_sample = AsyncMock(side_effect=AssertionError("refetched"))
+    db.writing_style.save_style_profile = AsyncMock()
+    return db
+
+
+def _sample(sample_id, content, profile=None):
+    return {
+        "id": sample_id,
+        "title": f"Sample {sample_id}",
+        "content": content,
+        "metadata": {"style_profile": profile} if profile else {},
+    }
+
+
+class TestStyleProfile:
+    """Profiles are keyed by content hash and analyzer version"""
+
+    def test_profile_is_current_until_text_or_version_changes(self, monkeypatch):
+        profile = build_style_profile(SAMPLE)
+
+        assert profile["analysis"]["detected_tone"] in ("formal", "authoritative")
+        assert is_profile_current(profile, SAMPLE)
+        assert not is_profile_current(profile, SAMPLE + " Edited.")
+        assert not is_profile_current(None, SAMPLE)
+
+        monkeypatch.setattr(writing_style_profile, "STYLE_PROFILE_VERSION", 2)
+        assert not is_profile_current(profile, SAMPLE)
+
+
+class TestProfileReuse:
+    """Generation and RAG read stored profiles; stale ones are rebuilt once"""
+
+    async def test_current_profile_is_reused_without_analysis(self, monkeypatch):
+        stored = build_style_profile(SAMPLE)
+        db = _db([])
+        monkeypatch.setattr(
+            writing_style_integration,
+            "build_style_profile",
+            MagicMock(side_effect=AssertionError("re-analyzed")),
+        )
+
+        data = await WritingStyleIntegrationService(db).prepare_sample(_sample(1, SAMPLE, stored))
+
+        assert data["analysis"] == stored["analysis"]
+        db.writing_style.save_style_profile.assert_not_awaited()
+
+    async def test_stale_profile_is_rebuilt_and_stored(self):
+        stale = {**build_style_profile("old text"), "content_hash": "outdated"}
+        db = _db([])
+
+        data = await WritingStyleIntegrationService(db).prepare_sample(_sample(7, SAMPLE, stale))
+
+        sample_id, profile = db.writing_style.save_style_profile.await_args.args
+        assert sample_id == 7
+        assert is_profile_current(profile, SAMPLE)
+        assert data["analysis"] == profile["analysis"]
+
+    async def test_rag_scores_listed_rows_without_refetching(self):
+        samples = [
+            _sample(1, SAMPLE, build_style_profile(SAMPLE)),
+            _sample(2, "Pretty cool stuff, really awesome. " * 5),
+        ]
+        db = _db(samples)
+
+        results = await WritingSampleRAGService(db).retrieve_relevant_samples(
+            "user", "caching latency"
+        )
+
+        assert [r["id"] for r in results] == [1, 2]
+        assert results[1]["analysis"]["detected_tone"] == "casual"
+        db.writing_style.get_writing_sample.assert_not_awaited()
+        assert db.writing_style.save_style_profile.await_count == 1  # Only the unprofiled row
+
+
+class TestProfileStorage:
+    """Create and content edits write the profile; other edits leave it alone"""
+
+    @staticmethod
+    def _pool():
+        conn = MagicMock()
+        row = {"id": 1, "user_id": "u", "title": "t", "content": "c"}
+        conn.fetchrow = AsyncMock(return_value=row)
+        acquire = MagicMock()
+        acquire.__aenter__ = AsyncMock(return_value=conn)
+        acquire.__aexit__ = AsyncMock(return_value=False)
+        pool = MagicMock()
+        pool.acquire.return_value = acquire
+        return pool, conn
+
+    async def test_only_content_edits_recompute_profile(self):
+        pool, conn = self._pool()
+        db = WritingStyleDatabase(pool)
+
+        await db.update_writing_sample("1", "u", title="Renamed")
+        assert "metadata = " not in conn.fetchrow.await_args.args[0]
+
+        await db.update_writing_sample("1", "u", content=SAMPLE)
+        query, *params = conn.fetchrow.await_args.args
+        assert "metadata = COALESCE(metadata, '{}'::jsonb) ||" in query
+        assert '"style_profile"' in params[-1]
+
+
+class TestValidatorReference:
+    """StyleConsistencyValidator accepts a stored profile as its reference"""
+
+    async def test_profile_supplies_reference_tone_and_metrics(self):
+        profile = build_style_profile(SAMPLE)
+        validator = StyleConsistencyValidator()
+
+        result = await validator.validate_style_consistency(SAMPLE, reference_metrics=profile)
+
+        assert result.reference_tone == profile["analysis"]["detected_tone"]
+        assert result.reference_metrics == profile["analysis"]
+        assert result.sentence_structure_score == 0.95